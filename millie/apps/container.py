@@ -0,0 +1,203 @@
+from apps.pricing.application.services.coupon_service import CouponService
+from apps.pricing.application.services.lowest_price_service import LowestPriceService
+from apps.pricing.application.services.promotion_service import PromotionService
+from apps.pricing.application.use_case.async_calculate_price_use_case import AsyncCalculatePriceUseCase
+from apps.pricing.application.use_case.calculate_cart_price_use_case import CalculateCartPriceUseCase
+from apps.pricing.application.use_case.calculate_price_use_case import CalculatePriceUseCase
+from apps.pricing.application.use_case.get_coupon_wallet_use_case import GetCouponWalletUseCase
+from apps.pricing.application.use_case.issue_coupons_use_case import IssueCouponsUseCase
+from apps.pricing.application.use_case.refresh_lowest_prices_use_case import RefreshLowestPricesUseCase
+from apps.pricing.application.use_case.simulate_discount_use_case import SimulateDiscountUseCase
+from apps.pricing.domain.repositories.coupon_repository import (
+    AsyncCouponRepository,
+    CouponRepository,
+)
+from apps.pricing.domain.repositories.issued_coupon_repository import IssuedCouponRepository
+from apps.pricing.domain.repositories.lowest_price_repository import LowestPriceRepository
+from apps.pricing.domain.repositories.promotion_repository import (
+    AsyncPromotionRepository,
+    PromotionRepository,
+)
+from apps.pricing.domain.repositories.rule_snapshot_repository import RuleSnapshotRepository
+from apps.pricing.domain.repositories.user_segment_repository import UserSegmentRepository
+from apps.pricing.infrastructure.persistence.repository_impl.async_coupon_repo_impl import AsyncCouponRepoImpl
+from apps.pricing.infrastructure.persistence.repository_impl.async_promotion_repo_impl import AsyncPromotionRepoImpl
+from apps.pricing.infrastructure.persistence.repository_impl.coupon_repo_impl import CouponRepoImpl
+from apps.pricing.infrastructure.persistence.repository_impl.issued_coupon_repo_impl import IssuedCouponRepoImpl
+from apps.pricing.infrastructure.persistence.repository_impl.lowest_price_repo_impl import LowestPriceRepoImpl
+from apps.pricing.infrastructure.persistence.repository_impl.promotion_repo_impl import PromotionRepoImpl
+from apps.pricing.infrastructure.persistence.repository_impl.snapshot_repo_impl import RuleSnapshotRepoImpl
+from apps.pricing.infrastructure.persistence.repository_impl.user_segment_repo_impl import UserSegmentRepoImpl
+from apps.product.application.async_get_product_detail_use_case import AsyncGetProductDetailUseCase
+from apps.product.application.async_get_product_list_use_case import AsyncGetProductListUseCase
+from apps.product.application.get_product_bulk_detail_use_case import GetProductBulkDetailUseCase
+from apps.product.application.get_product_detail_use_case import GetProductDetailUseCase
+from apps.product.application.get_product_facets_use_case import GetProductFacetsUseCase
+from apps.product.application.get_product_list_use_case import GetProductListUseCase
+from apps.product.application.search_product_use_case import SearchProductUseCase
+from apps.product.application.suggest_product_use_case import SuggestProductUseCase
+from apps.product.domain.repository import (
+    AsyncProductRepository,
+    ProductRepository,
+)
+from apps.product.infrastructure.persistence.async_product_repo_impl import AsyncProductRepoImpl
+from apps.product.infrastructure.persistence.product_repo_impl import ProductRepoImpl
+
+from apps.utils.container import (
+    Container,
+    Lifetime,
+)
+
+
+def build_container() -> Container:
+    """
+    객체 그래프 조립 (composition root)
+    - repository(mapper/캐시 포함), service: 상태가 없으므로 프로세스 singleton → 요청마다 다시 만들지 않음
+    - use case: 요청 scope (같은 요청 안에서는 하나를 공유)
+    """
+    container = Container()
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # repository / service
+    # ──────────────────────────────────────────────────────────────────────────
+    container.register(ProductRepository, lambda c: ProductRepoImpl(), Lifetime.SINGLETON)
+    container.register(CouponRepository, lambda c: CouponRepoImpl(), Lifetime.SINGLETON)
+    container.register(PromotionRepository, lambda c: PromotionRepoImpl(), Lifetime.SINGLETON)
+    container.register(RuleSnapshotRepository, lambda c: RuleSnapshotRepoImpl(), Lifetime.SINGLETON)
+    container.register(LowestPriceRepository, lambda c: LowestPriceRepoImpl(), Lifetime.SINGLETON)
+    container.register(UserSegmentRepository, lambda c: UserSegmentRepoImpl(), Lifetime.SINGLETON)
+    container.register(IssuedCouponRepository, lambda c: IssuedCouponRepoImpl(), Lifetime.SINGLETON)
+
+    # 비동기 repository는 sync repository를 감싸므로 캐시/조회 테이블 경로를 공유
+    container.register(
+        AsyncProductRepository,
+        lambda c: AsyncProductRepoImpl(c.resolve(ProductRepository)),
+        Lifetime.SINGLETON,
+    )
+    container.register(
+        AsyncCouponRepository,
+        lambda c: AsyncCouponRepoImpl(c.resolve(CouponRepository)),
+        Lifetime.SINGLETON,
+    )
+    container.register(
+        AsyncPromotionRepository,
+        lambda c: AsyncPromotionRepoImpl(c.resolve(PromotionRepository)),
+        Lifetime.SINGLETON,
+    )
+
+    container.register(CouponService, lambda c: CouponService(c.resolve(CouponRepository)), Lifetime.SINGLETON)
+    container.register(PromotionService, lambda c: PromotionService(c.resolve(PromotionRepository)), Lifetime.SINGLETON)
+    container.register(
+        LowestPriceService,
+        lambda c: LowestPriceService(c.resolve(LowestPriceRepository)),
+        Lifetime.SINGLETON,
+    )
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # use case
+    # ──────────────────────────────────────────────────────────────────────────
+    for use_case in (GetProductFacetsUseCase, SuggestProductUseCase):
+        container.register(use_case, lambda c, cls=use_case: cls(c.resolve(ProductRepository)), Lifetime.SCOPED)
+
+    # 목록/검색 결과에는 최저 구매 가능가(배치 결과)를 붙임
+    for use_case in (GetProductListUseCase, SearchProductUseCase):
+        container.register(
+            use_case,
+            lambda c, cls=use_case: cls(c.resolve(ProductRepository), c.resolve(LowestPriceService)),
+            Lifetime.SCOPED,
+        )
+
+    container.register(
+        GetProductDetailUseCase,
+        lambda c: GetProductDetailUseCase(
+            product_repo=c.resolve(ProductRepository),
+            promotion_service=c.resolve(PromotionService),
+            coupon_service=c.resolve(CouponService),
+        ),
+        Lifetime.SCOPED,
+    )
+    container.register(
+        GetProductBulkDetailUseCase,
+        lambda c: GetProductBulkDetailUseCase(
+            product_repo=c.resolve(ProductRepository),
+            coupon_service=c.resolve(CouponService),
+        ),
+        Lifetime.SCOPED,
+    )
+    container.register(
+        CalculatePriceUseCase,
+        lambda c: CalculatePriceUseCase(
+            product_repo=c.resolve(ProductRepository),
+            promotion_service=c.resolve(PromotionService),
+            coupon_service=c.resolve(CouponService),
+        ),
+        Lifetime.SCOPED,
+    )
+    container.register(
+        RefreshLowestPricesUseCase,
+        lambda c: RefreshLowestPricesUseCase(
+            product_repo=c.resolve(ProductRepository),
+            rule_snapshot_repo=c.resolve(RuleSnapshotRepository),
+            lowest_price_repo=c.resolve(LowestPriceRepository),
+        ),
+        Lifetime.SCOPED,
+    )
+    container.register(
+        CalculateCartPriceUseCase,
+        lambda c: CalculateCartPriceUseCase(
+            product_repo=c.resolve(ProductRepository),
+            rule_snapshot_repo=c.resolve(RuleSnapshotRepository),
+            coupon_repo=c.resolve(CouponRepository),
+        ),
+        Lifetime.SCOPED,
+    )
+    container.register(
+        GetCouponWalletUseCase,
+        lambda c: GetCouponWalletUseCase(c.resolve(CouponService)),
+        Lifetime.SCOPED,
+    )
+    container.register(
+        IssueCouponsUseCase,
+        lambda c: IssueCouponsUseCase(
+            coupon_repo=c.resolve(CouponRepository),
+            issued_coupon_repo=c.resolve(IssuedCouponRepository),
+            user_segment_repo=c.resolve(UserSegmentRepository),
+        ),
+        Lifetime.SCOPED,
+    )
+    container.register(
+        SimulateDiscountUseCase,
+        lambda c: SimulateDiscountUseCase(
+            product_repo=c.resolve(ProductRepository),
+            rule_snapshot_repo=c.resolve(RuleSnapshotRepository),
+        ),
+        Lifetime.SCOPED,
+    )
+
+    # 비동기(ASGI) 뷰용
+    container.register(
+        AsyncGetProductListUseCase,
+        lambda c: AsyncGetProductListUseCase(c.resolve(AsyncProductRepository), c.resolve(LowestPriceService)),
+        Lifetime.SCOPED,
+    )
+    container.register(
+        AsyncGetProductDetailUseCase,
+        lambda c: AsyncGetProductDetailUseCase(
+            product_repo=c.resolve(AsyncProductRepository),
+            coupon_repo=c.resolve(AsyncCouponRepository),
+        ),
+        Lifetime.SCOPED,
+    )
+    container.register(
+        AsyncCalculatePriceUseCase,
+        lambda c: AsyncCalculatePriceUseCase(
+            product_repo=c.resolve(AsyncProductRepository),
+            coupon_repo=c.resolve(AsyncCouponRepository),
+            promotion_repo=c.resolve(AsyncPromotionRepository),
+        ),
+        Lifetime.SCOPED,
+    )
+    return container
+
+
+container = build_container()
@@ -1,4 +1,5 @@
 from typing import (
+    Dict,
     List,
     Optional,
 )
@@ -6,6 +7,10 @@ from typing import (
 from django.utils import timezone
 
 from apps.pricing.domain.entity.coupon import Coupon as CouponEntity
+from apps.pricing.domain.entity.issued_coupon import (
+    IssuedCoupon as IssuedCouponEntity,
+    with_wallet,
+)
 from apps.pricing.domain.repositories.coupon_repository import CouponRepository
 
 class CouponService:
@@ -19,11 +24,24 @@ class CouponService:
         self,
         product_code: str,
         user,
+        coupon_code: Optional[List[str]] = None,
     ) -> List[CouponEntity]:
+        # coupon_code가 주어지면 전체 쿠폰이 아닌 해당 쿠폰들 중에서만 적용 가능 여부를 판단
+        # 로그인 사용자의 개별 발급 쿠폰은 지갑(사용자 색인)에서 조회하여 합침
 
         now = timezone.now()
-        coupons = self._repo.list_active_not_expired(now)
+        coupons = self._repo.list_active_not_expired(now, coupon_code=coupon_code)
+        if user is not None:
+            coupons = with_wallet(coupons, self._repo.list_issued_coupons(user.id, now, coupon_code=coupon_code))
+        return self.select_applicable(coupons, user, product_code)
 
+    @staticmethod
+    def select_applicable(
+        coupons: List[CouponEntity],
+        user,
+        product_code: str,
+    ) -> List[CouponEntity]:
+        # 조회된 쿠폰 중 해당 사용자/상품에 적용 가능한 쿠폰 (비동기 use case에서도 같은 기준으로 사용)
         result: List[CouponEntity] = []
         for coupon in coupons:
             if coupon.is_active and coupon.is_available(user, product_code):
@@ -31,6 +49,33 @@ class CouponService:
 
         return result
 
+    def get_applicable_coupons_by_product(
+        self,
+        product_codes: List[str],
+        user,
+    ) -> Dict[str, List[CouponEntity]]:
+        """
+        여러 상품의 적용 가능 쿠폰을 한 번의 쿠폰 로드로 계산
+        (상품 수만큼 get_applicable_coupons를 반복 호출하지 않기 위함)
+        """
+        now = timezone.now()
+        coupons = self._repo.list_active_not_expired(now)
+        if user is not None:
+            coupons = with_wallet(coupons, self._repo.list_issued_coupons(user.id, now))
+        coupons = [coupon for coupon in coupons if coupon.is_active]
+
+        return {
+            product_code: [coupon for coupon in coupons if coupon.is_available(user, product_code)]
+            for product_code in product_codes
+        }
+
+    def get_wallet(
+        self,
+        user_id,
+    ) -> List[IssuedCouponEntity]:
+        # 사용자가 지금 사용할 수 있는 발급 쿠폰 (먼저 끝나는 순)
+        return self._repo.list_issued_coupons(user_id, timezone.now())
+
     def get_coupons_by_code(
         self,
         coupon_code: List[str],
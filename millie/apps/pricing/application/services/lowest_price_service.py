@@ -0,0 +1,36 @@
+from dataclasses import replace
+from typing import List
+
+from django.utils import timezone
+
+from apps.pricing.domain.repositories.lowest_price_repository import LowestPriceRepository
+from apps.product.domain.entity import Product as ProductEntity
+
+
+class LowestPriceService:
+    def __init__(
+        self,
+        repo: LowestPriceRepository,
+    ):
+        self._repo = repo
+
+    def with_lowest_prices(
+        self,
+        products: List[ProductEntity],
+    ) -> List[ProductEntity]:
+        """
+        목록의 상품들에 최저 구매 가능가를 붙여 반환 (상품 수와 관계없이 조회 1회)
+        캐시에서 꺼낸 엔티티를 공유하고 있을 수 있으므로 원본을 바꾸지 않고 복사본에 설정
+        """
+        if not products:
+            return products
+
+        lowest_prices = self._repo.get_many([product.code for product in products])
+        now = timezone.now()
+        result: List[ProductEntity] = []
+        for product in products:
+            lowest = lowest_prices.get(product.code)
+            if lowest is not None and lowest.is_valid(product.price, now):
+                product = replace(product, lowest_price=lowest.lowest_price)
+            result.append(product)
+        return result
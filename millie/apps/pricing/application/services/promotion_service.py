@@ -1,8 +1,14 @@
 from decimal import Decimal
-from typing import Tuple
+from typing import (
+    List,
+    Optional,
+    Tuple,
+)
 
 from apps.pricing.domain.entity.price_result import PriceResult as PriceResultEntity
+from apps.pricing.domain.policy.discount_policy import DiscountPolicy
 from apps.pricing.domain.repositories.promotion_repository import PromotionRepository
+from apps.product.domain.value_objects import ProductAttributes
 
 
 class PromotionService:
@@ -17,16 +23,25 @@ class PromotionService:
         product_code: str,
         original_price: Decimal,
         user = None,
+        attributes: Optional[ProductAttributes] = None,
     ) -> Tuple[PriceResultEntity, bool]:
         # NOTE!
         # 프로모션 코드이면서 쿠폰 코드인것은 없다고 가정하였습니다.
         # 한 상품에 적용되는 프로모션 할인은 우선선위 높은것 하나만 가져오도록 하였습니다.
 
-        has_promotion = False
         strategy_list = self._repo.get_active_promotions(
             target_product_code=product_code,
             target_user_id=user.id if user else None,
+            attributes=attributes,
         )
+        return self.apply_promotions(strategy_list, original_price)
+
+    @staticmethod
+    def apply_promotions(
+        strategy_list: List[DiscountPolicy],
+        original_price: Decimal,
+    ) -> Tuple[PriceResultEntity, bool, Optional[str]]:
+        # 조회된 프로모션(우선순위순) 중 첫 번째만 적용 (비동기 use case에서도 같은 기준으로 사용)
         if not strategy_list:
             return PriceResultEntity(
                 original=original_price,
@@ -34,8 +49,5 @@ class PromotionService:
                 discount_amount=Decimal("0"),
             ), False, None
 
-        has_promotion = True
         promotion = strategy_list[0]
-        applied_promotion = promotion.name
-
-        return promotion.to_discount_policy().apply(original_price), has_promotion, applied_promotion
+        return promotion.to_discount_policy().apply(original_price), True, promotion.name
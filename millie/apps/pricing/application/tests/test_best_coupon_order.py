@@ -0,0 +1,160 @@
+import random
+import time
+from datetime import timedelta
+from decimal import Decimal
+from itertools import permutations
+from unittest import mock
+
+from django.test import SimpleTestCase
+from django.utils import timezone
+
+from apps.pricing.application.use_case.calculate_price_use_case import CalculatePriceUseCase
+from apps.pricing.domain.entity.coupon import Coupon as CouponEntity
+from apps.pricing.domain.entity.price_result import PriceResult as PriceResultEntity
+from apps.pricing.domain.policy.coupon_stacking import best_coupon_order
+from apps.pricing.domain.policy.discount_policy import build_discount_policy
+from apps.product.domain.entity import Product as ProductEntity
+
+
+def coupon(code, discount_type, value, minimum="0"):
+    now = timezone.now()
+    return CouponEntity(
+        id=code,
+        code=code,
+        name=code,
+        discount_policy=build_discount_policy(discount_type, Decimal(value)),
+        valid_until=now + timedelta(days=30),
+        status="ACTIVE",
+        created_at=now,
+        updated_at=None,
+        target_type="ALL",
+        target_product_code=None,
+        target_user_id=None,
+        minimum_purchase_amount=Decimal(minimum),
+        is_active=True,
+    )
+
+
+def apply_in_order(price, coupons):
+    for c in coupons:
+        price = c.to_discount_policy().apply(price).discounted
+    return price
+
+
+class BestCouponOrderTest(SimpleTestCase):
+    def test_percentage_before_fixed(self):
+        coupons = [coupon("FIX1000", "FIXED", "1000"), coupon("PCT10", "PERCENTAGE", "0.10")]
+
+        ordered = best_coupon_order(Decimal("22000"), coupons)
+
+        # 22,000 * 0.9 - 1,000 = 18,800 (반대 순서면 18,900)
+        self.assertEqual([c.code for c in ordered], ["PCT10", "FIX1000"])
+        self.assertEqual(apply_in_order(Decimal("22000"), ordered), Decimal("18800"))
+
+    def test_fewest_coupons_when_price_reaches_zero(self):
+        coupons = [
+            coupon("FIX3000", "FIXED", "3000"),
+            coupon("FIX6000", "FIXED", "6000"),
+            coupon("PCT50", "PERCENTAGE", "0.50"),
+            coupon("ZERO", "PERCENTAGE", "0"),
+        ]
+
+        # 10,000 * 0.5 = 5,000 → 6,000 하나면 0원 (3,000원/0% 쿠폰은 쓰지 않음)
+        ordered = best_coupon_order(Decimal("10000"), coupons)
+        self.assertEqual([c.code for c in ordered], ["PCT50", "FIX6000"])
+
+        self.assertEqual(best_coupon_order(Decimal("0"), coupons), [])
+
+    def test_matches_brute_force(self):
+        rng = random.Random(44)
+        for _ in range(200):
+            price = Decimal(rng.randrange(1000, 30000, 100))
+            coupons = [
+                coupon(f"P{i}", "PERCENTAGE", f"0.{rng.randrange(0, 60):02d}") if rng.random() < 0.5
+                else coupon(f"F{i}", "FIXED", str(rng.randrange(0, 8000, 500)))
+                for i in range(rng.randrange(0, 6))
+            ]
+
+            best_price, best_count = price, 0
+            for size in range(1, len(coupons) + 1):
+                for combination in permutations(coupons, size):
+                    final = apply_in_order(price, combination)
+                    if final < best_price or (final == best_price and size < best_count):
+                        best_price, best_count = final, size
+
+            ordered = best_coupon_order(price, coupons)
+            with self.subTest(price=price, coupons=[(c.code, c.discount_value) for c in coupons]):
+                self.assertEqual(apply_in_order(price, ordered), best_price)
+                self.assertEqual(len(ordered), best_count)
+
+    def test_thirty_candidates_under_a_millisecond(self):
+        rng = random.Random(30)
+        coupons = [
+            coupon(f"C{i}", "PERCENTAGE", f"0.{rng.randrange(1, 30):02d}") if i % 2
+            else coupon(f"C{i}", "FIXED", str(rng.randrange(100, 3000, 100)))
+            for i in range(30)
+        ]
+        best_coupon_order(Decimal("30000"), coupons)
+
+        runs = 200
+        started = time.perf_counter()
+        for _ in range(runs):
+            best_coupon_order(Decimal("30000"), coupons)
+        self.assertLess((time.perf_counter() - started) / runs, 0.001)
+
+
+class CalculatePriceBestPriceTest(SimpleTestCase):
+    def setUp(self):
+        self.product = ProductEntity(
+            code="BOOK2", name="도서 2", price=Decimal("22000.00"), status="ACTIVE",
+            created_at=timezone.now(), updated_at=None,
+        )
+        self.fixed = coupon("FIX1000", "FIXED", "1000")
+        self.percentage = coupon("PCT10", "PERCENTAGE", "0.10", minimum="15000")
+        self.unrequested = coupon("PCT20", "PERCENTAGE", "0.20")
+
+        promotion_service = mock.Mock()
+        promotion_service.apply_policy.return_value = (
+            PriceResultEntity(
+                original=Decimal("22000.00"), discounted=Decimal("22000.00"), discount_amount=Decimal("0"),
+                discount_types=[],
+            ),
+            False,
+            None,
+        )
+        # 조회 순서는 정액 → 정률
+        all_coupons = [self.fixed, self.percentage, self.unrequested]
+        coupon_service = mock.Mock(
+            get_applicable_coupons=lambda coupon_code=None, **kwargs: [
+                c for c in all_coupons if coupon_code is None or c.code in coupon_code
+            ],
+            get_coupons_by_code=lambda codes: [c for c in all_coupons if c.code in codes],
+        )
+        self.use_case = CalculatePriceUseCase(
+            product_repo=mock.Mock(), promotion_service=promotion_service, coupon_service=coupon_service,
+        )
+
+    def test_requested_coupons_in_best_order(self):
+        for include_available_coupons in (True, False):
+            with self.subTest(include_available_coupons=include_available_coupons):
+                _, applied, result = self.use_case.execute(
+                    product=self.product, coupon_code=["FIX1000", "PCT10"],
+                    include_available_coupons=include_available_coupons, best_price=True,
+                )
+                self.assertEqual(applied, ["PCT10", "FIX1000"])
+                self.assertEqual(result.discounted, Decimal("18800.00"))
+                self.assertEqual(result.discount_amount, Decimal("3200.00"))
+
+        # 기본 모드는 요청(조회) 순서대로
+        _, applied, result = self.use_case.execute(product=self.product, coupon_code=["FIX1000", "PCT10"])
+        self.assertEqual(applied, ["FIX1000", "PCT10"])
+        self.assertEqual(result.discounted, Decimal("18900.00"))
+
+    def test_all_available_coupons_without_codes(self):
+        _, applied, result = self.use_case.execute(
+            product=self.product, include_available_coupons=False, best_price=True,
+        )
+
+        # 22,000 * 0.8 * 0.9 - 1,000 = 14,840
+        self.assertEqual(applied, ["PCT20", "PCT10", "FIX1000"])
+        self.assertEqual(result.discounted, Decimal("14840.00"))
@@ -0,0 +1,206 @@
+import time
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+
+from django.core.cache import caches
+from django.db import connection
+from django.test import (
+    TestCase,
+    override_settings,
+)
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.container import container
+from apps.pricing.application.use_case.calculate_cart_price_use_case import CalculateCartPriceUseCase
+from apps.pricing.application.use_case.calculate_price_use_case import CalculatePriceUseCase
+from apps.pricing.domain.entity.cart import CartItem
+from apps.pricing.domain.policy.allocation import allocate
+from apps.pricing.domain.value_objects import (
+    CouponStatus,
+    DiscountType,
+    TargetType,
+)
+from apps.pricing.infrastructure.persistence.models import (
+    Coupon as CouponModel,
+    DiscountPolicy as DiscountPolicyModel,
+    DiscountTarget as DiscountTargetModel,
+    Promotion as PromotionModel,
+)
+from apps.product.domain.value_objects import ProductStatus
+from apps.product.infrastructure.persistence.models import Book as BookModel
+from apps.utils.cache import clear_local_caches
+from apps.utils.exceptions import NotFoundException
+
+
+class AllocateTest(TestCase):
+    def test_sum_matches_amount(self):
+        shares = allocate(Decimal("3000"), [Decimal("19000"), Decimal("7600")])
+        # 2142.857… / 857.142… → 나머지 1전은 나머지가 큰 첫 번째 라인에
+        self.assertEqual(shares, [Decimal("2142.86"), Decimal("857.14")])
+
+        shares = allocate(Decimal("100"), [Decimal("1")] * 3)
+        self.assertEqual(shares, [Decimal("33.34"), Decimal("33.33"), Decimal("33.33")])
+        self.assertEqual(sum(shares), Decimal("100"))
+
+    def test_zero(self):
+        self.assertEqual(allocate(Decimal("0"), [Decimal("10"), Decimal("20")]), [Decimal("0")] * 2)
+        self.assertEqual(allocate(Decimal("10"), [Decimal("0")]), [Decimal("0")])
+
+
+class CalculateCartPriceUseCaseTest(TestCase):
+    def setUp(self):
+        self.now = timezone.now()
+        for code, price in (("BOOK001", "20000.00"), ("BOOK002", "8000.00"), ("BOOK003", "15000.00")):
+            BookModel.objects.create(code=code, name=code, price=Decimal(price), status=ProductStatus.ACTIVE.value)
+        BookModel.objects.create(
+            code="BOOK004", name="품절", price=Decimal("9000.00"), status=ProductStatus.SOLD_OUT.value,
+        )
+
+        # 전체 10% (최소 30,000원), 전체 3,000원, BOOK003 전용 2,000원
+        self._coupon("ALL10", DiscountType.PERCENTAGE, "0.10", minimum="30000.00")
+        self._coupon("FIX3000", DiscountType.FIXED, "3000.00")
+        self._coupon("B3FIX2000", DiscountType.FIXED, "2000.00", target_type=TargetType.PRODUCT, product_code="BOOK003")
+
+        promotion_policy = self._policy(DiscountType.PERCENTAGE, "0.05")
+        PromotionModel.objects.create(
+            id=uuid.uuid4(), name="전체 5% 할인", status=CouponStatus.ACTIVE.value, is_auto_discount=True,
+            discount_policy=promotion_policy,
+        )
+        DiscountTargetModel.objects.create(id=uuid.uuid4(), discount_policy=promotion_policy, apply_priority=1)
+        self.use_case = container.resolve(CalculateCartPriceUseCase)
+
+    def _policy(self, discount_type, value, target_type=TargetType.ALL, minimum="0"):
+        return DiscountPolicyModel.objects.create(
+            id=uuid.uuid4(),
+            discount_type=discount_type.value,
+            value=Decimal(value),
+            target_type=target_type.value,
+            minimum_purchase_amount=Decimal(minimum),
+            effective_start_at=self.now - timedelta(days=1),
+            effective_end_at=self.now + timedelta(days=30),
+        )
+
+    def _coupon(self, code, discount_type, value, target_type=TargetType.ALL, product_code=None, minimum="0"):
+        policy = self._policy(discount_type, value, target_type, minimum)
+        if target_type is not TargetType.ALL:
+            DiscountTargetModel.objects.create(
+                id=uuid.uuid4(), discount_policy=policy, target_product_code_id=product_code, apply_priority=0,
+            )
+        CouponModel.objects.create(
+            id=uuid.uuid4(), code=code, name=code, valid_until=self.now + timedelta(days=7),
+            status=CouponStatus.ACTIVE.value, discount_policy=policy,
+        )
+
+    def _cart(self, *items):
+        return [CartItem(product_code=code, quantity=quantity) for code, quantity in items]
+
+    def test_single_item_matches_calculate_price_use_case(self):
+        single = container.resolve(CalculatePriceUseCase)
+        for code in ("BOOK001", "BOOK002", "BOOK003"):
+            for coupons in (["FIX3000"], ["B3FIX2000", "FIX3000"]):
+                with self.subTest(code=code, coupons=coupons):
+                    result = self.use_case.execute(self._cart((code, 1)), coupon_code=coupons)
+                    _, applied, price_result = single.execute(product=single.fetch(code), coupon_code=coupons)
+                    self.assertEqual(result.discounted, price_result.discounted)
+                    self.assertEqual(result.lines[0].applied_policies, applied)
+
+    def test_minimum_purchase_against_cart_total(self):
+        # 8,000 × 2 + 15,000 = 31,000 ≥ 30,000 (상품 하나만으로는 미달)
+        result = self.use_case.execute(self._cart(("BOOK002", 2), ("BOOK003", 1)), coupon_code=["ALL10"])
+
+        self.assertEqual(result.applied_coupons, ["ALL10"])
+        self.assertEqual(result.rejected_coupons, [])
+        # 프로모션 5% 후 15,200 / 14,250 → 쿠폰 10%
+        self.assertEqual([line.discounted for line in result.lines], [Decimal("13680.00"), Decimal("12825.00")])
+        self.assertEqual([line.coupon_discount for line in result.lines], [Decimal("1520.00"), Decimal("1425.00")])
+        self.assertEqual(result.original, Decimal("31000.00"))
+        self.assertEqual(result.discounted, Decimal("26505.00"))
+        self.assertEqual(result.lines[0].applied_policies, ["ALL10", "전체 5% 할인"])
+
+        result = self.use_case.execute(self._cart(("BOOK002", 1), ("BOOK003", 1)), coupon_code=["ALL10"])
+        self.assertEqual(result.applied_coupons, [])
+        self.assertEqual(result.rejected_coupons, ["ALL10"])
+        self.assertEqual(result.discounted, Decimal("21850.00"))
+
+    def test_fixed_coupon_allocated_once_per_cart(self):
+        result = self.use_case.execute(self._cart(("BOOK001", 1), ("BOOK002", 1)), coupon_code=["FIX3000"])
+
+        # 19,000 + 7,600 에서 3,000원을 한 번만, 금액 비율로 배분
+        self.assertEqual([line.coupon_discount for line in result.lines], [Decimal("2142.86"), Decimal("857.14")])
+        self.assertEqual(result.discounted, Decimal("23600.00"))
+        self.assertEqual(result.discount_amount, Decimal("4400.00"))
+
+    def test_product_coupon_only_on_target_line(self):
+        result = self.use_case.execute(
+            self._cart(("BOOK001", 1), ("BOOK003", 2)), coupon_code=["B3FIX2000", "UNKNOWN"],
+        )
+
+        self.assertEqual(result.applied_coupons, ["B3FIX2000"])
+        self.assertEqual(result.rejected_coupons, ["UNKNOWN"])
+        book001, book003 = result.lines
+        self.assertEqual(book001.coupon_discount, Decimal("0"))
+        self.assertEqual(book001.applied_policies, ["전체 5% 할인"])
+        self.assertEqual(book003.discounted, Decimal("26500.00"))        # 14,250 × 2 - 2,000
+        self.assertEqual(book003.applied_policies, ["B3FIX2000", "전체 5% 할인"])
+
+    def test_duplicate_items_merged(self):
+        result = self.use_case.execute(self._cart(("BOOK002", 1), ("BOOK001", 1), ("BOOK002", 2)))
+
+        self.assertEqual(
+            [(line.product_code, line.quantity) for line in result.lines], [("BOOK002", 3), ("BOOK001", 1)],
+        )
+        self.assertEqual(result.lines[0].original, Decimal("24000.00"))
+
+    def test_not_found(self):
+        with self.assertRaises(NotFoundException):
+            self.use_case.execute(self._cart(("BOOK001", 1), ("NOPE", 1)))
+        with self.assertRaises(NotFoundException):
+            self.use_case.execute(self._cart(("BOOK004", 1)))
+        with self.assertRaises(NotFoundException):
+            self.use_case.execute(self._cart(("BOOK001", 1)), coupon_code=["UNKNOWN"])
+
+    def test_queries_do_not_grow_with_items(self):
+        BookModel.objects.bulk_create([
+            BookModel(
+                code=f"CART{i:03d}", name=f"CART{i:03d}", price=Decimal(10000 + i * 100),
+                status=ProductStatus.ACTIVE.value,
+            )
+            for i in range(102)
+        ])
+        with CaptureQueriesContext(connection) as small:
+            self.use_case.execute(self._cart(("CART100", 1), ("CART101", 1)), coupon_code=["FIX3000"])
+        codes = [(f"CART{i:03d}", 1) for i in range(100)]
+        with CaptureQueriesContext(connection) as large:
+            result = self.use_case.execute(self._cart(*codes), coupon_code=["FIX3000", "ALL10"])
+        self.assertEqual(len(large), len(small))
+        self.assertEqual(sorted(result.applied_coupons), ["ALL10", "FIX3000"])
+
+        # 상품이 캐시된 상태에서 100개 라인 계산은 수 ms 수준
+        start = time.perf_counter()
+        self.use_case.execute(self._cart(*codes), coupon_code=["FIX3000", "ALL10"])
+        self.assertLess(time.perf_counter() - start, 0.1)
+
+    @override_settings(CACHES={
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        "product": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
+        "pricing": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "cart-rule-cache-test"},
+    })
+    def test_rules_read_from_pricing_cache(self):
+        caches["pricing"].clear()
+        clear_local_caches()
+        cart = self._cart(("BOOK001", 1), ("BOOK003", 1))
+        first = self.use_case.execute(cart, coupon_code=["ALL10"])
+
+        # 규칙(프로모션 색인/쿠폰 목록)은 캐시 버전이 바뀌기 전까지 다시 읽지 않고 상품 일괄 조회만 실행
+        with CaptureQueriesContext(connection) as queries:
+            second = self.use_case.execute(cart, coupon_code=["ALL10"])
+        self.assertEqual(second.discounted, first.discounted)
+        rule_tables = ('"coupons"', '"promotions"', '"discount_policies"', '"discount_targets"')
+        self.assertFalse([q["sql"] for q in queries if any(table in q["sql"] for table in rule_tables)])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            PromotionModel.objects.update(is_auto_discount=False)
+            PromotionModel.objects.first().save()
+        self.assertEqual(self.use_case.execute(cart, coupon_code=["ALL10"]).lines[0].promotion, None)
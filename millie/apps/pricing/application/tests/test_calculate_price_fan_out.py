@@ -0,0 +1,103 @@
+import threading
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+from unittest import mock
+
+from django.test import (
+    TransactionTestCase,
+    override_settings,
+)
+from django.utils import timezone
+
+from apps.container import container
+from apps.pricing.application.use_case.calculate_price_use_case import CalculatePriceUseCase
+from apps.pricing.domain.value_objects import (
+    CouponStatus,
+    DiscountType,
+    TargetType,
+)
+from apps.pricing.infrastructure.persistence.models import (
+    Coupon as CouponModel,
+    DiscountPolicy as DiscountPolicyModel,
+    Promotion as PromotionModel,
+)
+from apps.pricing.infrastructure.persistence.repository_impl.coupon_repo_impl import CouponRepoImpl
+from apps.product.application.get_product_detail_use_case import GetProductDetailUseCase
+from apps.product.domain.value_objects import ProductStatus
+from apps.product.infrastructure.persistence.models import Book as BookModel
+from apps.utils.exceptions import NotFoundException
+
+
+class CalculatePriceFanOutTest(TransactionTestCase):
+    """
+    USE_CASE_FAN_OUT=True면 쿠폰 스캔을 스레드 풀(별도 DB 연결)에서 실행하고, 결과는 순서대로 실행할 때와 같아야 한다.
+    (풀 스레드의 연결에서 데이터가 보이도록 트랜잭션으로 감싸지 않는 TransactionTestCase 사용)
+    """
+
+    def setUp(self):
+        now = timezone.now()
+        self.book = BookModel.objects.create(
+            code="BOOK001", name="도서", price=Decimal("20000.00"), status=ProductStatus.ACTIVE.value,
+        )
+        for code, discount_type, value in (
+            ("TEST10", DiscountType.PERCENTAGE, "0.10"),
+            ("MINUS1000", DiscountType.FIXED, "1000.00"),
+        ):
+            CouponModel.objects.create(
+                id=uuid.uuid4(), code=code, name=code, valid_until=now + timedelta(days=7),
+                status=CouponStatus.ACTIVE.value, discount_policy=self._policy(discount_type, value, now),
+            )
+        PromotionModel.objects.create(
+            id=uuid.uuid4(), name="자동 5% 할인", status=CouponStatus.ACTIVE.value, is_auto_discount=True,
+            discount_policy=self._policy(DiscountType.PERCENTAGE, "0.05", now),
+        )
+
+    @staticmethod
+    def _policy(discount_type, value, now):
+        return DiscountPolicyModel.objects.create(
+            id=uuid.uuid4(),
+            discount_type=discount_type.value,
+            value=Decimal(value),
+            target_type=TargetType.ALL.value,
+            effective_start_at=now - timedelta(days=1),
+            effective_end_at=now + timedelta(days=30),
+        )
+
+    def _calculate(self):
+        use_case = container.resolve(CalculatePriceUseCase)
+        product = use_case.fetch("BOOK001")
+        return use_case.execute(product=product, coupon_code=["TEST10", "MINUS1000"])
+
+    def test_same_result_with_coupon_scan_on_pool_thread(self):
+        expected = self._calculate()
+
+        threads = []
+        original = CouponRepoImpl.list_active_not_expired
+
+        def record(repo, *args, **kwargs):
+            threads.append(threading.current_thread().name)
+            return original(repo, *args, **kwargs)
+
+        with override_settings(USE_CASE_FAN_OUT=True), \
+                mock.patch.object(CouponRepoImpl, "list_active_not_expired", autospec=True, side_effect=record):
+            available, applied, price_result = self._calculate()
+            product, detail_coupons = container.resolve(GetProductDetailUseCase).execute("BOOK001")
+
+        self.assertEqual(
+            ([c.code for c in available], applied, price_result),
+            ([c.code for c in expected[0]], *expected[1:]),
+        )
+        self.assertEqual(price_result.discounted, Decimal("16100.00"))
+        self.assertEqual(product.code, "BOOK001")
+        self.assertEqual(sorted(c.code for c in detail_coupons), ["MINUS1000", "TEST10"])
+        # 가격 계산은 쿠폰 스캔을 풀에서, 상품 상세는 상품 조회를 풀에서 하고 쿠폰 스캔은 요청 스레드에서 실행
+        self.assertEqual(len(threads), 2)
+        self.assertTrue(threads[0].startswith("db-pool"))
+        self.assertEqual(threads[1], threading.current_thread().name)
+
+    def test_unknown_product_skips_coupon_scan_when_sequential(self):
+        with mock.patch.object(CouponRepoImpl, "list_active_not_expired", autospec=True) as scan:
+            with self.assertRaises(NotFoundException):
+                container.resolve(GetProductDetailUseCase).execute("NOPE")
+        scan.assert_not_called()
@@ -153,7 +153,7 @@ class CalculatePriceUseCaseTest(TestCase):
         mock_repo = mock.Mock(get_product_by_code=lambda code: self.book2)
 
         mock_promo_service = mock.Mock()
-        mock_promo_service.apply_policy.side_effect = lambda product_code, original_price, user=None: (
+        mock_promo_service.apply_policy.side_effect = lambda product_code, original_price, user=None, attributes=None: (
             PriceResultEntity(
                 original=original_price,
                 discounted=(original_price * Decimal("0.90")).quantize(Decimal("0.01")),
@@ -193,7 +193,7 @@ class CalculatePriceUseCaseTest(TestCase):
         mock_repo = mock.Mock(get_product_by_code=lambda code: self.book2)
 
         mock_promo_service = mock.Mock()
-        mock_promo_service.apply_policy.side_effect = lambda product_code, original_price, user=None: (
+        mock_promo_service.apply_policy.side_effect = lambda product_code, original_price, user=None, attributes=None: (
             PriceResultEntity(
                 original=original_price,
                 discounted=(original_price * Decimal("0.90")).quantize(Decimal("0.01")),
@@ -784,7 +784,7 @@ class CalculatePriceUseCaseTest(TestCase):
 
         # PromotionService: 프로모션 5%만 적용
         mock_promo_service = mock.Mock()
-        mock_promo_service.apply_policy.side_effect = lambda product_code, original_price, user=None: (
+        mock_promo_service.apply_policy.side_effect = lambda product_code, original_price, user=None, attributes=None: (
             PriceResultEntity(
                 original=original_price,
                 discounted=(original_price * Decimal("0.95")).quantize(Decimal("0.01")),
@@ -827,7 +827,7 @@ class CalculatePriceUseCaseTest(TestCase):
 
         # 프로모션: 전체 대상 5% 적용
         mock_promo_service = mock.Mock()
-        mock_promo_service.apply_policy.side_effect = lambda product_code, original_price, user=None: (
+        mock_promo_service.apply_policy.side_effect = lambda product_code, original_price, user=None, attributes=None: (
             PriceResultEntity(
                 original=original_price,
                 discounted=(original_price * Decimal("0.95")).quantize(Decimal("0.01")),
@@ -961,7 +961,7 @@ class CalculatePriceUseCaseTest(TestCase):
 
         # 프로모션: BOOK2에 10% 적용
         mock_promo_service = mock.Mock()
-        mock_promo_service.apply_policy.side_effect = lambda product_code, original_price, user=None: (
+        mock_promo_service.apply_policy.side_effect = lambda product_code, original_price, user=None, attributes=None: (
             PriceResultEntity(
                 original=original_price,
                 discounted=(original_price * Decimal("0.90")).quantize(Decimal("0.01")),
@@ -995,3 +995,59 @@ class CalculatePriceUseCaseTest(TestCase):
         self.assertEqual(price_res.discounted, Decimal("19800.00"))
         self.assertEqual(applied_coupons, ["BOOK2_10PERCENT_PROMO"])
         self.assertListEqual(price_res.discount_types, ["PERCENTAGE"])
+
+    # 21) available_coupons 미포함 모드 → 전체 쿠폰 스캔 없이 요청된 쿠폰만 로드하여 적용
+    def test_적용가능쿠폰_목록생략_요청쿠폰만_로드(self):
+        mock_repo = mock.Mock(get_product_by_code=lambda code: self.book2)
+
+        mock_promo_service = mock.Mock()
+        mock_promo_service.apply_policy.return_value = (
+            PriceResultEntity(
+                original=Decimal("22000.00"),
+                discounted=Decimal("22000.00"),
+                discount_amount=Decimal("0.00"),
+                discount_types=[]
+            ),
+            False,
+            ""
+        )
+
+        # 요청된 코드로 좁혀진 조회만 허용 (coupon_code 없이 호출되면 전체 스캔)
+        def get_applicable_coupons(product_code, user, coupon_code=None):
+            self.assertIsNotNone(coupon_code)
+            return [c for c in (self.coupon_all_10pct, self.coupon_book2_5k) if c.code in coupon_code]
+
+        mock_coupon_service = mock.Mock()
+        mock_coupon_service.get_applicable_coupons.side_effect = get_applicable_coupons
+
+        use_case = CalculatePriceUseCase(
+            product_repo=mock_repo,
+            promotion_service=mock_promo_service,
+            coupon_service=mock_coupon_service,
+        )
+
+        available_coupons, applied_coupons, price_res = use_case.execute(
+            product=self.book2,
+            user=None,
+            coupon_code=[self.coupon_all_10pct.code],
+            include_available_coupons=False,
+        )
+
+        # 22,000 * 0.9 = 19,800, 이미 로드한 쿠폰을 재사용하므로 코드 재조회 없음
+        self.assertEqual(price_res.discounted, Decimal("19800.00"))
+        self.assertEqual(applied_coupons, ["전체 10% 할인"])
+        self.assertEqual([c.code for c in available_coupons], [self.coupon_all_10pct.code])
+        mock_coupon_service.get_applicable_coupons.assert_called_once()
+        mock_coupon_service.get_coupons_by_code.assert_not_called()
+
+        # 쿠폰 요청이 없으면 쿠폰 조회 자체를 하지 않음
+        mock_coupon_service.reset_mock()
+        available_coupons, applied_coupons, price_res = use_case.execute(
+            product=self.book2,
+            user=None,
+            coupon_code=[],
+            include_available_coupons=False,
+        )
+        self.assertEqual(available_coupons, [])
+        self.assertEqual(price_res.discounted, Decimal("22000.00"))
+        mock_coupon_service.get_applicable_coupons.assert_not_called()
@@ -0,0 +1,214 @@
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.db.models.signals import post_save
+from django.test import (
+    TestCase,
+    override_settings,
+)
+from django.utils import timezone
+
+from apps.container import container
+from apps.pricing.application.use_case.calculate_price_use_case import CalculatePriceUseCase
+from apps.pricing.application.use_case.refresh_lowest_prices_use_case import RefreshLowestPricesUseCase
+from apps.pricing.domain.value_objects import (
+    CouponStatus,
+    DiscountType,
+    TargetType,
+)
+from apps.pricing.infrastructure import lowest_price_refresh
+from apps.pricing.infrastructure.persistence.models import (
+    Coupon as CouponModel,
+    DiscountPolicy as DiscountPolicyModel,
+    DiscountTarget as DiscountTargetModel,
+    ProductLowestPrice as ProductLowestPriceModel,
+    Promotion as PromotionModel,
+    User as UserModel,
+)
+from apps.product.domain.value_objects import ProductStatus
+from apps.product.infrastructure.persistence.models import Book as BookModel
+
+
+class RefreshLowestPricesTest(TestCase):
+    def setUp(self):
+        # 준비 데이터는 commit된 것으로 보고 commit 이후 작업까지 실행 (각 테스트의 변경만 따로 확인)
+        with self.captureOnCommitCallbacks(execute=True):
+            self._create_fixtures()
+        self.use_case = container.resolve(RefreshLowestPricesUseCase)
+
+    def _create_fixtures(self):
+        self.now = timezone.now()
+        for code, price in (("BOOK001", "20000.00"), ("BOOK002", "8000.00"), ("BOOK003", "15000.00")):
+            BookModel.objects.create(code=code, name=code, price=Decimal(price), status=ProductStatus.ACTIVE.value)
+        BookModel.objects.create(
+            code="BOOK004", name="품절", price=Decimal("9000.00"), status=ProductStatus.SOLD_OUT.value,
+        )
+
+        # 전체 10% (최소 10,000원), BOOK003 전용 2,000원, 사용자 전용 50% (최저가 계산 대상 아님)
+        self._coupon("ALL10", DiscountType.PERCENTAGE, "0.10", minimum="10000.00")
+        self._coupon("B3FIX2000", DiscountType.FIXED, "2000.00", target_type=TargetType.PRODUCT, product_code="BOOK003",
+                     valid_until=self.now + timedelta(days=1))
+        user = UserModel.objects.create(id=uuid.uuid4(), name="사용자")
+        self._coupon("USER50", DiscountType.PERCENTAGE, "0.50", target_type=TargetType.USER, user=user)
+
+        promotion_policy = self._policy(DiscountType.PERCENTAGE, "0.05")
+        PromotionModel.objects.create(
+            id=uuid.uuid4(), name="전체 5% 할인", status=CouponStatus.ACTIVE.value, is_auto_discount=True,
+            discount_policy=promotion_policy,
+        )
+        DiscountTargetModel.objects.create(id=uuid.uuid4(), discount_policy=promotion_policy, apply_priority=1)
+
+    def _policy(self, discount_type, value, target_type=TargetType.ALL, minimum="0"):
+        return DiscountPolicyModel.objects.create(
+            id=uuid.uuid4(),
+            discount_type=discount_type.value,
+            value=Decimal(value),
+            target_type=target_type.value,
+            minimum_purchase_amount=Decimal(minimum),
+            effective_start_at=self.now - timedelta(days=1),
+            effective_end_at=self.now + timedelta(days=30),
+        )
+
+    def _coupon(self, code, discount_type, value, target_type=TargetType.ALL, product_code=None, user=None,
+                minimum="0", valid_until=None, starts_at=None):
+        policy = self._policy(discount_type, value, target_type, minimum)
+        if starts_at is not None:
+            policy.effective_start_at = starts_at
+            policy.save()
+        if target_type is not TargetType.ALL:
+            DiscountTargetModel.objects.create(
+                id=uuid.uuid4(), discount_policy=policy, target_product_code_id=product_code, target_user=user,
+                apply_priority=0,
+            )
+        return CouponModel.objects.create(
+            id=uuid.uuid4(), code=code, name=code, valid_until=valid_until or self.now + timedelta(days=7),
+            status=CouponStatus.ACTIVE.value, discount_policy=policy,
+        )
+
+    def _stored(self):
+        return {row.book_code_id: row for row in ProductLowestPriceModel.objects.all()}
+
+    def test_lowest_price_per_book(self):
+        self.assertEqual(self.use_case.execute(reference_time=self.now), 3)
+
+        stored = self._stored()
+        self.assertEqual(set(stored), {"BOOK001", "BOOK002", "BOOK003"})
+        # 20,000 * 0.95 * 0.9 = 17,100
+        self.assertEqual(stored["BOOK001"].lowest_price, Decimal("17100.00"))
+        self.assertEqual(stored["BOOK001"].applied_policies, ["ALL10", "전체 5% 할인"])
+        self.assertEqual(stored["BOOK001"].valid_until, self.now + timedelta(days=7))
+        # BOOK002: 최소 구매 금액 미달로 프로모션만 (8,000 * 0.95)
+        self.assertEqual(stored["BOOK002"].lowest_price, Decimal("7600.00"))
+        self.assertIsNone(stored["BOOK002"].valid_until)
+        # BOOK003: 15,000 * 0.95 * 0.9 - 2,000 = 10,825 (정률 → 정액), 전용 쿠폰이 먼저 끝남
+        self.assertEqual(stored["BOOK003"].lowest_price, Decimal("10825.00"))
+        self.assertEqual(stored["BOOK003"].valid_until, self.now + timedelta(days=1))
+
+        # 쿠폰 전체 적용(best_price) 결과와 같아야 함
+        calculate = container.resolve(CalculatePriceUseCase)
+        for code, row in stored.items():
+            with self.subTest(code=code):
+                _, _, price_result = calculate.execute(product=calculate.fetch(code), best_price=True)
+                self.assertEqual(row.lowest_price, price_result.discounted)
+
+    def test_refresh_only_given_codes(self):
+        self.use_case.execute(reference_time=self.now)
+        ProductLowestPriceModel.objects.filter(pk="BOOK002").update(lowest_price=Decimal("1.00"))
+        BookModel.objects.filter(code="BOOK003").update(status=ProductStatus.SOLD_OUT.value)
+
+        self.assertEqual(self.use_case.execute(["BOOK003"], reference_time=self.now), 0)
+
+        stored = self._stored()
+        self.assertNotIn("BOOK003", stored)                             # 판매 중이 아니면 삭제
+        self.assertEqual(stored["BOOK002"].lowest_price, Decimal("1.00"))   # 대상이 아닌 상품은 그대로
+
+    def test_signals_refresh_affected_books(self):
+        self.use_case.execute(reference_time=self.now)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self._coupon(
+                "B2FIX500", DiscountType.FIXED, "500.00", target_type=TargetType.PRODUCT, product_code="BOOK002",
+            )
+        self.assertEqual(self._stored()["BOOK002"].lowest_price, Decimal("7100.00"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            book = BookModel.objects.get(code="BOOK002")
+            book.price = Decimal("12000.00")
+            book.save()
+        # 12,000 * 0.95 * 0.9 - 500 = 9,760 (최소 구매 금액 충족)
+        self.assertEqual(self._stored()["BOOK002"].lowest_price, Decimal("9760.00"))
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self._coupon("USER10", DiscountType.PERCENTAGE, "0.10", target_type=TargetType.USER,
+                         user=UserModel.objects.get())
+        # 사용자 대상 쿠폰은 캐시 무효화만
+        self.assertFalse(any("lowest" in repr(callback) for callback in callbacks))
+
+    def test_one_refresh_per_transaction(self):
+        with mock.patch.object(RefreshLowestPricesUseCase, "execute") as execute:
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                self._coupon(
+                    "B2FIX500", DiscountType.FIXED, "500.00", target_type=TargetType.PRODUCT, product_code="BOOK002",
+                )
+                self._coupon(
+                    "B3FIX500", DiscountType.FIXED, "500.00", target_type=TargetType.PRODUCT, product_code="BOOK003",
+                )
+                BookModel.objects.filter(code="BOOK001").get().save()
+
+        self.assertEqual(len([c for c in callbacks if isinstance(c, lowest_price_refresh._PendingRefresh)]), 1)
+        execute.assert_called_once_with(["BOOK001", "BOOK002", "BOOK003"])
+
+    def test_raw_save_skips_refresh(self):
+        # loaddata(raw=True)는 적재 후 명령으로 한 번에 계산
+        coupon = CouponModel.objects.get(code="ALL10")
+        with self.captureOnCommitCallbacks() as callbacks:
+            post_save.send(sender=CouponModel, instance=coupon, created=False, raw=True, using="default")
+        self.assertFalse(any(isinstance(c, lowest_price_refresh._PendingRefresh) for c in callbacks))
+
+    @override_settings(LOWEST_PRICE_REFRESH_IN_BACKGROUND=True)
+    def test_full_refresh_runs_in_background_once(self):
+        executor = mock.Mock()
+        with mock.patch.object(lowest_price_refresh, "_executor", executor), \
+                mock.patch.object(lowest_price_refresh, "_full_queued", False), \
+                mock.patch.object(RefreshLowestPricesUseCase, "execute") as execute:
+            for code in ("ALL5", "ALL7"):
+                with self.captureOnCommitCallbacks(execute=True):
+                    self._coupon(code, DiscountType.PERCENTAGE, "0.05")
+
+        # 요청 스레드에서는 계산하지 않고, 시작 전인 전체 재계산이 있으면 합침
+        execute.assert_not_called()
+        executor.submit.assert_called_once_with(lowest_price_refresh._run_full)
+
+    def test_future_coupon_bounds_stored_rows(self):
+        self.use_case.execute(reference_time=self.now)
+        starts_at = self.now + timedelta(days=2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self._coupon("SOON20", DiscountType.PERCENTAGE, "0.20", starts_at=starts_at)
+
+        # 시작 시각에 행이 만료되어 그 전 결과로 응답하지 않음 (BOOK002는 적용 쿠폰이 없어도 시작 시각까지)
+        stored = self._stored()
+        self.assertEqual(stored["BOOK002"].valid_until, starts_at)
+        self.assertEqual(stored["BOOK003"].valid_until, self.now + timedelta(days=1))
+
+        with override_settings(LOWEST_PRICE_REFRESH_IN_BACKGROUND=True), \
+                mock.patch.object(lowest_price_refresh, "_timers", {}), \
+                mock.patch.object(lowest_price_refresh, "_executor", mock.Mock()), \
+                mock.patch("apps.pricing.infrastructure.lowest_price_refresh.threading.Timer") as timer:
+            with self.captureOnCommitCallbacks(execute=True):
+                self._coupon("SOON30", DiscountType.PERCENTAGE, "0.30", starts_at=starts_at)
+        delay, _ = timer.call_args.args[:2]
+        self.assertAlmostEqual(delay, timedelta(days=2).total_seconds(), delta=60)
+        timer.return_value.start.assert_called_once()
+
+    def test_command(self):
+        stdout = StringIO()
+        call_command("refresh_lowest_prices", stdout=stdout)
+        self.assertIn("3권", stdout.getvalue())
+
+        call_command("refresh_lowest_prices", "BOOK001", stdout=stdout)
+        self.assertEqual(ProductLowestPriceModel.objects.count(), 3)
@@ -0,0 +1,132 @@
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.container import container
+from apps.pricing.application.use_case.calculate_price_use_case import CalculatePriceUseCase
+from apps.pricing.application.use_case.simulate_discount_use_case import SimulateDiscountUseCase
+from apps.pricing.domain.entity.simulation import DraftDiscount
+from apps.pricing.domain.policy.discount_policy import build_discount_policy
+from apps.pricing.domain.value_objects import (
+    CouponStatus,
+    DiscountType,
+    DraftKind,
+    TargetType,
+)
+from apps.pricing.infrastructure.persistence.models import (
+    DiscountPolicy as DiscountPolicyModel,
+    DiscountTarget as DiscountTargetModel,
+    Promotion as PromotionModel,
+)
+from apps.product.domain.value_objects import ProductStatus
+from apps.product.infrastructure.persistence.models import Book as BookModel
+
+
+class SimulateDiscountUseCaseTest(TestCase):
+    def setUp(self):
+        self.now = timezone.now()
+        books = (("BOOK001", "20000.00"), ("BOOK002", "8000.00"), ("BOOK003", "15000.00"), ("BOOK005", "15000.00"))
+        for code, price in books:
+            BookModel.objects.create(code=code, name=code, price=Decimal(price), status=ProductStatus.ACTIVE.value)
+        BookModel.objects.create(
+            code="BOOK004", name="품절", price=Decimal("9000.00"), status=ProductStatus.SOLD_OUT.value,
+        )
+        self._promotion("BOOK001 5% 할인", DiscountType.PERCENTAGE, "0.05", product_codes=["BOOK001"], priority=1)
+        self.use_case = container.resolve(SimulateDiscountUseCase)
+
+    def _promotion(self, name, discount_type, value, product_codes=None, priority=0):
+        policy = DiscountPolicyModel.objects.create(
+            id=uuid.uuid4(),
+            discount_type=discount_type.value,
+            value=Decimal(value),
+            target_type=TargetType.ALL.value,
+            effective_start_at=self.now - timedelta(days=1),
+            effective_end_at=self.now + timedelta(days=30),
+        )
+        PromotionModel.objects.create(
+            id=uuid.uuid4(), name=name, status=CouponStatus.ACTIVE.value, is_auto_discount=True, discount_policy=policy,
+        )
+        for code in product_codes or [None]:
+            DiscountTargetModel.objects.create(
+                id=uuid.uuid4(), discount_policy=policy, target_product_code_id=code, apply_priority=priority,
+            )
+
+    def _draft(self, kind, discount_type, value, **kwargs):
+        return DraftDiscount(
+            kind=kind.value,
+            name="초안",
+            discount_policy=build_discount_policy(discount_type.value, Decimal(value)),
+            **kwargs,
+        )
+
+    def _live_prices(self):
+        use_case = container.resolve(CalculatePriceUseCase)
+        return {
+            code: use_case.execute(product=use_case.fetch(code))[2].discounted
+            for code in ("BOOK001", "BOOK002", "BOOK003", "BOOK005")
+        }
+
+    def test_promotion_draft_matches_prices_after_saving(self):
+        before = self._live_prices()
+        result = self.use_case.execute(
+            self._draft(DraftKind.PROMOTION, DiscountType.PERCENTAGE, "0.10", apply_priority=0),
+            reference_time=self.now,
+            limit=10,
+        )
+
+        # 판매 중인 상품만 대상, 초안은 DB에 저장되지 않음
+        self.assertEqual(result.total_books, 4)
+        self.assertEqual(PromotionModel.objects.count(), 1)
+        self.assertEqual(result.baseline_total, sum(before.values()))
+
+        # 초안을 실제로 저장했을 때의 가격과 같아야 함
+        with self.captureOnCommitCallbacks(execute=True):
+            self._promotion("초안", DiscountType.PERCENTAGE, "0.10", priority=0)
+        after = self._live_prices()
+        scenario = dict(before, **{row.code: row.scenario for row in result.deltas})
+        self.assertEqual(scenario, after)
+        self.assertEqual(result.scenario_total, sum(after.values()))
+        self.assertEqual(result.affected_books, sum(1 for code in before if before[code] != after[code]))
+
+        # BOOK001: 19,000(5%) → 18,000(10%, 우선순위 0), BOOK001 전용 프로모션은 다른 상품에 적용되지 않음
+        deltas = {row.code: row.delta for row in result.deltas}
+        self.assertEqual(deltas["BOOK001"], Decimal("-1000"))
+        self.assertEqual(deltas["BOOK003"], Decimal("-1500"))
+
+    def test_coupon_draft_applies_on_top_of_promotion(self):
+        result = self.use_case.execute(
+            self._draft(
+                DraftKind.COUPON, DiscountType.FIXED, "1000.00",
+                target_product_codes=("BOOK001", "BOOK003", "BOOK004"),
+                minimum_purchase_amount=Decimal("10000.00"),
+            ),
+            reference_time=self.now,
+        )
+
+        # 품절(BOOK004), 대상 아님(BOOK002, BOOK005)은 변동 없음
+        self.assertEqual([row.code for row in result.deltas], ["BOOK001", "BOOK003"])
+        self.assertEqual([row.delta for row in result.deltas], [Decimal("-1000.00")] * 2)
+        self.assertEqual(result.deltas[0].scenario, Decimal("18000.00"))     # 20,000 * 0.95 - 1,000
+        self.assertEqual(result.discount_change, Decimal("2000.00"))
+
+    def test_histogram_and_limit(self):
+        result = self.use_case.execute(
+            self._draft(DraftKind.COUPON, DiscountType.FIXED, "6000.00", target_product_codes=("BOOK003", "BOOK005")),
+            reference_time=self.now,
+            bucket_size=Decimal("10000"),
+            limit=1,
+        )
+
+        self.assertEqual(result.affected_books, 2)
+        self.assertEqual([row.code for row in result.deltas], ["BOOK003"])
+        # 15,000 → 9,000: 10,000~20,000 구간에서 0~10,000 구간으로 이동
+        self.assertEqual(
+            [(b.lower, b.upper, b.baseline_count, b.scenario_count) for b in result.buckets],
+            [
+                (Decimal("0"), Decimal("10000"), 1, 3),
+                (Decimal("10000"), Decimal("20000"), 3, 1),
+            ],
+        )
@@ -0,0 +1,116 @@
+import asyncio
+from typing import (
+    List,
+    Optional,
+    Tuple,
+)
+
+from django.utils import timezone
+
+from apps.pricing.application.services.coupon_service import CouponService
+from apps.pricing.application.services.promotion_service import PromotionService
+from apps.pricing.application.use_case.calculate_price_use_case import (
+    apply_best_coupons,
+    apply_coupons,
+    filter_available_coupons,
+)
+from apps.pricing.domain.entity.coupon import Coupon as CouponEntity
+from apps.pricing.domain.entity.issued_coupon import with_wallet
+from apps.pricing.domain.entity.price_result import PriceResult as PriceResultEntity
+from apps.pricing.domain.repositories.coupon_repository import AsyncCouponRepository
+from apps.pricing.domain.repositories.promotion_repository import AsyncPromotionRepository
+from apps.product.domain.entity import Product as ProductEntity
+from apps.product.domain.repository import AsyncProductRepository
+from apps.product.domain.value_objects import ProductStatus
+
+from apps.utils.exceptions import NotFoundException
+
+
+class AsyncCalculatePriceUseCase:
+    def __init__(
+        self,
+        product_repo: AsyncProductRepository,
+        coupon_repo: AsyncCouponRepository,
+        promotion_repo: AsyncPromotionRepository,
+    ):
+        self._product_repo = product_repo
+        self._coupon_repo = coupon_repo
+        self._promotion_repo = promotion_repo
+
+    async def execute(
+        self,
+        code: str,
+        user=None,
+        coupon_code: Optional[List[str]] = None,
+        include_available_coupons: bool = True,
+        best_price: bool = False,
+    ) -> Tuple[List[CouponEntity], List[str], PriceResultEntity]:
+        """
+        CalculatePriceUseCase의 fetch → validate → execute를 한 번에 수행 (결과 동일)
+        상품/프로모션/쿠폰 조회는 서로의 결과가 필요 없으므로 동시에 기다리고, 계산은 모두 끝난 뒤 수행
+        """
+        coupon_code = list(coupon_code or [])
+        scan_all = include_available_coupons or (best_price and not coupon_code)
+        load_available = scan_all or bool(coupon_code)
+
+        # 분야/출판사/도서 타입 대상 판정에는 상품 속성이 필요하므로 프로모션은 색인만 함께 읽고 상품 조회 후 선택
+        now = timezone.now()
+        product, promotion_index, candidates, issued, requested = await asyncio.gather(
+            self._product_repo.get_product_by_code(code),
+            self._promotion_repo.get_promotion_index(),
+            self._coupon_repo.list_active_not_expired(
+                now,
+                coupon_code=None if scan_all else coupon_code,
+            ) if load_available else asyncio.sleep(0, result=[]),
+            self._coupon_repo.list_issued_coupons(
+                user.id,
+                now,
+                coupon_code=None if scan_all else coupon_code,
+            ) if load_available and user is not None else asyncio.sleep(0, result=[]),
+            self._coupon_repo.get_coupons_by_code(
+                coupon_code=coupon_code,
+                is_valid=True,
+            ) if coupon_code else asyncio.sleep(0, result=[]),
+        )
+        self._validate(product, code, coupon_code, requested)
+
+        available_coupons = filter_available_coupons(
+            CouponService.select_applicable(with_wallet(candidates, issued), user, product.code),
+            product, user, product.price,
+        )
+        promotions = promotion_index.promotions_for(product.code, user.id if user else None, product.attributes)
+        auto_discount_result, has_promotion, promotion_name = PromotionService.apply_promotions(
+            promotions, product.price,
+        )
+
+        if not coupon_code and not has_promotion and not best_price:
+            return available_coupons, [], auto_discount_result
+
+        if best_price:
+            price_result, applied_coupons = apply_best_coupons(
+                product, user, auto_discount_result, available_coupons, set(coupon_code),
+            )
+        else:
+            price_result, applied_coupons = apply_coupons(
+                product, user, auto_discount_result, available_coupons,
+                # 요청된 쿠폰만 로드한 경우 이미 읽어온 쿠폰을 그대로 적용
+                coupons_to_apply=requested if include_available_coupons else available_coupons,
+            )
+        if has_promotion:
+            applied_coupons.append(promotion_name)
+
+        return available_coupons, applied_coupons, price_result
+
+    @staticmethod
+    def _validate(
+        product: Optional[ProductEntity],
+        code: str,
+        coupon_code: List[str],
+        requested: List[CouponEntity],
+    ) -> None:
+        if not product:
+            raise NotFoundException(f"해당 코드({code})의 상품이 존재하지 않습니다.")
+        if product.status != ProductStatus.ACTIVE.value:
+            raise NotFoundException(f"해당 코드({product.code})의 상품은 현재 비활성 상태입니다.")
+        if coupon_code and not requested:
+            raise NotFoundException(f"해당 코드({coupon_code})의 쿠폰이 존재하지 않습니다.")
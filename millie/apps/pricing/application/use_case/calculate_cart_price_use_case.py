@@ -0,0 +1,147 @@
+from decimal import Decimal
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from django.utils import timezone
+
+from apps.pricing.application.services.promotion_service import PromotionService
+from apps.pricing.domain.entity.cart import (
+    CartItem,
+    CartLine,
+    CartPriceResult,
+)
+from apps.pricing.domain.entity.coupon import Coupon as CouponEntity
+from apps.pricing.domain.entity.issued_coupon import with_wallet
+from apps.pricing.domain.entity.rule_snapshot import RuleSnapshot
+from apps.pricing.domain.policy.allocation import allocate
+from apps.pricing.domain.repositories.coupon_repository import CouponRepository
+from apps.pricing.domain.repositories.rule_snapshot_repository import RuleSnapshotRepository
+from apps.product.domain.entity import Product as ProductEntity
+from apps.product.domain.repository import ProductRepository
+from apps.product.domain.value_objects import ProductStatus
+from apps.utils.exceptions import NotFoundException
+
+
+class CalculateCartPriceUseCase:
+    def __init__(
+        self,
+        product_repo: ProductRepository,
+        rule_snapshot_repo: RuleSnapshotRepository,
+        coupon_repo: CouponRepository,
+    ):
+        self._product_repo = product_repo
+        self._rule_snapshot_repo = rule_snapshot_repo
+        self._coupon_repo = coupon_repo
+
+    def execute(
+        self,
+        items: List[CartItem],
+        user=None,
+        coupon_code: Optional[List[str]] = None,
+    ) -> CartPriceResult:
+        """
+        장바구니 전체 가격 계산 (상품 일괄 조회 1회 + 규칙 스냅샷 1회 + 로그인 시 지갑 1회, 상품별 추가 조회 없음)
+        - 프로모션: 상품별로 CalculatePriceUseCase와 같은 기준(우선순위 첫 번째)으로 단가에 적용 후 수량만큼
+        - 쿠폰: 쿠폰 적용 API와 같은 순서(쿠폰 저장소 조회 순)로 장바구니 단위로 한 번씩 적용
+            - 대상 상품(coupon.is_available) 정가 합계가 minimum_purchase_amount 이상일 때만 적용
+            - 할인액은 대상 상품의 현재 금액 합계에 정책을 적용해 구하고, 라인별 현재 금액 비율로 배분
+        """
+        items = self._merge(items)
+        products = self._fetch(items)
+        now = timezone.now()
+        rules = self._rule_snapshot_repo.load(now)
+        coupons = list(rules.coupons)
+        if user is not None and coupon_code:
+            # 개별 발급 쿠폰은 보유자 기준으로 교체
+            issued = self._coupon_repo.list_issued_coupons(user.id, now, coupon_code=list(coupon_code))
+            coupons = with_wallet(coupons, issued)
+        coupons, rejected = self._requested_coupons(coupons, coupon_code or [], self._coupon_repo)
+
+        user_id = user.id if user else None
+        lines = [self._price_line(rules, products[item.product_code], item.quantity, user_id) for item in items]
+
+        applied: List[str] = []
+        for coupon in coupons:
+            if self._apply_coupon(lines, coupon, user):
+                applied.append(coupon.name)
+            else:
+                rejected.append(coupon.code)
+
+        return CartPriceResult(lines=lines, applied_coupons=applied, rejected_coupons=rejected)
+
+    @staticmethod
+    def _merge(items: List[CartItem]) -> List[CartItem]:
+        # 같은 상품은 수량을 합쳐 한 라인으로 (처음 나온 순서 유지)
+        quantities: Dict[str, int] = {}
+        for item in items:
+            quantities[item.product_code] = quantities.get(item.product_code, 0) + item.quantity
+        return [CartItem(product_code=code, quantity=quantity) for code, quantity in quantities.items()]
+
+    def _fetch(self, items: List[CartItem]) -> Dict[str, ProductEntity]:
+        codes = [item.product_code for item in items]
+        products = {product.code: product for product in self._product_repo.get_products_by_codes(codes)}
+
+        missing = [code for code in codes if code not in products]
+        if missing:
+            raise NotFoundException(f"해당 코드({', '.join(missing)})의 상품이 존재하지 않습니다.")
+        inactive = [code for code in codes if products[code].status != ProductStatus.ACTIVE.value]
+        if inactive:
+            raise NotFoundException(f"해당 코드({', '.join(inactive)})의 상품은 현재 비활성 상태입니다.")
+        return products
+
+    @staticmethod
+    def _requested_coupons(
+        coupons: List[CouponEntity],
+        coupon_code: List[str],
+        coupon_repo: CouponRepository,
+    ) -> Tuple[List[CouponEntity], List[str]]:
+        if not coupon_code:
+            return [], []
+
+        requested = set(coupon_code)
+        coupons = [coupon for coupon in coupons if coupon.code in requested]
+        if not coupons:
+            # 발급용 쿠폰은 보유자의 지갑에서만 조회되므로, 보유하지 않은 사용자에게는 없는 쿠폰이 아닌 적용 불가로 응답
+            if not coupon_repo.get_coupons_by_code(list(requested)):
+                raise NotFoundException(f"해당 코드({coupon_code})의 쿠폰이 존재하지 않습니다.")
+            return [], list(dict.fromkeys(coupon_code))
+        found = {coupon.code for coupon in coupons}
+        return coupons, [code for code in dict.fromkeys(coupon_code) if code not in found]
+
+    @staticmethod
+    def _price_line(rules: RuleSnapshot, product: ProductEntity, quantity: int, user_id) -> CartLine:
+        result, has_promotion, promotion_name = PromotionService.apply_promotions(
+            rules.promotions_for(product.code, user_id, product.attributes), product.price,
+        )
+        original = product.price * quantity
+        discounted = result.discounted * quantity
+        return CartLine(
+            product_code=product.code,
+            name=product.name,
+            quantity=quantity,
+            unit_price=product.price,
+            original=original,
+            discounted=discounted,
+            promotion_discount=original - discounted,
+            promotion=promotion_name if has_promotion else None,
+        )
+
+    @staticmethod
+    def _apply_coupon(lines: List[CartLine], coupon: CouponEntity, user) -> bool:
+        eligible = [line for line in lines if coupon.is_available(user, line.product_code)]
+        if not eligible:
+            return False
+        if sum((line.original for line in eligible), Decimal("0")) < coupon.minimum_purchase_amount:
+            return False
+
+        weights = [line.discounted for line in eligible]
+        amount = coupon.to_discount_policy().apply(sum(weights, Decimal("0"))).discount_amount
+        for line, share in zip(eligible, allocate(amount, weights)):
+            line.discounted -= share
+            line.coupon_discount += share
+            line.coupons.append(coupon.name)
+        return True
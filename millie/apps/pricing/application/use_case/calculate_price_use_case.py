@@ -10,11 +10,25 @@ from apps.pricing.application.services.promotion_service import PromotionService
 from apps.product.domain.entity import Product as ProductEntity
 from apps.pricing.domain.entity.coupon import Coupon as CouponEntity
 from apps.pricing.domain.entity.price_result import PriceResult as PriceResultEntity
+from apps.pricing.domain.policy.coupon_stacking import best_coupon_order
 from apps.pricing.domain.policy.discount_policy import DiscountPolicy
-from apps.product.domain.value_objects import ProductStatus
+from apps.product.domain.value_objects import (
+    ProductAttributes,
+    ProductStatus,
+)
 from apps.product.domain.repository import ProductRepository
 
+from apps.utils.concurrency import fan_out
 from apps.utils.exceptions import NotFoundException
+from apps.utils.singleflight import (
+    SingleFlight,
+    user_key,
+)
+
+
+# 같은 상품/쿠폰/사용자 조합의 가격 계산을 동시에 요청하면 한 번만 계산 (프로세스 단위)
+# 상품/가격 규칙이 바뀌면(상품·가격 캐시의 cache_versions 버전) 다른 키로 계산
+_price_flight = SingleFlight("calculate-price", stamps=("product", "pricing"))
 
 
 class CalculatePriceUseCase:
@@ -80,23 +94,78 @@ class CalculatePriceUseCase:
         product: ProductEntity,
         user=None,
         coupon_code: Optional[List[str]] = None,
+        include_available_coupons: bool = True,
+        best_price: bool = False,
+        attributes: Optional[ProductAttributes] = None,
+    ) -> Tuple[List[CouponEntity], List[CouponEntity], PriceResultEntity]:
+        """
+        include_available_coupons=False이면 전체 적용 가능 쿠폰 스캔을 생략하고,
+        요청된 쿠폰만 로드하여 적용 가능 여부를 판단 (반환되는 available_coupons도 요청된 쿠폰 중 적용 가능한 것만)
+        best_price=True이면 요청 순서 대신 최종 가격이 가장 낮은 쿠폰 조합/순서로 적용
+        (coupon_code가 없으면 적용 가능한 전체 쿠폰 중에서 선택)
+        attributes: 분야/출판사/도서 타입 대상 프로모션 판정용, 미지정이면 상품 엔티티의 연관 정보 기준
+        """
+        key = _price_flight.key(
+            product.code,
+            product.price,
+            user_key(user),
+            sorted(map(str, coupon_code or [])),
+            include_available_coupons,
+            best_price,
+        )
+        return _price_flight.do(
+            key,
+            lambda: self._execute(product, user, coupon_code, include_available_coupons, best_price, attributes),
+        )
+
+    def _execute(
+        self,
+        product: ProductEntity,
+        user=None,
+        coupon_code: Optional[List[str]] = None,
+        include_available_coupons: bool = True,
+        best_price: bool = False,
+        attributes: Optional[ProductAttributes] = None,
     ) -> Tuple[List[CouponEntity], List[CouponEntity], PriceResultEntity]:
         base_price = product.price
 
-        available_coupons = self._filter_available_coupons(product, user, base_price)
-        auto_discount_result, has_promotion, promotion_name = self._promotion_service.apply_policy(
-            product_code=product.code,
-            original_price=base_price,
-            user=user,
-        )
+        def load_promotion():
+            return self._promotion_service.apply_policy(
+                product_code=product.code,
+                original_price=base_price,
+                user=user,
+                attributes=attributes if attributes is not None else product.attributes,
+            )
+
+        # 쿠폰 스캔과 프로모션 조회는 서로 독립적이므로 동시에 실행 (USE_CASE_FAN_OUT)
+        if include_available_coupons or (best_price and not coupon_code):
+            available_coupons, promotion = fan_out(
+                lambda: self._filter_available_coupons(product, user, base_price),
+                load_promotion,
+            )
+        elif coupon_code:
+            available_coupons, promotion = fan_out(
+                lambda: self._filter_available_coupons(product, user, base_price, coupon_code=list(coupon_code)),
+                load_promotion,
+            )
+        else:
+            available_coupons, promotion = [], load_promotion()
+        auto_discount_result, has_promotion, promotion_name = promotion
         applied_codes = set(coupon_code) if coupon_code else set()
 
-        if not coupon_code and not has_promotion:
+        if not coupon_code and not has_promotion and not best_price:
             return available_coupons, [], auto_discount_result
 
-        price_result, applied_coupons = self._calculate_price_with_coupons(
-            product, user, auto_discount_result, available_coupons, applied_codes
-        )
+        if best_price:
+            price_result, applied_coupons = apply_best_coupons(
+                product, user, auto_discount_result, available_coupons, applied_codes,
+            )
+        else:
+            price_result, applied_coupons = self._calculate_price_with_coupons(
+                product, user, auto_discount_result, available_coupons, applied_codes,
+                # 요청된 쿠폰만 로드한 경우 이미 읽어온 쿠폰을 그대로 적용 (재조회 생략)
+                coupons_to_apply=None if include_available_coupons else available_coupons,
+            )
         if has_promotion:
             applied_coupons.append(promotion_name)
 
@@ -108,21 +177,14 @@ class CalculatePriceUseCase:
         product_entity: ProductEntity,
         user,
         base_price: Decimal,
+        coupon_code: Optional[List[str]] = None,
     ) -> List[CouponEntity]:
         raw_list = self._coupon_service.get_applicable_coupons(
             product_code=product_entity.code,
             user=user,
+            coupon_code=coupon_code,
         ) or []
-
-        filtered: List[CouponEntity] = []
-        for coupon in raw_list:
-            if base_price < coupon.minimum_purchase_amount:
-                continue
-            if not coupon.is_available(user, product_entity.code):
-                continue
-            filtered.append(coupon)
-
-        return filtered
+        return filter_available_coupons(raw_list, product_entity, user, base_price)
 
     def _calculate_price_with_coupons(
         self,
@@ -131,33 +193,80 @@ class CalculatePriceUseCase:
         initial_result: PriceResultEntity,
         available_coupons: List[CouponEntity],
         applied_codes: set,
+        coupons_to_apply: Optional[List[CouponEntity]] = None,
     ) -> Tuple[PriceResultEntity, List[str]]:
-        allowed_code_set = {c.code for c in available_coupons}
-        coupons_to_apply = self._coupon_service.get_coupons_by_code(list(applied_codes)) or []
-
-        final_price = initial_result.discounted
-        total_discount_amount = initial_result.discount_amount
-        accumulated_types: List[str] = list(initial_result.discount_types)
-
-        applied_coupons: List[CouponEntity] = []
-        for coupon in coupons_to_apply:
-            if coupon.code not in allowed_code_set:
-                continue
-            if not coupon.is_available(user, product_entity.code):
-                continue
-            applied_coupons.append(coupon.name)
-            policy: DiscountPolicy = coupon.to_discount_policy()
-            result = policy.apply(final_price)
-
-            total_discount_amount += (final_price - result.discounted)
-            final_price = result.discounted
-            accumulated_types.extend(result.discount_types)
-
-        unique_types = list(dict.fromkeys(accumulated_types))
-
-        return PriceResultEntity(
-            original=initial_result.original,
-            discounted=final_price,
-            discount_amount=total_discount_amount,
-            discount_types=unique_types,
-        ), applied_coupons
+        if coupons_to_apply is None:
+            coupons_to_apply = self._coupon_service.get_coupons_by_code(list(applied_codes)) or []
+        return apply_coupons(product_entity, user, initial_result, available_coupons, coupons_to_apply)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 조회가 끝난 데이터로만 계산 (동기/비동기 use case 공통)
+# ──────────────────────────────────────────────────────────────────────────────
+def filter_available_coupons(
+    raw_list: List[CouponEntity],
+    product_entity: ProductEntity,
+    user,
+    base_price: Decimal,
+) -> List[CouponEntity]:
+    filtered: List[CouponEntity] = []
+    for coupon in raw_list:
+        if base_price < coupon.minimum_purchase_amount:
+            continue
+        if not coupon.is_available(user, product_entity.code):
+            continue
+        filtered.append(coupon)
+
+    return filtered
+
+
+def apply_coupons(
+    product_entity: ProductEntity,
+    user,
+    initial_result: PriceResultEntity,
+    available_coupons: List[CouponEntity],
+    coupons_to_apply: List[CouponEntity],
+) -> Tuple[PriceResultEntity, List[str]]:
+    # 적용 가능 쿠폰 쪽(지갑 쿠폰이면 보유자 기준)으로 적용
+    allowed_by_id = {c.id: c for c in available_coupons}
+
+    final_price = initial_result.discounted
+    total_discount_amount = initial_result.discount_amount
+    accumulated_types: List[str] = list(initial_result.discount_types)
+
+    applied_coupons: List[CouponEntity] = []
+    for requested in coupons_to_apply:
+        coupon = allowed_by_id.get(requested.id)
+        if coupon is None:
+            continue
+        if not coupon.is_available(user, product_entity.code):
+            continue
+        applied_coupons.append(coupon.name)
+        policy: DiscountPolicy = coupon.to_discount_policy()
+        result = policy.apply(final_price)
+
+        total_discount_amount += (final_price - result.discounted)
+        final_price = result.discounted
+        accumulated_types.extend(result.discount_types)
+
+    unique_types = list(dict.fromkeys(accumulated_types))
+
+    return PriceResultEntity(
+        original=initial_result.original,
+        discounted=final_price,
+        discount_amount=total_discount_amount,
+        discount_types=unique_types,
+    ), applied_coupons
+
+
+def apply_best_coupons(
+    product_entity: ProductEntity,
+    user,
+    initial_result: PriceResultEntity,
+    available_coupons: List[CouponEntity],
+    applied_codes: set,
+) -> Tuple[PriceResultEntity, List[str]]:
+    # 적용 가능한 쿠폰(요청 코드가 있으면 그중에서) 중 최종 가격이 가장 낮은 조합을 그 순서대로 적용
+    candidates = [c for c in available_coupons if not applied_codes or c.code in applied_codes]
+    ordered = best_coupon_order(initial_result.discounted, candidates)
+    return apply_coupons(product_entity, user, initial_result, available_coupons, ordered)
@@ -0,0 +1,19 @@
+from typing import List
+from uuid import UUID
+
+from apps.pricing.application.services.coupon_service import CouponService
+from apps.pricing.domain.entity.issued_coupon import IssuedCoupon as IssuedCouponEntity
+
+
+class GetCouponWalletUseCase:
+    def __init__(
+        self,
+        coupon_service: CouponService,
+    ):
+        self._coupon_service = coupon_service
+
+    def execute(self, user_id: UUID) -> List[IssuedCouponEntity]:
+        """
+        사용자 쿠폰 지갑: 지금 사용할 수 있는 발급 쿠폰 (먼저 끝나는 순, 사용자 색인 조회 1회)
+        """
+        return self._coupon_service.get_wallet(user_id)
@@ -0,0 +1,139 @@
+import time
+from datetime import datetime
+from typing import (
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+from uuid import UUID
+
+from apps.pricing.domain.entity.coupon import Coupon as CouponEntity
+from apps.pricing.domain.entity.issued_coupon import IssueResult
+from apps.pricing.domain.entity.user_segment import SegmentMembers
+from apps.pricing.domain.policy.coupon_code import generate_codes
+from apps.pricing.domain.repositories.coupon_repository import CouponRepository
+from apps.pricing.domain.repositories.issued_coupon_repository import IssuedCouponRepository
+from apps.pricing.domain.repositories.user_segment_repository import UserSegmentRepository
+from apps.pricing.domain.value_objects import TargetType
+from apps.utils.bloom import BloomFilter
+from apps.utils.exceptions import (
+    ConflictException,
+    NotFoundException,
+)
+
+# 저장 중 제약 조건에 걸리면(다른 프로세스와 동시 발급) 해당 batch를 다시 저장하는 최대 횟수
+MAX_BATCH_ATTEMPTS = 3
+
+
+class IssueCouponsUseCase:
+    def __init__(
+        self,
+        coupon_repo: CouponRepository,
+        issued_coupon_repo: IssuedCouponRepository,
+        user_segment_repo: UserSegmentRepository,
+    ):
+        self._coupon_repo = coupon_repo
+        self._issued_coupon_repo = issued_coupon_repo
+        self._user_segment_repo = user_segment_repo
+
+    def execute(
+        self,
+        coupon_code: str,
+        user_ids: Optional[Iterable[UUID]] = None,
+        segment_id: Optional[UUID] = None,
+        valid_until: Optional[datetime] = None,
+        batch_size: int = 10000,
+    ) -> IssueResult:
+        """
+        사용자 대상 쿠폰을 사용자마다 한 장씩 발급 (발급 쿠폰 id는 난수 코드)
+        - 대상: user_ids 또는 세그먼트 회원 (중복 제거), 이미 이 쿠폰을 받은 사용자는 건너뜀 (중단 후 다시 실행 가능)
+        - 코드 중복 검사: 기존 코드와 이번에 만든 코드를 Bloom filter에 넣고, 있을 수 있다고 나오면 다시 생성
+          (DB에 코드별로 조회하지 않음, 메모리는 코드 수 100만 개당 약 1.8MB)
+        - batch_size명씩 한 트랜잭션으로 bulk 저장
+        """
+        started = time.perf_counter()
+        coupon = self._template(coupon_code)
+        recipients = self._recipients(user_ids, segment_id)
+
+        holders = SegmentMembers.from_ids(self._issued_coupon_repo.list_holder_ids(coupon.id))
+        targets = [user_id for user_id in recipients if user_id not in holders] if len(holders) else list(recipients)
+        until = min(valid_until, coupon.valid_until) if valid_until else coupon.valid_until
+
+        issued = regenerated = raced = 0
+        if not targets:
+            return IssueResult(issued=0, skipped=len(recipients), regenerated=0, elapsed=time.perf_counter() - started)
+
+        seen = BloomFilter(self._issued_coupon_repo.count() + len(targets))
+        for issued_coupon_id in self._issued_coupon_repo.iter_issued_coupon_ids():
+            seen.add(issued_coupon_id)
+
+        for start in range(0, len(targets), batch_size):
+            issues, retried = self._assign_codes(seen, targets[start:start + batch_size])
+            regenerated += retried
+            for attempt in range(MAX_BATCH_ATTEMPTS):
+                try:
+                    issued += self._issued_coupon_repo.bulk_issue(coupon.id, issues, until)
+                    break
+                except ConflictException:
+                    if attempt == MAX_BATCH_ATTEMPTS - 1:
+                        raise
+                # 동시에 실행된 발급이 먼저 준 사용자(원본 쿠폰·사용자 unique)는 건너뛰고 나머지는 같은 코드로 다시 저장
+                # 그런 사용자가 없으면 발급 쿠폰 id가 겹친 것이므로 batch 전체를 새 코드로
+                held = set(self._issued_coupon_repo.list_holder_ids(coupon.id, [user_id for user_id, _ in issues]))
+                if held:
+                    remaining = [(user_id, code) for user_id, code in issues if user_id not in held]
+                    raced += len(issues) - len(remaining)
+                    issues = remaining
+                    if not issues:
+                        break
+                else:
+                    issues, retried = self._assign_codes(seen, [user_id for user_id, _ in issues])
+                    regenerated += retried
+
+        return IssueResult(
+            issued=issued,
+            skipped=len(recipients) - len(targets) + raced,
+            regenerated=regenerated,
+            elapsed=time.perf_counter() - started,
+        )
+
+    def _template(self, coupon_code: str) -> CouponEntity:
+        coupons = self._coupon_repo.get_coupons_by_code([coupon_code], is_valid=True)
+        if not coupons:
+            raise NotFoundException(f"해당 코드({coupon_code})의 쿠폰이 존재하지 않습니다.")
+        for coupon in coupons:
+            if coupon.target_type == TargetType.USER.value and coupon.target_user_id is None:
+                return coupon
+        raise ValueError(f"해당 코드({coupon_code})의 쿠폰은 발급용(대상 사용자가 없는 사용자 대상) 쿠폰이 아닙니다.")
+
+    def _recipients(
+        self,
+        user_ids: Optional[Iterable[UUID]],
+        segment_id: Optional[UUID],
+    ) -> SegmentMembers:
+        if segment_id is None:
+            return SegmentMembers.from_ids(user_ids or [])
+
+        segment = self._user_segment_repo.get(segment_id)
+        if segment is None:
+            raise NotFoundException(f"해당 id({segment_id})의 세그먼트가 존재하지 않습니다.")
+        return segment.load_members(segment.id, segment.version)
+
+    @classmethod
+    def _assign_codes(cls, seen: BloomFilter, user_ids: List[UUID]) -> Tuple[List[Tuple[UUID, str]], int]:
+        codes, regenerated = cls._new_codes(seen, len(user_ids))
+        return list(zip(user_ids, codes)), regenerated
+
+    @staticmethod
+    def _new_codes(seen: BloomFilter, count: int) -> Tuple[List[str], int]:
+        # 새 코드 count개와 다시 만든 횟수 (Bloom filter에 없다고 나온 코드만 사용하므로 기존/이번 코드와 겹치지 않음)
+        codes: List[str] = []
+        regenerated = 0
+        while len(codes) < count:
+            for code in generate_codes(count - len(codes)):
+                if seen.add(code):
+                    codes.append(code)
+                else:
+                    regenerated += 1
+        return codes, regenerated
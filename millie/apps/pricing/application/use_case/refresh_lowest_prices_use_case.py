@@ -0,0 +1,102 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from django.utils import timezone
+
+from apps.pricing.application.services.promotion_service import PromotionService
+from apps.pricing.domain.entity.lowest_price import LowestPrice
+from apps.pricing.domain.entity.rule_snapshot import RuleSnapshot
+from apps.pricing.domain.policy.coupon_stacking import best_coupon_order
+from apps.pricing.domain.repositories.lowest_price_repository import LowestPriceRepository
+from apps.pricing.domain.repositories.rule_snapshot_repository import RuleSnapshotRepository
+from apps.pricing.domain.value_objects import TargetType
+from apps.product.domain.repository import ProductRepository
+from apps.product.domain.value_objects import ProductAttributes
+
+
+class RefreshLowestPricesUseCase:
+    def __init__(
+        self,
+        product_repo: ProductRepository,
+        rule_snapshot_repo: RuleSnapshotRepository,
+        lowest_price_repo: LowestPriceRepository,
+    ):
+        self._product_repo = product_repo
+        self._rule_snapshot_repo = rule_snapshot_repo
+        self._lowest_price_repo = lowest_price_repo
+
+    def execute(
+        self,
+        product_codes: Optional[List[str]] = None,
+        reference_time: Optional[datetime] = None,
+    ) -> int:
+        """
+        판매 중인 상품의 최저 구매 가능가를 다시 계산하여 저장 (product_codes가 None이면 전체), 저장한 행 수 반환
+        - 자동할인 프로모션(비로그인 기준) 적용 후, 전체/상품 대상 쿠폰 중 최종 가격이 가장 낮은 조합(best_coupon_order)을 적용
+        - 상품별 결과는 (가격, 적용되는 프로모션과 순서, 그 상품을 직접 대상으로 하는 쿠폰)으로만 달라지므로 같은 조합은 한 번만 계산
+        - 판매 중이 아닌 상품은 행을 지움
+        - 행의 valid_until: 적용한 쿠폰이 끝나거나 새 쿠폰이 시작되는 시각 중 먼저 오는 시각 (이후에는 다시 계산 전까지 사용 안 함)
+        """
+        now = reference_time or timezone.now()
+        rules = self._rule_snapshot_repo.load(now)
+        attributes = self._product_repo.list_active_attributes(product_codes)
+        coupons = rules.public_coupons
+        coupon_indexes: Dict[str, List[int]] = {}
+        for index, coupon in enumerate(coupons):
+            if coupon.target_type == TargetType.PRODUCT.value:
+                coupon_indexes.setdefault(coupon.target_product_code, []).append(index)
+
+        computed: Dict[Tuple, Tuple[Decimal, Tuple[str, ...], Optional[datetime]]] = {}
+        lowest_prices: List[LowestPrice] = []
+        for code, price in self._product_repo.list_active_prices(product_codes):
+            product_attributes = attributes.get(code)
+            key = (price, rules.promotion_key(code, product_attributes), tuple(coupon_indexes.get(code, ())))
+            if key not in computed:
+                computed[key] = self._lowest(rules, code, price, product_attributes)
+            lowest_price, applied, valid_until = computed[key]
+            lowest_prices.append(LowestPrice(
+                product_code=code,
+                price=price,
+                lowest_price=lowest_price,
+                applied_policies=applied,
+                computed_at=now,
+                valid_until=valid_until,
+            ))
+
+        self._lowest_price_repo.replace(lowest_prices, product_codes)
+        return len(lowest_prices)
+
+    @staticmethod
+    def _lowest(
+        rules: RuleSnapshot,
+        code: str,
+        price: Decimal,
+        attributes: Optional[ProductAttributes],
+    ) -> Tuple[Decimal, Tuple[str, ...], Optional[datetime]]:
+        promotion_result, has_promotion, promotion_name = PromotionService.apply_promotions(
+            rules.promotions_for(code, None, attributes), price,
+        )
+
+        # 최소 구매 금액은 정가 기준 (filter_available_coupons와 동일)
+        candidates = [
+            coupon for coupon in rules.public_coupons
+            if (coupon.target_type == TargetType.ALL.value or coupon.target_product_code == code)
+            and price >= coupon.minimum_purchase_amount
+        ]
+        lowest = promotion_result.discounted
+        ordered = best_coupon_order(lowest, candidates)
+        for coupon in ordered:
+            lowest = coupon.to_discount_policy().apply(lowest).discounted
+
+        # 적용 이름 순서는 apply-coupon 응답과 같이 쿠폰 → 프로모션
+        applied = tuple(coupon.name for coupon in ordered) + ((promotion_name,) if has_promotion else ())
+        ends = [coupon.valid_until for coupon in ordered]
+        if rules.next_start_at is not None:
+            ends.append(rules.next_start_at)
+        return lowest, applied, min(ends, default=None)
@@ -0,0 +1,109 @@
+from collections import Counter
+from datetime import datetime
+from decimal import Decimal
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from django.utils import timezone
+
+from apps.pricing.application.services.promotion_service import PromotionService
+from apps.pricing.domain.entity.rule_snapshot import RuleSnapshot
+from apps.pricing.domain.entity.simulation import (
+    BookPriceDelta,
+    DraftDiscount,
+    PriceBucket,
+    SimulationResult,
+)
+from apps.pricing.domain.repositories.rule_snapshot_repository import RuleSnapshotRepository
+from apps.product.domain.repository import ProductRepository
+from apps.product.domain.value_objects import ProductAttributes
+
+
+class SimulateDiscountUseCase:
+    def __init__(
+        self,
+        product_repo: ProductRepository,
+        rule_snapshot_repo: RuleSnapshotRepository,
+    ):
+        self._product_repo = product_repo
+        self._rule_snapshot_repo = rule_snapshot_repo
+
+    def execute(
+        self,
+        draft: DraftDiscount,
+        reference_time: Optional[datetime] = None,
+        bucket_size: Decimal = Decimal("5000"),
+        limit: int = 100,
+    ) -> SimulationResult:
+        """
+        판매 중인 전체 상품에 대해 현재 규칙(baseline)과 초안을 더한 규칙(scenario)의 자동할인 가격을 비교 (DB 쓰기 없음)
+        - 규칙은 기준 시각의 스냅샷으로 한 번만 읽고, 상품은 코드/가격만 읽음
+        - 상품별 프로모션 순서는 그 상품(코드/분야/출판사/도서 타입)을 대상으로 하는 규칙에 의해서만 달라지므로,
+          (가격, 적용 규칙과 순서, 초안 대상 여부)가 같은 상품은 한 번만 계산하여 결과를 공유
+        """
+        reference_time = reference_time or timezone.now()
+        baseline_rules = self._rule_snapshot_repo.load(reference_time)
+        scenario_rules = baseline_rules
+        if draft.is_promotion:
+            scenario_rules = baseline_rules.with_promotion(draft.as_promotion_rule(reference_time))
+
+        attributes = self._product_repo.list_active_attributes()
+        computed: Dict[Tuple, Tuple[Decimal, Decimal]] = {}
+        rows: List[BookPriceDelta] = []
+        for code, price in self._product_repo.list_active_prices():
+            product_attributes = attributes.get(code)
+            key = (price, scenario_rules.promotion_key(code, product_attributes), draft.applies_to(code))
+            if key not in computed:
+                computed[key] = self._price(baseline_rules, scenario_rules, draft, code, price, product_attributes)
+            baseline, scenario = computed[key]
+            rows.append(BookPriceDelta(code=code, price=price, baseline=baseline, scenario=scenario))
+
+        changed = [row for row in rows if row.delta != 0]
+        changed.sort(key=lambda row: (row.delta, row.code))
+        return SimulationResult(
+            reference_time=reference_time,
+            total_books=len(rows),
+            affected_books=len(changed),
+            baseline_total=sum((row.baseline for row in rows), Decimal("0")),
+            scenario_total=sum((row.scenario for row in rows), Decimal("0")),
+            buckets=self._histogram(rows, bucket_size),
+            deltas=changed[:limit],
+        )
+
+    @staticmethod
+    def _price(
+        baseline_rules: RuleSnapshot,
+        scenario_rules: RuleSnapshot,
+        draft: DraftDiscount,
+        code: str,
+        price: Decimal,
+        attributes: Optional[ProductAttributes],
+    ) -> Tuple[Decimal, Decimal]:
+        # 비로그인 기준 자동할인 가격 (CalculatePriceUseCase와 같은 PromotionService.apply_promotions)
+        baseline, _, _ = PromotionService.apply_promotions(baseline_rules.promotions_for(code, None, attributes), price)
+        if not draft.is_promotion:
+            return baseline.discounted, draft.apply_as_coupon(code, price, baseline.discounted)
+
+        scenario, _, _ = PromotionService.apply_promotions(scenario_rules.promotions_for(code, None, attributes), price)
+        return baseline.discounted, scenario.discounted
+
+    @staticmethod
+    def _histogram(rows: List[BookPriceDelta], bucket_size: Decimal) -> List[PriceBucket]:
+        def bucket(value: Decimal) -> Decimal:
+            return (value // bucket_size) * bucket_size
+
+        baseline = Counter(bucket(row.baseline) for row in rows)
+        scenario = Counter(bucket(row.scenario) for row in rows)
+        return [
+            PriceBucket(
+                lower=lower,
+                upper=lower + bucket_size,
+                baseline_count=baseline[lower],
+                scenario_count=scenario[lower],
+            )
+            for lower in sorted(set(baseline) | set(scenario))
+        ]
@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class PricingConfig(AppConfig):
+    name = "apps.pricing"
+    label = "pricing"
+
+    def ready(self):
+        # 쿠폰/프로모션 변경 시 조회 캐시를 무효화하는 signal 등록
+        from apps.pricing.infrastructure.persistence import signals  # noqa: F401
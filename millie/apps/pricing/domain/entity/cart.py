@@ -0,0 +1,57 @@
+from dataclasses import (
+    dataclass,
+    field,
+)
+from decimal import Decimal
+from typing import (
+    List,
+    Optional,
+)
+
+
+@dataclass(frozen=True)
+class CartItem:
+    product_code: str
+    quantity: int
+
+
+@dataclass
+class CartLine:
+    product_code: str
+    name: str
+    quantity: int
+    unit_price: Decimal
+    original: Decimal                       # 정가 × 수량
+    discounted: Decimal                     # 프로모션/쿠폰 적용 후 금액
+    promotion_discount: Decimal = Decimal("0")
+    coupon_discount: Decimal = Decimal("0")
+    promotion: Optional[str] = None         # 적용된 프로모션 이름
+    coupons: List[str] = field(default_factory=list)   # 이 라인에 배분된 쿠폰 이름
+
+    @property
+    def applied_policies(self) -> List[str]:
+        # 쿠폰 적용 API와 같이 쿠폰 → 프로모션 순
+        return self.coupons + ([self.promotion] if self.promotion else [])
+
+    @property
+    def discount_amount(self) -> Decimal:
+        return self.original - self.discounted
+
+
+@dataclass
+class CartPriceResult:
+    lines: List[CartLine]
+    applied_coupons: List[str]              # 적용된 쿠폰 이름 (적용 순서)
+    rejected_coupons: List[str]             # 요청했지만 적용되지 않은 쿠폰 코드 (없음/대상 아님/최소 구매 금액 미달)
+
+    @property
+    def original(self) -> Decimal:
+        return sum((line.original for line in self.lines), Decimal("0"))
+
+    @property
+    def discounted(self) -> Decimal:
+        return sum((line.discounted for line in self.lines), Decimal("0"))
+
+    @property
+    def discount_amount(self) -> Decimal:
+        return self.original - self.discounted
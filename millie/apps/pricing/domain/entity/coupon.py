@@ -6,6 +6,7 @@ from uuid import UUID
 
 from django.utils import timezone
 
+from apps.pricing.domain.entity.user_segment import UserSegment
 from apps.pricing.domain.policy.discount_policy import DiscountPolicy
 from apps.pricing.domain.value_objects import (
     CouponStatus,
@@ -29,6 +30,11 @@ class Coupon:
     minimum_purchase_amount: Decimal
     is_active: bool = False
     apply_priority: int = 0
+    target_segment: Optional[UserSegment] = None    # 세그먼트 대상 쿠폰: 회원 목록 포함 여부로 판정
+
+    @property
+    def target_segment_id(self) -> Optional[UUID]:
+        return self.target_segment.id if self.target_segment is not None else None
 
     @property
     def discount_type(self):
@@ -54,10 +60,17 @@ class Coupon:
             prod_code = str(product_code) if product_code is not None else None
             return coupon_code == prod_code
 
+        # 분야/출판사/도서 타입 대상(TargetType.promotion_only)은 프로모션 전용이라 쿠폰 정책으로 저장되지 않음
         checks = {
             TargetType.ALL.value: lambda: True,
             TargetType.PRODUCT.value: product_code_match,
-            TargetType.USER.value: lambda: self.target_user_id == getattr(user, 'id', None),
+            # 대상 사용자가 없는 사용자 대상 쿠폰(발급용 원본)은 지갑에서 보유자 기준으로 바꾼 경우에만 사용 가능
+            TargetType.USER.value: lambda: (
+                self.target_user_id is not None and self.target_user_id == getattr(user, 'id', None)
+            ),
+            TargetType.SEGMENT.value: lambda: (
+                self.target_segment is not None and getattr(user, 'id', None) in self.target_segment
+            ),
         }
         return checks.get(self.target_type, lambda: False)()
 
@@ -0,0 +1,69 @@
+from dataclasses import (
+    dataclass,
+    replace,
+)
+from datetime import datetime
+from typing import (
+    Iterable,
+    List,
+)
+from uuid import UUID
+
+from apps.pricing.domain.entity.coupon import Coupon
+from apps.pricing.domain.value_objects import TargetType
+
+
+@dataclass(frozen=True)
+class IssuedCoupon:
+    """
+    사용자에게 개별 발급된 쿠폰 (쿠폰 지갑의 한 장)
+    """
+    id: UUID
+    issued_coupon_id: str
+    user_id: UUID
+    coupon: Coupon              # 발급 원본 쿠폰
+    status: str
+    valid_until: datetime
+    issued_at: datetime
+
+    @property
+    def usable_until(self) -> datetime:
+        return min(self.valid_until, self.coupon.valid_until)
+
+    def to_coupon(self) -> Coupon:
+        # 보유자 기준 쿠폰: 사용자 대상 원본은 보유자를 대상으로, 유효기간은 발급/원본 중 먼저 끝나는 시각
+        target_user_id = self.coupon.target_user_id
+        if self.coupon.target_type == TargetType.USER.value:
+            target_user_id = self.user_id
+        return replace(self.coupon, target_user_id=target_user_id, valid_until=self.usable_until)
+
+
+@dataclass(frozen=True)
+class IssueResult:
+    """
+    쿠폰 대량 발급 결과
+    """
+    issued: int
+    skipped: int            # 이미 보유 중이라 건너뛴 사용자 수
+    regenerated: int        # 기존/이번 코드와 겹칠 수 있어 다시 만든 코드 수
+    elapsed: float          # 초
+
+    @property
+    def per_second(self) -> float:
+        return self.issued / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def with_wallet(
+    coupons: Iterable[Coupon],
+    issued_coupons: Iterable[IssuedCoupon],
+) -> List[Coupon]:
+    """
+    전체 쿠폰 목록(발급용 쿠폰 제외)에 사용자 지갑의 쿠폰을 합침
+    - 지갑 쿠폰은 뒤에 추가, 같은 코드의 쿠폰이 목록에 있으면 그 자리에서 보유자 기준 쿠폰으로 교체 (적용 순서 유지)
+    - 같은 쿠폰을 여러 장 보유하면 지갑 조회 순서(먼저 끝나는 것)의 한 장만 사용
+    """
+    wallet = {}
+    for issued in issued_coupons:
+        wallet.setdefault(issued.coupon.code, issued.to_coupon())
+    merged = [wallet.pop(coupon.code, coupon) for coupon in coupons]
+    return merged + list(wallet.values())
@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import (
+    Optional,
+    Tuple,
+)
+
+
+@dataclass(frozen=True)
+class LowestPrice:
+    """
+    상품별 최저 구매 가능가 (자동할인 프로모션 + 공개 쿠폰의 최적 조합, 비로그인 기준)
+    """
+    product_code: str
+    price: Decimal                          # 계산 기준 정가
+    lowest_price: Decimal
+    applied_policies: Tuple[str, ...]       # 적용한 프로모션/쿠폰 이름 (적용 순서)
+    computed_at: datetime
+    valid_until: Optional[datetime] = None  # 적용한 쿠폰이 끝나거나 새 쿠폰이 시작되는 시각 중 먼저 오는 시각
+
+    def is_valid(self, price: Decimal, now: datetime) -> bool:
+        # 정가가 바뀌었거나 쿠폰이 끝났거나 새 쿠폰이 시작되었으면 다시 계산되기 전까지 사용하지 않음
+        return self.price == price and (self.valid_until is None or now <= self.valid_until)
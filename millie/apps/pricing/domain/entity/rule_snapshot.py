@@ -0,0 +1,170 @@
+from dataclasses import (
+    dataclass,
+    replace,
+)
+from datetime import datetime
+from functools import cached_property
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+from uuid import UUID
+
+from apps.pricing.domain.entity.coupon import Coupon
+from apps.pricing.domain.entity.promotion import Promotion
+from apps.pricing.domain.value_objects import TargetType
+from apps.product.domain.value_objects import ProductAttributes
+
+
+@dataclass(frozen=True)
+class PromotionTarget:
+    product_code: Optional[str]     # 모든 대상 값이 None이면 전체 대상
+    user_id: Optional[UUID]
+    apply_priority: int
+    category: Optional[str] = None
+    publisher: Optional[str] = None
+    feature: Optional[str] = None
+
+    @property
+    def keys(self) -> Tuple[Tuple[str, Any], ...]:
+        # 색인 key (대상 차원, 값), 여러 값이 있으면 그중 하나만 일치해도 대상 (빈 값: 전체 대상)
+        return tuple(
+            (dimension, value)
+            for dimension, value in (
+                (TargetType.PRODUCT.value, self.product_code),
+                (TargetType.USER.value, self.user_id),
+                (TargetType.CATEGORY.value, self.category),
+                (TargetType.PUBLISHER.value, self.publisher),
+                (TargetType.FEATURE.value, self.feature),
+            )
+            if value is not None
+        )
+
+
+@dataclass(frozen=True)
+class PromotionRule:
+    promotion: Promotion
+    targets: Tuple[PromotionTarget, ...]
+
+
+class PromotionIndex:
+    """
+    대상 차원(상품/사용자/분야/출판사/도서 타입)별 프로모션 색인
+    - 상품에 적용되는 프로모션은 상품 속성 값마다 dict 조회 한 번씩으로 찾음 (도서별 대상 행을 훑지 않음)
+    - 일치하는 대상의 최소 apply_priority 순, 같으면 먼저 읽은 순 / 일치하는 대상이 없는 프로모션은 적용하지 않음
+    """
+
+    def __init__(self, rules: Iterable[PromotionRule]):
+        self.rules: Tuple[PromotionRule, ...] = tuple(rules)
+        self._promotions: List[Promotion] = []
+        self._global: Dict[int, int] = {}                       # 위치 → 우선순위
+        self._postings: Dict[Tuple[str, Any], Dict[int, int]] = {}
+        for position, rule in enumerate(self.rules):
+            self._promotions.append(rule.promotion)
+            for target in rule.targets:
+                keys = target.keys
+                for postings in ([self._postings.setdefault(key, {}) for key in keys] if keys else [self._global]):
+                    _keep_min(postings, position, target.apply_priority)
+
+    def ranked(
+        self,
+        product_code: Optional[str] = None,
+        user_id: Optional[UUID] = None,
+        attributes: Optional[ProductAttributes] = None,
+    ) -> Tuple[Tuple[int, int], ...]:
+        # 적용 대상 프로모션의 (우선순위, 위치), 같은 값이면 같은 프로모션이 같은 순서로 적용됨
+        keys = [(TargetType.PRODUCT.value, product_code), (TargetType.USER.value, user_id)]
+        if attributes is not None:
+            keys.append((TargetType.CATEGORY.value, attributes.category))
+            keys.append((TargetType.PUBLISHER.value, attributes.publisher))
+            keys.extend((TargetType.FEATURE.value, feature) for feature in attributes.features)
+
+        matched = dict(self._global)
+        for key in keys:
+            if key[1] is None:
+                continue
+            for position, priority in self._postings.get(key, {}).items():
+                _keep_min(matched, position, priority)
+        return tuple(sorted((priority, position) for position, priority in matched.items()))
+
+    def promotions_for(
+        self,
+        product_code: Optional[str] = None,
+        user_id: Optional[UUID] = None,
+        attributes: Optional[ProductAttributes] = None,
+    ) -> List[Promotion]:
+        return [self._promotions[position] for _, position in self.ranked(product_code, user_id, attributes)]
+
+
+def _keep_min(postings: Dict[int, int], position: int, priority: int) -> None:
+    if position not in postings or priority < postings[position]:
+        postings[position] = priority
+
+
+@dataclass(frozen=True)
+class RuleSnapshot:
+    """
+    특정 시각(reference_time) 기준의 가격 규칙 (자동할인 프로모션 + 그 시각에 유효한 쿠폰)
+    한 번 읽어와서 여러 상품/프로세스의 가격 계산에 재사용 (pickle 가능)
+    """
+    reference_time: datetime
+    promotions: Tuple[PromotionRule, ...]
+    coupons: Tuple[Coupon, ...]
+    next_start_at: Optional[datetime] = None    # 기준 시각 이후 가장 먼저 시작하는 쿠폰 (이때부터 coupons가 달라짐)
+
+    @classmethod
+    def from_index(
+        cls,
+        reference_time: datetime,
+        index: PromotionIndex,
+        coupons: Iterable[Coupon],
+        next_start_at: Optional[datetime] = None,
+    ) -> "RuleSnapshot":
+        # 이미 만들어진(캐시된) 색인으로 스냅샷 생성 (색인을 다시 만들지 않음)
+        snapshot = cls(
+            reference_time=reference_time,
+            promotions=index.rules,
+            coupons=tuple(coupons),
+            next_start_at=next_start_at,
+        )
+        snapshot.__dict__["promotion_index"] = index
+        return snapshot
+
+    @cached_property
+    def promotion_index(self) -> PromotionIndex:
+        return PromotionIndex(self.promotions)
+
+    def promotions_for(
+        self,
+        product_code: Optional[str] = None,
+        user_id: Optional[UUID] = None,
+        attributes: Optional[ProductAttributes] = None,
+    ) -> List[Promotion]:
+        # PromotionRepoImpl과 같은 색인/순서 (PromotionIndex)
+        return self.promotion_index.promotions_for(product_code, user_id, attributes)
+
+    def promotion_key(
+        self,
+        product_code: Optional[str] = None,
+        attributes: Optional[ProductAttributes] = None,
+    ) -> Tuple[Tuple[int, int], ...]:
+        """
+        비로그인 기준으로 상품에 적용되는 프로모션과 순서
+        (상품별 프로모션 결과는 이것으로만 달라지므로, 같은 값을 가진 상품끼리는 계산 결과를 공유할 수 있음)
+        """
+        return self.promotion_index.ranked(product_code, None, attributes)
+
+    def with_promotion(self, rule: PromotionRule) -> "RuleSnapshot":
+        return replace(self, promotions=self.promotions + (rule,))
+
+    @property
+    def public_coupons(self) -> Tuple[Coupon, ...]:
+        # 로그인 여부와 관계없이 누구나 쓸 수 있는 쿠폰 (전체/상품 대상)
+        return tuple(
+            coupon for coupon in self.coupons
+            if coupon.is_active and coupon.target_type in (TargetType.ALL.value, TargetType.PRODUCT.value)
+        )
@@ -0,0 +1,102 @@
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import (
+    List,
+    Optional,
+    Tuple,
+)
+
+from apps.pricing.domain.entity.promotion import Promotion
+from apps.pricing.domain.entity.rule_snapshot import (
+    PromotionRule,
+    PromotionTarget,
+)
+from apps.pricing.domain.policy.discount_policy import DiscountPolicy
+from apps.pricing.domain.value_objects import DraftKind
+
+
+@dataclass(frozen=True)
+class DraftDiscount:
+    """
+    저장하지 않은 프로모션/쿠폰 초안 (가격 시뮬레이션 입력)
+    - PROMOTION: 기존 자동할인 프로모션과 함께 같은 우선순위 기준으로 경쟁
+    - COUPON: 자동할인 가격 위에 적용 (minimum_purchase_amount는 정가 기준, 쿠폰 적용과 동일)
+    """
+    kind: str
+    name: str
+    discount_policy: DiscountPolicy
+    target_product_codes: Optional[Tuple[str, ...]] = None     # None: 전체 상품
+    apply_priority: int = 0
+    minimum_purchase_amount: Decimal = Decimal("0")
+
+    @property
+    def is_promotion(self) -> bool:
+        return self.kind == DraftKind.PROMOTION.value
+
+    def applies_to(self, product_code: str) -> bool:
+        return self.target_product_codes is None or product_code in self.target_product_codes
+
+    def as_promotion_rule(self, now: datetime) -> PromotionRule:
+        if self.target_product_codes is None:
+            targets = (PromotionTarget(product_code=None, user_id=None, apply_priority=self.apply_priority),)
+        else:
+            targets = tuple(
+                PromotionTarget(product_code=code, user_id=None, apply_priority=self.apply_priority)
+                for code in self.target_product_codes
+            )
+        return PromotionRule(
+            promotion=Promotion(
+                id=uuid.uuid4(),
+                name=self.name,
+                created_at=now,
+                updated_at=now,
+                discount_policy=self.discount_policy,
+                is_auto_discount=True,
+                apply_priority=self.apply_priority,
+            ),
+            targets=targets,
+        )
+
+    def apply_as_coupon(self, product_code: str, price: Decimal, current: Decimal) -> Decimal:
+        # 적용 대상이 아니거나 최소 구매 금액 미만이면 현재 가격 그대로
+        if not self.applies_to(product_code) or price < self.minimum_purchase_amount:
+            return current
+        return self.discount_policy.apply(current).discounted
+
+
+@dataclass(frozen=True)
+class BookPriceDelta:
+    code: str
+    price: Decimal          # 정가
+    baseline: Decimal       # 현재 규칙 적용가
+    scenario: Decimal       # 초안 포함 적용가
+
+    @property
+    def delta(self) -> Decimal:
+        return self.scenario - self.baseline
+
+
+@dataclass(frozen=True)
+class PriceBucket:
+    lower: Decimal
+    upper: Decimal
+    baseline_count: int
+    scenario_count: int
+
+
+@dataclass(frozen=True)
+class SimulationResult:
+    reference_time: datetime
+    total_books: int
+    affected_books: int
+    baseline_total: Decimal
+    scenario_total: Decimal
+    buckets: List[PriceBucket]
+    deltas: List[BookPriceDelta]        # 가격이 바뀐 상품 중 인하 폭이 큰 순 (limit개)
+
+    @property
+    def discount_change(self) -> Decimal:
+        # 초안으로 늘어나는 총 할인액 (음수면 줄어듦)
+        return self.baseline_total - self.scenario_total
@@ -0,0 +1,79 @@
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import (
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+)
+from uuid import UUID
+
+
+class SegmentMembers:
+    """
+    세그먼트 회원 id 집합
+    - UUID(16바이트)를 오름차순으로 이어붙인 bytes 한 덩어리로 보관 (회원 수 N이면 16N 바이트, 회원별 객체/행 없음)
+    - 포함 여부는 이진 탐색 (회원 100만 명이어도 비교 20번)
+    """
+    WIDTH = 16
+
+    def __init__(self, packed: bytes = b""):
+        if len(packed) % self.WIDTH:
+            raise ValueError("세그먼트 회원 목록의 길이가 올바르지 않습니다.")
+        self._packed = bytes(packed)
+
+    @classmethod
+    def from_ids(cls, user_ids: Iterable[UUID]) -> "SegmentMembers":
+        # 중복 제거 후 정렬 (big-endian bytes 순서 == UUID 정수 순서)
+        return cls(b"".join(sorted({_uuid(user_id).bytes for user_id in user_ids})))
+
+    @property
+    def packed(self) -> bytes:
+        return self._packed
+
+    def __contains__(self, user_id) -> bool:
+        if user_id is None:
+            return False
+        needle = _uuid(user_id).bytes
+        low, high = 0, len(self)
+        while low < high:
+            middle = (low + high) // 2
+            offset = middle * self.WIDTH
+            value = self._packed[offset:offset + self.WIDTH]
+            if value == needle:
+                return True
+            if value < needle:
+                low = middle + 1
+            else:
+                high = middle
+        return False
+
+    def __len__(self) -> int:
+        return len(self._packed) // self.WIDTH
+
+    def __iter__(self) -> Iterator[UUID]:
+        for offset in range(0, len(self._packed), self.WIDTH):
+            yield UUID(bytes=self._packed[offset:offset + self.WIDTH])
+
+
+def _uuid(value) -> UUID:
+    return value if isinstance(value, UUID) else UUID(str(value))
+
+
+@dataclass(frozen=True)
+class UserSegment:
+    """
+    사용자 세그먼트 (쿠폰 대상)
+    회원 목록은 포함 여부를 처음 판정할 때 load_members(id, version)로 읽어옴
+    (쿠폰 캐시/스냅샷에는 id/version만 pickle되고, 회원 목록은 프로세스마다 version별로 한 번만 로딩)
+    """
+    id: UUID
+    version: str            # 회원 목록이 바뀌면 함께 바뀌는 값
+    load_members: Callable[[UUID, str], SegmentMembers] = field(compare=False, repr=False)
+
+    def __contains__(self, user_id: Optional[UUID]) -> bool:
+        if user_id is None:
+            return False
+        return user_id in self.load_members(self.id, self.version)
@@ -0,0 +1,28 @@
+from decimal import (
+    ROUND_DOWN,
+    ROUND_HALF_UP,
+    Decimal,
+)
+from typing import List
+
+CENT = Decimal("0.01")
+
+
+def allocate(amount: Decimal, weights: List[Decimal]) -> List[Decimal]:
+    """
+    amount(원 단위 소수 둘째 자리로 반올림)를 weights 비율로 나눔, 합계는 항상 amount와 같음
+    - 각 몫을 내림한 뒤 남은 1전 단위를 나머지가 큰 순(같으면 앞쪽)으로 하나씩 배분 (최대 잉여법)
+    - 몫이 weight를 넘지 않으므로 할인 후 금액이 음수가 되지 않음 (amount ≤ sum(weights)인 경우)
+    """
+    amount = amount.quantize(CENT, rounding=ROUND_HALF_UP)
+    total = sum(weights, Decimal("0"))
+    if total <= 0 or amount <= 0:
+        return [Decimal("0.00")] * len(weights)
+
+    exact = [amount * weight / total for weight in weights]
+    shares = [value.quantize(CENT, rounding=ROUND_DOWN) for value in exact]
+    remaining = int((amount - sum(shares, Decimal("0"))) / CENT)
+    by_remainder = sorted(range(len(weights)), key=lambda i: (-(exact[i] - shares[i]), i))
+    for i in by_remainder[:remaining]:
+        shares[i] += CENT
+    return shares
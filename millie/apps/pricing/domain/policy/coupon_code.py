@@ -0,0 +1,17 @@
+import os
+from typing import List
+
+# 혼동되는 문자(0/O, 1/I)를 뺀 32자: 난수 1바이트를 32로 나눈 나머지로 치우침 없이 한 글자씩 선택
+CODE_ALPHABET = "23456789ABCDEFGHJKLMNPQRSTUVWXYZ"
+CODE_LENGTH = 12        # 32^12 ≈ 1.2 × 10^18 가지
+
+_TRANSLATION = bytes(CODE_ALPHABET[b % len(CODE_ALPHABET)].encode()[0] for b in range(256))
+
+
+def generate_codes(count: int, length: int = CODE_LENGTH) -> List[str]:
+    """
+    count개의 난수 쿠폰 코드 (os.urandom, 중복 검사는 호출하는 쪽에서)
+    난수 바이트를 한 번에 만들어 문자 변환표로 바꾼 뒤 length씩 자름 (코드마다 난수 호출 없음)
+    """
+    raw = os.urandom(count * length).translate(_TRANSLATION).decode()
+    return [raw[i:i + length] for i in range(0, count * length, length)]
@@ -0,0 +1,58 @@
+from bisect import bisect_left
+from decimal import Decimal
+from itertools import accumulate
+from typing import List
+
+from apps.pricing.domain.entity.coupon import Coupon
+from apps.pricing.domain.value_objects import DiscountType
+
+
+def best_coupon_order(price: Decimal, coupons: List[Coupon]) -> List[Coupon]:
+    """
+    price에 적용했을 때 최종 가격이 가장 낮은 쿠폰 조합과 적용 순서 (최저가가 같으면 쿠폰 수가 적은 조합)
+
+    - 정률 할인끼리는 순서와 관계없이 곱해지고, 정액 할인은 정률 할인 뒤에 적용해야 항상 더 싸짐
+      (p·(1-r) - a ≤ (p - a)·(1-r)) → 순서는 "정률(할인율 큰 순) → 정액(금액 큰 순)"으로 고정
+    - 할인은 가격을 올리지 않으므로 전부 적용한 가격이 최저가
+        - 최저가가 0보다 크면 할인 값이 0인 쿠폰을 뺀 전부가 필요
+        - 0이면 0에 도달하는 최소 조합: 정률 k개(할인율 큰 순)를 고르면 남은 금액을 덮는 정액 쿠폰 수는
+          금액 큰 순 누적합의 이분 탐색으로 정해지므로, k마다 O(log n)으로 확인 (순열 전수 탐색 없음)
+    """
+    if price <= 0:
+        return []
+
+    def by_value(discount_type: DiscountType) -> List[Coupon]:
+        # 값이 같으면 입력 순서 유지 (sorted는 안정 정렬)
+        return sorted(
+            (c for c in coupons if c.discount_type == discount_type.value and c.discount_value > 0),
+            key=lambda c: c.discount_value,
+            reverse=True,
+        )
+
+    percentage = by_value(DiscountType.PERCENTAGE)
+    fixed = by_value(DiscountType.FIXED)
+
+    # after_percentage[k]: 정률 쿠폰 k개 적용 후 가격, fixed_sums[j]: 정액 쿠폰 j+1개의 합
+    after_percentage = [price]
+    for coupon in percentage:
+        after_percentage.append(coupon.to_discount_policy().apply(after_percentage[-1]).discounted)
+    fixed_sums = list(accumulate(c.discount_value for c in fixed))
+
+    if after_percentage[-1] > (fixed_sums[-1] if fixed_sums else Decimal("0")):
+        return percentage + fixed
+
+    best_count, best = None, (0, 0)
+    for k, remaining in enumerate(after_percentage):
+        if best_count is not None and k >= best_count:
+            break                               # 정률 쿠폰만으로도 이미 더 많음
+        if remaining <= 0:
+            j = 0
+        else:
+            j = bisect_left(fixed_sums, remaining) + 1
+            if j > len(fixed_sums):
+                continue                        # 정액 쿠폰을 모두 써도 0에 못 미침
+        if best_count is None or k + j < best_count:
+            best_count, best = k + j, (k, j)
+
+    k, j = best
+    return percentage[:k] + fixed[:j]
@@ -4,6 +4,7 @@ from abc import (
 )
 from decimal import Decimal
 from apps.pricing.domain.entity.price_result import PriceResult as PriceResultEntity
+from apps.pricing.domain.value_objects import DiscountType
 
 
 class DiscountPolicy(ABC):
@@ -84,3 +85,13 @@ class FixedDiscountPolicy(DiscountPolicy):
     def value(self) -> Decimal:
         return self._discount_amount
 
+
+def build_discount_policy(discount_type: str, value: Decimal) -> DiscountPolicy:
+    """
+    할인 유형/값으로 정책 생성 (저장 전 초안 정책 등), 값이 범위를 벗어나거나 유형이 없으면 ValueError
+    """
+    if discount_type == DiscountType.PERCENTAGE.value:
+        return PercentageDiscountPolicy(discount_type=discount_type, discount_rate=value)
+    if discount_type == DiscountType.FIXED.value:
+        return FixedDiscountPolicy(discount_type=discount_type, discount_amount=value)
+    raise ValueError(f"지원하지 않는 할인 유형입니다: {discount_type}")
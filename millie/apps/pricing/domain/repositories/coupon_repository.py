@@ -10,6 +10,7 @@ from typing import (
 from uuid import UUID
 
 from apps.pricing.domain.entity.coupon import Coupon
+from apps.pricing.domain.entity.issued_coupon import IssuedCoupon
 
 
 class CouponRepository(ABC):
@@ -24,5 +25,52 @@ class CouponRepository(ABC):
 
 
     @abstractmethod
-    def list_active_not_expired(self, reference_time: datetime) -> List[Coupon]:
-        pass
\ No newline at end of file
+    def list_active_not_expired(
+        self,
+        reference_time: datetime,
+        coupon_code: Optional[List[str]] = None,
+    ) -> List[Coupon]:
+        pass
+
+    @abstractmethod
+    def list_issued_coupons(
+        self,
+        user_id: UUID,
+        reference_time: datetime,
+        coupon_code: Optional[List[str]] = None,
+    ) -> List[IssuedCoupon]:
+        """
+        사용자 지갑에서 reference_time에 사용 가능한 발급 쿠폰 (먼저 끝나는 순)
+        """
+        pass
+
+
+class AsyncCouponRepository(ABC):
+    """
+    비동기(ASGI) 뷰용 쿠폰 조회
+    """
+
+    @abstractmethod
+    async def get_coupons_by_code(
+        self,
+        coupon_code: List[str],
+        is_valid: bool = True,
+    ) -> List[Optional[Coupon]]:
+        pass
+
+    @abstractmethod
+    async def list_active_not_expired(
+        self,
+        reference_time: datetime,
+        coupon_code: Optional[List[str]] = None,
+    ) -> List[Coupon]:
+        pass
+
+    @abstractmethod
+    async def list_issued_coupons(
+        self,
+        user_id: UUID,
+        reference_time: datetime,
+        coupon_code: Optional[List[str]] = None,
+    ) -> List[IssuedCoupon]:
+        pass
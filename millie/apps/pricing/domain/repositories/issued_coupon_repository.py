@@ -0,0 +1,53 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from datetime import datetime
+from typing import (
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+from uuid import UUID
+
+
+class IssuedCouponRepository(ABC):
+    """
+    쿠폰 대량 발급용 (지갑 조회는 CouponRepository.list_issued_coupons)
+    """
+
+    @abstractmethod
+    def count(self) -> int:
+        pass
+
+    @abstractmethod
+    def iter_issued_coupon_ids(self) -> Iterator[str]:
+        """
+        기존 발급 쿠폰 id 전체 (코드 중복 검사용, 메모리에 한 번에 올리지 않고 순회)
+        """
+        pass
+
+    @abstractmethod
+    def list_holder_ids(
+        self,
+        coupon_id: UUID,
+        user_ids: Optional[List[UUID]] = None,
+    ) -> List[UUID]:
+        """
+        해당 쿠폰을 이미 발급받은 사용자 id (user_ids가 있으면 그 중에서만)
+        """
+        pass
+
+    @abstractmethod
+    def bulk_issue(
+        self,
+        coupon_id: UUID,
+        issues: List[Tuple[UUID, str]],
+        valid_until: datetime,
+    ) -> int:
+        """
+        (사용자 id, 발급 쿠폰 id) 목록을 한 트랜잭션으로 저장
+        제약 조건 위반(발급 쿠폰 id 중복, 같은 사용자 중복 발급, 없는 사용자 등)이면 전체 취소 후 ConflictException
+        """
+        pass
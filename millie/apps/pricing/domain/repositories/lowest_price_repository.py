@@ -0,0 +1,32 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from typing import (
+    Dict,
+    List,
+    Optional,
+)
+
+from apps.pricing.domain.entity.lowest_price import LowestPrice
+
+
+class LowestPriceRepository(ABC):
+
+    @abstractmethod
+    def get_many(
+        self,
+        product_codes: List[str],
+    ) -> Dict[str, LowestPrice]:
+        pass
+
+    @abstractmethod
+    def replace(
+        self,
+        lowest_prices: List[LowestPrice],
+        product_codes: Optional[List[str]] = None,
+    ) -> None:
+        """
+        product_codes의 기존 값을 지우고 lowest_prices로 교체 (None이면 전체 교체)
+        """
+        pass
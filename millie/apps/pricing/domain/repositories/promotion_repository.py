@@ -8,7 +8,9 @@ from typing import (
 )
 from uuid import UUID
 
+from apps.pricing.domain.entity.rule_snapshot import PromotionIndex
 from apps.pricing.domain.policy.discount_policy import DiscountPolicy
+from apps.product.domain.value_objects import ProductAttributes
 
 
 class PromotionRepository(ABC):
@@ -18,6 +20,31 @@ class PromotionRepository(ABC):
         self,
         target_product_code: Optional[str] = None,
         target_user_id: Optional[UUID] = None,
+        attributes: Optional[ProductAttributes] = None,
     ) -> List[DiscountPolicy]:
 
         pass
+
+    @abstractmethod
+    def get_promotion_index(self) -> PromotionIndex:
+        # 상품 속성을 알기 전에 미리 읽어둘 수 있는 자동할인 프로모션 색인
+        pass
+
+
+class AsyncPromotionRepository(ABC):
+    """
+    비동기(ASGI) 뷰용 프로모션 조회
+    """
+
+    @abstractmethod
+    async def get_active_promotions(
+        self,
+        target_product_code: Optional[str] = None,
+        target_user_id: Optional[UUID] = None,
+        attributes: Optional[ProductAttributes] = None,
+    ) -> List[DiscountPolicy]:
+        pass
+
+    @abstractmethod
+    async def get_promotion_index(self) -> PromotionIndex:
+        pass
@@ -0,0 +1,17 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from datetime import datetime
+
+from apps.pricing.domain.entity.rule_snapshot import RuleSnapshot
+
+
+class RuleSnapshotRepository(ABC):
+
+    @abstractmethod
+    def load(
+        self,
+        reference_time: datetime,
+    ) -> RuleSnapshot:
+        pass
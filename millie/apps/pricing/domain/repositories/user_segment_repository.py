@@ -0,0 +1,33 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from typing import (
+    Iterable,
+    Optional,
+)
+from uuid import UUID
+
+from apps.pricing.domain.entity.user_segment import UserSegment
+
+
+class UserSegmentRepository(ABC):
+
+    @abstractmethod
+    def get(
+        self,
+        segment_id: UUID,
+    ) -> Optional[UserSegment]:
+        pass
+
+    @abstractmethod
+    def save(
+        self,
+        name: str,
+        user_ids: Iterable[UUID],
+        segment_id: Optional[UUID] = None,
+    ) -> UserSegment:
+        """
+        세그먼트 회원 목록을 user_ids로 교체 (segment_id가 없으면 새로 생성)
+        """
+        pass
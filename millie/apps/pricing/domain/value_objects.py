@@ -11,6 +11,15 @@ class TargetType(ChoiceEnum):
     PRODUCT = "PRODUCT"
     USER = "USER"
     ALL = "ALL"
+    CATEGORY = "CATEGORY"       # 분야 전체 (product.Category, 프로모션 전용)
+    PUBLISHER = "PUBLISHER"     # 출판사 전체 (프로모션 전용)
+    FEATURE = "FEATURE"         # 도서 타입 전체 (product.Feature, 프로모션 전용)
+    SEGMENT = "SEGMENT"         # 사용자 세그먼트 회원 (쿠폰 전용)
+
+    @classmethod
+    def promotion_only(cls):
+        # 상품 정보(분야/출판사/타입)로 찾는 대상: 쿠폰은 상품 코드로만 적용 여부를 판정하므로 사용할 수 없음
+        return {cls.CATEGORY.value, cls.PUBLISHER.value, cls.FEATURE.value}
 
 
 class DiscountType(ChoiceEnum):
@@ -22,3 +31,14 @@ class CouponStatus(ChoiceEnum):
     ACTIVE = "ACTIVE"
     INACTIVE = "INACTIVE"
     EXPIRED = "EXPIRED"
+
+
+class IssuedCouponStatus(ChoiceEnum):
+    ISSUED = "ISSUED"           # 발급됨 (사용 가능)
+    USED = "USED"
+    REVOKED = "REVOKED"         # 회수/취소
+
+
+class DraftKind(ChoiceEnum):
+    PROMOTION = "PROMOTION"     # 자동할인 (적용 순서는 기존 프로모션과 같은 기준)
+    COUPON = "COUPON"           # 자동할인 가격 위에 추가로 적용
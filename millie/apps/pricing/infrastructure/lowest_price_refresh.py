@@ -0,0 +1,148 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from django.conf import settings
+from django.db import (
+    connections,
+    transaction,
+)
+from django.utils import timezone
+
+from apps.container import container
+from apps.pricing.application.use_case.refresh_lowest_prices_use_case import RefreshLowestPricesUseCase
+
+logger = logging.getLogger(__name__)
+
+
+def schedule(codes: Optional[Iterable[str]], using: Optional[str] = None) -> None:
+    """
+    commit 이후 최저 구매 가능가를 다시 계산하도록 예약 (codes가 None이면 전체)
+    - 한 트랜잭션 안의 여러 변경은 상품 코드를 모아 commit 이후 한 번만 계산
+    - 전체 재계산은 요청 스레드가 아닌 백그라운드 스레드에서 실행 (LOWEST_PRICE_REFRESH_IN_BACKGROUND)
+    """
+    pending = _pending_refresh(using)
+    if pending is not None:
+        pending.add(codes)
+        return
+
+    pending = _PendingRefresh()
+    pending.add(codes)
+    transaction.on_commit(pending, using=using)     # 트랜잭션 밖이면 바로 실행
+
+
+def schedule_at(starts_at: datetime, codes: Optional[Iterable[str]]) -> None:
+    """
+    아직 시작 전인 쿠폰이 시작되는 시각에 다시 계산 (프로세스가 살아 있는 동안만, 저장된 행은 그 시각에 만료되어 있음)
+    """
+    if not settings.LOWEST_PRICE_REFRESH_IN_BACKGROUND:
+        return
+    key = (starts_at, tuple(sorted(codes)) if codes is not None else None)
+    with _lock:
+        if key in _timers:
+            return
+        delay = max((starts_at - timezone.now()).total_seconds(), 0)
+        timer = threading.Timer(delay, _on_timer, args=(key,))
+        timer.daemon = True
+        _timers[key] = timer
+    timer.start()
+
+
+class _PendingRefresh:
+    """
+    한 트랜잭션에서 바뀐 상품 코드 (None: 전체), commit 이후 한 번 호출됨
+    """
+
+    def __init__(self):
+        self.codes: Optional[Set[str]] = set()
+        self.done = False
+
+    def add(self, codes: Optional[Iterable[str]]) -> None:
+        if codes is None:
+            self.codes = None
+        elif self.codes is not None:
+            self.codes.update(codes)
+
+    def __call__(self) -> None:
+        self.done = True
+        if self.codes is None:
+            refresh_all()
+        elif self.codes:
+            _refresh(sorted(self.codes))
+
+
+def _pending_refresh(using: Optional[str]) -> Optional[_PendingRefresh]:
+    # 현재 트랜잭션에 이미 등록된 예약 (savepoint rollback으로 취소된 예약은 목록에서 빠지므로 다시 등록됨)
+    # 먼저 등록된 캐시 무효화 뒤에 실행되고, commit 이후에는 변경 내용이 모두 보이므로 나중 변경도 함께 반영됨
+    connection = transaction.get_connection(using)
+    if not connection.in_atomic_block:
+        return None
+    for entry in connection.run_on_commit:
+        if isinstance(entry[1], _PendingRefresh) and not entry[1].done:
+            return entry[1]
+    return None
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 전체 재계산: 프로세스당 백그라운드 스레드 하나에서 순서대로, 대기 중인 요청이 있으면 합침
+# ──────────────────────────────────────────────────────────────────────────────
+_executor: Optional[ThreadPoolExecutor] = None
+_lock = threading.Lock()
+_full_queued = False
+_timers: Dict[Tuple[datetime, Optional[Tuple[str, ...]]], threading.Timer] = {}
+
+
+def refresh_all() -> None:
+    global _executor, _full_queued
+    if not settings.LOWEST_PRICE_REFRESH_IN_BACKGROUND:
+        _refresh(None)
+        return
+
+    with _lock:
+        if _full_queued:
+            return          # 아직 시작하지 않은 전체 재계산이 이번 변경까지 반영함
+        _full_queued = True
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lowest-price")
+        executor = _executor
+    executor.submit(_run_full)
+
+
+def _run_full() -> None:
+    global _full_queued
+    with _lock:
+        _full_queued = False    # 이 시점 이후의 변경은 다음 전체 재계산으로
+    try:
+        _refresh(None)
+    except Exception:
+        logger.exception("최저 구매 가능가 전체 재계산 실패")
+    finally:
+        connections.close_all()     # 이 스레드의 연결 (다음 실행에서 다시 연결)
+
+
+def _on_timer(key: Tuple[datetime, Optional[Tuple[str, ...]]]) -> None:
+    with _lock:
+        _timers.pop(key, None)
+    _, codes = key
+    if codes is None:
+        refresh_all()
+        return
+    try:
+        _refresh(list(codes))
+    except Exception:
+        logger.exception("최저 구매 가능가 재계산 실패")
+    finally:
+        connections.close_all()
+
+
+def _refresh(codes: Optional[List[str]]) -> None:
+    container.resolve(RefreshLowestPricesUseCase).execute(codes)
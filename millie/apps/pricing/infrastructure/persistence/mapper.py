@@ -1,15 +1,27 @@
+from django.db.models import Prefetch
+
 from apps.pricing.domain.entity.coupon import Coupon as CouponEntity
+from apps.pricing.domain.entity.issued_coupon import IssuedCoupon as IssuedCouponEntity
 from apps.pricing.domain.policy.discount_policy import (
     DiscountPolicy,
     FixedDiscountPolicy,
     PercentageDiscountPolicy,
 )
 from apps.pricing.domain.entity.promotion import Promotion as PromotionEntity
-from apps.pricing.domain.value_objects import DiscountType
+from apps.pricing.domain.entity.rule_snapshot import (
+    PromotionRule,
+    PromotionTarget,
+)
+from apps.pricing.domain.value_objects import (
+    DiscountType,
+    TargetType,
+)
 from apps.pricing.infrastructure.persistence.models import Coupon as CouponModel
 from apps.pricing.infrastructure.persistence.models import DiscountPolicy as DiscountPolicyModel
 from apps.pricing.infrastructure.persistence.models import DiscountTarget as DiscountTargetModel
+from apps.pricing.infrastructure.persistence.models import IssuedCoupon as IssuedCouponModel
 from apps.pricing.infrastructure.persistence.models import Promotion as PromotionModel
+from apps.pricing.infrastructure.persistence.repository_impl.user_segment_repo_impl import to_segment
 
 
 class CouponMapper:
@@ -21,22 +33,26 @@ class CouponMapper:
         policy_model = coupon_model.discount_policy
         strategy = self.discount_policy_mapper.to_domain(policy_model)
 
-        discount_target_model = (
-            DiscountTargetModel.objects
-            .filter(discount_policy=policy_model)
-            .order_by("apply_priority", "created_at")
-            .first()
-        )
+        discount_target_model = self._first_target(policy_model)
         target_product_code = None
         target_user_id = None
+        target_segment = None
 
+        # FK 객체를 따라가면 Book/User를 건건이 다시 조회하므로 컬럼 값(*_id)만 사용
         if discount_target_model:
-            if discount_target_model.target_product_code:
-                target_product_code = discount_target_model.target_product_code.code
+            if discount_target_model.target_product_code_id:
+                target_product_code = discount_target_model.target_product_code_id
             if discount_target_model.target_user_id:
-                target_user_id = discount_target_model.target_user_id.id
-
-        return CouponEntity(id=coupon_model.id,
+                target_user_id = discount_target_model.target_user_id
+            if discount_target_model.target_segment_id:
+                # 회원 목록은 포함 여부를 판정할 때 읽어오므로 버전만 전달
+                target_segment = to_segment(
+                    discount_target_model.target_segment_id,
+                    discount_target_model.target_segment.members_digest,
+                )
+
+        return CouponEntity(
+            id=coupon_model.id,
             code=coupon_model.code,
             name=coupon_model.name,
             discount_policy=strategy,
@@ -47,10 +63,52 @@ class CouponMapper:
             target_type=policy_model.target_type,
             target_product_code=target_product_code,
             target_user_id=target_user_id,
+            target_segment=target_segment,
             is_active=policy_model.is_active,
             minimum_purchase_amount=policy_model.minimum_purchase_amount,
         )
 
+    @staticmethod
+    def targets_prefetch(lookup: str = "discount_policy__discounttarget_set") -> Prefetch:
+        # 쿠폰 조회 시 prefetch_related에 사용: 대상 행과 세그먼트 버전을 함께 읽음 (세그먼트 회원 목록 blob은 제외)
+        return Prefetch(lookup, queryset=CouponMapper._targets())
+
+    @staticmethod
+    def _targets():
+        return DiscountTargetModel.objects.select_related("target_segment").defer("target_segment__members")
+
+    @staticmethod
+    def _first_target(policy_model: DiscountPolicyModel):
+        # targets_prefetch()로 읽어온 경우 쿼리 없이 메모리에서 선택
+        if "discounttarget_set" in getattr(policy_model, "_prefetched_objects_cache", {}):
+            return min(
+                policy_model.discounttarget_set.all(),
+                key=lambda target: (target.apply_priority, target.created_at),
+                default=None,
+            )
+        return (
+            CouponMapper._targets()
+            .filter(discount_policy=policy_model)
+            .order_by("apply_priority", "created_at")
+            .first()
+        )
+
+
+class IssuedCouponMapper:
+
+    def __init__(self):
+        self.coupon_mapper = CouponMapper()
+
+    def to_domain(self, issued_model: IssuedCouponModel) -> IssuedCouponEntity:
+        return IssuedCouponEntity(
+            id=issued_model.id,
+            issued_coupon_id=issued_model.issued_coupon_id,
+            user_id=issued_model.user_id,
+            coupon=self.coupon_mapper.to_domain(issued_model.coupon),
+            status=issued_model.status,
+            valid_until=issued_model.valid_until,
+            issued_at=issued_model.created_at,
+        )
 
 
 class DiscountPolicyMapper:
@@ -86,4 +144,24 @@ class PromotionMapper:
             apply_priority=promotion_model.discount_policy.apply_priority,
             created_at=promotion_model.created_at,
             updated_at=promotion_model.updated_at,
-        )
\ No newline at end of file
+        )
+
+    def to_rule(self, promotion_model: PromotionModel) -> PromotionRule:
+        # prefetch_related("discount_policy__discounttarget_set")로 읽어온 대상 행을 함께 변환 (FK는 *_id 값만 사용)
+        policy_model = promotion_model.discount_policy
+        targets = tuple(
+            PromotionTarget(
+                product_code=target.target_product_code_id,
+                user_id=target.target_user_id,
+                apply_priority=target.apply_priority,
+                category=target.target_category,
+                publisher=target.target_publisher,
+                feature=target.target_feature,
+            )
+            for target in policy_model.discounttarget_set.all()
+            if target.target_segment_id is None     # 세그먼트 대상은 쿠폰 전용
+        )
+        # 대상 행이 없는 전체 대상 정책은 정책 우선순위로 전체 상품에 적용
+        if not targets and policy_model.target_type == TargetType.ALL.value:
+            targets = (PromotionTarget(product_code=None, user_id=None, apply_priority=policy_model.apply_priority),)
+        return PromotionRule(promotion=self.to_domain(promotion_model), targets=targets)
@@ -1,11 +1,18 @@
+import uuid
 from uuid import UUID
 
+from django.core.exceptions import ValidationError
 from django.db import models
 
+from apps.product.domain.value_objects import (
+    Category,
+    Feature,
+)
 from apps.product.infrastructure.persistence.models import Book
 from apps.pricing.domain.value_objects import (
     TargetType,
     DiscountType,
+    IssuedCouponStatus,
 )
 
 
@@ -33,12 +40,39 @@ class DiscountPolicy(models.Model):
         db_table = "discount_policies"
         db_table_comment = "할인 정책 테이블"
 
+    def clean(self):
+        # 쿠폰이 사용하는 정책은 프로모션 전용 대상(분야/출판사/도서 타입)으로 바꿀 수 없음
+        if (
+            self.target_type in TargetType.promotion_only()
+            and not self._state.adding
+            and self.coupon_set.exists()
+        ):
+            raise ValidationError({
+                "target_type": f"쿠폰이 사용하는 할인 정책은 {self.target_type} 대상으로 지정할 수 없습니다.",
+            })
+
+    def save(self, *args, **kwargs):
+        self.clean()
+        super().save(*args, **kwargs)
+
 
 class DiscountTarget(models.Model):
     id = models.UUIDField(primary_key=True, default=UUID, editable=False)
     discount_policy = models.ForeignKey(DiscountPolicy, null=False, on_delete=models.CASCADE, db_comment="할인 정책")
     target_user = models.ForeignKey("User", to_field="id", null=True, on_delete=models.CASCADE, db_comment="사용자에 적용되는 경우 값 있음")
     target_product_code = models.ForeignKey(Book, to_field="code", null=True, on_delete=models.CASCADE, db_comment="상품에 적용되는 경우 값 있음")
+    # 분야/출판사/도서 타입 단위 대상: 도서마다 대상 행을 만들지 않고 한 행으로 지정
+    target_category = models.CharField(
+        max_length=255, choices=Category.choices(), null=True, db_comment="분야에 적용되는 경우 값 있음",
+    )
+    target_publisher = models.CharField(max_length=255, null=True, db_comment="출판사에 적용되는 경우 값 있음")
+    target_feature = models.CharField(
+        max_length=255, choices=Feature.choices(), null=True, db_comment="도서 타입에 적용되는 경우 값 있음",
+    )
+    # 대량 사용자 대상: 사용자마다 대상 행을 만들지 않고 세그먼트 한 행으로 지정 (쿠폰 전용)
+    target_segment = models.ForeignKey(
+        "UserSegment", null=True, on_delete=models.CASCADE, db_comment="사용자 세그먼트에 적용되는 경우 값 있음",
+    )
     apply_priority = models.IntegerField(null=False, db_comment="적용 우선순위") # 타겟(상품, 유저별로 우선순위 다를 경우를 고려하여 설계만 잡아놓음)
     created_at = models.DateTimeField(auto_now_add=True, null=False)
     updated_at = models.DateTimeField(auto_now=True)
@@ -62,6 +96,19 @@ class Coupon(models.Model):
         db_table = "coupons"
         db_table_comment = "쿠폰 테이블"
 
+    def clean(self):
+        # 분야/출판사/도서 타입 대상 정책은 프로모션 전용 (쿠폰으로 저장하면 어떤 상품에도 적용되지 않음)
+        if self.discount_policy_id is None:
+            return
+        if self.discount_policy.target_type in TargetType.promotion_only():
+            raise ValidationError({
+                "discount_policy": f"쿠폰에는 {self.discount_policy.target_type} 대상 할인 정책을 사용할 수 없습니다.",
+            })
+
+    def save(self, *args, **kwargs):
+        self.clean()
+        super().save(*args, **kwargs)
+
 
 class Promotion(models.Model):
     id = models.UUIDField(primary_key=True, default=UUID, editable=False)
@@ -77,6 +124,25 @@ class Promotion(models.Model):
         db_table_comment = "프로모션 테이블"
 
 
+class ProductLowestPrice(models.Model):
+    """
+    상품별 "최저 구매 가능가" (자동할인 프로모션 + 누구나 쓸 수 있는 전체/상품 대상 쿠폰의 최적 조합, 비로그인 기준)
+    목록 배지용으로 배치(refresh_lowest_prices)로 채우고, 규칙/도서가 바뀌면 영향받는 상품만 signal로 다시 계산
+    """
+    book_code = models.OneToOneField(
+        Book, to_field="code", primary_key=True, on_delete=models.CASCADE,
+        db_comment="상품 코드", related_name="lowest_price",
+    )
+    price = models.DecimalField(max_digits=10, decimal_places=2, null=False, db_comment="계산 기준 정가")
+    lowest_price = models.DecimalField(max_digits=10, decimal_places=2, null=False, db_comment="최저 구매 가능가")
+    applied_policies = models.JSONField(null=False, default=list, db_comment="적용한 프로모션/쿠폰 이름 (적용 순서)")
+    valid_until = models.DateTimeField(null=True, db_comment="적용한 쿠폰이 끝나거나 새 쿠폰이 시작되는 시각 중 먼저 오는 시각 (없으면 NULL)")
+    computed_at = models.DateTimeField(null=False, db_comment="계산 시각")
+
+    class Meta:
+        db_table = "product_lowest_prices"
+        db_table_comment = "상품별 최저 구매 가능가 테이블"
+
 
 class User(models.Model):
     """
@@ -85,24 +151,62 @@ class User(models.Model):
     """
     id = models.UUIDField(primary_key=True, default=UUID, editable=False)
     name = models.CharField(max_length=255, null=False, db_comment="사용자 이름")
-    ...
+
+    @property
+    def is_authenticated(self) -> bool:
+        # 인증된 요청의 request.user로 쓰일 때 (django.contrib.auth의 사용자 모델과 같은 규약)
+        return True
 
     class Meta:
         db_table = "users"
         db_table_comment = "사용자 테이블"
 
 
+class UserSegment(models.Model):
+    """
+    사용자 세그먼트 (쿠폰 대상 사용자 묶음)
+    회원 목록은 사용자별 행 대신 UUID(16바이트) 오름차순 배열 하나로 저장 (SegmentMembers)
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    name = models.CharField(max_length=255, null=False, db_comment="세그먼트 이름")
+    members = models.BinaryField(null=False, default=bytes, db_comment="회원 id 배열 (UUID 16바이트, 오름차순)")
+    member_count = models.IntegerField(null=False, default=0, db_comment="회원 수")
+    members_digest = models.CharField(max_length=40, null=False, db_comment="회원 목록 sha1 (캐시 버전)")
+    created_at = models.DateTimeField(auto_now_add=True, null=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "user_segments"
+        db_table_comment = "사용자 세그먼트 테이블"
 
-# class IssuedCoupon(models.Model):
-#     """
-#     Coupon을 발급하는 경우 발급된 쿠폰의 정보를 저장하는 테이블
-#     (각 유저에 대한 개별발급 확장 가능성)
-#     """
-#     id = models.UUIDField(primary_key=True, default=UUID, editable=False)
-#     coupon = models.ForeignKey(Coupon, to_field="code", null=False, on_delete=models.CASCADE, db_comment="쿠폰")
-#     issued_coupon_id = models.CharField(max_length=255, null=False, db_comment="발급된 쿠폰 id")  # 난수번호등
-#     user = models.ForeignKey(User, null=False, on_delete=models.CASCADE, db_comment="사용자")    # 특정 사용자만 사용가능하도록 하는 쿠폰의 경우
-#     ...
-#     created_at = models.DateTimeField(auto_now_add=True, null=False, db_comment="등록 일자")
-#     updated_at = models.DateTimeField(auto_now=True, db_comment="수정 일자")
 
+class IssuedCoupon(models.Model):
+    """
+    Coupon을 발급하는 경우 발급된 쿠폰의 정보를 저장하는 테이블 (사용자별 쿠폰 지갑)
+    - 사용자 대상(USER) 쿠폰을 원본으로 발급하면 보유자만 사용 가능, 그 외 대상 조건(상품 등)은 원본을 따름
+    - 지갑 조회는 (user, status, valid_until) 색인 한 번으로 조회
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    coupon = models.ForeignKey(Coupon, null=False, on_delete=models.CASCADE, db_comment="발급 원본 쿠폰")
+    issued_coupon_id = models.CharField(max_length=255, null=False, unique=True, db_comment="발급된 쿠폰 id")  # 난수번호등
+    # 특정 사용자만 사용가능하도록 하는 쿠폰의 경우
+    user = models.ForeignKey(User, null=False, on_delete=models.CASCADE, db_comment="사용자")
+    status = models.CharField(
+        max_length=20, choices=IssuedCouponStatus.choices(), default=IssuedCouponStatus.ISSUED.value,
+        null=False, db_comment="발급 쿠폰 상태",
+    )
+    valid_until = models.DateTimeField(null=False, db_comment="발급 쿠폰 유효 기간 (원본 쿠폰 유효 기간과 둘 중 먼저 끝나는 시각까지 사용 가능)")
+    used_at = models.DateTimeField(null=True, db_comment="사용 일자")
+    created_at = models.DateTimeField(auto_now_add=True, null=False, db_comment="등록(발급) 일자")
+    updated_at = models.DateTimeField(auto_now=True, db_comment="수정 일자")
+
+    class Meta:
+        db_table = "issued_coupons"
+        db_table_comment = "발급 쿠폰 테이블"
+        indexes = [
+            models.Index(fields=["user", "status", "valid_until"], name="issued_coupon_wallet_idx"),
+        ]
+        constraints = [
+            # 같은 원본 쿠폰은 사용자마다 한 장 (동시에 실행된 발급끼리도 중복 발급되지 않음)
+            models.UniqueConstraint(fields=["coupon", "user"], name="issued_coupon_coupon_user_uniq"),
+        ]
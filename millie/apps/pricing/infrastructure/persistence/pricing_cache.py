@@ -0,0 +1,45 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import (
+    Any,
+    Optional,
+)
+
+from django.conf import settings
+
+from apps.utils.cache import TwoTierCache
+
+
+@dataclass(frozen=True)
+class TimeBoundResult:
+    """
+    기준 시각에 따라 결과가 달라지는 조회(유효기간/적용기간)의 캐시 값
+    loaded_at 이후 valid_through(포함)까지, next_start_at(미포함) 전까지는 같은 결과임이 보장됨
+    """
+    value: Any
+    loaded_at: datetime
+    valid_through: Optional[datetime] = None
+    next_start_at: Optional[datetime] = None
+
+    def covers(self, reference_time: datetime) -> bool:
+        return (
+            self.loaded_at <= reference_time
+            and (self.valid_through is None or reference_time <= self.valid_through)
+            and (self.next_start_at is None or reference_time < self.next_start_at)
+        )
+
+
+class PricingCache(TwoTierCache):
+    """
+    쿠폰/프로모션 조회 결과 캐시
+    쿠폰·할인정책·할인대상·프로모션 중 하나라도 바뀌면 전체 버전을 교체 (변경이 드물고 조회 조건 조합이 많으므로)
+    """
+
+    def __init__(self):
+        super().__init__(alias=settings.PRICING_CACHE_ALIAS, prefix="pricing")
+
+    def query_key(self, name: str, **conditions) -> str:
+        return self.key(self.version("all"), name, self.digest(conditions))
+
+    def invalidate(self) -> None:
+        self.bump_version("all")
@@ -0,0 +1,45 @@
+from datetime import datetime
+from typing import (
+    List,
+    Optional,
+)
+from uuid import UUID
+
+from apps.pricing.domain.entity.coupon import Coupon as CouponEntity
+from apps.pricing.domain.entity.issued_coupon import IssuedCoupon as IssuedCouponEntity
+from apps.pricing.domain.repositories.coupon_repository import (
+    AsyncCouponRepository,
+    CouponRepository,
+)
+from apps.utils.concurrency import db_sync_to_async
+
+
+class AsyncCouponRepoImpl(AsyncCouponRepository):
+    """
+    CouponRepoImpl의 조회를 await 가능하게 노출 (유효 구간 캐시 경로를 그대로 사용)
+    """
+
+    def __init__(self, repo: CouponRepository):
+        self._repo = repo
+
+    async def get_coupons_by_code(
+        self,
+        coupon_code: List[str],
+        is_valid: bool = True,
+    ) -> List[Optional[CouponEntity]]:
+        return await db_sync_to_async(self._repo.get_coupons_by_code)(coupon_code=coupon_code, is_valid=is_valid)
+
+    async def list_active_not_expired(
+        self,
+        reference_time: datetime,
+        coupon_code: Optional[List[str]] = None,
+    ) -> List[CouponEntity]:
+        return await db_sync_to_async(self._repo.list_active_not_expired)(reference_time, coupon_code=coupon_code)
+
+    async def list_issued_coupons(
+        self,
+        user_id: UUID,
+        reference_time: datetime,
+        coupon_code: Optional[List[str]] = None,
+    ) -> List[IssuedCouponEntity]:
+        return await db_sync_to_async(self._repo.list_issued_coupons)(user_id, reference_time, coupon_code=coupon_code)
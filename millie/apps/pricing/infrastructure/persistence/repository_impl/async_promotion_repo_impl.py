@@ -0,0 +1,38 @@
+from typing import (
+    List,
+    Optional,
+)
+from uuid import UUID
+
+from apps.pricing.domain.entity.rule_snapshot import PromotionIndex
+from apps.pricing.domain.policy.discount_policy import DiscountPolicy
+from apps.pricing.domain.repositories.promotion_repository import (
+    AsyncPromotionRepository,
+    PromotionRepository,
+)
+from apps.product.domain.value_objects import ProductAttributes
+from apps.utils.concurrency import db_sync_to_async
+
+
+class AsyncPromotionRepoImpl(AsyncPromotionRepository):
+    """
+    PromotionRepoImpl의 조회를 await 가능하게 노출 (유효 구간 캐시 경로를 그대로 사용)
+    """
+
+    def __init__(self, repo: PromotionRepository):
+        self._repo = repo
+
+    async def get_active_promotions(
+        self,
+        target_product_code: Optional[str] = None,
+        target_user_id: Optional[UUID] = None,
+        attributes: Optional[ProductAttributes] = None,
+    ) -> List[DiscountPolicy]:
+        return await db_sync_to_async(self._repo.get_active_promotions)(
+            target_product_code=target_product_code,
+            target_user_id=target_user_id,
+            attributes=attributes,
+        )
+
+    async def get_promotion_index(self) -> PromotionIndex:
+        return await db_sync_to_async(self._repo.get_promotion_index)()
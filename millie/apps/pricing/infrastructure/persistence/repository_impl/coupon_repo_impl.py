@@ -3,17 +3,35 @@ from typing import (
     List,
     Optional,
 )
+from uuid import UUID
 
+from django.db.models import (
+    Exists,
+    Min,
+    OuterRef,
+)
 from django.utils import timezone
 
 from apps.pricing.domain.entity.coupon import Coupon as CouponEntity
+from apps.pricing.domain.entity.issued_coupon import IssuedCoupon as IssuedCouponEntity
 from apps.pricing.infrastructure.persistence.mapper import (
     CouponMapper,
     DiscountPolicyMapper,
+    IssuedCouponMapper,
 )
 from apps.pricing.infrastructure.persistence.models import Coupon as CouponModel
+from apps.pricing.infrastructure.persistence.models import DiscountTarget as DiscountTargetModel
+from apps.pricing.infrastructure.persistence.models import IssuedCoupon as IssuedCouponModel
+from apps.pricing.infrastructure.persistence.pricing_cache import (
+    PricingCache,
+    TimeBoundResult,
+)
 from apps.pricing.domain.repositories.coupon_repository import CouponRepository
-from apps.pricing.domain.value_objects import CouponStatus
+from apps.pricing.domain.value_objects import (
+    CouponStatus,
+    IssuedCouponStatus,
+    TargetType,
+)
 
 
 class CouponRepoImpl(CouponRepository):
@@ -21,31 +39,151 @@ class CouponRepoImpl(CouponRepository):
     def __init__(self):
         self.coupon_mapper = CouponMapper()
         self.discount_policy_mapper = DiscountPolicyMapper()
+        self.issued_coupon_mapper = IssuedCouponMapper()
+        self.cache = PricingCache()
 
     def get_coupons_by_code(
         self,
         coupon_code: List[str],
         is_valid: bool = True,
     ) -> List[Optional[CouponEntity]]:
+        # 유효 쿠폰만 조회하는 경우 가장 먼저 만료되는 쿠폰의 유효기간까지만 캐시 결과를 사용
+        now = timezone.now()
+        key = self.cache.query_key("by_code", coupon_code=sorted(coupon_code), is_valid=is_valid)
+        result = self.cache.get_or_load(
+            key,
+            lambda: self._load_coupons_by_code(coupon_code, is_valid, now),
+            is_fresh=lambda cached: cached.covers(now),
+        )
+        return list(result.value)
 
-        coupons = CouponModel.objects.filter(code__in=coupon_code)
+    def _load_coupons_by_code(
+        self,
+        coupon_code: List[str],
+        is_valid: bool,
+        reference_time: datetime,
+    ) -> TimeBoundResult:
+        coupons = CouponModel.objects.filter(code__in=coupon_code).select_related(
+            "discount_policy"
+        ).prefetch_related(self.coupon_mapper.targets_prefetch())
 
         if is_valid:
-            coupons = coupons.filter(valid_until__gte=timezone.now(), status=CouponStatus.ACTIVE.value)
-        return [self.coupon_mapper.to_domain(c) for c in coupons]
+            coupons = coupons.filter(valid_until__gte=reference_time, status=CouponStatus.ACTIVE.value)
+        entities = [self.coupon_mapper.to_domain(c) for c in coupons]
 
+        return TimeBoundResult(
+            value=entities,
+            loaded_at=reference_time,
+            valid_through=min((c.valid_until for c in entities), default=None) if is_valid else None,
+        )
 
     def list_active_not_expired(
         self,
         reference_time: datetime,
+        coupon_code: Optional[List[str]] = None,
     ) -> List[CouponEntity]:
+        return list(self.load_active_not_expired(reference_time, coupon_code).value)
 
-        coupons = CouponModel.objects.filter(
+    def load_active_not_expired(
+        self,
+        reference_time: datetime,
+        coupon_code: Optional[List[str]] = None,
+        with_next_start: bool = False,
+    ) -> TimeBoundResult:
+        """
+        list_active_not_expired의 캐시 값 (유효 구간 포함)
+        결과가 바뀌는 다음 시각(유효기간/적용기간 경계) 전까지는 캐시된 목록을 그대로 사용
+        with_next_start: 캐시가 비활성화여도 next_start_at(아직 시작 전인 쿠폰 중 가장 먼저 시작하는 시각)을 계산
+        """
+        key = self.cache.query_key(
+            "active_not_expired",
+            coupon_code=sorted(coupon_code) if coupon_code is not None else None,
+        )
+        return self.cache.get_or_load(
+            key,
+            lambda: self._load_active_not_expired(reference_time, coupon_code, with_next_start),
+            is_fresh=lambda cached: cached.covers(reference_time),
+        )
+
+    @staticmethod
+    def _candidates(reference_time: datetime):
+        # 기준 시각에 끝나지 않은 쿠폰 (시작 전 포함)
+        # 발급용 쿠폰(대상 사용자가 없는 사용자 대상)은 보유자만 쓰므로 제외하고 지갑(list_issued_coupons)에서만 조회
+        return CouponModel.objects.filter(
             status=CouponStatus.ACTIVE.value,
             valid_until__gte=reference_time,
             discount_policy__is_active=True,
-            discount_policy__effective_start_at__lte=reference_time,
             discount_policy__effective_end_at__gte=reference_time,
+        ).alias(
+            has_target_user=Exists(DiscountTargetModel.objects.filter(
+                discount_policy_id=OuterRef("discount_policy_id"), target_user__isnull=False,
+            )),
+        ).exclude(
+            discount_policy__target_type=TargetType.USER.value,
+            has_target_user=False,
+        )
+
+    def _load_active_not_expired(
+        self,
+        reference_time: datetime,
+        coupon_code: Optional[List[str]] = None,
+        with_next_start: bool = False,
+    ) -> TimeBoundResult:
+        candidates = self._candidates(reference_time)
+        # 요청된 쿠폰만 필요한 경우 전체 스캔 대신 코드 조건으로 좁혀서 조회
+        if coupon_code is not None:
+            candidates = candidates.filter(code__in=coupon_code)
+
+        coupons = candidates.filter(
+            discount_policy__effective_start_at__lte=reference_time,
+        ).select_related(
+            "discount_policy"
+        ).prefetch_related(self.coupon_mapper.targets_prefetch())
+
+        coupons = list(coupons)
+
+        # 캐시 유효 구간: 포함된 쿠폰 중 가장 먼저 끝나는 시각 ~ 아직 시작 전인 쿠폰 중 가장 먼저 시작하는 시각
+        # (캐시가 비활성화면 요청된 경우에만 계산)
+        next_start = None
+        if with_next_start or not self.cache.disabled:
+            next_start = candidates.filter(
+                discount_policy__effective_start_at__gt=reference_time,
+            ).aggregate(start=Min("discount_policy__effective_start_at"))["start"]
+
+        return TimeBoundResult(
+            value=[self.coupon_mapper.to_domain(coupon) for coupon in coupons],
+            loaded_at=reference_time,
+            valid_through=min(
+                (min(coupon.valid_until, coupon.discount_policy.effective_end_at) for coupon in coupons),
+                default=None,
+            ),
+            next_start_at=next_start,
+        )
+
+    def list_issued_coupons(
+        self,
+        user_id: UUID,
+        reference_time: datetime,
+        coupon_code: Optional[List[str]] = None,
+    ) -> List[IssuedCouponEntity]:
+        # 사용자 지갑: (user, status, valid_until) 색인으로 보유 쿠폰만 조회 (원본 쿠폰/정책은 join, 대상 행은 prefetch)
+        # 사용할 때마다 바뀌므로 캐시하지 않음
+        issued = IssuedCouponModel.objects.filter(
+            user_id=user_id,
+            status=IssuedCouponStatus.ISSUED.value,
+            valid_until__gte=reference_time,
+            coupon__status=CouponStatus.ACTIVE.value,
+            coupon__valid_until__gte=reference_time,
+            coupon__discount_policy__is_active=True,
+            coupon__discount_policy__effective_start_at__lte=reference_time,
+            coupon__discount_policy__effective_end_at__gte=reference_time,
         )
-        return [self.coupon_mapper.to_domain(coupon) for coupon in coupons]
+        if coupon_code is not None:
+            issued = issued.filter(coupon__code__in=coupon_code)
 
+        issued = issued.select_related(
+            "coupon__discount_policy"
+        ).prefetch_related(
+            self.coupon_mapper.targets_prefetch("coupon__discount_policy__discounttarget_set")
+        ).order_by("valid_until", "created_at")
+        return [self.issued_coupon_mapper.to_domain(model) for model in issued]
@@ -0,0 +1,67 @@
+from typing import (
+    Dict,
+    List,
+    Optional,
+)
+
+from django.db import transaction
+
+from apps.pricing.domain.entity.lowest_price import LowestPrice
+from apps.pricing.domain.repositories.lowest_price_repository import LowestPriceRepository
+from apps.pricing.infrastructure.persistence.models import ProductLowestPrice as ProductLowestPriceModel
+
+
+class LowestPriceRepoImpl(LowestPriceRepository):
+
+    def __init__(self, batch_size: int = 500):
+        self._batch_size = batch_size
+
+    def get_many(
+        self,
+        product_codes: List[str],
+    ) -> Dict[str, LowestPrice]:
+        # 목록 한 페이지 분량을 한 번에 조회 (전체 목록이면 batch_size씩 나누어 IN 조회)
+        result: Dict[str, LowestPrice] = {}
+        for start in range(0, len(product_codes), self._batch_size):
+            rows = ProductLowestPriceModel.objects.filter(pk__in=product_codes[start:start + self._batch_size])
+            result.update((row.book_code_id, self._to_domain(row)) for row in rows)
+        return result
+
+    def replace(
+        self,
+        lowest_prices: List[LowestPrice],
+        product_codes: Optional[List[str]] = None,
+    ) -> None:
+        with transaction.atomic():
+            if product_codes is None:
+                ProductLowestPriceModel.objects.all().delete()
+            else:
+                for start in range(0, len(product_codes), self._batch_size):
+                    batch = product_codes[start:start + self._batch_size]
+                    ProductLowestPriceModel.objects.filter(pk__in=batch).delete()
+            ProductLowestPriceModel.objects.bulk_create(
+                [self._to_model(lowest_price) for lowest_price in lowest_prices],
+                batch_size=self._batch_size,
+            )
+
+    @staticmethod
+    def _to_domain(row: ProductLowestPriceModel) -> LowestPrice:
+        return LowestPrice(
+            product_code=row.book_code_id,
+            price=row.price,
+            lowest_price=row.lowest_price,
+            applied_policies=tuple(row.applied_policies),
+            computed_at=row.computed_at,
+            valid_until=row.valid_until,
+        )
+
+    @staticmethod
+    def _to_model(lowest_price: LowestPrice) -> ProductLowestPriceModel:
+        return ProductLowestPriceModel(
+            book_code_id=lowest_price.product_code,
+            price=lowest_price.price,
+            lowest_price=lowest_price.lowest_price,
+            applied_policies=list(lowest_price.applied_policies),
+            computed_at=lowest_price.computed_at,
+            valid_until=lowest_price.valid_until,
+        )
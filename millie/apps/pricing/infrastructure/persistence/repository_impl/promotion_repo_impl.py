@@ -4,21 +4,16 @@ from typing import (
     Optional,
 )
 
-from django.db.models import (
-    IntegerField,
-    OuterRef,
-    Q,
-    Subquery,
-)
-
-
 from apps.pricing.domain.entity.promotion import Promotion as PromotionEntity
+from apps.pricing.domain.entity.rule_snapshot import (
+    PromotionIndex,
+    PromotionRule,
+)
 from apps.pricing.domain.repositories.promotion_repository import PromotionRepository
 from apps.pricing.infrastructure.persistence.mapper import PromotionMapper
-from apps.pricing.infrastructure.persistence.models import (
-    Promotion as PromotionModel,
-    DiscountTarget as DiscountTargetModel,
-)
+from apps.pricing.infrastructure.persistence.models import Promotion as PromotionModel
+from apps.pricing.infrastructure.persistence.pricing_cache import PricingCache
+from apps.product.domain.value_objects import ProductAttributes
 
 
 class PromotionRepoImpl(PromotionRepository):
@@ -26,38 +21,32 @@ class PromotionRepoImpl(PromotionRepository):
 
     def __init__(self):
         self.promotion_mapper = PromotionMapper()
+        self.cache = PricingCache()
 
 
     def get_active_promotions(
         self,
         target_product_code: Optional[str] = None,
         target_user_id: Optional[UUID] = None,
+        attributes: Optional[ProductAttributes] = None,
     ) -> List[Optional[PromotionEntity]]:
-
-
-        target_q = Q()
-
-        if target_product_code:
-            target_q |= Q(target_product_code=target_product_code)
-
-        if target_user_id:
-            target_q |= Q(target_user=target_user_id)
-
-        target_q |= Q(target_product_code__isnull=True, target_user__isnull=True)
-
-        discount_target_qs = DiscountTargetModel.objects.filter(
-            discount_policy=OuterRef('discount_policy_id')
-        ).filter(target_q).order_by('apply_priority')
-
-        promotions = (
-            PromotionModel.objects.filter(
-                is_auto_discount=True,          # 자동할인 적용인것만
-            ).annotate(
-                target_priority=Subquery(
-                    discount_target_qs.values('apply_priority')[:1],
-                    output_field=IntegerField()
-                )
-            ).order_by('target_priority')
+        # 상품/사용자/분야/출판사/도서 타입마다 색인 조회 한 번씩 (DB 조회 없음)
+        return self.get_promotion_index().promotions_for(target_product_code, target_user_id, attributes)
+
+    def get_promotion_index(self) -> PromotionIndex:
+        # 자동할인 프로모션 전체를 한 번 읽어 색인으로 캐시 (규칙이 바뀌면 signal로 캐시 버전 교체)
+        return self.cache.get_or_load(
+            self.cache.query_key("promotion_index"),
+            lambda: PromotionIndex(self.load_rules()),
         )
 
-        return [self.promotion_mapper.to_domain(promotion) for promotion in promotions]
+    def load_rules(self) -> List[PromotionRule]:
+        promotions = PromotionModel.objects.filter(
+            is_auto_discount=True,          # 자동할인 적용인것만
+        ).select_related(
+            "discount_policy"
+        ).prefetch_related(
+            "discount_policy__discounttarget_set"
+        ).order_by("created_at", "id")
+
+        return [self.promotion_mapper.to_rule(promotion) for promotion in promotions]
@@ -0,0 +1,97 @@
+from datetime import datetime
+from typing import (
+    List,
+    Optional,
+)
+from uuid import UUID
+
+from apps.pricing.domain.entity.coupon import Coupon as CouponEntity
+from apps.pricing.domain.entity.issued_coupon import IssuedCoupon as IssuedCouponEntity
+from apps.pricing.domain.entity.promotion import Promotion as PromotionEntity
+from apps.pricing.domain.entity.rule_snapshot import (
+    PromotionIndex,
+    RuleSnapshot,
+)
+from apps.pricing.domain.repositories.coupon_repository import CouponRepository
+from apps.pricing.domain.repositories.promotion_repository import PromotionRepository
+from apps.pricing.domain.repositories.rule_snapshot_repository import RuleSnapshotRepository
+from apps.pricing.infrastructure.persistence.repository_impl.coupon_repo_impl import CouponRepoImpl
+from apps.pricing.infrastructure.persistence.repository_impl.promotion_repo_impl import PromotionRepoImpl
+from apps.product.domain.value_objects import ProductAttributes
+
+
+class RuleSnapshotRepoImpl(RuleSnapshotRepository):
+
+    def __init__(self):
+        self.promotion_repo = PromotionRepoImpl()
+        self.coupon_repo = CouponRepoImpl()
+
+    def load(self, reference_time: datetime) -> RuleSnapshot:
+        # 프로모션 색인과 쿠폰 목록은 각 repository의 캐시(가격 캐시 버전이 들어간 키)를 그대로 사용
+        # 규칙이 바뀌어 버전이 교체되기 전까지는 요청마다 DB를 다시 읽지 않음
+        coupons = self.coupon_repo.load_active_not_expired(reference_time, with_next_start=True)
+        return RuleSnapshot.from_index(
+            reference_time=reference_time,
+            index=self.promotion_repo.get_promotion_index(),
+            coupons=coupons.value,
+            next_start_at=coupons.next_start_at,
+        )
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 스냅샷 기반 repository (DB 조회 없이 메모리에서 응답)
+# ──────────────────────────────────────────────────────────────────────────────
+class SnapshotPromotionRepoImpl(PromotionRepository):
+    """
+    스냅샷의 프로모션을 PromotionRepoImpl과 같은 순서로 반환 (RuleSnapshot.promotions_for)
+    """
+
+    def __init__(self, snapshot: RuleSnapshot):
+        self._snapshot = snapshot
+
+    def get_active_promotions(
+        self,
+        target_product_code: Optional[str] = None,
+        target_user_id: Optional[UUID] = None,
+        attributes: Optional[ProductAttributes] = None,
+    ) -> List[Optional[PromotionEntity]]:
+        return self._snapshot.promotions_for(target_product_code, target_user_id, attributes)
+
+    def get_promotion_index(self) -> PromotionIndex:
+        return self._snapshot.promotion_index
+
+
+class SnapshotCouponRepoImpl(CouponRepository):
+    """
+    스냅샷 시각에 유효한 쿠폰만 반환 (reference_time 인자와 관계없이 스냅샷 시각 기준)
+    """
+
+    def __init__(self, snapshot: RuleSnapshot):
+        self._coupons = snapshot.coupons
+
+    def get_coupons_by_code(
+        self,
+        coupon_code: List[str],
+        is_valid: bool = True,
+    ) -> List[Optional[CouponEntity]]:
+        codes = set(coupon_code)
+        return [coupon for coupon in self._coupons if coupon.code in codes]
+
+    def list_active_not_expired(
+        self,
+        reference_time: datetime,
+        coupon_code: Optional[List[str]] = None,
+    ) -> List[CouponEntity]:
+        if coupon_code is None:
+            return list(self._coupons)
+        codes = set(coupon_code)
+        return [coupon for coupon in self._coupons if coupon.code in codes]
+
+    def list_issued_coupons(
+        self,
+        user_id: UUID,
+        reference_time: datetime,
+        coupon_code: Optional[List[str]] = None,
+    ) -> List[IssuedCouponEntity]:
+        # 스냅샷은 사용자와 무관한 규칙만 담음 (재계산/시뮬레이션은 비로그인 기준)
+        return []
@@ -0,0 +1,79 @@
+import hashlib
+import uuid
+from typing import (
+    Iterable,
+    Optional,
+)
+from uuid import UUID
+
+from django.conf import settings
+
+from apps.pricing.domain.entity.user_segment import (
+    SegmentMembers,
+    UserSegment,
+)
+from apps.pricing.domain.repositories.user_segment_repository import UserSegmentRepository
+from apps.pricing.infrastructure.persistence.models import UserSegment as UserSegmentModel
+from apps.utils.cache import (
+    MISSING,
+    LocalLRUCache,
+)
+
+
+# 세그먼트 회원 목록 (프로세스 로컬, (id, version) 단위라 무효화가 필요 없음)
+_members_cache = LocalLRUCache(max_entries=settings.SEGMENT_CACHE_MAX_ENTRIES)
+
+
+def load_segment_members(segment_id: UUID, version: str) -> SegmentMembers:
+    """
+    UserSegment.load_members 구현 (쿠폰 캐시에 함께 pickle되므로 모듈 함수로 둠)
+    """
+    key = f"{segment_id}:{version}"
+    members = _members_cache.get(key)
+    if members is MISSING:
+        row = UserSegmentModel.objects.filter(id=segment_id).values_list("members", "members_digest").first()
+        if row is None:
+            members = SegmentMembers()
+        else:
+            members = SegmentMembers(bytes(row[0]))
+            # 그사이 회원 목록이 바뀌었으면 읽어온 버전으로 저장 (요청한 버전으로 저장하면 이전 목록으로 오인됨)
+            key = f"{segment_id}:{row[1]}"
+        _members_cache.set(key, members)
+    return members
+
+
+def to_segment(segment_id: UUID, version: str) -> UserSegment:
+    return UserSegment(id=segment_id, version=version, load_members=load_segment_members)
+
+
+class UserSegmentRepoImpl(UserSegmentRepository):
+
+    def get(
+        self,
+        segment_id: UUID,
+    ) -> Optional[UserSegment]:
+        # 회원 목록(members)은 포함 여부를 판정할 때 읽어오므로 버전만 조회
+        version = UserSegmentModel.objects.filter(id=segment_id).values_list("members_digest", flat=True).first()
+        if version is None:
+            return None
+        return to_segment(segment_id, version)
+
+    def save(
+        self,
+        name: str,
+        user_ids: Iterable[UUID],
+        segment_id: Optional[UUID] = None,
+    ) -> UserSegment:
+        members = SegmentMembers.from_ids(user_ids)
+        digest = hashlib.sha1(members.packed).hexdigest()
+        model, _ = UserSegmentModel.objects.update_or_create(
+            id=segment_id or uuid.uuid4(),
+            defaults={
+                "name": name,
+                "members": members.packed,
+                "member_count": len(members),
+                "members_digest": digest,
+            },
+        )
+        _members_cache.set(f"{model.id}:{digest}", members)
+        return to_segment(model.id, digest)
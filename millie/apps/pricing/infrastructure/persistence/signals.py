@@ -0,0 +1,127 @@
+from datetime import datetime
+from typing import (
+    List,
+    Optional,
+)
+
+from django.db import transaction
+from django.db.models.signals import (
+    post_delete,
+    post_save,
+)
+from django.dispatch import receiver
+from django.utils import timezone
+
+from apps.pricing.domain.value_objects import TargetType
+from apps.pricing.infrastructure import lowest_price_refresh
+from apps.pricing.infrastructure.persistence.models import (
+    Coupon as CouponModel,
+    DiscountPolicy as DiscountPolicyModel,
+    DiscountTarget as DiscountTargetModel,
+    Promotion as PromotionModel,
+    UserSegment as UserSegmentModel,
+)
+from apps.pricing.infrastructure.persistence.pricing_cache import PricingCache
+from apps.product.infrastructure.persistence.models import (
+    Book as BookModel,
+    BookDetail as BookDetailModel,
+    BookFeature as BookFeatureModel,
+    PublishInfo as PublishInfoModel,
+)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 가격 조회 캐시: 쿠폰/할인정책/할인대상/프로모션이 바뀌면 commit 이후 전체 버전 교체
+# (세그먼트는 캐시된 쿠폰이 회원 목록 버전을 들고 있으므로 함께 교체)
+# ──────────────────────────────────────────────────────────────────────────────
+@receiver(post_save, sender=CouponModel)
+@receiver(post_save, sender=DiscountPolicyModel)
+@receiver(post_save, sender=DiscountTargetModel)
+@receiver(post_save, sender=PromotionModel)
+@receiver(post_save, sender=UserSegmentModel)
+@receiver(post_delete, sender=CouponModel)
+@receiver(post_delete, sender=DiscountPolicyModel)
+@receiver(post_delete, sender=DiscountTargetModel)
+@receiver(post_delete, sender=PromotionModel)
+@receiver(post_delete, sender=UserSegmentModel)
+def invalidate_pricing_cache(sender, instance, **kwargs):
+    transaction.on_commit(lambda: PricingCache().invalidate())
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 최저 구매 가능가: 규칙/도서가 바뀌면 영향받는 상품만 commit 이후 다시 계산
+# (위의 캐시 무효화보다 뒤에 등록되어야 새 규칙으로 계산됨, 트랜잭션당 한 번: lowest_price_refresh.schedule)
+# ──────────────────────────────────────────────────────────────────────────────
+def _coupon_policy_codes(policy: DiscountPolicyModel) -> Optional[List[str]]:
+    # 쿠폰 정책이 영향을 주는 상품 (None: 전체, 빈 목록: 없음)
+    if policy.promotion_set.exists():
+        return None         # 프로모션 순서는 다른 상품의 결과에도 영향
+    if policy.target_type in (TargetType.USER.value, TargetType.SEGMENT.value):
+        return []           # 사용자/세그먼트 대상 쿠폰은 최저가 계산 대상이 아님
+    if policy.target_type == TargetType.PRODUCT.value:
+        return list(
+            policy.discounttarget_set.exclude(target_product_code=None).values_list("target_product_code_id", flat=True)
+        )
+    return None
+
+
+def _affected_product_codes(instance) -> Optional[List[str]]:
+    if isinstance(instance, BookModel):
+        return [instance.code]
+    if isinstance(instance, (BookDetailModel, BookFeatureModel, PublishInfoModel)):
+        return [instance.book_code_id]      # 분야/출판사/도서 타입 대상 프로모션 적용 여부가 바뀔 수 있음
+    if isinstance(instance, PromotionModel):
+        return None
+    try:
+        if isinstance(instance, CouponModel):
+            return _coupon_policy_codes(instance.discount_policy)
+        if isinstance(instance, DiscountTargetModel):
+            codes = _coupon_policy_codes(instance.discount_policy)
+            if codes is not None and instance.target_product_code_id:
+                codes = sorted(set(codes) | {instance.target_product_code_id})
+            return codes
+        return _coupon_policy_codes(instance)
+    except DiscountPolicyModel.DoesNotExist:
+        return None         # 정책까지 함께 삭제되는 중이면 범위를 알 수 없으므로 전체
+
+
+def _coupon_starts_at(instance) -> Optional[datetime]:
+    # 아직 시작 전인 쿠폰이면 시작 시각 (쿠폰 조회는 시작 이후에만 포함하므로 그때 다시 계산)
+    if isinstance(instance, DiscountPolicyModel):
+        policy = instance
+    elif isinstance(instance, (CouponModel, DiscountTargetModel)):
+        policy = instance.discount_policy
+    else:
+        return None
+    if policy.effective_start_at <= timezone.now() or policy.promotion_set.exists():
+        return None
+    return policy.effective_start_at
+
+
+@receiver(post_save, sender=CouponModel)
+@receiver(post_save, sender=DiscountPolicyModel)
+@receiver(post_save, sender=DiscountTargetModel)
+@receiver(post_save, sender=PromotionModel)
+@receiver(post_save, sender=BookModel)
+@receiver(post_save, sender=BookDetailModel)
+@receiver(post_save, sender=BookFeatureModel)
+@receiver(post_save, sender=PublishInfoModel)
+@receiver(post_delete, sender=CouponModel)
+@receiver(post_delete, sender=DiscountPolicyModel)
+@receiver(post_delete, sender=DiscountTargetModel)
+@receiver(post_delete, sender=PromotionModel)
+@receiver(post_delete, sender=BookDetailModel)
+@receiver(post_delete, sender=BookFeatureModel)
+@receiver(post_delete, sender=PublishInfoModel)
+def refresh_lowest_prices(sender, instance, raw=False, using=None, **kwargs):
+    if raw:
+        return      # loaddata: 적재 후 refresh_lowest_prices 명령으로 한 번에 계산
+    codes = _affected_product_codes(instance)
+    if codes == []:
+        return
+    lowest_price_refresh.schedule(codes, using=using)
+
+    if kwargs.get("signal") is post_save:
+        starts_at = _coupon_starts_at(instance)
+        if starts_at is not None:
+            transaction.on_commit(lambda: lowest_price_refresh.schedule_at(starts_at, codes), using=using)
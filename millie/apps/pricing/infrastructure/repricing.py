@@ -0,0 +1,208 @@
+import csv
+import json
+import pickle
+from dataclasses import dataclass
+from typing import (
+    IO,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+)
+
+import django
+from django.apps import apps
+from django.test.utils import override_settings
+
+
+CSV = "csv"
+NDJSON = "ndjson"
+FORMATS = (CSV, NDJSON)
+
+COLUMNS = (
+    "code",
+    "name",
+    "price",
+    "discounted",
+    "discount_amount",
+    "discount_types",
+    "applied_pricing_policies",
+    "available_coupons",
+)
+# CSV에서 목록 값 구분자
+LIST_SEPARATOR = "|"
+
+
+@dataclass(frozen=True)
+class Partition:
+    """
+    상품 코드 구간 [first_code, last_code] 하나 (결과는 path에 기록)
+    """
+    index: int
+    first_code: str
+    last_code: str
+    path: str
+
+
+def partition_codes(codes: Sequence[str], count: int) -> List[tuple]:
+    """
+    정렬된 코드 목록을 상품 수가 고른 count개 구간 [(first_code, last_code), ...]으로 나눔
+    """
+    count = max(1, min(count, len(codes)))
+    size, remainder = divmod(len(codes), count)
+    ranges = []
+    start = 0
+    for i in range(count):
+        end = start + size + (1 if i < remainder else 0)
+        if end > start:
+            ranges.append((codes[start], codes[end - 1]))
+        start = end
+    return ranges
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 워커 (ProcessPoolExecutor의 각 프로세스에서 실행)
+# ──────────────────────────────────────────────────────────────────────────────
+_state: Dict[str, Any] = {}
+
+
+def init_worker(snapshot_data: bytes, coupon_code: List[str], output_format: str, batch_size: int) -> None:
+    """
+    프로세스마다 한 번 실행
+    - spawn으로 시작된 프로세스는 Django 초기화부터 (모델 import는 그 이후)
+    - 스냅샷은 부모가 한 번 읽어 pickle로 전달, 워커는 규칙을 DB에서 다시 읽지 않음
+    - DB 연결은 프로세스마다 새로 맺음 (부모 연결을 이어받지 않음)
+    """
+    if not apps.ready:
+        django.setup()
+
+    from apps.pricing.application.services.coupon_service import CouponService
+    from apps.pricing.application.services.promotion_service import PromotionService
+    from apps.pricing.application.use_case.calculate_price_use_case import CalculatePriceUseCase
+    from apps.pricing.infrastructure.persistence.repository_impl.snapshot_repo_impl import (
+        SnapshotCouponRepoImpl,
+        SnapshotPromotionRepoImpl,
+    )
+
+    snapshot = pickle.loads(snapshot_data)
+    # 실시간 요청(현재 규칙)과 single-flight 결과를 공유하지 않도록 프로세스 내에서만 합침
+    override = override_settings(SINGLE_FLIGHT_CACHE_ALIAS=None)
+    override.enable()
+
+    _state.update(
+        use_case=CalculatePriceUseCase(
+            product_repo=None,          # 상품은 구간 단위로 직접 읽음
+            promotion_service=PromotionService(SnapshotPromotionRepoImpl(snapshot)),
+            coupon_service=CouponService(SnapshotCouponRepoImpl(snapshot)),
+        ),
+        coupon_code=list(coupon_code),
+        output_format=output_format,
+        batch_size=batch_size,
+        override=override,
+    )
+
+
+def close_worker() -> None:
+    # 같은 프로세스에서 실행한 경우(워커 1개) 설정 복구
+    override = _state.pop("override", None)
+    if override is not None:
+        override.disable()
+    _state.clear()
+
+
+def price_partition(partition: Partition) -> int:
+    """
+    구간의 판매 중인 상품 가격을 계산하여 partition.path에 기록, 기록한 상품 수 반환
+    """
+    from django.db import close_old_connections
+
+    from apps.product.domain.entity import Product as ProductEntity
+    from apps.product.domain.value_objects import (
+        ProductAttributes,
+        ProductStatus,
+    )
+    from apps.product.infrastructure.persistence.models import (
+        Book as BookModel,
+        BookFeature as BookFeatureModel,
+    )
+
+    use_case = _state["use_case"]
+    books = BookModel.objects.filter(
+        code__gte=partition.first_code,
+        code__lte=partition.last_code,
+        status=ProductStatus.ACTIVE.value,
+    )
+    # 분야/출판사/도서 타입 대상 프로모션 판정용 속성 (feature는 상품 엔티티와 같이 도서별 첫 번째 것만)
+    features: Dict[str, str] = {}
+    feature_rows = BookFeatureModel.objects.filter(book_code__in=books.values("code")).order_by("pk")
+    for book_code, feature in feature_rows.values_list("book_code_id", "feature"):
+        features.setdefault(book_code, feature)
+    books = books.order_by("code").values_list(
+        "code", "name", "price", "status", "created_at", "updated_at", "detail__category", "publish_info__publisher",
+    )
+
+    written = 0
+    try:
+        with open(partition.path, "w", encoding="utf-8", newline="") as out:
+            writer = RowWriter(out, _state["output_format"])
+            for code, name, price, status, created_at, updated_at, category, publisher in books.iterator(
+                chunk_size=_state["batch_size"],
+            ):
+                product = ProductEntity(
+                    code=code, name=name, price=price, status=status, created_at=created_at, updated_at=updated_at,
+                )
+                attributes = ProductAttributes(
+                    category=category,
+                    publisher=publisher,
+                    features=(features[code],) if code in features else (),
+                )
+                available, applied, price_result = use_case.execute(
+                    product=product,
+                    coupon_code=_state["coupon_code"],
+                    include_available_coupons=True,
+                    attributes=attributes,
+                )
+                writer.write({
+                    "code": code,
+                    "name": name,
+                    "price": price_result.original,
+                    "discounted": price_result.discounted,
+                    "discount_amount": price_result.discount_amount,
+                    "discount_types": list(price_result.discount_types),
+                    "applied_pricing_policies": list(applied),
+                    "available_coupons": [coupon.code for coupon in available],
+                })
+                written += 1
+    finally:
+        close_old_connections()
+    return written
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 출력
+# ──────────────────────────────────────────────────────────────────────────────
+class RowWriter:
+    """
+    CSV: 헤더 없이 한 줄씩 (헤더는 병합 시 한 번만), 목록 값은 LIST_SEPARATOR로 연결
+    NDJSON: 한 줄에 JSON 객체 하나, Decimal은 문자열
+    """
+
+    def __init__(self, out: IO[str], output_format: str):
+        self._format = output_format
+        self._out = out
+        self._csv = csv.writer(out) if output_format == CSV else None
+
+    @staticmethod
+    def header(output_format: str) -> Optional[str]:
+        return ",".join(COLUMNS) + "\r\n" if output_format == CSV else None
+
+    def write(self, row: Dict[str, Any]) -> None:
+        if self._csv is not None:
+            self._csv.writerow([
+                LIST_SEPARATOR.join(row[column]) if isinstance(row[column], list) else row[column]
+                for column in COLUMNS
+            ])
+            return
+        self._out.write(json.dumps({column: row[column] for column in COLUMNS}, ensure_ascii=False, default=str))
+        self._out.write("\n")
@@ -0,0 +1,80 @@
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+
+from django.core.cache import caches
+from django.test import (
+    TestCase,
+    override_settings,
+)
+from django.utils import timezone
+
+from apps.pricing.domain.value_objects import (
+    CouponStatus,
+    DiscountType,
+    TargetType,
+)
+from apps.pricing.infrastructure.persistence.models import (
+    Coupon as CouponModel,
+    DiscountPolicy as DiscountPolicyModel,
+)
+from apps.pricing.infrastructure.persistence.repository_impl.coupon_repo_impl import CouponRepoImpl
+from apps.utils.cache import clear_local_caches
+
+
+@override_settings(CACHES={
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "product": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
+    "pricing": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "coupon-repo-cache-test"},
+})
+class CouponRepoCacheTest(TestCase):
+    def setUp(self):
+        caches["pricing"].clear()
+        clear_local_caches()
+
+        self.now = timezone.now()
+        self.repo = CouponRepoImpl()
+        self._create_coupon("NOW10", start=self.now - timedelta(days=1), valid_until=self.now + timedelta(hours=1))
+        self._create_coupon("LATER10", start=self.now + timedelta(minutes=30), valid_until=self.now + timedelta(days=1))
+
+    def _create_coupon(self, code, start, valid_until):
+        policy = DiscountPolicyModel.objects.create(
+            id=uuid.uuid4(),
+            discount_type=DiscountType.PERCENTAGE.value,
+            value=Decimal("0.10"),
+            target_type=TargetType.ALL.value,
+            effective_start_at=start,
+            effective_end_at=self.now + timedelta(days=30),
+        )
+        return CouponModel.objects.create(
+            id=uuid.uuid4(),
+            code=code,
+            name=code,
+            valid_until=valid_until,
+            status=CouponStatus.ACTIVE.value,
+            discount_policy=policy,
+        )
+
+    def _codes(self, reference_time):
+        return sorted(coupon.code for coupon in self.repo.list_active_not_expired(reference_time))
+
+    def test_cached_result_reused_until_next_boundary(self):
+        self.assertEqual(self._codes(self.now), ["NOW10"])
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self._codes(self.now + timedelta(minutes=10)), ["NOW10"])
+
+        # 다른 쿠폰의 적용 시작 시각이 지나면 다시 조회
+        self.assertEqual(self._codes(self.now + timedelta(minutes=31)), ["LATER10", "NOW10"])
+        # 포함된 쿠폰의 유효기간이 지나면 다시 조회
+        self.assertEqual(self._codes(self.now + timedelta(hours=2)), ["LATER10"])
+
+    def test_invalidated_on_commit(self):
+        self.assertEqual(self._codes(self.now), ["NOW10"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            coupon = CouponModel.objects.get(code="NOW10")
+            coupon.status = CouponStatus.INACTIVE.value
+            coupon.save()
+
+        self.assertEqual(self._codes(self.now), [])
@@ -0,0 +1,179 @@
+import tempfile
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
+
+from django.core.management import (
+    CommandError,
+    call_command,
+)
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.container import container
+from apps.pricing.application.use_case.issue_coupons_use_case import IssueCouponsUseCase
+from apps.pricing.domain.policy.coupon_code import (
+    CODE_ALPHABET,
+    CODE_LENGTH,
+)
+from apps.pricing.domain.value_objects import (
+    CouponStatus,
+    DiscountType,
+    IssuedCouponStatus,
+    TargetType,
+)
+from apps.pricing.infrastructure.persistence.models import (
+    Coupon as CouponModel,
+    DiscountPolicy as DiscountPolicyModel,
+    DiscountTarget as DiscountTargetModel,
+    IssuedCoupon as IssuedCouponModel,
+    User as UserModel,
+)
+from apps.pricing.infrastructure.persistence.repository_impl.issued_coupon_repo_impl import IssuedCouponRepoImpl
+from apps.pricing.infrastructure.persistence.repository_impl.user_segment_repo_impl import UserSegmentRepoImpl
+from apps.utils.exceptions import (
+    ConflictException,
+    NotFoundException,
+)
+
+
+class IssueCouponsTest(TestCase):
+    def setUp(self):
+        self.now = timezone.now()
+        self.users = [UserModel.objects.create(id=uuid.uuid4(), name=f"사용자{i}") for i in range(5)]
+        self.template = self._create_coupon("WELCOME")
+        self.use_case = container.resolve(IssueCouponsUseCase)
+
+    def _create_coupon(self, code, target_type=TargetType.USER.value):
+        policy = DiscountPolicyModel.objects.create(
+            id=uuid.uuid4(), discount_type=DiscountType.FIXED.value, value=Decimal("1000.00"),
+            target_type=target_type,
+            effective_start_at=self.now - timedelta(days=1), effective_end_at=self.now + timedelta(days=30),
+        )
+        return CouponModel.objects.create(
+            id=uuid.uuid4(), code=code, name=f"{code} 쿠폰", valid_until=self.now + timedelta(days=30),
+            status=CouponStatus.ACTIVE.value, discount_policy=policy,
+        )
+
+    def _issued(self):
+        return IssuedCouponModel.objects.filter(coupon=self.template)
+
+    def test_issue_one_per_user_with_unique_codes(self):
+        user_ids = [user.id for user in self.users]
+        result = self.use_case.execute(
+            "WELCOME", user_ids=user_ids + user_ids[:2], valid_until=self.now + timedelta(days=7), batch_size=2,
+        )
+
+        self.assertEqual((result.issued, result.skipped), (5, 0))
+        issued = list(self._issued())
+        self.assertEqual({row.user_id for row in issued}, set(user_ids))
+        codes = {row.issued_coupon_id for row in issued}
+        self.assertEqual(len(codes), 5)
+        self.assertTrue(all(len(code) == CODE_LENGTH and set(code) <= set(CODE_ALPHABET) for code in codes))
+        self.assertTrue(all(row.status == IssuedCouponStatus.ISSUED.value for row in issued))
+        self.assertEqual({row.valid_until for row in issued}, {self.now + timedelta(days=7)})
+
+    def test_rerun_skips_holders(self):
+        self.use_case.execute("WELCOME", user_ids=[user.id for user in self.users[:3]])
+        result = self.use_case.execute("WELCOME", user_ids=[user.id for user in self.users])
+
+        self.assertEqual((result.issued, result.skipped), (2, 3))
+        self.assertEqual(self._issued().count(), 5)
+
+    def test_issue_to_segment_members(self):
+        segment = UserSegmentRepoImpl().save("신규 가입", [user.id for user in self.users[:4]])
+
+        result = self.use_case.execute("WELCOME", segment_id=segment.id)
+
+        self.assertEqual(result.issued, 4)
+        self.assertEqual(set(self._issued().values_list("user_id", flat=True)), {user.id for user in self.users[:4]})
+
+    def test_regenerates_codes_already_in_use(self):
+        IssuedCouponModel.objects.create(
+            id=uuid.uuid4(), coupon=self.template, issued_coupon_id="TAKEN0000000", user=self.users[0],
+            valid_until=self.now + timedelta(days=7),
+        )
+        codes = iter([["TAKEN0000000"], ["FRESH0000000"]])
+        with mock.patch(
+            "apps.pricing.application.use_case.issue_coupons_use_case.generate_codes",
+            side_effect=lambda count: next(codes),
+        ):
+            result = self.use_case.execute("WELCOME", user_ids=[self.users[1].id])
+
+        self.assertEqual((result.issued, result.regenerated), (1, 1))
+        self.assertTrue(self._issued().filter(user=self.users[1], issued_coupon_id="FRESH0000000").exists())
+
+    def test_conflicting_batch_is_rolled_back_and_retried(self):
+        repo = IssuedCouponRepoImpl()
+        IssuedCouponModel.objects.create(
+            id=uuid.uuid4(), coupon=self.template, issued_coupon_id="RACE00000000", user=self.users[0],
+            valid_until=self.now + timedelta(days=7),
+        )
+        with self.assertRaises(ConflictException):
+            repo.bulk_issue(
+                self.template.id, [(self.users[1].id, "OK0000000000"), (self.users[2].id, "RACE00000000")], self.now,
+            )
+        self.assertFalse(self._issued().filter(issued_coupon_id="OK0000000000").exists())
+
+        # 다른 프로세스가 같은 코드를 먼저 저장한 경우: batch 전체를 새 코드로 다시 저장
+        conflict_once = [ConflictException("dup"), 1]
+        with mock.patch.object(IssuedCouponRepoImpl, "bulk_issue", side_effect=conflict_once) as bulk_issue:
+            result = self.use_case.execute("WELCOME", user_ids=[self.users[3].id])
+
+        self.assertEqual(result.issued, 1)
+        first, second = (call.args[1][0][1] for call in bulk_issue.call_args_list)
+        self.assertNotEqual(first, second)
+
+    def test_concurrently_issued_users_are_skipped(self):
+        # 보유자 확인 이후 다른 프로세스가 같은 사용자에게 먼저 발급한 경우: 그 사용자만 건너뛰고 나머지는 같은 코드로 저장
+        original = IssuedCouponRepoImpl.list_holder_ids
+
+        def race(repo, coupon_id, user_ids=None):
+            if user_ids is None:
+                IssuedCouponModel.objects.create(
+                    id=uuid.uuid4(), coupon=self.template, issued_coupon_id="OTHER0000000", user=self.users[1],
+                    valid_until=self.now + timedelta(days=7),
+                )
+                return []
+            return original(repo, coupon_id, user_ids)
+
+        record_bulk_issue = mock.patch.object(
+            IssuedCouponRepoImpl, "bulk_issue", autospec=True, side_effect=IssuedCouponRepoImpl.bulk_issue,
+        )
+        with mock.patch.object(IssuedCouponRepoImpl, "list_holder_ids", autospec=True, side_effect=race), \
+                record_bulk_issue as bulk_issue:
+            result = self.use_case.execute("WELCOME", user_ids=[user.id for user in self.users[:3]])
+
+        self.assertEqual((result.issued, result.skipped), (2, 1))
+        first, second = (dict(call.args[2]) for call in bulk_issue.call_args_list)
+        self.assertEqual(second, {user_id: code for user_id, code in first.items() if user_id != self.users[1].id})
+        self.assertEqual(self._issued().count(), 3)
+
+    def test_rejects_non_issuable_coupon(self):
+        with self.assertRaises(NotFoundException):
+            self.use_case.execute("NOPE", user_ids=[self.users[0].id])
+
+        self._create_coupon("BOOKONLY", target_type=TargetType.PRODUCT.value)
+        with self.assertRaises(ValueError):
+            self.use_case.execute("BOOKONLY", user_ids=[self.users[0].id])
+
+        targeted = self._create_coupon("VIP")
+        DiscountTargetModel.objects.create(
+            id=uuid.uuid4(), discount_policy=targeted.discount_policy, target_user=self.users[0], apply_priority=1,
+        )
+        with self.assertRaises(ValueError):
+            self.use_case.execute("VIP", user_ids=[self.users[1].id])
+
+    def test_command(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as stream:
+            stream.write("\n".join(str(user.id) for user in self.users[:2]) + "\n\n")
+        out = StringIO()
+
+        call_command("issue_coupons", "WELCOME", "--users-file", stream.name, "--valid-days", "3", stdout=out)
+
+        self.assertIn("2장 발급 완료", out.getvalue())
+        self.assertEqual(self._issued().count(), 2)
+        with self.assertRaises(CommandError):
+            call_command("issue_coupons", "NOPE", "--users-file", stream.name, stdout=StringIO())
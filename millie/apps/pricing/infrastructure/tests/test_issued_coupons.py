@@ -0,0 +1,171 @@
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+
+from django.db import (
+    IntegrityError,
+    connection,
+    transaction,
+)
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.container import container
+from apps.pricing.application.services.coupon_service import CouponService
+from apps.pricing.application.use_case.calculate_cart_price_use_case import CalculateCartPriceUseCase
+from apps.pricing.application.use_case.calculate_price_use_case import CalculatePriceUseCase
+from apps.pricing.domain.entity.cart import CartItem
+from apps.pricing.domain.value_objects import (
+    CouponStatus,
+    DiscountType,
+    IssuedCouponStatus,
+    TargetType,
+)
+from apps.pricing.infrastructure.persistence.models import (
+    Coupon as CouponModel,
+    DiscountPolicy as DiscountPolicyModel,
+    DiscountTarget as DiscountTargetModel,
+    IssuedCoupon as IssuedCouponModel,
+    User as UserModel,
+)
+from apps.pricing.infrastructure.persistence.repository_impl.coupon_repo_impl import CouponRepoImpl
+from apps.product.domain.value_objects import ProductStatus
+from apps.product.infrastructure.persistence.models import Book as BookModel
+
+
+class IssuedCouponTest(TestCase):
+    def setUp(self):
+        self.now = timezone.now()
+        BookModel.objects.create(
+            code="BOOK001", name="BOOK001", price=Decimal("10000.00"), status=ProductStatus.ACTIVE.value,
+        )
+        self.holder = UserModel.objects.create(id=uuid.uuid4(), name="보유자")
+        self.other = UserModel.objects.create(id=uuid.uuid4(), name="다른 사용자")
+
+        # 발급용 원본 쿠폰 (사용자 대상, 대상 행 없음: 발급받은 사용자만 사용)
+        self.welcome = self._create_coupon("WELCOME20", Decimal("0.20"))
+        self.coupon_repo = CouponRepoImpl()
+
+    def _create_coupon(self, code, rate, valid_until=None):
+        policy = DiscountPolicyModel.objects.create(
+            id=uuid.uuid4(),
+            discount_type=DiscountType.PERCENTAGE.value,
+            value=rate,
+            target_type=TargetType.USER.value,
+            effective_start_at=self.now - timedelta(days=1),
+            effective_end_at=self.now + timedelta(days=30),
+        )
+        return CouponModel.objects.create(
+            id=uuid.uuid4(),
+            code=code,
+            name=f"{code} 쿠폰",
+            valid_until=valid_until or self.now + timedelta(days=30),
+            status=CouponStatus.ACTIVE.value,
+            discount_policy=policy,
+        )
+
+    def _issue(self, coupon, user, days=7, status=IssuedCouponStatus.ISSUED.value):
+        return IssuedCouponModel.objects.create(
+            id=uuid.uuid4(),
+            coupon=coupon,
+            issued_coupon_id=uuid.uuid4().hex,
+            user=user,
+            status=status,
+            valid_until=self.now + timedelta(days=days),
+        )
+
+    def test_wallet_lists_only_usable_coupons(self):
+        later = self._issue(self.welcome, self.holder, days=7)
+        sooner = self._issue(self._create_coupon("BIRTHDAY10", Decimal("0.10")), self.holder, days=3)
+        self._issue(self._create_coupon("USED10", Decimal("0.10")), self.holder, status=IssuedCouponStatus.USED.value)
+        self._issue(self._create_coupon("EXPIRED10", Decimal("0.10")), self.holder, days=-1)
+        ended = self._create_coupon("ENDED", Decimal("0.10"), valid_until=self.now - timedelta(hours=1))
+        self._issue(ended, self.holder)
+        self._issue(self.welcome, self.other)
+
+        with self.assertNumQueries(2):      # 지갑 조회 1회 + 원본 쿠폰 대상 행 1회
+            wallet = self.coupon_repo.list_issued_coupons(self.holder.id, self.now)
+
+        self.assertEqual(
+            [issued.issued_coupon_id for issued in wallet], [sooner.issued_coupon_id, later.issued_coupon_id],
+        )
+        self.assertEqual(wallet[1].to_coupon().target_user_id, self.holder.id)
+        self.assertEqual(wallet[1].usable_until, later.valid_until)
+        self.assertEqual(
+            [
+                issued.coupon.code
+                for issued in self.coupon_repo.list_issued_coupons(self.holder.id, self.now, coupon_code=["WELCOME20"])
+            ],
+            ["WELCOME20"],
+        )
+
+    def test_issued_coupon_id_generated_per_row(self):
+        first = IssuedCouponModel.objects.create(
+            coupon=self.welcome, issued_coupon_id="A", user=self.holder, valid_until=self.now + timedelta(days=1),
+        )
+        second = IssuedCouponModel.objects.create(
+            coupon=self.welcome, issued_coupon_id="B", user=self.other, valid_until=self.now + timedelta(days=1),
+        )
+        self.assertIsInstance(first.id, uuid.UUID)
+        self.assertNotEqual(first.id, second.id)
+
+    def test_one_per_user_per_coupon(self):
+        self._issue(self.welcome, self.holder, status=IssuedCouponStatus.USED.value)
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            self._issue(self.welcome, self.holder)
+
+    def test_wallet_query_uses_user_index(self):
+        queryset = IssuedCouponModel.objects.filter(
+            user_id=self.holder.id, status=IssuedCouponStatus.ISSUED.value, valid_until__gte=self.now,
+        )
+        if connection.vendor == "sqlite":
+            self.assertIn("issued_coupon_wallet_idx", queryset.explain())
+
+    def test_global_scan_skips_issuable_coupons(self):
+        self._issue(self.welcome, self.holder)
+        targeted = self._create_coupon("VIP10", Decimal("0.10"))
+        DiscountTargetModel.objects.create(
+            id=uuid.uuid4(), discount_policy=targeted.discount_policy, target_user=self.other, apply_priority=1,
+        )
+
+        # 발급용 원본 쿠폰은 전체 목록에 없고 보유자의 지갑에서만 조회됨 (대상 사용자가 지정된 쿠폰은 그대로)
+        self.assertEqual([c.code for c in self.coupon_repo.list_active_not_expired(self.now)], ["VIP10"])
+        applicable = container.resolve(CouponService).get_applicable_coupons("BOOK001", self.other)
+        self.assertEqual([c.code for c in applicable], ["VIP10"])
+
+    def test_applicable_only_for_holder(self):
+        self._issue(self.welcome, self.holder)
+        service = container.resolve(CouponService)
+
+        self.assertEqual([c.code for c in service.get_applicable_coupons("BOOK001", self.holder)], ["WELCOME20"])
+        self.assertEqual(service.get_applicable_coupons("BOOK001", self.other), [])
+        self.assertEqual(service.get_applicable_coupons("BOOK001", None), [])
+
+    def test_apply_issued_coupon(self):
+        self._issue(self.welcome, self.holder)
+        use_case = container.resolve(CalculatePriceUseCase)
+        product = use_case.fetch("BOOK001")
+
+        for include_available_coupons in (True, False):
+            _, applied, result = use_case.execute(
+                product, user=self.holder, coupon_code=["WELCOME20"],
+                include_available_coupons=include_available_coupons,
+            )
+            self.assertEqual(applied, ["WELCOME20 쿠폰"])
+            self.assertEqual(result.discounted, Decimal("8000.00"))
+
+        _, applied, result = use_case.execute(product, user=self.other, coupon_code=["WELCOME20"])
+        self.assertEqual(applied, [])
+        self.assertEqual(result.discounted, Decimal("10000.00"))
+
+    def test_cart_applies_issued_coupon_for_holder(self):
+        self._issue(self.welcome, self.holder)
+        use_case = container.resolve(CalculateCartPriceUseCase)
+        items = [CartItem(product_code="BOOK001", quantity=2)]
+
+        result = use_case.execute(items, user=self.holder, coupon_code=["WELCOME20"])
+        self.assertEqual(result.applied_coupons, ["WELCOME20 쿠폰"])
+        self.assertEqual(result.discounted, Decimal("16000.00"))
+
+        result = use_case.execute(items, user=self.other, coupon_code=["WELCOME20"])
+        self.assertEqual(result.rejected_coupons, ["WELCOME20"])
@@ -0,0 +1,272 @@
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+
+from asgiref.sync import async_to_sync
+from django.core.cache import caches
+from django.core.exceptions import ValidationError
+from django.test import (
+    SimpleTestCase,
+    TestCase,
+    override_settings,
+)
+from django.utils import timezone
+
+from apps.container import container
+from apps.pricing.application.use_case.async_calculate_price_use_case import AsyncCalculatePriceUseCase
+from apps.pricing.application.use_case.calculate_price_use_case import CalculatePriceUseCase
+from apps.pricing.application.use_case.refresh_lowest_prices_use_case import RefreshLowestPricesUseCase
+from apps.pricing.domain.entity.promotion import Promotion
+from apps.pricing.domain.entity.rule_snapshot import (
+    PromotionIndex,
+    PromotionRule,
+    PromotionTarget,
+)
+from apps.pricing.domain.policy.discount_policy import build_discount_policy
+from apps.pricing.domain.value_objects import (
+    CouponStatus,
+    DiscountType,
+    TargetType,
+)
+from apps.pricing.infrastructure.persistence.models import (
+    Coupon as CouponModel,
+    DiscountPolicy as DiscountPolicyModel,
+    DiscountTarget as DiscountTargetModel,
+    ProductLowestPrice as ProductLowestPriceModel,
+    Promotion as PromotionModel,
+)
+from apps.pricing.infrastructure.persistence.repository_impl.promotion_repo_impl import PromotionRepoImpl
+from apps.pricing.infrastructure.persistence.repository_impl.snapshot_repo_impl import RuleSnapshotRepoImpl
+from apps.product.domain.value_objects import (
+    Category,
+    Feature,
+    ProductAttributes,
+    ProductStatus,
+    VisibilityStatus,
+)
+from apps.product.infrastructure.persistence.models import (
+    Book as BookModel,
+    BookDetail as BookDetailModel,
+    BookFeature as BookFeatureModel,
+    PublishInfo as PublishInfoModel,
+)
+from apps.product.infrastructure.persistence.product_repo_impl import ProductRepoImpl
+from apps.utils.cache import clear_local_caches
+
+
+class PromotionIndexTest(SimpleTestCase):
+    def _rule(self, name, *targets):
+        now = timezone.now()
+        promotion = Promotion(
+            id=uuid.uuid4(), name=name, created_at=now, updated_at=now, is_auto_discount=True, apply_priority=0,
+            discount_policy=build_discount_policy(DiscountType.PERCENTAGE.value, Decimal("0.10")),
+        )
+        return PromotionRule(promotion=promotion, targets=targets)
+
+    def test_lookup_by_dimension(self):
+        index = PromotionIndex([
+            self._rule("과학", PromotionTarget(None, None, 2, category=Category.SCIENCE.value)),
+            self._rule("전체", PromotionTarget(None, None, 9)),
+            self._rule(
+                "BOOK001 / 베스트셀러",
+                PromotionTarget("BOOK001", None, 5),
+                PromotionTarget(None, None, 1, feature=Feature.BEST_SELLER.value),
+            ),
+            self._rule("BOOK002", PromotionTarget("BOOK002", None, 0)),
+        ])
+
+        def names(code, attributes=None):
+            return [p.name for p in index.promotions_for(code, None, attributes)]
+
+        science = ProductAttributes(category=Category.SCIENCE.value, features=(Feature.BEST_SELLER.value,))
+        self.assertEqual(names("BOOK001", science), ["BOOK001 / 베스트셀러", "과학", "전체"])
+        self.assertEqual(names("BOOK001"), ["BOOK001 / 베스트셀러", "전체"])
+        # 대상이 일치하지 않는 프로모션은 적용하지 않음
+        self.assertEqual(names("BOOK003"), ["전체"])
+        self.assertEqual(index.ranked("BOOK003"), ((9, 1),))
+
+
+class PromotionTargetTest(TestCase):
+    def setUp(self):
+        # 준비 데이터는 commit된 것으로 보고 commit 이후 작업까지 실행 (각 테스트의 변경만 따로 확인)
+        with self.captureOnCommitCallbacks(execute=True):
+            self._create_fixtures()
+
+    def _create_fixtures(self):
+        self.now = timezone.now()
+        # (코드, 정가, 분야, 출판사, 도서 타입)
+        for code, price, category, publisher, feature in (
+            ("SCI1", "20000.00", Category.SCIENCE, "민음사", Feature.BEST_SELLER),
+            ("SCI2", "10000.00", Category.SCIENCE, "창비", None),
+            ("FIC1", "15000.00", Category.FICTION, "민음사", Feature.NEW_ARRIVAL),
+            ("FIC2", "8000.00", Category.FICTION, "문학동네", Feature.BEST_SELLER),
+            ("HIS1", "9000.00", Category.HISTORY, "창비", None),
+        ):
+            self._book(code, price, category, publisher, feature)
+
+        self._promotion("과학 20%", DiscountType.PERCENTAGE, "0.20", priority=2, target_category=Category.SCIENCE.value)
+        self._promotion("민음사 10%", DiscountType.PERCENTAGE, "0.10", priority=1, target_publisher="민음사")
+        self._promotion(
+            "베스트셀러 1000원", DiscountType.FIXED, "1000.00", priority=3, target_feature=Feature.BEST_SELLER.value,
+        )
+        self._promotion("FIC2 50%", DiscountType.PERCENTAGE, "0.50", priority=5, target_product_code_id="FIC2")
+
+    def _book(self, code, price, category, publisher, feature):
+        book = BookModel.objects.create(code=code, name=code, price=Decimal(price), status=ProductStatus.ACTIVE.value)
+        BookDetailModel.objects.create(
+            book_code=book, category=category.value, description=code, status=VisibilityStatus.VISIBLE.value,
+        )
+        PublishInfoModel.objects.create(
+            book_code=book, publisher=publisher, published_date=self.now.date(), status=VisibilityStatus.VISIBLE.value,
+        )
+        if feature:
+            BookFeatureModel.objects.create(
+                book_code=book, feature=feature.value, status=VisibilityStatus.VISIBLE.value,
+            )
+
+    def _promotion(self, name, discount_type, value, priority, **target):
+        policy = DiscountPolicyModel.objects.create(
+            id=uuid.uuid4(),
+            discount_type=discount_type.value,
+            value=Decimal(value),
+            target_type=next(
+                target_type.value for field, target_type in (
+                    ("target_category", TargetType.CATEGORY),
+                    ("target_publisher", TargetType.PUBLISHER),
+                    ("target_feature", TargetType.FEATURE),
+                    ("target_product_code_id", TargetType.PRODUCT),
+                ) if field in target
+            ),
+            effective_start_at=self.now - timedelta(days=1),
+            effective_end_at=self.now + timedelta(days=30),
+        )
+        PromotionModel.objects.create(
+            id=uuid.uuid4(), name=name, status=CouponStatus.ACTIVE.value, is_auto_discount=True, discount_policy=policy,
+        )
+        return DiscountTargetModel.objects.create(
+            id=uuid.uuid4(), discount_policy=policy, apply_priority=priority, **target,
+        )
+
+    # 적용 우선순위가 가장 높은(작은) 프로모션 하나만 적용
+    EXPECTED = {
+        "SCI1": (Decimal("18000.00"), ["민음사 10%"]),          # 분야(2)/출판사(1)/도서 타입(3) 중 출판사
+        "SCI2": (Decimal("8000.00"), ["과학 20%"]),
+        "FIC1": (Decimal("13500.00"), ["민음사 10%"]),
+        "FIC2": (Decimal("7000.00"), ["베스트셀러 1000원"]),   # 도서 타입(3)이 상품 대상(5)보다 우선
+        "HIS1": (Decimal("9000.00"), []),                       # 일치하는 대상 없음
+    }
+
+    def test_live_prices(self):
+        use_case = container.resolve(CalculatePriceUseCase)
+        for code, (discounted, applied) in self.EXPECTED.items():
+            with self.subTest(code=code):
+                _, applied_names, price_result = use_case.execute(product=use_case.fetch(code))
+                self.assertEqual(price_result.discounted, discounted)
+                self.assertEqual(applied_names, applied)
+
+    def test_async_matches_sync(self):
+        use_case = container.resolve(AsyncCalculatePriceUseCase)
+        for code, (discounted, applied) in self.EXPECTED.items():
+            with self.subTest(code=code):
+                _, applied_names, price_result = async_to_sync(use_case.execute)(code)
+                self.assertEqual((price_result.discounted, applied_names), (discounted, applied))
+
+    def test_snapshot_matches_repository(self):
+        snapshot = RuleSnapshotRepoImpl().load(self.now)
+        attributes = ProductRepoImpl().list_active_attributes()
+        repo = PromotionRepoImpl()
+        self.assertEqual(
+            attributes["SCI1"],
+            ProductAttributes(category="SCIENCE", publisher="민음사", features=("BEST_SELLER",)),
+        )
+        for code in self.EXPECTED:
+            with self.subTest(code=code):
+                self.assertEqual(
+                    [p.name for p in snapshot.promotions_for(code, None, attributes[code])],
+                    [p.name for p in repo.get_active_promotions(code, None, attributes[code])],
+                )
+
+    def test_lowest_prices_follow_attribute_changes(self):
+        container.resolve(RefreshLowestPricesUseCase).execute()
+        stored = {row.book_code_id: row.lowest_price for row in ProductLowestPriceModel.objects.all()}
+        self.assertEqual(stored, {code: discounted for code, (discounted, _) in self.EXPECTED.items()})
+
+        # 분야가 바뀌면 그 도서만 다시 계산
+        detail = BookDetailModel.objects.get(book_code="SCI2")
+        detail.category = Category.HISTORY.value
+        with self.captureOnCommitCallbacks(execute=True):
+            detail.save()
+        self.assertEqual(ProductLowestPriceModel.objects.get(book_code="SCI2").lowest_price, Decimal("10000.00"))
+
+
+@override_settings(CACHES={
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "product": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
+    "pricing": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "promotion-index-test"},
+})
+class PromotionIndexCacheTest(PromotionTargetTest):
+    # 색인 캐시를 켠 상태에서도 PromotionTargetTest와 같은 결과
+    def setUp(self):
+        caches["pricing"].clear()
+        clear_local_caches()
+        super().setUp()
+
+    def test_lookups_without_queries(self):
+        repo = PromotionRepoImpl()
+        attributes = ProductAttributes(category=Category.SCIENCE.value, publisher="창비")
+        self.assertEqual([p.name for p in repo.get_active_promotions("SCI2", None, attributes)], ["과학 20%"])
+
+        # 색인을 한 번 읽은 뒤에는 상품/속성이 달라도 DB 조회 없음
+        with self.assertNumQueries(0):
+            for code in self.EXPECTED:
+                repo.get_active_promotions(code, None, ProductAttributes(publisher="민음사"))
+
+        # 대상이 바뀌면 commit 이후 캐시 버전이 바뀌어 새 색인을 읽음
+        with self.captureOnCommitCallbacks(execute=True):
+            self._promotion("창비 30%", DiscountType.PERCENTAGE, "0.30", priority=0, target_publisher="창비")
+        self.assertEqual(
+            [p.name for p in repo.get_active_promotions("SCI2", None, attributes)],
+            ["창비 30%", "과학 20%"],
+        )
+
+
+class CouponTargetTypeTest(TestCase):
+    """
+    분야/출판사/도서 타입 대상은 프로모션 전용: 쿠폰은 상품 코드로만 적용 여부를 판정하므로 저장 단계에서 거부
+    """
+
+    def _policy(self, target_type):
+        now = timezone.now()
+        return DiscountPolicyModel.objects.create(
+            id=uuid.uuid4(), discount_type=DiscountType.FIXED.value, value=Decimal("1000.00"),
+            target_type=target_type, effective_start_at=now - timedelta(days=1),
+            effective_end_at=now + timedelta(days=30),
+        )
+
+    def _coupon(self, policy, code="COUPON"):
+        return CouponModel.objects.create(
+            id=uuid.uuid4(), code=code, name=f"{code} 쿠폰", valid_until=timezone.now() + timedelta(days=30),
+            status=CouponStatus.ACTIVE.value, discount_policy=policy,
+        )
+
+    def test_promotion_only_targets_rejected_for_coupons(self):
+        for target_type in (TargetType.CATEGORY, TargetType.PUBLISHER, TargetType.FEATURE):
+            with self.subTest(target_type=target_type), self.assertRaises(ValidationError):
+                self._coupon(self._policy(target_type.value), code=target_type.value)
+        self.assertFalse(CouponModel.objects.exists())
+
+        # 같은 정책을 프로모션에는 사용할 수 있음
+        PromotionModel.objects.create(
+            id=uuid.uuid4(), name="과학 분야", status=CouponStatus.ACTIVE.value, is_auto_discount=True,
+            discount_policy=self._policy(TargetType.CATEGORY.value),
+        )
+
+    def test_coupon_policy_cannot_become_promotion_only(self):
+        policy = self._policy(TargetType.PRODUCT.value)
+        self._coupon(policy)
+
+        policy.target_type = TargetType.CATEGORY.value
+        with self.assertRaises(ValidationError):
+            policy.save()
+        policy.refresh_from_db()
+        self.assertEqual(policy.target_type, TargetType.PRODUCT.value)
@@ -0,0 +1,128 @@
+import csv
+import json
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.container import container
+from apps.pricing.application.use_case.calculate_price_use_case import CalculatePriceUseCase
+from apps.pricing.domain.value_objects import (
+    CouponStatus,
+    DiscountType,
+    TargetType,
+)
+from apps.pricing.infrastructure.persistence.models import (
+    Coupon as CouponModel,
+    DiscountPolicy as DiscountPolicyModel,
+    DiscountTarget as DiscountTargetModel,
+    Promotion as PromotionModel,
+)
+from apps.pricing.infrastructure.persistence.repository_impl.promotion_repo_impl import PromotionRepoImpl
+from apps.pricing.infrastructure.persistence.repository_impl.snapshot_repo_impl import (
+    RuleSnapshotRepoImpl,
+    SnapshotPromotionRepoImpl,
+)
+from apps.pricing.infrastructure.repricing import partition_codes
+from apps.product.domain.value_objects import ProductStatus
+from apps.product.infrastructure.persistence.models import Book as BookModel
+
+
+class RepriceCatalogCommandTest(TestCase):
+    def setUp(self):
+        self.now = timezone.now()
+        for code, price in (("BOOK001", "20000.00"), ("BOOK002", "8000.00"), ("BOOK003", "15000.00")):
+            BookModel.objects.create(code=code, name=code, price=Decimal(price), status=ProductStatus.ACTIVE.value)
+        BookModel.objects.create(
+            code="BOOK004", name="품절", price=Decimal("9000.00"), status=ProductStatus.SOLD_OUT.value,
+        )
+
+        self._coupon("TEST10", DiscountType.PERCENTAGE, "0.10", valid_until=self.now + timedelta(days=7))
+        # 내일 끝나는 쿠폰 / 내일부터 시작하는 쿠폰
+        self._coupon("TODAY1000", DiscountType.FIXED, "1000.00", valid_until=self.now + timedelta(hours=12))
+        self._coupon(
+            "TOMORROW2000", DiscountType.FIXED, "2000.00",
+            valid_until=self.now + timedelta(days=7), start=self.now + timedelta(hours=20),
+        )
+        promotion_policy = self._policy(DiscountType.PERCENTAGE, "0.05")
+        PromotionModel.objects.create(
+            id=uuid.uuid4(), name="BOOK001 5% 할인", status=CouponStatus.ACTIVE.value, is_auto_discount=True,
+            discount_policy=promotion_policy,
+        )
+        DiscountTargetModel.objects.create(
+            id=uuid.uuid4(), discount_policy=promotion_policy, target_product_code_id="BOOK001", apply_priority=1,
+        )
+
+    def _policy(self, discount_type, value, start=None):
+        return DiscountPolicyModel.objects.create(
+            id=uuid.uuid4(),
+            discount_type=discount_type.value,
+            value=Decimal(value),
+            target_type=TargetType.ALL.value,
+            effective_start_at=start or self.now - timedelta(days=1),
+            effective_end_at=self.now + timedelta(days=30),
+        )
+
+    def _coupon(self, code, discount_type, value, valid_until, start=None):
+        CouponModel.objects.create(
+            id=uuid.uuid4(), code=code, name=code, valid_until=valid_until,
+            status=CouponStatus.ACTIVE.value, discount_policy=self._policy(discount_type, value, start),
+        )
+
+    def _reprice(self, *args, output_format="csv"):
+        stdout = StringIO()
+        call_command(
+            "reprice_catalog", "--workers", "1", "--format", output_format, *args, stdout=stdout, stderr=StringIO(),
+        )
+        return stdout.getvalue()
+
+    def test_partition_codes(self):
+        codes = [f"B{i:02d}" for i in range(10)]
+        self.assertEqual(partition_codes(codes, 3), [("B00", "B03"), ("B04", "B06"), ("B07", "B09")])
+        self.assertEqual(partition_codes(codes[:2], 5), [("B00", "B00"), ("B01", "B01")])
+        self.assertEqual(partition_codes([], 4), [])
+
+    def test_matches_calculate_price_use_case(self):
+        rows = list(csv.DictReader(StringIO(self._reprice("--coupon", "TEST10", "--partitions", "2"))))
+
+        # 판매 중인 상품만, 코드 순서대로
+        self.assertEqual([row["code"] for row in rows], ["BOOK001", "BOOK002", "BOOK003"])
+        use_case = container.resolve(CalculatePriceUseCase)
+        for row in rows:
+            available, applied, price_result = use_case.execute(
+                product=use_case.fetch(row["code"]), coupon_code=["TEST10"],
+            )
+            self.assertEqual(Decimal(row["discounted"]), price_result.discounted)
+            self.assertEqual(row["applied_pricing_policies"].split("|"), applied)
+            self.assertEqual(sorted(row["available_coupons"].split("|")), sorted(c.code for c in available))
+
+        # 20,000 * 0.95 * 0.9 = 17,100
+        self.assertEqual(Decimal(rows[0]["discounted"]), Decimal("17100.00"))
+
+    def test_rules_at_reference_time(self):
+        tomorrow = (self.now + timedelta(days=1)).isoformat()
+        rows = [json.loads(line) for line in self._reprice("--at", tomorrow, output_format="ndjson").splitlines()]
+
+        # 기준 시각에 끝난 쿠폰은 빠지고 시작된 쿠폰은 포함
+        self.assertEqual(len(rows), 3)
+        self.assertEqual({tuple(sorted(row["available_coupons"])) for row in rows}, {("TEST10", "TOMORROW2000")})
+
+    def test_snapshot_promotion_order_matches_repository(self):
+        other_policy = self._policy(DiscountType.FIXED, "500.00")
+        PromotionModel.objects.create(
+            id=uuid.uuid4(), name="전체 500원 할인", status=CouponStatus.ACTIVE.value, is_auto_discount=True,
+            discount_policy=other_policy,
+        )
+        DiscountTargetModel.objects.create(id=uuid.uuid4(), discount_policy=other_policy, apply_priority=5)
+
+        snapshot_repo = SnapshotPromotionRepoImpl(RuleSnapshotRepoImpl().load(self.now))
+        for code in ("BOOK001", "BOOK002"):
+            with self.subTest(code=code):
+                self.assertEqual(
+                    [p.name for p in snapshot_repo.get_active_promotions(target_product_code=code)],
+                    [p.name for p in PromotionRepoImpl().get_active_promotions(target_product_code=code)],
+                )
@@ -0,0 +1,121 @@
+import pickle
+import re
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.pricing.domain.entity.user_segment import SegmentMembers
+from apps.pricing.domain.value_objects import (
+    CouponStatus,
+    DiscountType,
+    TargetType,
+)
+from apps.pricing.infrastructure.persistence.models import (
+    Coupon as CouponModel,
+    DiscountPolicy as DiscountPolicyModel,
+    DiscountTarget as DiscountTargetModel,
+    User as UserModel,
+    UserSegment as UserSegmentModel,
+)
+from apps.pricing.infrastructure.persistence.repository_impl.coupon_repo_impl import CouponRepoImpl
+from apps.pricing.infrastructure.persistence.repository_impl.user_segment_repo_impl import UserSegmentRepoImpl
+
+
+class SegmentMembersTest(TestCase):
+    def test_membership_by_binary_search(self):
+        ids = [uuid.uuid4() for _ in range(1000)]
+        members = SegmentMembers.from_ids(ids + ids[:10])
+
+        self.assertEqual(len(members), 1000)
+        self.assertEqual(list(members), sorted(ids, key=lambda user_id: user_id.int))
+        self.assertTrue(all(user_id in members for user_id in ids))
+        self.assertTrue(str(ids[0]) in members)
+        self.assertFalse(uuid.uuid4() in members)
+        self.assertFalse(None in members)
+        self.assertFalse(ids[0] in SegmentMembers())
+
+    def test_packed_length_validated(self):
+        with self.assertRaises(ValueError):
+            SegmentMembers(b"\x00" * 17)
+
+
+class SegmentCouponTest(TestCase):
+    def setUp(self):
+        self.now = timezone.now()
+        self.member = UserModel.objects.create(id=uuid.uuid4(), name="회원")
+        self.outsider = UserModel.objects.create(id=uuid.uuid4(), name="비회원")
+
+        self.segment_repo = UserSegmentRepoImpl()
+        others = [uuid.uuid4() for _ in range(5000)]
+        self.segment = self.segment_repo.save("VIP", others + [self.member.id])
+
+        policy = DiscountPolicyModel.objects.create(
+            id=uuid.uuid4(),
+            discount_type=DiscountType.PERCENTAGE.value,
+            value=Decimal("0.10"),
+            target_type=TargetType.SEGMENT.value,
+            effective_start_at=self.now - timedelta(days=1),
+            effective_end_at=self.now + timedelta(days=30),
+        )
+        DiscountTargetModel.objects.create(
+            id=uuid.uuid4(), discount_policy=policy, target_segment_id=self.segment.id, apply_priority=1,
+        )
+        CouponModel.objects.create(
+            id=uuid.uuid4(),
+            code="VIP10",
+            name="VIP 10% 할인",
+            valid_until=self.now + timedelta(days=1),
+            status=CouponStatus.ACTIVE.value,
+            discount_policy=policy,
+        )
+        self.coupon_repo = CouponRepoImpl()
+
+    def _coupon(self):
+        coupons = self.coupon_repo.list_active_not_expired(self.now)
+        self.assertEqual([coupon.code for coupon in coupons], ["VIP10"])
+        return coupons[0]
+
+    def test_available_only_to_members(self):
+        coupon = self._coupon()
+
+        self.assertEqual(coupon.target_segment_id, self.segment.id)
+        self.assertTrue(coupon.is_available(self.member, "BOOK001"))
+        self.assertFalse(coupon.is_available(self.outsider, "BOOK001"))
+        self.assertFalse(coupon.is_available(None, "BOOK001"))
+
+    def test_members_not_loaded_with_coupon(self):
+        with CaptureQueriesContext(connection) as captured:
+            coupon = self._coupon()
+        self.assertFalse(any(re.search(r'"members"(?!_)', query["sql"]) for query in captured))
+
+        # 회원 목록은 프로세스에서 버전별로 한 번만 읽음 (저장한 프로세스는 이미 보관 중)
+        with self.assertNumQueries(0):
+            self.assertTrue(coupon.is_available(self.member, "BOOK001"))
+
+    def test_pickled_coupon_reads_members_by_version(self):
+        coupon = pickle.loads(pickle.dumps(self._coupon()))
+
+        self.assertTrue(coupon.is_available(self.member, "BOOK001"))
+        self.assertFalse(coupon.is_available(self.outsider, "BOOK001"))
+
+    def test_replaced_members_apply_after_commit(self):
+        self.assertFalse(self._coupon().is_available(self.outsider, "BOOK001"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.segment_repo.save("VIP", [self.outsider.id], segment_id=self.segment.id)
+
+        coupon = self._coupon()
+        self.assertTrue(coupon.is_available(self.outsider, "BOOK001"))
+        self.assertFalse(coupon.is_available(self.member, "BOOK001"))
+        self.assertEqual(self.segment_repo.get(self.segment.id), coupon.target_segment)
+
+    def test_segment_id_generated_per_row(self):
+        first = UserSegmentModel.objects.create(name="A", members_digest="")
+        second = UserSegmentModel.objects.create(name="B", members_digest="")
+        self.assertIsInstance(first.id, uuid.UUID)
+        self.assertNotEqual(first.id, second.id)
@@ -1,5 +1,16 @@
+from decimal import Decimal
+
 from rest_framework import serializers
 
+from apps.pricing.domain.entity.cart import CartItem
+from apps.pricing.domain.entity.simulation import DraftDiscount
+from apps.pricing.domain.policy.discount_policy import build_discount_policy
+from apps.pricing.domain.value_objects import (
+    DiscountType,
+    DraftKind,
+)
+from apps.utils import const
+
 
 class CouponSummarySerializer(serializers.Serializer):
     code = serializers.CharField()
@@ -12,14 +23,133 @@ class CouponSummarySerializer(serializers.Serializer):
     target_type = serializers.CharField()
     target_product_code = serializers.CharField()
     target_user_id = serializers.UUIDField()
+    target_segment_id = serializers.UUIDField()
     minimum_purchase_amount = serializers.DecimalField(max_digits=10, decimal_places=2)
     valid_until = serializers.DateTimeField()
     status = serializers.CharField()
     created_at = serializers.DateTimeField()
 
 
+class IssuedCouponSerializer(serializers.Serializer):
+    issued_coupon_id = serializers.CharField()
+    status = serializers.CharField()
+    valid_until = serializers.DateTimeField(source="usable_until")
+    issued_at = serializers.DateTimeField()
+    coupon = CouponSummarySerializer(source="to_coupon")
+
+
 class PriceResultSerializer(serializers.Serializer):
     original = serializers.DecimalField(max_digits=10, decimal_places=2)
     discounted = serializers.DecimalField(max_digits=10, decimal_places=2)
     discount_amount = serializers.DecimalField(max_digits=10, decimal_places=2)
-    discount_types = serializers.ListField(child=serializers.CharField(), allow_empty=True)
\ No newline at end of file
+    discount_types = serializers.ListField(child=serializers.CharField(), allow_empty=True)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 할인 초안 시뮬레이션
+# ──────────────────────────────────────────────────────────────────────────────
+class DraftDiscountSerializer(serializers.Serializer):
+    kind = serializers.ChoiceField(choices=DraftKind.choices())
+    name = serializers.CharField(max_length=100)
+    discount_type = serializers.ChoiceField(choices=DiscountType.choices())
+    value = serializers.DecimalField(max_digits=10, decimal_places=2, min_value=Decimal("0"))
+    target_product_codes = serializers.ListField(
+        child=serializers.CharField(max_length=50), allow_empty=False, required=False,
+    )                                                   # 미지정: 전체 상품
+    apply_priority = serializers.IntegerField(default=0)
+    minimum_purchase_amount = serializers.DecimalField(
+        max_digits=10, decimal_places=2, min_value=Decimal("0"), default=Decimal("0"),
+    )
+    at = serializers.DateTimeField(required=False)     # 기준 시각 (미지정: 현재)
+    bucket_size = serializers.DecimalField(
+        max_digits=10, decimal_places=2, min_value=Decimal("100"), default=Decimal("5000"),
+    )
+    limit = serializers.IntegerField(
+        min_value=0, max_value=const.SIMULATION_MAX_LIMIT, default=const.SIMULATION_DEFAULT_LIMIT,
+    )
+
+    def validate(self, attrs):
+        try:
+            attrs["discount_policy"] = build_discount_policy(attrs["discount_type"], attrs["value"])
+        except ValueError as e:
+            raise serializers.ValidationError({"value": str(e)})
+        return attrs
+
+    def to_draft(self) -> DraftDiscount:
+        data = self.validated_data
+        codes = data.get("target_product_codes")
+        return DraftDiscount(
+            kind=data["kind"],
+            name=data["name"],
+            discount_policy=data["discount_policy"],
+            target_product_codes=tuple(codes) if codes is not None else None,
+            apply_priority=data["apply_priority"],
+            minimum_purchase_amount=data["minimum_purchase_amount"],
+        )
+
+
+class BookPriceDeltaSerializer(serializers.Serializer):
+    code = serializers.CharField()
+    price = serializers.DecimalField(max_digits=10, decimal_places=2)
+    baseline = serializers.DecimalField(max_digits=10, decimal_places=2)
+    scenario = serializers.DecimalField(max_digits=10, decimal_places=2)
+    delta = serializers.DecimalField(max_digits=10, decimal_places=2)
+
+
+class PriceBucketSerializer(serializers.Serializer):
+    lower = serializers.DecimalField(max_digits=10, decimal_places=2)
+    upper = serializers.DecimalField(max_digits=10, decimal_places=2)
+    baseline_count = serializers.IntegerField()
+    scenario_count = serializers.IntegerField()
+
+
+class SimulationResultSerializer(serializers.Serializer):
+    reference_time = serializers.DateTimeField()
+    total_books = serializers.IntegerField()
+    affected_books = serializers.IntegerField()
+    baseline_total = serializers.DecimalField(max_digits=18, decimal_places=2)
+    scenario_total = serializers.DecimalField(max_digits=18, decimal_places=2)
+    discount_change = serializers.DecimalField(max_digits=18, decimal_places=2)
+    buckets = PriceBucketSerializer(many=True)
+    deltas = BookPriceDeltaSerializer(many=True)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 장바구니 가격 계산
+# ──────────────────────────────────────────────────────────────────────────────
+class CartItemSerializer(serializers.Serializer):
+    code = serializers.CharField(max_length=50)
+    quantity = serializers.IntegerField(min_value=1, default=1)
+
+
+class CartPriceRequestSerializer(serializers.Serializer):
+    items = CartItemSerializer(many=True, allow_empty=False, max_length=const.CART_MAX_ITEMS)
+    coupon_code = serializers.ListField(child=serializers.CharField(max_length=50), required=False, default=list)
+
+    def to_items(self):
+        return [
+            CartItem(product_code=item["code"], quantity=item["quantity"])
+            for item in self.validated_data["items"]
+        ]
+
+
+class CartLineSerializer(serializers.Serializer):
+    code = serializers.CharField(source="product_code")
+    name = serializers.CharField()
+    quantity = serializers.IntegerField()
+    unit_price = serializers.DecimalField(max_digits=10, decimal_places=2)
+    original = serializers.DecimalField(max_digits=18, decimal_places=2)
+    promotion_discount = serializers.DecimalField(max_digits=18, decimal_places=2)
+    coupon_discount = serializers.DecimalField(max_digits=18, decimal_places=2)
+    discount_amount = serializers.DecimalField(max_digits=18, decimal_places=2)
+    discounted = serializers.DecimalField(max_digits=18, decimal_places=2)
+    applied_pricing_policies = serializers.ListField(source="applied_policies", child=serializers.CharField())
+
+
+class CartPriceResultSerializer(serializers.Serializer):
+    lines = CartLineSerializer(many=True)
+    original = serializers.DecimalField(max_digits=18, decimal_places=2)
+    discount_amount = serializers.DecimalField(max_digits=18, decimal_places=2)
+    discounted = serializers.DecimalField(max_digits=18, decimal_places=2)
+    applied_coupons = serializers.ListField(child=serializers.CharField())
+    rejected_coupons = serializers.ListField(child=serializers.CharField())
@@ -0,0 +1,137 @@
+import json
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+
+from asgiref.sync import sync_to_async
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.pricing.domain.value_objects import (
+    CouponStatus,
+    DiscountType,
+    TargetType,
+)
+from apps.pricing.infrastructure.persistence.models import (
+    Coupon as CouponModel,
+    DiscountPolicy as DiscountPolicyModel,
+    Promotion as PromotionModel,
+)
+from apps.product.domain.value_objects import (
+    ProductStatus,
+    VisibilityStatus,
+)
+from apps.product.infrastructure.persistence.models import (
+    Book as BookModel,
+    BookDetail as BookDetailModel,
+    PublishInfo as PublishInfoModel,
+)
+from apps.utils import (
+    const,
+    messages,
+)
+
+
+class AsyncApplyCouponAPITest(APITestCase):
+    """
+    비동기 쿠폰 적용 API는 실제 상품/프로모션/쿠폰 데이터로 동기 API와 같은 응답을 반환해야 한다.
+    """
+
+    def setUp(self):
+        self.now = timezone.now()
+        book = BookModel.objects.create(
+            code="BOOK001", name="도서", price=Decimal("20000.00"), status=ProductStatus.ACTIVE.value,
+        )
+        BookDetailModel.objects.create(
+            book_code=book, category="FICTION", description="설명", status=VisibilityStatus.VISIBLE.value,
+        )
+        PublishInfoModel.objects.create(
+            book_code=book, publisher="밀리출판", published_date=self.now.date(), status=VisibilityStatus.VISIBLE.value,
+        )
+
+        CouponModel.objects.create(
+            id=uuid.uuid4(), code="TEST10", name="10% 할인", valid_until=self.now + timedelta(days=7),
+            status=CouponStatus.ACTIVE.value, discount_policy=self._policy(DiscountType.PERCENTAGE, "0.10"),
+        )
+        CouponModel.objects.create(
+            id=uuid.uuid4(), code="MINUS1000", name="1000원 할인", valid_until=self.now + timedelta(days=7),
+            status=CouponStatus.ACTIVE.value, discount_policy=self._policy(DiscountType.FIXED, "1000.00"),
+        )
+        PromotionModel.objects.create(
+            id=uuid.uuid4(), name="자동 5% 할인", status=CouponStatus.ACTIVE.value, is_auto_discount=True,
+            discount_policy=self._policy(DiscountType.PERCENTAGE, "0.05"),
+        )
+
+    def _policy(self, discount_type, value):
+        return DiscountPolicyModel.objects.create(
+            id=uuid.uuid4(),
+            discount_type=discount_type.value,
+            value=Decimal(value),
+            target_type=TargetType.ALL.value,
+            effective_start_at=self.now - timedelta(days=1),
+            effective_end_at=self.now + timedelta(days=30),
+        )
+
+    async def _post_both(self, code, payload, query=""):
+        body = json.dumps(payload)
+        response = await self.async_client.post(
+            reverse("async-apply-coupon", args=[code]) + query, body, content_type="application/json",
+        )
+        expected = await sync_to_async(self.client.post)(
+            reverse("apply-coupon", args=[code]) + query, body, content_type="application/json",
+        )
+        return response, expected
+
+    async def test_apply_matches_sync(self):
+        for query in ("", f"?{const.INCLUDE}="):
+            with self.subTest(query=query):
+                response, expected = await self._post_both(
+                    "BOOK001", {const.COUPON_CODE: ["TEST10", "MINUS1000"]}, query,
+                )
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(response.json(), expected.json())
+
+        price_result = response.json()["data"]["price_result"]
+        self.assertLess(Decimal(price_result["discounted"]), Decimal("20000.00"))
+        self.assertIn("자동 5% 할인", response.json()["data"]["applied_pricing_policies"])
+
+    async def test_best_price_matches_sync(self):
+        for payload in (
+            {const.COUPON_CODE: ["MINUS1000", "TEST10"], const.BEST_PRICE: True},
+            {const.BEST_PRICE: True, const.INCLUDE: []},
+        ):
+            with self.subTest(payload=payload):
+                response, expected = await self._post_both("BOOK001", payload)
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(response.json(), expected.json())
+                # 정률(TEST10) → 정액(MINUS1000) 순서로 적용
+                applied = response.json()["data"]["applied_pricing_policies"]
+                self.assertLess(applied.index("10% 할인"), applied.index("1000원 할인"))
+
+    async def test_promotion_only_matches_sync(self):
+        response, expected = await self._post_both("BOOK001", {})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), expected.json())
+
+    async def test_not_found_matches_sync(self):
+        for code, payload in (("NOPE", {}), ("BOOK001", {const.COUPON_CODE: ["UNKNOWN"]})):
+            with self.subTest(code=code, payload=payload):
+                response, expected = await self._post_both(code, payload)
+
+                self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+                self.assertEqual(response.json(), expected.json())
+
+    async def test_bad_request_extra_params(self):
+        response = await self.async_client.post(
+            reverse("async-apply-coupon", args=["BOOK001"]),
+            json.dumps({const.COUPON_CODE: ["TEST10"], "unexpected_key": "value"}),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn(messages.BAD_REQUEST, response.json()["message"])
@@ -0,0 +1,84 @@
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.pricing.domain.value_objects import (
+    CouponStatus,
+    DiscountType,
+    TargetType,
+)
+from apps.pricing.infrastructure.persistence.models import (
+    Coupon as CouponModel,
+    DiscountPolicy as DiscountPolicyModel,
+)
+from apps.product.domain.value_objects import ProductStatus
+from apps.product.infrastructure.persistence.models import Book as BookModel
+from apps.utils import (
+    const,
+    messages,
+)
+
+
+class CartPriceAPITest(APITestCase):
+    def setUp(self):
+        self.url = reverse("cart-price")
+        now = timezone.now()
+        for code, price in (("BOOK001", "20000.00"), ("BOOK002", "8000.00")):
+            BookModel.objects.create(code=code, name=code, price=Decimal(price), status=ProductStatus.ACTIVE.value)
+        policy = DiscountPolicyModel.objects.create(
+            id=uuid.uuid4(), discount_type=DiscountType.FIXED.value, value=Decimal("3000.00"),
+            target_type=TargetType.ALL.value, minimum_purchase_amount=Decimal("30000.00"),
+            effective_start_at=now - timedelta(days=1), effective_end_at=now + timedelta(days=30),
+        )
+        CouponModel.objects.create(
+            id=uuid.uuid4(), code="FIX3000", name="3000원 할인", valid_until=now + timedelta(days=7),
+            status=CouponStatus.ACTIVE.value, discount_policy=policy,
+        )
+
+    def test_cart_price_with_coupon(self):
+        payload = {
+            "items": [{"code": "BOOK001", "quantity": 1}, {"code": "BOOK002", "quantity": 2}],
+            "coupon_code": ["FIX3000"],
+        }
+        response = self.client.post(self.url, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()[const.DATA]
+        self.assertEqual(data["original"], "36000.00")
+        self.assertEqual(data["discounted"], "33000.00")
+        self.assertEqual(data["applied_coupons"], ["3000원 할인"])
+        self.assertEqual(
+            [(line["code"], line["quantity"], line["coupon_discount"]) for line in data["lines"]],
+            [("BOOK001", 1, "1666.67"), ("BOOK002", 2, "1333.33")],
+        )
+        self.assertEqual(data["lines"][0]["applied_pricing_policies"], ["3000원 할인"])
+
+    def test_minimum_not_met(self):
+        payload = {"items": [{"code": "BOOK001"}], "coupon_code": ["FIX3000"]}
+        response = self.client.post(self.url, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()[const.DATA]
+        self.assertEqual(data["discounted"], "20000.00")
+        self.assertEqual(data["rejected_coupons"], ["FIX3000"])
+
+    def test_invalid_body(self):
+        for payload in (
+            {},
+            {"items": []},
+            {"items": [{"code": "BOOK001", "quantity": 0}]},
+            {"items": [{"code": f"BOOK{i:03d}"} for i in range(const.CART_MAX_ITEMS + 1)]},
+        ):
+            with self.subTest(payload=str(payload)[:40]):
+                response = self.client.post(self.url, payload, format="json")
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertTrue(response.json()[const.MESSAGE].startswith(messages.INVALID_BODY))
+
+    def test_unknown_product(self):
+        response = self.client.post(self.url, {"items": [{"code": "NOPE"}]}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
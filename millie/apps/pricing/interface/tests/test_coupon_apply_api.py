@@ -7,6 +7,8 @@ from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APITestCase
 
+from apps.container import container
+from apps.pricing.application.use_case.calculate_price_use_case import CalculatePriceUseCase
 from apps.pricing.domain.entity.coupon import Coupon as CouponEntity
 from apps.pricing.domain.entity.price_result import PriceResult as PriceResultEntity
 from apps.pricing.domain.policy.discount_policy import PercentageDiscountPolicy
@@ -16,11 +18,15 @@ from apps.utils import (
 )
 from apps.utils.exceptions import NotFoundException
 
-PATCH_TARGET = "apps.pricing.interface.views.coupon_apply_views.CalculatePriceUseCase"
-
 
 class ApplyCouponAPITest(APITestCase):
     def setUp(self):
+        # 뷰가 컨테이너에서 받는 use case를 mock으로 교체
+        self.use_case = mock.Mock(spec=CalculatePriceUseCase)
+        override = container.override(CalculatePriceUseCase, self.use_case)
+        override.start()
+        self.addCleanup(override.stop)
+
         self.product_code = "BOOK001"
         self.url = reverse("apply-coupon", args=[self.product_code])
         now = timezone.now()
@@ -48,8 +54,7 @@ class ApplyCouponAPITest(APITestCase):
             discount_types=["PERCENTAGE"],
         )
 
-    @mock.patch(PATCH_TARGET)
-    def test_bad_request_extra_params(self, mock_use_case_cls):
+    def test_bad_request_extra_params(self):
         payload = {
             const.COUPON_CODE: ["TEST10"],
             "unexpected_key": "value"
@@ -61,12 +66,11 @@ class ApplyCouponAPITest(APITestCase):
         self.assertIn(messages.BAD_REQUEST, response.data["message"])
         self.assertEqual(response.data["data"], {})
 
-    @mock.patch(PATCH_TARGET)
-    def test_product_not_found_returns_404(self, mock_use_case_cls):
+    def test_product_not_found_returns_404(self):
         """
         CalculatePriceUseCase.fetch()가 NotFoundException을 던지면 404를 반환해야 한다.
         """
-        instance = mock_use_case_cls.return_value
+        instance = self.use_case
         instance.fetch.side_effect = NotFoundException("상품을 찾을 수 없습니다.")
 
         payload = {const.COUPON_CODE: ["TEST10"]}
@@ -77,12 +81,11 @@ class ApplyCouponAPITest(APITestCase):
         self.assertIn("상품을 찾을 수 없습니다.", response.data["message"])
         self.assertEqual(response.data["data"], {})
 
-    @mock.patch(PATCH_TARGET)
-    def test_validate_failure_returns_404(self, mock_use_case_cls):
+    def test_validate_failure_returns_404(self):
         """
         CalculatePriceUseCase.validate()가 NotFoundException을 던지면 404를 반환해야 한다.
         """
-        instance = mock_use_case_cls.return_value
+        instance = self.use_case
         instance.fetch.return_value = mock.Mock()
         instance.validate.side_effect = NotFoundException("유효하지 않은 쿠폰입니다.")
 
@@ -95,12 +98,11 @@ class ApplyCouponAPITest(APITestCase):
         self.assertIn("유효하지 않은 쿠폰입니다.", response.data["message"])
         self.assertEqual(response.data["data"], {})
 
-    @mock.patch(PATCH_TARGET)
-    def test_internal_error_returns_500(self, mock_use_case_cls):
+    def test_internal_error_returns_500(self):
         """
         CalculatePriceUseCase.execute()가 일반 Exception을 던지면 500을 반환해야 한다.
         """
-        instance = mock_use_case_cls.return_value
+        instance = self.use_case
         instance.fetch.return_value = mock.Mock()
         instance.validate.return_value = None
         instance.execute.side_effect = Exception("계산 중 오류 발생")
@@ -113,12 +115,11 @@ class ApplyCouponAPITest(APITestCase):
         self.assertIn(messages.INTERNAL_SERVER_ERROR, response.data["message"])
         self.assertEqual(response.data["data"], {})
 
-    @mock.patch(PATCH_TARGET)
-    def test_successful_apply_returns_200(self, mock_use_case_cls):
+    def test_successful_apply_returns_200(self):
         """
         fetch, validate, execute가 모두 성공하면 200을 반환하고, 직렬화된 결과가 와야 한다.
         """
-        instance = mock_use_case_cls.return_value
+        instance = self.use_case
         dummy_product = mock.Mock()
         instance.fetch.return_value = dummy_product
         instance.validate.return_value = None
@@ -154,3 +155,44 @@ class ApplyCouponAPITest(APITestCase):
 
         # applied_pricing_policies 검증
         self.assertListEqual(data["applied_pricing_policies"], applied_policies)
+
+    def test_include_empty_skips_available_coupons(self):
+        """
+        include를 빈 값으로 주면 available_coupons 계산을 생략하도록 use case에 전달하고, 응답에서도 제외해야 한다.
+        """
+        instance = self.use_case
+        instance.fetch.return_value = mock.Mock()
+        instance.validate.return_value = None
+        instance.execute.return_value = ([], ["TEST10_PROMO"], self.example_price_result)
+
+        payload = {const.COUPON_CODE: ["TEST10"], const.INCLUDE: []}
+        response = self.client.post(self.url, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.data["data"]
+        self.assertIn("price_result", data)
+        self.assertNotIn(const.AVAILABLE_COUPONS, data)
+        self.assertListEqual(data["applied_pricing_policies"], ["TEST10_PROMO"])
+        self.assertFalse(instance.execute.call_args.kwargs["include_available_coupons"])
+
+    def test_invalid_include_returns_400(self):
+        payload = {const.COUPON_CODE: ["TEST10"], const.INCLUDE: ["unknown"]}
+        response = self.client.post(self.url, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn(messages.INVALID_INCLUDE, response.data["message"])
+        self.use_case.execute.assert_not_called()
+
+    def test_best_price_passed_to_use_case(self):
+        instance = self.use_case
+        instance.fetch.return_value = mock.Mock()
+        instance.validate.return_value = None
+        instance.execute.return_value = ([], [], self.example_price_result)
+
+        for value, expected in ((True, True), ("true", True), (False, False)):
+            with self.subTest(value=value):
+                payload = {const.COUPON_CODE: ["TEST10"], const.BEST_PRICE: value}
+                response = self.client.post(self.url, payload, format="json")
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(instance.execute.call_args.kwargs["best_price"], expected)
@@ -0,0 +1,76 @@
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.pricing.domain.value_objects import (
+    CouponStatus,
+    DiscountType,
+    IssuedCouponStatus,
+    TargetType,
+)
+from apps.pricing.infrastructure.persistence.models import (
+    Coupon as CouponModel,
+    DiscountPolicy as DiscountPolicyModel,
+    IssuedCoupon as IssuedCouponModel,
+    User as UserModel,
+)
+from apps.utils import (
+    const,
+    messages,
+)
+
+
+class CouponWalletAPITest(APITestCase):
+    def setUp(self):
+        now = timezone.now()
+        self.user = UserModel.objects.create(id=uuid.uuid4(), name="사용자")
+        policy = DiscountPolicyModel.objects.create(
+            id=uuid.uuid4(), discount_type=DiscountType.FIXED.value, value=Decimal("2000.00"),
+            target_type=TargetType.USER.value,
+            effective_start_at=now - timedelta(days=1), effective_end_at=now + timedelta(days=30),
+        )
+        for code, name, issued_coupon_id, issued_status in (
+            ("WELCOME", "가입 축하 2000원", "W-0001", IssuedCouponStatus.ISSUED),
+            ("BIRTHDAY", "생일 축하 2000원", "B-0001", IssuedCouponStatus.USED),
+        ):
+            coupon = CouponModel.objects.create(
+                id=uuid.uuid4(), code=code, name=name, valid_until=now + timedelta(days=3),
+                status=CouponStatus.ACTIVE.value, discount_policy=policy,
+            )
+            IssuedCouponModel.objects.create(
+                id=uuid.uuid4(), coupon=coupon, issued_coupon_id=issued_coupon_id, user=self.user,
+                status=issued_status.value, valid_until=now + timedelta(days=7),
+            )
+
+    def test_lists_usable_issued_coupons(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(reverse("coupon-wallet"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        coupons = response.json()[const.DATA]["coupons"]
+        self.assertEqual([c["issued_coupon_id"] for c in coupons], ["W-0001"])
+        self.assertEqual(coupons[0]["coupon"]["code"], "WELCOME")
+        self.assertEqual(coupons[0]["coupon"]["target_user_id"], str(self.user.id))
+        # 발급 유효기간보다 원본 쿠폰이 먼저 끝나면 원본 기준
+        self.assertEqual(coupons[0]["valid_until"], coupons[0]["coupon"]["valid_until"])
+
+    def test_empty_wallet(self):
+        # 다른 사용자의 지갑은 조회할 수 없고 본인 지갑만
+        other = UserModel.objects.create(id=uuid.uuid4(), name="다른 사용자")
+        self.client.force_authenticate(user=other)
+        response = self.client.get(reverse("coupon-wallet"), {"user_id": str(self.user.id)})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()[const.DATA]["coupons"], [])
+
+    def test_requires_authentication(self):
+        response = self.client.get(reverse("coupon-wallet"))
+
+        self.assertIn(response.status_code, (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN))
+        self.assertEqual(response.json()["message"], messages.AUTHENTICATION_REQUIRED)
+        self.assertEqual(response.json()[const.DATA], {})
@@ -0,0 +1,75 @@
+from decimal import Decimal
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.pricing.infrastructure.persistence.models import (
+    Coupon as CouponModel,
+    Promotion as PromotionModel,
+)
+from apps.product.domain.value_objects import ProductStatus
+from apps.product.infrastructure.persistence.models import Book as BookModel
+from apps.utils import (
+    const,
+    messages,
+)
+
+
+class PricingSimulationAPITest(APITestCase):
+    def setUp(self):
+        self.url = reverse("pricing-simulation")
+        for code, price in (("BOOK001", "20000.00"), ("BOOK002", "8000.00")):
+            BookModel.objects.create(code=code, name=code, price=Decimal(price), status=ProductStatus.ACTIVE.value)
+
+    def test_simulate_promotion_for_all_books(self):
+        payload = {"kind": "PROMOTION", "name": "전체 10%", "discount_type": "PERCENTAGE", "value": "0.10"}
+        response = self.client.post(self.url, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()[const.DATA]
+        self.assertEqual(data["total_books"], 2)
+        self.assertEqual(data["affected_books"], 2)
+        self.assertEqual(data["baseline_total"], "28000.00")
+        self.assertEqual(data["scenario_total"], "25200.00")
+        self.assertEqual(data["discount_change"], "2800.00")
+        self.assertEqual(
+            [(row["code"], row["scenario"], row["delta"]) for row in data["deltas"]],
+            [("BOOK001", "18000.00", "-2000.00"), ("BOOK002", "7200.00", "-800.00")],
+        )
+        # 저장하지 않음
+        self.assertFalse(PromotionModel.objects.exists())
+        self.assertFalse(CouponModel.objects.exists())
+
+    def test_simulate_coupon_with_minimum_purchase(self):
+        payload = {
+            "kind": "COUPON", "name": "5천원", "discount_type": "FIXED", "value": "5000",
+            "minimum_purchase_amount": "10000", "limit": 1,
+        }
+        response = self.client.post(self.url, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()[const.DATA]
+        self.assertEqual(data["affected_books"], 1)
+        self.assertEqual([row["code"] for row in data["deltas"]], ["BOOK001"])
+
+    def test_bad_request(self):
+        cases = {
+            "invalid_rate": (
+                {"kind": "PROMOTION", "name": "n", "discount_type": "PERCENTAGE", "value": "1.5"}, ["value"],
+            ),
+            "unknown_kind": ({"kind": "GIFT", "name": "n", "discount_type": "FIXED", "value": "100"}, ["kind"]),
+            "missing": ({"kind": "COUPON"}, ["discount_type", "name", "value"]),
+            "limit": (
+                {
+                    "kind": "COUPON", "name": "n", "discount_type": "FIXED", "value": "100",
+                    "limit": const.SIMULATION_MAX_LIMIT + 1,
+                },
+                ["limit"],
+            ),
+        }
+        for name, (payload, fields) in cases.items():
+            with self.subTest(name):
+                response = self.client.post(self.url, payload, format="json")
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertEqual(response.json()[const.MESSAGE], f"{messages.INVALID_BODY} {', '.join(fields)}")
@@ -0,0 +1,88 @@
+from rest_framework import status
+
+from apps.pricing.application.use_case.async_calculate_price_use_case import AsyncCalculatePriceUseCase
+from apps.pricing.interface.serializer import (
+    CouponSummarySerializer,
+    PriceResultSerializer,
+)
+from apps.pricing.interface.views.coupon_apply_views import CouponApplyRequestMixin
+
+from apps.container import container
+from apps.utils import (
+    const,
+    messages,
+)
+from apps.utils.async_views import AsyncAPIView
+from apps.utils.exceptions import NotFoundException
+from apps.utils.response import build_api_response
+
+
+class AsyncCouponApplyView(CouponApplyRequestMixin, AsyncAPIView):
+    """
+    CouponApplyView의 비동기(ASGI) 버전 (요청/응답 동일)
+    상품/프로모션/쿠폰 조회를 동시에 기다림
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._use_case = container.resolve(AsyncCalculatePriceUseCase)
+
+    async def post(self, request, code: str):
+        redundant_params = self._find_invalid_params(request)
+        if redundant_params:
+            return self._bad_request(f"{messages.BAD_REQUEST}: {', '.join(redundant_params)}")
+
+        include = self._parse_include(request)
+        invalid_include = sorted(set(include) - const.APPLY_COUPON_INCLUDE_OPTIONS)
+        if invalid_include:
+            return self._bad_request(f"{messages.INVALID_INCLUDE}: {', '.join(invalid_include)}")
+        include_available_coupons = const.AVAILABLE_COUPONS in include
+
+        coupon_code_list = request.data.get(const.COUPON_CODE, [])
+        # NOTE! 실제 서비스에서는 인증된 유저 정보 전달받음
+        user = request.user if getattr(request.user, "is_authenticated", False) else None
+
+        try:
+            available_coupons, applied_coupons, price_result = await self._use_case.execute(
+                code=code,
+                user=user,
+                coupon_code=coupon_code_list,
+                include_available_coupons=include_available_coupons,
+                best_price=self._parse_best_price(request),
+            )
+        except NotFoundException as e:
+            return build_api_response(
+                data={},
+                message=str(e),
+                code=status.HTTP_404_NOT_FOUND,
+                http_status=status.HTTP_404_NOT_FOUND,
+            )
+        except Exception as e:                       # NOTE! 실제 서비스에서는 이렇게 예외처리 하지 않고 더 세밀히 해야함
+            return build_api_response(
+                data={},
+                message=f"{messages.INTERNAL_SERVER_ERROR}: {str(e)}",
+                code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                http_status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        response_data = {
+            "price_result": PriceResultSerializer(price_result).data,
+        }
+        if include_available_coupons:
+            response_data[const.AVAILABLE_COUPONS] = CouponSummarySerializer(available_coupons, many=True).data
+        response_data["applied_pricing_policies"] = applied_coupons
+
+        return build_api_response(
+            data=response_data,
+            message=messages.OK,
+            code=status.HTTP_200_OK,
+            http_status=status.HTTP_200_OK,
+        )
+
+    def _bad_request(self, message: str):
+        return build_api_response(
+            data={},
+            message=message,
+            code=status.HTTP_400_BAD_REQUEST,
+            http_status=status.HTTP_400_BAD_REQUEST,
+        )
@@ -0,0 +1,64 @@
+from rest_framework.views import APIView
+from rest_framework import status
+
+from apps.pricing.application.use_case.calculate_cart_price_use_case import CalculateCartPriceUseCase
+from apps.pricing.interface.serializer import (
+    CartPriceRequestSerializer,
+    CartPriceResultSerializer,
+)
+
+from apps.container import container
+from apps.utils import messages
+from apps.utils.exceptions import NotFoundException
+from apps.utils.response import build_api_response
+
+
+class CartPriceView(APIView):
+    """
+    여러 상품(수량 포함)의 가격을 한 번에 계산 (상품별 프로모션 + 장바구니 단위 쿠폰)
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._use_case = container.resolve(CalculateCartPriceUseCase)
+
+    def post(self, request):
+        serializer = CartPriceRequestSerializer(data=request.data)
+        if not serializer.is_valid():
+            return build_api_response(
+                data=serializer.errors,
+                message=f"{messages.INVALID_BODY} {', '.join(sorted(serializer.errors))}",
+                code=status.HTTP_400_BAD_REQUEST,
+                http_status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # NOTE! 실제 서비스에서는 인증된 유저 정보 전달받음
+        user = request.user if getattr(request.user, "is_authenticated", False) else None
+
+        try:
+            result = self._use_case.execute(
+                items=serializer.to_items(),
+                user=user,
+                coupon_code=serializer.validated_data["coupon_code"],
+            )
+        except NotFoundException as e:
+            return build_api_response(
+                data={},
+                message=str(e),
+                code=status.HTTP_404_NOT_FOUND,
+                http_status=status.HTTP_404_NOT_FOUND,
+            )
+        except Exception as e:                       # NOTE! 실제 서비스에서는 이렇게 예외처리 하지 않고 더 세밀히 해야함
+            return build_api_response(
+                data={},
+                message=f"{messages.INTERNAL_SERVER_ERROR}: {str(e)}",
+                code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                http_status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        return build_api_response(
+            data=CartPriceResultSerializer(result).data,
+            message=messages.OK,
+            code=status.HTTP_200_OK,
+            http_status=status.HTTP_200_OK,
+        )
@@ -1,17 +1,13 @@
 from rest_framework.views import APIView
 from rest_framework import status
 
-from apps.pricing.application.services.coupon_service import CouponService
-from apps.pricing.application.services.promotion_service import PromotionService
 from apps.pricing.application.use_case.calculate_price_use_case import CalculatePriceUseCase
-from apps.product.infrastructure.persistence.product_repo_impl import ProductRepoImpl
-from apps.pricing.infrastructure.persistence.repository_impl.coupon_repo_impl import CouponRepoImpl
-from apps.pricing.infrastructure.persistence.repository_impl.promotion_repo_impl import PromotionRepoImpl
 from apps.pricing.interface.serializer import (
     CouponSummarySerializer,
     PriceResultSerializer,
 )
 
+from apps.container import container
 from apps.utils import (
     const,
     messages,
@@ -20,14 +16,38 @@ from apps.utils.exceptions import NotFoundException
 from apps.utils.response import build_api_response
 
 
-class CouponApplyView(APIView):
+class CouponApplyRequestMixin:
+    """
+    쿠폰 적용 요청 파싱 (동기/비동기 뷰 공통)
+    """
+
+    def _parse_include(self, request) -> set:
+        # include 미지정 시 기존 응답과 동일하게 모든 부가 정보 포함, 빈 값이면 price_result만 반환
+        if const.INCLUDE not in request.data:
+            return set(const.APPLY_COUPON_INCLUDE_OPTIONS)
+
+        include = request.data.get(const.INCLUDE) or []
+        if isinstance(include, str):
+            include = include.split(",")
+        return {option.strip() for option in include if option and option.strip()}
+
+    def _parse_best_price(self, request) -> bool:
+        # 최저가 모드: 요청 순서 대신 최종 가격이 가장 낮은 쿠폰 조합/순서로 적용
+        value = request.data.get(const.BEST_PRICE, False)
+        if isinstance(value, str):
+            return value.strip().lower() in ("true", "1")
+        return bool(value)
+
+    def _find_invalid_params(self, request) -> list:
+        allowed = {const.COUPON_CODE, const.INCLUDE, const.BEST_PRICE}
+        extras = set(request.data.keys()) - allowed
+        return list(extras)
+
+
+class CouponApplyView(CouponApplyRequestMixin, APIView):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._use_case = CalculatePriceUseCase(
-            product_repo=ProductRepoImpl(),
-            coupon_service=CouponService(CouponRepoImpl()),
-            promotion_service=PromotionService(PromotionRepoImpl()),
-        )
+        self._use_case = container.resolve(CalculatePriceUseCase)
 
     def post(self, request, code: str):
 
@@ -40,6 +60,17 @@ class CouponApplyView(APIView):
                 http_status=status.HTTP_400_BAD_REQUEST,
             )
 
+        include = self._parse_include(request)
+        invalid_include = sorted(set(include) - const.APPLY_COUPON_INCLUDE_OPTIONS)
+        if invalid_include:
+            return build_api_response(
+                data={},
+                message=f"{messages.INVALID_INCLUDE}: {', '.join(invalid_include)}",
+                code=status.HTTP_400_BAD_REQUEST,
+                http_status=status.HTTP_400_BAD_REQUEST,
+            )
+        include_available_coupons = const.AVAILABLE_COUPONS in include
+
         coupon_code_list = request.data.get(const.COUPON_CODE, [])
         user = request.user if getattr(request.user, "is_authenticated", False) else None   # NOTE! 실제 서비스에서는 인증된 유저 정보 전달받음
 
@@ -54,6 +85,8 @@ class CouponApplyView(APIView):
                 product=product,
                 user=user,
                 coupon_code=coupon_code_list,
+                include_available_coupons=include_available_coupons,
+                best_price=self._parse_best_price(request),
             )
         except NotFoundException as e:
             return build_api_response(
@@ -70,18 +103,16 @@ class CouponApplyView(APIView):
                 http_status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+        response_data = {
+            "price_result": PriceResultSerializer(price_result).data,
+        }
+        if include_available_coupons:
+            response_data[const.AVAILABLE_COUPONS] = CouponSummarySerializer(available_coupons, many=True).data
+        response_data["applied_pricing_policies"] = applied_coupons
+
         return build_api_response(
-            data={
-                "price_result": PriceResultSerializer(price_result).data,
-                "available_coupons": CouponSummarySerializer(available_coupons, many=True).data,
-                "applied_pricing_policies": applied_coupons,
-            },
+            data=response_data,
             message=messages.OK,
             code=status.HTTP_200_OK,
             http_status=status.HTTP_200_OK,
         )
-
-    def _find_invalid_params(self, request) -> list:
-        allowed = {const.COUPON_CODE}
-        extras = set(request.data.keys()) - allowed
-        return list(extras)
@@ -0,0 +1,51 @@
+from rest_framework import status
+from rest_framework.exceptions import (
+    AuthenticationFailed,
+    NotAuthenticated,
+)
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.views import APIView
+
+from apps.pricing.application.use_case.get_coupon_wallet_use_case import GetCouponWalletUseCase
+from apps.pricing.interface.serializer import IssuedCouponSerializer
+
+from apps.container import container
+from apps.utils import messages
+from apps.utils.response import build_api_response
+
+
+class CouponWalletView(APIView):
+    """
+    로그인한 사용자의 쿠폰 지갑: 지금 사용할 수 있는 개별 발급 쿠폰 목록 (먼저 끝나는 순)
+    발급 쿠폰 id는 그대로 사용할 수 있는 코드이므로 본인 지갑만 조회 (경로로 사용자를 받지 않음)
+    """
+    permission_classes = [IsAuthenticated]
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._use_case = container.resolve(GetCouponWalletUseCase)
+
+    def get(self, request):
+        try:
+            issued_coupons = self._use_case.execute(request.user.id)
+        except Exception as e:                       # NOTE! 실제 서비스에서는 이렇게 예외처리 하지 않고 더 세밀히 해야함
+            return build_api_response(
+                data={},
+                message=f"{messages.INTERNAL_SERVER_ERROR}: {str(e)}",
+                code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                http_status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        return build_api_response(
+            data={"coupons": IssuedCouponSerializer(issued_coupons, many=True).data},
+            message=messages.OK,
+            code=status.HTTP_200_OK,
+            http_status=status.HTTP_200_OK,
+        )
+
+    def handle_exception(self, exc):
+        # 인증 실패도 같은 응답 형식으로 (상태 코드/헤더는 DRF 기본 처리 그대로)
+        response = super().handle_exception(exc)
+        if isinstance(exc, (NotAuthenticated, AuthenticationFailed)):
+            response.data = {"code": response.status_code, "message": messages.AUTHENTICATION_REQUIRED, "data": {}}
+        return response
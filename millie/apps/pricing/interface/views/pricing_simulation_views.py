@@ -0,0 +1,54 @@
+from rest_framework.views import APIView
+from rest_framework import status
+
+from apps.pricing.application.use_case.simulate_discount_use_case import SimulateDiscountUseCase
+from apps.pricing.interface.serializer import (
+    DraftDiscountSerializer,
+    SimulationResultSerializer,
+)
+
+from apps.container import container
+from apps.utils import messages
+from apps.utils.response import build_api_response
+
+
+class PricingSimulationView(APIView):
+    """
+    저장하지 않은 프로모션/쿠폰 초안을 현재 규칙과 함께 전체 상품에 적용했을 때의 가격 변화 (DB 쓰기 없음)
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._use_case = container.resolve(SimulateDiscountUseCase)
+
+    def post(self, request):
+        serializer = DraftDiscountSerializer(data=request.data)
+        if not serializer.is_valid():
+            return build_api_response(
+                data=serializer.errors,
+                message=f"{messages.INVALID_BODY} {', '.join(sorted(serializer.errors))}",
+                code=status.HTTP_400_BAD_REQUEST,
+                http_status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            result = self._use_case.execute(
+                draft=serializer.to_draft(),
+                reference_time=serializer.validated_data.get("at"),
+                bucket_size=serializer.validated_data["bucket_size"],
+                limit=serializer.validated_data["limit"],
+            )
+        except Exception as e:                       # NOTE! 실제 서비스에서는 이렇게 예외처리 하지 않고 더 세밀히 해야함
+            return build_api_response(
+                data={},
+                message=f"{messages.INTERNAL_SERVER_ERROR}: {str(e)}",
+                code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                http_status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        return build_api_response(
+            data=SimulationResultSerializer(result).data,
+            message=messages.OK,
+            code=status.HTTP_200_OK,
+            http_status=status.HTTP_200_OK,
+        )
@@ -0,0 +1,37 @@
+import sys
+import time
+
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+)
+
+from apps.container import container
+from apps.pricing.domain.repositories.user_segment_repository import UserSegmentRepository
+
+
+class Command(BaseCommand):
+    help = "사용자 세그먼트 회원 목록을 파일(한 줄에 사용자 id 하나)로 등록/교체합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("name", help="세그먼트 이름")
+        parser.add_argument("path", help="사용자 id 파일 경로 (-: 표준 입력)")
+        parser.add_argument("--segment-id", help="지정하면 해당 세그먼트의 회원 목록을 교체")
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        stream = sys.stdin if options["path"] == "-" else open(options["path"], encoding="utf-8")
+        try:
+            with stream:
+                user_ids = [line.strip() for line in stream if line.strip()]
+            segment = container.resolve(UserSegmentRepository).save(
+                name=options["name"],
+                user_ids=user_ids,
+                segment_id=options["segment_id"],
+            )
+        except ValueError as e:
+            raise CommandError(f"사용자 id 형식이 올바르지 않습니다. ({e})")
+
+        count = len(segment.load_members(segment.id, segment.version))
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f"세그먼트 {segment.id} 등록 완료 ({count}명, {elapsed:.2f}s)"))
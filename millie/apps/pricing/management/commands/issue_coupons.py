@@ -0,0 +1,49 @@
+from datetime import timedelta
+
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+)
+from django.utils import timezone
+
+from apps.container import container
+from apps.pricing.application.use_case.issue_coupons_use_case import IssueCouponsUseCase
+from apps.utils.exceptions import (
+    ConflictException,
+    NotFoundException,
+)
+
+
+class Command(BaseCommand):
+    help = "발급용 쿠폰(대상 사용자가 없는 사용자 대상 쿠폰)을 사용자마다 한 장씩 난수 코드로 대량 발급합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("coupon_code", help="발급할 원본 쿠폰 코드")
+        target = parser.add_mutually_exclusive_group(required=True)
+        target.add_argument("--segment-id", help="세그먼트 회원 전체에게 발급")
+        target.add_argument("--users-file", help="사용자 id 파일 (한 줄에 하나)")
+        parser.add_argument("--valid-days", type=int, help="발급일로부터 유효 일수 (기본: 원본 쿠폰 유효기간)")
+        parser.add_argument("--batch-size", type=int, default=10000, help="한 트랜잭션으로 저장할 발급 수")
+
+    def handle(self, *args, **options):
+        user_ids = None
+        if options["users_file"]:
+            with open(options["users_file"], encoding="utf-8") as stream:
+                user_ids = [line.strip() for line in stream if line.strip()]
+        valid_until = timezone.now() + timedelta(days=options["valid_days"]) if options["valid_days"] else None
+
+        try:
+            result = container.resolve(IssueCouponsUseCase).execute(
+                coupon_code=options["coupon_code"],
+                user_ids=user_ids,
+                segment_id=options["segment_id"],
+                valid_until=valid_until,
+                batch_size=options["batch_size"],
+            )
+        except (NotFoundException, ConflictException, ValueError) as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{result.issued}장 발급 완료 (건너뜀 {result.skipped}명, 코드 재생성 {result.regenerated}회, "
+            f"{result.elapsed:.2f}s, {result.per_second:,.0f}장/s)"
+        ))
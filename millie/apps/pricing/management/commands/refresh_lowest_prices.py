@@ -0,0 +1,19 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.container import container
+from apps.pricing.application.use_case.refresh_lowest_prices_use_case import RefreshLowestPricesUseCase
+
+
+class Command(BaseCommand):
+    help = "상품별 최저 구매 가능가(product_lowest_prices)를 다시 계산합니다. (기본: 전체)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("codes", nargs="*", help="지정한 상품만 다시 계산")
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        count = container.resolve(RefreshLowestPricesUseCase).execute(options["codes"] or None)
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f"{count}권 계산 완료 ({elapsed:.2f}s)"))
@@ -0,0 +1,119 @@
+import multiprocessing
+import os
+import pickle
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+)
+from django.db import connections
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from apps.pricing.infrastructure.persistence.repository_impl.snapshot_repo_impl import RuleSnapshotRepoImpl
+from apps.pricing.infrastructure.repricing import (
+    CSV,
+    FORMATS,
+    Partition,
+    RowWriter,
+    close_worker,
+    init_worker,
+    partition_codes,
+    price_partition,
+)
+from apps.product.domain.value_objects import ProductStatus
+from apps.product.infrastructure.persistence.models import Book as BookModel
+
+
+COPY_CHUNK_SIZE = 1024 * 1024
+
+
+class Command(BaseCommand):
+    help = "지정 시각의 가격 규칙으로 판매 중인 전체 상품의 가격을 다시 계산하여 CSV/NDJSON으로 출력합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--at", default=None, help="규칙 기준 시각 (ISO 8601, 기본: 현재), 예: 2025-06-01T00:00:00+09:00")
+        parser.add_argument("--coupon", action="append", default=[], help="함께 적용할 쿠폰 코드 (여러 번 지정 가능)")
+        parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="프로세스 수 (1이면 현재 프로세스에서 실행)")
+        parser.add_argument("--partitions", type=int, default=None, help="코드 구간 수 (기본: 프로세스 수 × 4)")
+        parser.add_argument("--format", choices=FORMATS, default=CSV)
+        parser.add_argument("--output", default="-", help="출력 파일 (기본: 표준 출력)")
+        parser.add_argument("--batch-size", type=int, default=1000, help="구간 안에서 한 번에 읽는 상품 수")
+
+    def handle(self, *args, **options):
+        reference_time = self._reference_time(options["at"])
+        workers = max(1, options["workers"])
+        started = time.perf_counter()
+
+        # 규칙은 한 번만 읽어 모든 워커에 전달
+        snapshot = RuleSnapshotRepoImpl().load(reference_time)
+        codes = list(
+            BookModel.objects.filter(status=ProductStatus.ACTIVE.value).order_by("code").values_list("code", flat=True)
+        )
+        ranges = partition_codes(codes, options["partitions"] or workers * 4)
+
+        with tempfile.TemporaryDirectory(prefix="reprice-") as workdir:
+            partitions = [
+                Partition(index=i, first_code=first, last_code=last, path=os.path.join(workdir, f"part-{i:05d}"))
+                for i, (first, last) in enumerate(ranges)
+            ]
+            initargs = (pickle.dumps(snapshot), options["coupon"], options["format"], options["batch_size"])
+            total = self._run(partitions, workers, initargs)
+            self._merge(partitions, options["format"], options["output"])
+
+        elapsed = time.perf_counter() - started
+        self.stderr.write(self.style.SUCCESS(
+            f"{total}권 / 구간 {len(ranges)}개 / 프로세스 {workers}개, 기준 시각 {reference_time.isoformat()} "
+            f"({elapsed:.2f}s, {total / elapsed if elapsed else 0:.0f}권/s)"
+        ))
+
+    @staticmethod
+    def _reference_time(value):
+        if value is None:
+            return timezone.now()
+        reference_time = parse_datetime(value)
+        if reference_time is None:
+            raise CommandError(f"--at 형식이 올바르지 않습니다: {value}")
+        if timezone.is_naive(reference_time):
+            reference_time = timezone.make_aware(reference_time)
+        return reference_time
+
+    @staticmethod
+    def _run(partitions, workers, initargs) -> int:
+        if workers == 1:
+            init_worker(*initargs)
+            try:
+                return sum(price_partition(partition) for partition in partitions)
+            finally:
+                close_worker()
+
+        # fork로 이어받은 DB 소켓을 부모/자식이 함께 쓰지 않도록 spawn + 부모 연결 정리
+        connections.close_all()
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_worker,
+            initargs=initargs,
+        ) as executor:
+            return sum(executor.map(price_partition, partitions))
+
+    def _merge(self, partitions, output_format, output):
+        # 구간 순서(= 코드 순서)대로 이어 붙임
+        if output == "-":
+            self._copy_parts(partitions, output_format, lambda chunk: self.stdout.write(chunk, ending=""))
+            return
+        with open(output, "w", encoding="utf-8", newline="") as out:
+            self._copy_parts(partitions, output_format, out.write)
+
+    @staticmethod
+    def _copy_parts(partitions, output_format, write):
+        header = RowWriter.header(output_format)
+        if header:
+            write(header)
+        for partition in partitions:
+            with open(partition.path, encoding="utf-8", newline="") as part:
+                for chunk in iter(lambda: part.read(COPY_CHUNK_SIZE), ""):
+                    write(chunk)
@@ -0,0 +1,30 @@
+# Generated by Django 4.2.21 on 2026-10-19 19:31
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('product', '0004_product_read_models'),
+        ('pricing', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductLowestPrice',
+            fields=[
+                ('book_code', models.OneToOneField(db_comment='상품 코드', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='lowest_price', serialize=False, to='product.book', to_field='code')),
+                ('price', models.DecimalField(db_comment='계산 기준 정가', decimal_places=2, max_digits=10)),
+                ('lowest_price', models.DecimalField(db_comment='최저 구매 가능가', decimal_places=2, max_digits=10)),
+                ('applied_policies', models.JSONField(db_comment='적용한 프로모션/쿠폰 이름 (적용 순서)', default=list)),
+                ('valid_until', models.DateTimeField(db_comment='적용한 쿠폰 중 가장 먼저 끝나는 시각 (없으면 NULL)', null=True)),
+                ('computed_at', models.DateTimeField(db_comment='계산 시각')),
+            ],
+            options={
+                'db_table': 'product_lowest_prices',
+                'db_table_comment': '상품별 최저 구매 가능가 테이블',
+            },
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.21 on 2026-10-19 19:41
+
+import apps.pricing.domain.value_objects
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pricing', '0002_product_lowest_prices'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='discounttarget',
+            name='target_category',
+            field=models.CharField(choices=[('FICTION', 'FICTION'), ('NON_FICTION', 'NON_FICTION'), ('SCIENCE', 'SCIENCE'), ('TECHNOLOGY', 'TECHNOLOGY'), ('SELF_HELP', 'SELF_HELP'), ('BUSINESS', 'BUSINESS'), ('HISTORY', 'HISTORY'), ('BIOGRAPHY', 'BIOGRAPHY'), ('PHILOSOPHY', 'PHILOSOPHY'), ('RELIGION', 'RELIGION'), ('OTHER', 'OTHER')], db_comment='분야에 적용되는 경우 값 있음', max_length=255, null=True),
+        ),
+        migrations.AddField(
+            model_name='discounttarget',
+            name='target_feature',
+            field=models.CharField(choices=[('MONTHLY_RECOMMEND', 'MONTHLY_RECOMMEND'), ('NEW_ARRIVAL', 'NEW_ARRIVAL'), ('BEST_SELLER', 'BEST_SELLER')], db_comment='도서 타입에 적용되는 경우 값 있음', max_length=255, null=True),
+        ),
+        migrations.AddField(
+            model_name='discounttarget',
+            name='target_publisher',
+            field=models.CharField(db_comment='출판사에 적용되는 경우 값 있음', max_length=255, null=True),
+        ),
+        migrations.AlterField(
+            model_name='discountpolicy',
+            name='target_type',
+            field=models.CharField(choices=[('PRODUCT', 'PRODUCT'), ('USER', 'USER'), ('ALL', 'ALL'), ('CATEGORY', 'CATEGORY'), ('PUBLISHER', 'PUBLISHER'), ('FEATURE', 'FEATURE')], db_comment='할인 정책 타입', default=apps.pricing.domain.value_objects.TargetType['ALL'], max_length=20),
+        ),
+    ]
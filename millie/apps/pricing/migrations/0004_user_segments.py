@@ -0,0 +1,42 @@
+# Generated by Django 4.2.21 on 2026-10-19 19:47
+
+import apps.pricing.domain.value_objects
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pricing', '0003_discount_target_dimensions'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserSegment',
+            fields=[
+                ('id', models.UUIDField(default=uuid.UUID, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(db_comment='세그먼트 이름', max_length=255)),
+                ('members', models.BinaryField(db_comment='회원 id 배열 (UUID 16바이트, 오름차순)', default=bytes)),
+                ('member_count', models.IntegerField(db_comment='회원 수', default=0)),
+                ('members_digest', models.CharField(db_comment='회원 목록 sha1 (캐시 버전)', max_length=40)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'user_segments',
+                'db_table_comment': '사용자 세그먼트 테이블',
+            },
+        ),
+        migrations.AlterField(
+            model_name='discountpolicy',
+            name='target_type',
+            field=models.CharField(choices=[('PRODUCT', 'PRODUCT'), ('USER', 'USER'), ('ALL', 'ALL'), ('CATEGORY', 'CATEGORY'), ('PUBLISHER', 'PUBLISHER'), ('FEATURE', 'FEATURE'), ('SEGMENT', 'SEGMENT')], db_comment='할인 정책 타입', default=apps.pricing.domain.value_objects.TargetType['ALL'], max_length=20),
+        ),
+        migrations.AddField(
+            model_name='discounttarget',
+            name='target_segment',
+            field=models.ForeignKey(db_comment='사용자 세그먼트에 적용되는 경우 값 있음', null=True, on_delete=django.db.models.deletion.CASCADE, to='pricing.usersegment'),
+        ),
+    ]
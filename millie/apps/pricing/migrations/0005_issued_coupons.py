@@ -0,0 +1,34 @@
+# Generated by Django 4.2.21 on 2026-10-19 19:51
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pricing', '0004_user_segments'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IssuedCoupon',
+            fields=[
+                ('id', models.UUIDField(default=uuid.UUID, editable=False, primary_key=True, serialize=False)),
+                ('issued_coupon_id', models.CharField(db_comment='발급된 쿠폰 id', max_length=255, unique=True)),
+                ('status', models.CharField(choices=[('ISSUED', 'ISSUED'), ('USED', 'USED'), ('REVOKED', 'REVOKED')], db_comment='발급 쿠폰 상태', default='ISSUED', max_length=20)),
+                ('valid_until', models.DateTimeField(db_comment='발급 쿠폰 유효 기간 (원본 쿠폰 유효 기간과 둘 중 먼저 끝나는 시각까지 사용 가능)')),
+                ('used_at', models.DateTimeField(db_comment='사용 일자', null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_comment='등록(발급) 일자')),
+                ('updated_at', models.DateTimeField(auto_now=True, db_comment='수정 일자')),
+                ('coupon', models.ForeignKey(db_comment='발급 원본 쿠폰', on_delete=django.db.models.deletion.CASCADE, to='pricing.coupon')),
+                ('user', models.ForeignKey(db_comment='사용자', on_delete=django.db.models.deletion.CASCADE, to='pricing.user')),
+            ],
+            options={
+                'db_table': 'issued_coupons',
+                'db_table_comment': '발급 쿠폰 테이블',
+                'indexes': [models.Index(fields=['user', 'status', 'valid_until'], name='issued_coupon_wallet_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.21 on 2026-10-19 20:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pricing', '0005_issued_coupons'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='productlowestprice',
+            name='valid_until',
+            field=models.DateTimeField(db_comment='적용한 쿠폰이 끝나거나 새 쿠폰이 시작되는 시각 중 먼저 오는 시각 (없으면 NULL)', null=True),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.21 on 2026-10-19 20:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pricing', '0006_lowest_price_valid_until_comment'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='issuedcoupon',
+            constraint=models.UniqueConstraint(fields=('coupon', 'user'), name='issued_coupon_coupon_user_uniq'),
+        ),
+    ]
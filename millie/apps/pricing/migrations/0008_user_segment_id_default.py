@@ -0,0 +1,19 @@
+# Generated by Django 4.2.21 on 2026-10-19 20:27
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pricing', '0007_issued_coupon_coupon_user_uniq'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='usersegment',
+            name='id',
+            field=models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.21 on 2026-10-19 20:27
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pricing', '0008_user_segment_id_default'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='issuedcoupon',
+            name='id',
+            field=models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
@@ -0,0 +1,54 @@
+import asyncio
+from typing import (
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from django.utils import timezone
+
+from apps.pricing.application.services.coupon_service import CouponService
+from apps.pricing.application.use_case.calculate_price_use_case import filter_available_coupons
+from apps.pricing.domain.entity.coupon import Coupon as CouponEntity
+from apps.pricing.domain.entity.issued_coupon import with_wallet
+from apps.pricing.domain.repositories.coupon_repository import AsyncCouponRepository
+from apps.product.domain.entity import Product as ProductEntity
+from apps.product.domain.repository import AsyncProductRepository
+
+from apps.utils.exceptions import NotFoundException
+
+
+class AsyncGetProductDetailUseCase:
+    def __init__(
+        self,
+        product_repo: AsyncProductRepository,
+        coupon_repo: AsyncCouponRepository,
+    ):
+        self._product_repo = product_repo
+        self._coupon_repo = coupon_repo
+
+    async def execute(
+        self,
+        code: str,
+        user=None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Tuple[ProductEntity, List[CouponEntity]]:
+        """
+        GetProductDetailUseCase와 같은 결과
+        쿠폰 조회는 상품 코드만 있으면 되므로 상품 조회와 동시에 기다리고, 가격 조건은 둘 다 끝난 뒤 적용
+        """
+        now = timezone.now()
+        product, coupons, issued = await asyncio.gather(
+            self._fetch(code, fields),
+            self._coupon_repo.list_active_not_expired(now),
+            self._coupon_repo.list_issued_coupons(user.id, now) if user is not None else asyncio.sleep(0, result=[]),
+        )
+        applicable = CouponService.select_applicable(with_wallet(coupons, issued), user, product.code)
+        return product, filter_available_coupons(applicable, product, user, product.price)
+
+    async def _fetch(self, code: str, fields: Optional[Iterable[str]] = None) -> ProductEntity:
+        try:
+            return await self._product_repo.get_product_by_code(code, fields=fields)
+        except Exception:
+            raise NotFoundException(f"해당 코드({code})의 상품이 없거나 판매 불가 상태입니다.")
@@ -0,0 +1,47 @@
+from typing import (
+    Iterable,
+    List,
+    Optional,
+)
+
+from apps.pricing.application.services.lowest_price_service import LowestPriceService
+from apps.product.domain.entity import Product as ProductEntity
+from apps.product.domain.repository import AsyncProductRepository
+from apps.product.domain.value_objects import (
+    ProductFilter,
+    ProductSort,
+)
+from apps.utils.concurrency import db_sync_to_async
+from apps.utils.const import LOWEST_PRICE
+
+
+class AsyncGetProductListUseCase:
+
+    def __init__(
+        self,
+        product_repo: AsyncProductRepository,
+        lowest_price_service: Optional[LowestPriceService] = None,
+    ) -> None:
+        self.product_repo = product_repo
+        self.lowest_price_service = lowest_price_service
+
+    async def execute(
+        self,
+        fields: Optional[Iterable[str]] = None,
+        product_filter: Optional[ProductFilter] = None,
+        sort: Optional[ProductSort] = None,
+        page: Optional[int] = None,
+        size: int = 20,
+    ) -> List[ProductEntity]:
+        # page를 지정하지 않으면 전체 목록 반환 (GetProductListUseCase와 동일)
+        offset, limit = ((page - 1) * size, size) if page is not None else (0, None)
+        products = await self.product_repo.get_products(
+            fields=fields,
+            product_filter=product_filter,
+            sort=sort,
+            offset=offset,
+            limit=limit,
+        )
+        if self.lowest_price_service and (fields is None or LOWEST_PRICE in fields):
+            products = await db_sync_to_async(self.lowest_price_service.with_lowest_prices)(products)
+        return products
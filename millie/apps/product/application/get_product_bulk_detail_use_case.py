@@ -0,0 +1,65 @@
+from typing import List, Tuple
+
+from apps.pricing.application.services.coupon_service import CouponService
+from apps.product.domain.entity import Product as ProductEntity
+from apps.pricing.domain.entity.coupon import Coupon as CouponEntity
+from apps.product.domain.repository import ProductRepository
+
+from apps.utils.exceptions import NotFoundException
+
+
+class GetProductBulkDetailUseCase:
+    def __init__(
+        self,
+        product_repo: ProductRepository,
+        coupon_service: CouponService,
+    ):
+        self._product_repo = product_repo
+        self._coupon_service = coupon_service
+
+    def execute(
+        self,
+        codes: List[str],
+        user=None,
+    ) -> List[Tuple[ProductEntity, List[CouponEntity]]]:
+        """
+        1) 요청된 상품들을 한 번에 조회 (요청 순서 유지, 없거나 판매 불가 상품은 제외)
+        2) 쿠폰은 한 번만 로드하여 상품별 “적용 가능 쿠폰” 필터링
+        """
+        products = self._fetch(codes)
+
+        coupons_by_product = self._coupon_service.get_applicable_coupons_by_product(
+            product_codes=[product.code for product in products],
+            user=user,
+        )
+
+        return [
+            (product, self._filter_available_coupons(product, coupons_by_product.get(product.code, [])))
+            for product in products
+        ]
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # 상품 일괄 조회
+    # ──────────────────────────────────────────────────────────────────────────
+    def _fetch(self, codes: List[str]) -> List[ProductEntity]:
+        products_by_code = {
+            product.code: product
+            for product in self._product_repo.get_products_by_codes(codes)
+        }
+        if not products_by_code:
+            raise NotFoundException(f"해당 코드({', '.join(codes)})의 상품이 없거나 판매 불가 상태입니다.")
+
+        return [products_by_code[code] for code in codes if code in products_by_code]
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # 화면에 보여줄 적용 가능 쿠폰 필터링 (최소 구매 금액)
+    # ──────────────────────────────────────────────────────────────────────────
+    @staticmethod
+    def _filter_available_coupons(
+        product_entity: ProductEntity,
+        coupons: List[CouponEntity],
+    ) -> List[CouponEntity]:
+        return [
+            coupon for coupon in coupons
+            if product_entity.price >= coupon.minimum_purchase_amount
+        ]
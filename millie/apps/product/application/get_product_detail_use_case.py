@@ -1,5 +1,5 @@
 from decimal import Decimal
-from typing import List, Optional, Tuple
+from typing import Iterable, List, Optional, Tuple
 
 from apps.pricing.application.services.coupon_service import CouponService
 from apps.pricing.application.services.promotion_service import PromotionService
@@ -7,7 +7,17 @@ from apps.product.domain.entity import Product as ProductEntity
 from apps.pricing.domain.entity.coupon import Coupon as CouponEntity
 from apps.product.domain.repository import ProductRepository
 
+from apps.utils.concurrency import fan_out
 from apps.utils.exceptions import NotFoundException
+from apps.utils.singleflight import (
+    SingleFlight,
+    user_key,
+)
+
+
+# 같은 상품 상세를 동시에 요청하면 한 번만 계산 (프로세스 단위)
+# 상품/가격 규칙이 바뀌면(상품·가격 캐시의 cache_versions 버전) 다른 키로 계산
+_detail_flight = SingleFlight("product-detail", stamps=("product", "pricing"))
 
 
 class GetProductDetailUseCase:
@@ -26,15 +36,37 @@ class GetProductDetailUseCase:
         code: str,
         user=None,
         coupon_code: Optional[List[str]] = None,
+        fields: Optional[Iterable[str]] = None,
     ) -> Tuple[ProductEntity, List[CouponEntity]]:
         """
-        1) 상품 조회 및 활성 상태 검증
+        1) 상품 조회 및 활성 상태 검증 (fields가 있으면 필요한 연관 정보만 로딩)
         2) 화면에 보여줄 “적용 가능 쿠폰” 필터링
+        같은 (상품, 사용자, 쿠폰, 필드) 조합의 동시 요청은 먼저 들어온 요청의 결과를 공유
         """
-        product = self._fetch(code)
+        key = _detail_flight.key(
+            code,
+            user_key(user),
+            sorted(map(str, coupon_code or [])),
+            sorted(fields) if fields is not None else None,
+        )
+        return _detail_flight.do(key, lambda: self._execute(code, user, coupon_code, fields))
+
+    def _execute(
+        self,
+        code: str,
+        user=None,
+        coupon_code: Optional[List[str]] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Tuple[ProductEntity, List[CouponEntity]]:
+        # 쿠폰 조회는 상품 코드만 있으면 되므로 상품 조회와 동시에 실행 (USE_CASE_FAN_OUT)
+        # 순서대로 실행될 때 없는/판매 불가 상품이면 쿠폰 조회 전에 NotFound가 나도록 상품 조회를 먼저 둠
+        product, raw_coupons = fan_out(
+            lambda: self._fetch(code, fields),
+            lambda: self._coupon_service.get_applicable_coupons(product_code=code, user=user) or [],
+        )
         base_price = product.price
 
-        available_coupons = self._filter_available_coupons(product, user, base_price)
+        available_coupons = self._filter_available_coupons(product, user, base_price, raw_coupons)
 
         # 쿠폰 없으면 자동 할인 결과 반환
         if not coupon_code:
@@ -45,9 +77,9 @@ class GetProductDetailUseCase:
     # ──────────────────────────────────────────────────────────────────────────
     # 상품 조회 및 활성 상태 검증
     # ──────────────────────────────────────────────────────────────────────────
-    def _fetch(self, code: str) -> ProductEntity:
+    def _fetch(self, code: str, fields: Optional[Iterable[str]] = None) -> ProductEntity:
         try:
-            product = self._product_repo.get_product_by_code(code)
+            product = self._product_repo.get_product_by_code(code, fields=fields)
         except Exception:
             raise NotFoundException(f"해당 코드({code})의 상품이 없거나 판매 불가 상태입니다.")
         return product
@@ -60,12 +92,8 @@ class GetProductDetailUseCase:
         product_entity: ProductEntity,
         user,
         base_price: Decimal,
+        raw_list: List[CouponEntity],
     ) -> List[CouponEntity]:
-        raw_list = self._coupon_service.get_applicable_coupons(
-            product_code=product_entity.code,
-            user=user,
-        ) or []
-
         filtered: List[CouponEntity] = []
         for coupon in raw_list:
             if base_price < coupon.minimum_purchase_amount:
@@ -0,0 +1,26 @@
+from typing import (
+    Dict,
+    Optional,
+    Tuple,
+)
+
+from apps.product.domain.repository import ProductRepository
+from apps.product.domain.value_objects import ProductFilter
+
+
+class GetProductFacetsUseCase:
+
+    def __init__(
+        self,
+        product_repo: ProductRepository,
+    ) -> None:
+        self.product_repo = product_repo
+
+    def execute(
+        self,
+        product_filter: Optional[ProductFilter] = None,
+    ) -> Tuple[Dict[str, Dict[str, int]], int]:
+        """
+        상품 목록 필터 기준 분야/타입별 상품 수 (사이드바 패싯)
+        """
+        return self.product_repo.count_facets(product_filter=product_filter)
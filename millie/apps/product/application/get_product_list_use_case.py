@@ -1,7 +1,13 @@
-from typing import List
+from typing import Iterable, List, Optional
 from uuid import UUID
+from apps.pricing.application.services.lowest_price_service import LowestPriceService
 from apps.product.domain.repository import ProductRepository
 from apps.product.domain.entity import Product as ProductEntity
+from apps.product.domain.value_objects import (
+    ProductFilter,
+    ProductSort,
+)
+from apps.utils.const import LOWEST_PRICE
 
 
 class GetProductListUseCase:
@@ -9,13 +15,33 @@ class GetProductListUseCase:
     def __init__(
         self,
         product_repo: ProductRepository,
+        lowest_price_service: Optional[LowestPriceService] = None,
     ) -> None:
         self.product_repo = product_repo
+        self.lowest_price_service = lowest_price_service
 
-    def execute(self) -> List[ProductEntity]:
-        return self.product_repo.get_products()
+    def execute(
+        self,
+        fields: Optional[Iterable[str]] = None,
+        product_filter: Optional[ProductFilter] = None,
+        sort: Optional[ProductSort] = None,
+        page: Optional[int] = None,
+        size: int = 20,
+    ) -> List[ProductEntity]:
+        # page를 지정하지 않으면 기존처럼 전체 목록 반환
+        offset, limit = ((page - 1) * size, size) if page is not None else (0, None)
+        products = self.product_repo.get_products(
+            fields=fields,
+            product_filter=product_filter,
+            sort=sort,
+            offset=offset,
+            limit=limit,
+        )
+        # 최저가 배지는 요청 필드에 있을 때만 (목록 전체에 대해 조회 1회)
+        if self.lowest_price_service and (fields is None or LOWEST_PRICE in fields):
+            products = self.lowest_price_service.with_lowest_prices(products)
+        return products
 
     def validate(self) -> None:
         # 로직이 복잡해지면 그에 따라 구현
         pass
-
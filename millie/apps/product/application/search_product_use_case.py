@@ -0,0 +1,30 @@
+from typing import List, Optional, Tuple
+
+from apps.pricing.application.services.lowest_price_service import LowestPriceService
+from apps.product.domain.entity import Product as ProductEntity
+from apps.product.domain.repository import ProductRepository
+
+
+class SearchProductUseCase:
+
+    def __init__(
+        self,
+        product_repo: ProductRepository,
+        lowest_price_service: Optional[LowestPriceService] = None,
+    ) -> None:
+        self.product_repo = product_repo
+        self.lowest_price_service = lowest_price_service
+
+    def execute(
+        self,
+        query: str,
+        page: int = 1,
+        size: int = 20,
+    ) -> Tuple[List[ProductEntity], int]:
+        """
+        도서명/설명/저자/출판사 전문검색 (점수순, 페이지 단위)
+        """
+        products, total = self.product_repo.search_products(query=query, page=page, size=size)
+        if self.lowest_price_service:
+            products = self.lowest_price_service.with_lowest_prices(products)
+        return products, total
@@ -0,0 +1,23 @@
+from typing import List
+
+from apps.product.domain.entity import Suggestion
+from apps.product.domain.repository import ProductRepository
+
+
+class SuggestProductUseCase:
+
+    def __init__(
+        self,
+        product_repo: ProductRepository,
+    ) -> None:
+        self.product_repo = product_repo
+
+    def execute(
+        self,
+        prefix: str,
+        limit: int = 10,
+    ) -> List[Suggestion]:
+        """
+        입력 중인 검색어로 판매중 도서의 도서명/저자명 자동완성 후보 조회
+        """
+        return self.product_repo.suggest_products(prefix=prefix, limit=limit)
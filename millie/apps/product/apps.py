@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class ProductConfig(AppConfig):
+    name = "apps.product"
+    label = "product"
+
+    def ready(self):
+        # 도서 정보 변경 시 검색 색인 등 파생 데이터를 갱신하는 signal 등록
+        from apps.product.infrastructure.persistence import signals  # noqa: F401
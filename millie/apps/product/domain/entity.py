@@ -1,12 +1,15 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
+from decimal import Decimal
 from typing import Optional
 
 from apps.product.domain.value_objects import (
     Category,
     Feature,
+    ProductAttributes,
     ProductStatus,
+    SuggestionType,
     VisibilityStatus,
 )
 
@@ -23,11 +26,21 @@ class Product:  # aggregate root
     feature: Optional[BookFeature] = None
     publish_info: Optional[PublishInfo] = None
     author: Optional[Author] = None
+    lowest_price: Optional[Decimal] = None      # 최저 구매 가능가 (목록 배지, 가격 배치 결과를 조회 시점에 붙임)
 
     def __post_init__(self):
         if self.status == ProductStatus.ACTIVE and not self.detail:
             raise ValueError
 
+    @property
+    def attributes(self) -> ProductAttributes:
+        # 로딩한 연관 정보 기준 (feature는 엔티티에 담긴 첫 번째 것만, ProductMapper와 동일)
+        return ProductAttributes(
+            category=self.detail.category if self.detail else None,
+            publisher=self.publish_info.publisher if self.publish_info else None,
+            features=(self.feature.feature,) if self.feature else (),
+        )
+
 
 @dataclass(frozen=True)
 class BookDetail:
@@ -60,4 +73,11 @@ class Author:
     author: str
     status: VisibilityStatus
     created_at: datetime
-    updated_at: datetime
\ No newline at end of file
+    updated_at: datetime
+
+
+@dataclass(frozen=True)
+class Suggestion:   # 자동완성 후보 (도서명 또는 저자명)
+    code: str
+    text: str
+    type: SuggestionType
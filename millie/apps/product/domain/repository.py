@@ -2,21 +2,105 @@ from abc import (
     ABC,
     abstractmethod,
 )
+from decimal import Decimal
 from typing import (
+    Dict,
+    Iterable,
     List,
     Optional,
+    Tuple,
+)
+from apps.product.domain.entity import (
+    Product,
+    Suggestion,
+)
+from apps.product.domain.value_objects import (
+    ProductAttributes,
+    ProductFilter,
+    ProductSort,
 )
-from apps.product.domain.entity import Product
 
 
 class ProductRepository(ABC):
     @abstractmethod
-    def get_products(self) -> List[Product]:
+    def get_products(
+        self,
+        fields: Optional[Iterable[str]] = None,
+        product_filter: Optional[ProductFilter] = None,
+        sort: Optional[ProductSort] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[Product]:
         pass
 
     @abstractmethod
     def get_product_by_code(
         self,
-        code: str
+        code: str,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Optional[Product]:
+        pass
+
+    @abstractmethod
+    def get_products_by_codes(
+        self,
+        codes: List[str],
+    ) -> List[Product]:
+        pass
+
+    @abstractmethod
+    def search_products(
+        self,
+        query: str,
+        page: int,
+        size: int,
+    ) -> Tuple[List[Product], int]:
+        pass
+
+    @abstractmethod
+    def suggest_products(
+        self,
+        prefix: str,
+        limit: int,
+    ) -> List[Suggestion]:
+        pass
+
+    @abstractmethod
+    def count_facets(
+        self,
+        product_filter: Optional[ProductFilter] = None,
+    ) -> Tuple[Dict[str, Dict[str, int]], int]:
+        pass
+
+    @abstractmethod
+    def list_active_prices(self, codes: Optional[List[str]] = None) -> List[Tuple[str, Decimal]]:
+        pass
+
+    @abstractmethod
+    def list_active_attributes(self, codes: Optional[List[str]] = None) -> Dict[str, ProductAttributes]:
+        pass
+
+
+class AsyncProductRepository(ABC):
+    """
+    비동기(ASGI) 뷰용 상품 조회
+    """
+
+    @abstractmethod
+    async def get_products(
+        self,
+        fields: Optional[Iterable[str]] = None,
+        product_filter: Optional[ProductFilter] = None,
+        sort: Optional[ProductSort] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[Product]:
+        pass
+
+    @abstractmethod
+    async def get_product_by_code(
+        self,
+        code: str,
+        fields: Optional[Iterable[str]] = None,
     ) -> Optional[Product]:
         pass
@@ -1,4 +1,10 @@
+from dataclasses import dataclass
+from decimal import Decimal
 from enum import Enum
+from typing import (
+    Optional,
+    Tuple,
+)
 
 
 class ChoiceEnum(Enum):
@@ -35,4 +41,34 @@ class ProductStatus(ChoiceEnum):
 
 class VisibilityStatus(ChoiceEnum):
     VISIBLE = "VISIBLE"
-    HIDDEN = "HIDDEN"
\ No newline at end of file
+    HIDDEN = "HIDDEN"
+
+
+class SuggestionType(ChoiceEnum):
+    NAME = "NAME"
+    AUTHOR = "AUTHOR"
+
+
+class ProductSort(ChoiceEnum):
+    PRICE_ASC = "price"
+    PRICE_DESC = "-price"
+    PUBLISHED_DATE_ASC = "published_date"
+    PUBLISHED_DATE_DESC = "-published_date"
+    CREATED_AT_ASC = "created_at"
+    CREATED_AT_DESC = "-created_at"
+
+
+@dataclass(frozen=True)
+class ProductFilter:    # 상품 목록 필터 조건 (None이면 조건 없음)
+    category: Optional[Category] = None
+    feature: Optional[Feature] = None
+    publisher: Optional[str] = None
+    min_price: Optional[Decimal] = None
+    max_price: Optional[Decimal] = None
+
+
+@dataclass(frozen=True)
+class ProductAttributes:    # 상품 분류 속성 (할인 대상 판정 등에 사용, 값이 없으면 None/빈 값)
+    category: Optional[str] = None
+    publisher: Optional[str] = None
+    features: Tuple[str, ...] = ()
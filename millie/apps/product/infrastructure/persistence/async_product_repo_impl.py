@@ -0,0 +1,50 @@
+from typing import (
+    Iterable,
+    List,
+    Optional,
+)
+
+from apps.product.domain.entity import Product as ProductEntity
+from apps.product.domain.repository import (
+    AsyncProductRepository,
+    ProductRepository,
+)
+from apps.product.domain.value_objects import (
+    ProductFilter,
+    ProductSort,
+)
+from apps.utils.concurrency import db_sync_to_async
+
+
+class AsyncProductRepoImpl(AsyncProductRepository):
+    """
+    ProductRepoImpl의 조회를 await 가능하게 노출
+    Django 4.2의 async ORM(aget/afirst 등)도 내부적으로 sync 쿼리를 스레드에서 실행하므로,
+    캐시/조회 테이블 경로를 그대로 쓰도록 sync repository를 같은 방식으로 감쌈
+    """
+
+    def __init__(self, repo: ProductRepository):
+        self._repo = repo
+
+    async def get_products(
+        self,
+        fields: Optional[Iterable[str]] = None,
+        product_filter: Optional[ProductFilter] = None,
+        sort: Optional[ProductSort] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[ProductEntity]:
+        return await db_sync_to_async(self._repo.get_products)(
+            fields=fields,
+            product_filter=product_filter,
+            sort=sort,
+            offset=offset,
+            limit=limit,
+        )
+
+    async def get_product_by_code(
+        self,
+        code: str,
+        fields: Optional[Iterable[str]] = None,
+    ) -> ProductEntity:
+        return await db_sync_to_async(self._repo.get_product_by_code)(code, fields=fields)
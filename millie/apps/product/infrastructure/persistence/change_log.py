@@ -0,0 +1,129 @@
+import threading
+import time
+from datetime import timedelta
+from typing import (
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from django.conf import settings
+from django.db import router
+from django.db.models import Max
+from django.utils import timezone
+
+from apps.product.infrastructure.persistence.models import ProductChange as ProductChangeModel
+
+
+# 한 번에 따라잡을 최대 변경 수 (이보다 많이 밀렸으면 전체 재적재가 더 저렴)
+MAX_CATCH_UP = 1000
+
+
+class ProductChangeLog:
+    """
+    product_changes(상품 변경 로그) 기록/조회
+    - 기록: commit 이후 바뀐 도서 코드를 한 행씩 저장하고 마지막 순번(id) 반환
+    - 조회: 지정한 순번 이후의 변경을 순번 순서대로 반환
+    - 보관 기간(PRODUCT_CHANGE_LOG_RETENTION)이 지난 행은 기록할 때 정리하되, 가장 최근 행은 남겨 순번이 이어지는지 확인할 수 있게 함
+    - 조회는 바뀐 도서를 다시 읽을 DB(using)와 같은 DB에서 해야 함
+      (replica는 commit 순서대로 반영되므로, 같은 DB에서 보이는 변경 로그 행의 도서 변경은 그 DB에서도 보임)
+    """
+
+    @staticmethod
+    def db_for_read() -> str:
+        # 변경 로그와 도서를 함께 읽을 DB (라우터가 고른 replica 또는 primary)
+        return router.db_for_read(ProductChangeModel)
+
+    def __init__(self, retention: Optional[float] = None):
+        self._retention = settings.PRODUCT_CHANGE_LOG_RETENTION if retention is None else retention
+
+    def record(self, codes: Iterable[str]) -> int:
+        # 순번이 빠지지 않도록 한 행씩 저장 (bulk insert는 DB에 따라 id를 돌려주지 않음)
+        sequence = 0
+        for code in dict.fromkeys(codes):
+            sequence = ProductChangeModel.objects.create(book_code=code).id
+        ProductChangeModel.objects.filter(
+            id__lt=sequence, created_at__lt=timezone.now() - timedelta(seconds=self._retention),
+        ).delete()
+        return sequence
+
+    def latest(self, using: Optional[str] = None) -> int:
+        return ProductChangeModel.objects.using(using).aggregate(sequence=Max("id"))["sequence"] or 0
+
+    def since(
+        self,
+        sequence: int,
+        using: Optional[str] = None,
+        limit: int = MAX_CATCH_UP,
+    ) -> Optional[List[Tuple[int, str]]]:
+        """
+        sequence 이후의 (순번, 도서 코드) 목록
+        순번이 이어지지 않으면(정리된 행, 아직 commit 전인 앞 순번) 또는 limit보다 많으면 None (호출측에서 전체 재적재)
+        """
+        changes = ProductChangeModel.objects.using(using).filter(id__gt=sequence).order_by("id")
+        rows = list(changes.values_list("id", "book_code")[:limit + 1])
+        if len(rows) > limit:
+            return None
+        expected = sequence + 1
+        for row_sequence, _ in rows:
+            if row_sequence != expected:
+                return None
+            expected += 1
+        return rows
+
+
+class ChangeFeed:
+    """
+    프로세스 메모리 색인 하나가 변경 로그를 따라가는 위치 (색인에 반영된 마지막 순번)
+    - poll_interval마다 한 번만 변경 로그를 조회
+    - 이 워커의 signal로 반영한 변경은 바로 다음 순번이면 위치만 옮김 (다시 읽거나 전체 재적재하지 않음)
+    """
+
+    def __init__(self, change_log: Optional[ProductChangeLog] = None, poll_interval: Optional[float] = None):
+        self._change_log = change_log or ProductChangeLog()
+        self._poll_interval = settings.CACHE_VERSION_POLL_INTERVAL if poll_interval is None else poll_interval
+        self._sequence = 0
+        self._checked_at = float("-inf")
+        self._lock = threading.Lock()
+
+    @property
+    def sequence(self) -> int:
+        return self._sequence
+
+    def db_for_read(self) -> str:
+        return self._change_log.db_for_read()
+
+    def reset(self, using: Optional[str] = None) -> None:
+        # 전체 적재 직전에 같은 DB에서 호출 (적재 중 기록된 변경은 다음 조회 때 다시 반영되므로 누락 없음)
+        sequence = self._change_log.latest(using)
+        with self._lock:
+            self._sequence = sequence
+            self._checked_at = time.monotonic()
+
+    def applied(self, sequence: int) -> None:
+        with self._lock:
+            if sequence == self._sequence + 1:
+                self._sequence = sequence
+
+    def poll(self, using: Optional[str] = None) -> Optional[List[str]]:
+        """
+        마지막 위치 이후 바뀐 도서 코드 (조회 주기 전이면 빈 목록), 따라잡을 수 없으면 None
+        반환된 도서는 같은 DB(using)에서 다시 읽어야 함
+        """
+        now = time.monotonic()
+        with self._lock:
+            if now - self._checked_at < self._poll_interval:
+                return []
+            self._checked_at = now
+            sequence = self._sequence
+
+        rows = self._change_log.since(sequence, using)
+        if rows is None:
+            return None
+        with self._lock:
+            if self._sequence != sequence:
+                return []       # 그 사이 다른 스레드가 위치를 옮김 (다음 조회에서 이어서 반영)
+            if rows:
+                self._sequence = rows[-1][0]
+        return list(dict.fromkeys(code for _, code in rows))
@@ -0,0 +1,222 @@
+import threading
+from bisect import (
+    bisect_left,
+    bisect_right,
+    insort,
+)
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import (
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from apps.product.domain.value_objects import (
+    Category,
+    Feature,
+    ProductFilter,
+    ProductStatus,
+)
+from apps.product.infrastructure.persistence.change_log import ChangeFeed
+from apps.product.infrastructure.persistence.models import (
+    Book as BookModel,
+    BookFeature as BookFeatureModel,
+)
+from apps.utils import const
+
+
+@dataclass(frozen=True)
+class FacetDocument:
+    code: str
+    price: Decimal
+    category: Optional[str]
+    publisher: Optional[str]
+    features: FrozenSet[str]
+
+
+class BookFacetIndex:
+    """
+    판매중 도서의 분야/타입/출판사/가격 역색인 (프로세스 메모리)
+    - 패싯 건수는 값별 도서 코드 집합의 교집합 크기로 계산하므로 요청마다 books를 GROUP BY 하지 않음
+    - 최초 조회 시 적재, 이후에는 signal로 변경된 도서만 갱신
+    - 다른 워커의 변경은 상품 변경 로그(product_changes)에서 바뀐 도서만 읽어 갱신 (로그를 따라잡을 수 없을 때만 전체 재적재)
+    """
+
+    def __init__(self, feed: Optional[ChangeFeed] = None):
+        self._documents: Dict[str, FacetDocument] = {}
+        self._by_category: Dict[str, Set[str]] = {}
+        self._by_feature: Dict[str, Set[str]] = {}
+        self._by_publisher: Dict[str, Set[str]] = {}
+        self._prices: List[Tuple[Decimal, str]] = []        # 가격 범위 조회용 정렬 배열
+        self._loaded = False
+        self._lock = threading.RLock()
+        self._feed = feed or ChangeFeed()
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # 조회
+    # ──────────────────────────────────────────────────────────────────────────
+    def sync(self) -> int:
+        """
+        다른 워커의 변경을 반영한 뒤 색인에 반영된 변경 로그 순번 반환 (건수 캐시 키용)
+        """
+        self._ensure_loaded()
+        return self._feed.sequence
+
+    def count(self, product_filter: Optional[ProductFilter] = None) -> Tuple[Dict[str, Dict[str, int]], int]:
+        """
+        현재 필터 기준 분야/타입별 도서 수와 전체 건수 반환
+        각 패싯은 자기 자신의 조건을 뺀 나머지 조건으로 센다 (분야를 하나 골라도 다른 분야 건수가 보이도록)
+        """
+        product_filter = product_filter or ProductFilter()
+        self._ensure_loaded()
+
+        with self._lock:
+            category = product_filter.category.value if product_filter.category else None
+            feature = product_filter.feature.value if product_filter.feature else None
+
+            others = self._match_others(product_filter)
+            with_feature = self._intersect(others, self._by_feature, feature)
+            with_category = self._intersect(others, self._by_category, category)
+
+            facets = {
+                const.CATEGORY: {
+                    choice.value: len(self._intersect(with_feature, self._by_category, choice.value))
+                    for choice in Category
+                },
+                const.FEATURE: {
+                    choice.value: len(self._intersect(with_category, self._by_feature, choice.value))
+                    for choice in Feature
+                },
+            }
+            total = len(self._intersect(with_feature, self._by_category, category))
+        return facets, total
+
+    def _match_others(self, product_filter: ProductFilter) -> Set[str]:
+        # 분야/타입을 제외한 조건(출판사, 가격 범위)을 만족하는 도서
+        codes = self._intersect(set(self._documents), self._by_publisher, product_filter.publisher)
+
+        if product_filter.min_price is not None or product_filter.max_price is not None:
+            start = 0 if product_filter.min_price is None else bisect_left(self._prices, (product_filter.min_price,))
+            end = len(self._prices) if product_filter.max_price is None else bisect_right(
+                self._prices, (product_filter.max_price, chr(0x10FFFF)),
+            )
+            codes &= {code for _, code in self._prices[start:end]}
+        return codes
+
+    @staticmethod
+    def _intersect(codes: Set[str], postings: Dict[str, Set[str]], value: Optional[str]) -> Set[str]:
+        if value is None:
+            return codes
+        return codes & postings.get(value, set())
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # 적재 / 갱신
+    # ──────────────────────────────────────────────────────────────────────────
+    def rebuild(self) -> int:
+        using = self._feed.db_for_read()
+        self._feed.reset(using)
+        documents = self._load_documents(using=using)
+        with self._lock:
+            self._reset()
+            for document in documents:
+                self._add(document)
+            self._loaded = True
+        return len(documents)
+
+    def refresh(self, codes: Iterable[str], sequence: Optional[int] = None, using: Optional[str] = None) -> None:
+        """
+        지정한 도서만 교체 (판매중이 아니거나 삭제된 도서는 제거)
+        sequence: 이 변경을 기록한 변경 로그 순번 (이 워커에서 반영했으므로 다른 워커의 변경으로 다시 읽지 않음)
+        아직 적재 전이면 최초 조회 시 최신 상태로 적재되므로 무시
+        """
+        if not self._loaded:
+            return
+
+        codes = list(codes)
+        documents = self._load_documents(codes, using)
+        with self._lock:
+            for code in codes:
+                self._remove(code)
+            for document in documents:
+                self._add(document)
+            if sequence is not None:
+                self._feed.applied(sequence)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._reset()
+            self._loaded = False
+
+    def _ensure_loaded(self) -> None:
+        # signal은 변경이 일어난 워커에서만 실행되므로, 다른 워커의 변경은 변경 로그에서 바뀐 도서를 읽어 반영
+        with self._lock:
+            if not self._loaded:
+                self.rebuild()
+                return
+            using = self._feed.db_for_read()
+            codes = self._feed.poll(using)
+            if codes is None:
+                self.rebuild()
+            elif codes:
+                self.refresh(codes, using=using)
+
+    def _reset(self) -> None:
+        self._documents = {}
+        self._by_category = {}
+        self._by_feature = {}
+        self._by_publisher = {}
+        self._prices = []
+
+    def _add(self, document: FacetDocument) -> None:
+        self._documents[document.code] = document
+        for postings, value in self._postings(document):
+            postings.setdefault(value, set()).add(document.code)
+        insort(self._prices, (document.price, document.code))
+
+    def _remove(self, code: str) -> None:
+        document = self._documents.pop(code, None)
+        if document is None:
+            return
+        for postings, value in self._postings(document):
+            postings[value].discard(code)
+        del self._prices[bisect_left(self._prices, (document.price, code))]
+
+    def _postings(self, document: FacetDocument):
+        if document.category:
+            yield self._by_category, document.category
+        if document.publisher:
+            yield self._by_publisher, document.publisher
+        for feature in document.features:
+            yield self._by_feature, feature
+
+    @staticmethod
+    def _load_documents(codes: Optional[List[str]] = None, using: Optional[str] = None) -> List[FacetDocument]:
+        books = BookModel.objects.using(using).filter(status=ProductStatus.ACTIVE.value)
+        if codes is not None:
+            books = books.filter(code__in=codes)
+        rows = list(books.values_list("code", "price", "detail__category", "publish_info__publisher"))
+
+        features: Dict[str, Set[str]] = {}
+        feature_rows = BookFeatureModel.objects.using(using).filter(book_code__in=books.values("code"))
+        for book_code, feature in feature_rows.values_list("book_code_id", "feature"):
+            features.setdefault(book_code, set()).add(feature)
+
+        return [
+            FacetDocument(
+                code=code,
+                price=price,
+                category=category,
+                publisher=publisher,
+                features=frozenset(features.get(code, ())),
+            )
+            for code, price, category, publisher in rows
+        ]
+
+
+# 프로세스 단위로 공유하는 색인 인스턴스
+book_facet_index = BookFacetIndex()
@@ -1,4 +1,26 @@
+from dataclasses import fields as dataclass_fields
+from datetime import (
+    date,
+    datetime,
+)
+from decimal import Decimal
+from typing import (
+    Optional,
+    Set,
+)
+
+from django.utils.dateparse import (
+    parse_date,
+    parse_datetime,
+)
+
 from apps.product.domain.entity import Product as ProductEntity
+from apps.product.domain.entity import (
+    Author as AuthorEntity,
+    BookDetail as BookDetailEntity,
+    BookFeature as BookFeatureEntity,
+    PublishInfo as PublishInfoEntity,
+)
 from apps.product.infrastructure.persistence.models import Book as BookModel
 from apps.product.infrastructure.persistence.models import BookDetail as BookDetailModel
 from apps.product.infrastructure.persistence.models import BookFeature as BookFeatureModel
@@ -6,20 +28,100 @@ from apps.product.infrastructure.persistence.models import PublishInfo as Publis
 from apps.product.infrastructure.persistence.models import Author as AuthorModel
 
 
+ALL_RELATIONS = frozenset({"detail", "feature", "publish_info", "author"})
+
+# 비정규화 payload: 연관 정보 → 복원할 도메인 객체
+PAYLOAD_RELATIONS = {
+    "detail": BookDetailEntity,
+    "feature": BookFeatureEntity,
+    "publish_info": PublishInfoEntity,
+    "author": AuthorEntity,
+}
+PAYLOAD_BOOK_FIELDS = ("code", "name", "price", "status", "created_at", "updated_at")
+
+
 class ProductMapper:
 
     @staticmethod
-    def to_domain(book_model: BookModel) -> ProductEntity:
+    def to_domain(
+        book_model: BookModel,
+        relations: Optional[Set[str]] = None,
+    ) -> ProductEntity:
+        # relations: 조회 시 로딩한 연관 테이블. 로딩하지 않은 연관/지연(deferred) 컬럼은 건드리지 않아야 추가 쿼리가 없음
+        loaded = ALL_RELATIONS if relations is None else relations
+        deferred = book_model.get_deferred_fields()
+
+        def column(name: str):
+            return None if name in deferred else getattr(book_model, name)
+
+        def related(name: str):
+            return getattr(book_model, name) if name in loaded and hasattr(book_model, name) else None
+
         # TODO! feature의 경우 설계는 여러개일 수 있도록 해놨으나 핵심구현 부분이 아니라서 첫번째것만 가져옴
         return ProductEntity(
             code=book_model.code,
-            name=book_model.name,
-            price=book_model.price,
-            status=book_model.status,
-            detail=book_model.detail if hasattr(book_model, "detail") else None,
-            feature=book_model.feature.first() if hasattr(book_model, "feature") else None,
-            publish_info=book_model.publish_info if hasattr(book_model, "publish_info") else None,
-            author=book_model.author if hasattr(book_model, "author") else None,
-            created_at=book_model.created_at,
-            updated_at=book_model.updated_at,
+            name=column("name"),
+            price=column("price"),
+            status=column("status"),
+            detail=related("detail"),
+            feature=ProductMapper._first_feature(book_model) if "feature" in loaded else None,
+            publish_info=related("publish_info"),
+            author=related("author"),
+            created_at=column("created_at"),
+            updated_at=column("updated_at"),
+        )
+
+    @staticmethod
+    def _first_feature(book_model: BookModel):
+        # prefetch_related("feature")로 미리 읽어둔 경우 .first()는 정렬 쿼리를 다시 날리므로 캐시된 목록에서 꺼냄
+        if "feature" in getattr(book_model, "_prefetched_objects_cache", {}):
+            return next(iter(book_model.feature.all()), None)
+        return book_model.feature.first()
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # 비정규화 조회 테이블(product_read_models) payload 변환
+    # ──────────────────────────────────────────────────────────────────────────
+    @staticmethod
+    def to_payload(book_model: BookModel) -> dict:
+        # 전체 연관 정보를 로딩한 Book 기준으로 상세 응답에 필요한 값을 JSON 직렬화 가능한 형태로 저장
+        product = ProductMapper.to_domain(book_model)
+        payload = {name: _encode(getattr(product, name)) for name in PAYLOAD_BOOK_FIELDS}
+        for relation, entity_cls in PAYLOAD_RELATIONS.items():
+            related = getattr(product, relation)
+            payload[relation] = None if related is None else {
+                field.name: _encode(getattr(related, field.name)) for field in dataclass_fields(entity_cls)
+            }
+        return payload
+
+    @staticmethod
+    def from_payload(payload: dict) -> ProductEntity:
+        relations = {
+            relation: None if payload.get(relation) is None else entity_cls(**{
+                name: _decode(name, value) for name, value in payload[relation].items()
+            })
+            for relation, entity_cls in PAYLOAD_RELATIONS.items()
+        }
+        return ProductEntity(
+            **{name: _decode(name, payload[name]) for name in PAYLOAD_BOOK_FIELDS},
+            **relations,
         )
+
+
+def _encode(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _decode(name: str, value):
+    if value is None:
+        return None
+    if name in ("created_at", "updated_at"):
+        return parse_datetime(value)
+    if name == "published_date":
+        return parse_date(value)
+    if name == "price":
+        return Decimal(value)
+    return value
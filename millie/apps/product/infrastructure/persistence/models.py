@@ -19,6 +19,9 @@ class Book(models.Model):
     class Meta:
         db_table = "books"
         db_table_comment = "도서 테이블"
+        indexes = [
+            models.Index(fields=["status", "price"], name="idx_books_status_price"),
+        ]
 
 
 class BookDetail(models.Model):
@@ -32,6 +35,9 @@ class BookDetail(models.Model):
     class Meta:
         db_table = "book_details"
         db_table_comment = "도서 상세 테이블"
+        indexes = [
+            models.Index(fields=["category"], name="idx_book_details_category"),
+        ]
 
 
 class BookFeature(models.Model):
@@ -44,6 +50,9 @@ class BookFeature(models.Model):
     class Meta:
         db_table = "product_features"
         db_table_comment = "도서 타입 테이블"
+        indexes = [
+            models.Index(fields=["feature", "book_code"], name="idx_product_features_feature"),
+        ]
 
 
 class PublishInfo(models.Model):
@@ -68,4 +77,60 @@ class Author(models.Model):
 
     class Meta:
         db_table = "authors"
-        db_table_comment = "저자 테이블"
\ No newline at end of file
+        db_table_comment = "저자 테이블"
+
+
+class BookSearchTerm(models.Model):
+    """
+    도서 검색용 역색인 (term → 도서)
+    도서명/저자/출판사/설명을 토큰화한 term별 가중치를 저장하며, 도서 관련 정보 저장 시 signal로 갱신
+    """
+    book_code = models.ForeignKey(
+        Book, to_field="code", on_delete=models.CASCADE, db_comment="상품 코드", related_name="search_terms",
+    )
+    term = models.CharField(max_length=100, null=False, db_comment="검색 term")
+    weight = models.PositiveIntegerField(default=0, null=False, db_comment="필드 가중치 x 등장 횟수")
+
+    class Meta:
+        db_table = "book_search_terms"
+        db_table_comment = "도서 검색 역색인 테이블"
+        constraints = [
+            models.UniqueConstraint(fields=["term", "book_code"], name="uniq_book_search_term"),
+        ]
+
+
+class ProductReadModel(models.Model):
+    """
+    상품 조회용 비정규화 테이블 (도서 1권 = 1행)
+    상세 응답에 필요한 books/book_details/product_features/publishers/authors 정보를 payload(JSON) 하나에 담아
+    조인 없이 PK 조회로 읽음. 원본 테이블 저장/삭제 시 signal로 갱신
+    """
+    book_code = models.OneToOneField(
+        Book, to_field="code", primary_key=True, on_delete=models.CASCADE,
+        db_comment="상품 코드", related_name="read_model",
+    )
+    status = models.CharField(max_length=255, choices=ProductStatus.choices(), null=False, db_comment="판매 상태")
+    payload = models.JSONField(null=False, db_comment="상세 응답용 상품 정보")
+    updated_at = models.DateTimeField(auto_now=True, db_comment="수정 일자")
+
+    class Meta:
+        db_table = "product_read_models"
+        db_table_comment = "상품 조회용 비정규화 테이블"
+
+
+class ProductChange(models.Model):
+    """
+    상품 변경 로그 (도서 1권 변경 = 1행, id가 순번)
+    프로세스 메모리 색인(자동완성/패싯)이 다른 워커의 변경을 도서 단위로 따라잡는 데 사용
+    삭제된 도서도 기록해야 하므로 books를 참조하지 않음
+    """
+    id = models.BigAutoField(primary_key=True)
+    book_code = models.CharField(max_length=255, null=False, db_comment="상품 코드")
+    created_at = models.DateTimeField(auto_now_add=True, null=False, db_comment="등록 일자")
+
+    class Meta:
+        db_table = "product_changes"
+        db_table_comment = "상품 변경 로그 테이블"
+        indexes = [
+            models.Index(fields=["created_at"], name="idx_product_changes_created"),
+        ]
@@ -0,0 +1,163 @@
+import threading
+from bisect import (
+    bisect_left,
+    insort,
+)
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from apps.product.domain.entity import Suggestion
+from apps.product.domain.value_objects import (
+    ProductStatus,
+    SuggestionType,
+)
+from apps.product.infrastructure.persistence.change_log import ChangeFeed
+from apps.product.infrastructure.persistence.models import Book as BookModel
+from apps.utils.text import (
+    normalize,
+    prefix_key,
+    to_jamo,
+)
+
+
+# (정규화 키, 단어 위치, 표시 문자열, 도서 코드, 후보 종류)
+# 단어 위치 0 = 전체 문자열의 시작, 1 = 중간 단어에서 시작하는 접미어
+Entry = Tuple[str, int, str, str, str]
+
+# 접두어 범위에서 최대 limit x SCAN_FACTOR 개만 훑은 뒤 순위를 매김 (짧은 접두어에서도 조회 비용 상한)
+SCAN_FACTOR = 5
+
+
+class BookPrefixIndex:
+    """
+    판매중 도서의 도서명/저자명 접두어 색인 (프로세스 메모리, 정렬 배열 + bisect)
+    - 한글은 자모 단위로 분해하여 입력 중인 글자(“파이ㅆ”)도 매칭
+    - 중간 단어로 시작하는 접미어도 등록하여 “아키텍처” → “파이썬 클린 아키텍처” 매칭
+    - 최초 조회 시 적재, 이후에는 signal로 변경된 도서만 갱신
+    - 다른 워커의 변경은 상품 변경 로그(product_changes)에서 바뀐 도서만 읽어 갱신 (로그를 따라잡을 수 없을 때만 전체 재적재)
+    """
+
+    def __init__(self, feed: Optional[ChangeFeed] = None):
+        self._entries: List[Entry] = []
+        self._entries_by_code: Dict[str, List[Entry]] = {}
+        self._loaded = False
+        self._lock = threading.RLock()
+        self._feed = feed or ChangeFeed()
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # 조회
+    # ──────────────────────────────────────────────────────────────────────────
+    def search(self, prefix: str, limit: int) -> List[Suggestion]:
+        key = prefix_key(prefix)
+        if not key:
+            return []
+
+        self._ensure_loaded()
+        with self._lock:
+            candidates = []
+            index = bisect_left(self._entries, (key,))
+            while index < len(self._entries) and len(candidates) < limit * SCAN_FACTOR:
+                entry = self._entries[index]
+                if not entry[0].startswith(key):
+                    break
+                candidates.append(entry)
+                index += 1
+
+        # 문자열 시작 일치 > 중간 단어 일치, 같은 조건이면 짧은 문자열 우선
+        candidates.sort(key=lambda entry: (entry[1], len(entry[2]), entry[2], entry[3]))
+
+        suggestions, seen = [], set()
+        for _, _, text, code, suggestion_type in candidates:
+            if (code, suggestion_type) in seen:
+                continue
+            seen.add((code, suggestion_type))
+            suggestions.append(Suggestion(code=code, text=text, type=SuggestionType(suggestion_type)))
+            if len(suggestions) == limit:
+                break
+        return suggestions
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # 적재 / 갱신
+    # ──────────────────────────────────────────────────────────────────────────
+    def rebuild(self) -> int:
+        using = self._feed.db_for_read()
+        self._feed.reset(using)
+        rows = self._load_rows(using=using)
+        entries_by_code = {code: self.build_entries(code, name, author) for code, name, author in rows}
+
+        with self._lock:
+            self._entries_by_code = entries_by_code
+            self._entries = sorted(entry for entries in entries_by_code.values() for entry in entries)
+            self._loaded = True
+        return len(entries_by_code)
+
+    def refresh(self, codes: Iterable[str], sequence: Optional[int] = None, using: Optional[str] = None) -> None:
+        """
+        지정한 도서의 색인만 교체 (판매중이 아니거나 삭제된 도서는 제거)
+        sequence: 이 변경을 기록한 변경 로그 순번 (이 워커에서 반영했으므로 다른 워커의 변경으로 다시 읽지 않음)
+        아직 적재 전이면 최초 조회 시 최신 상태로 적재되므로 무시
+        """
+        if not self._loaded:
+            return
+
+        codes = list(codes)
+        rows = self._load_rows(codes, using)
+        with self._lock:
+            for code in codes:
+                for entry in self._entries_by_code.pop(code, []):
+                    del self._entries[bisect_left(self._entries, entry)]
+            for code, name, author in rows:
+                entries = self.build_entries(code, name, author)
+                self._entries_by_code[code] = entries
+                for entry in entries:
+                    insort(self._entries, entry)
+            if sequence is not None:
+                self._feed.applied(sequence)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = []
+            self._entries_by_code = {}
+            self._loaded = False
+
+    def _ensure_loaded(self) -> None:
+        # signal은 변경이 일어난 워커에서만 실행되므로, 다른 워커의 변경은 변경 로그에서 바뀐 도서를 읽어 반영
+        with self._lock:
+            if not self._loaded:
+                self.rebuild()
+                return
+            using = self._feed.db_for_read()
+            codes = self._feed.poll(using)
+            if codes is None:
+                self.rebuild()
+            elif codes:
+                self.refresh(codes, using=using)
+
+    @staticmethod
+    def _load_rows(
+        codes: Optional[List[str]] = None,
+        using: Optional[str] = None,
+    ) -> List[Tuple[str, str, Optional[str]]]:
+        qs = BookModel.objects.using(using).filter(status=ProductStatus.ACTIVE.value)
+        if codes is not None:
+            qs = qs.filter(code__in=codes)
+        return list(qs.values_list("code", "name", "author__author"))
+
+    @staticmethod
+    def build_entries(code: str, name: str, author: Optional[str]) -> List[Entry]:
+        entries = set()
+        for suggestion_type, text in ((SuggestionType.NAME, name), (SuggestionType.AUTHOR, author)):
+            words = normalize(text).split()
+            for position in range(len(words)):
+                key = to_jamo(" ".join(words[position:]))
+                entries.add((key, min(position, 1), text, code, suggestion_type.value))
+        return sorted(entries)
+
+
+# 프로세스 단위로 공유하는 색인 인스턴스
+book_prefix_index = BookPrefixIndex()
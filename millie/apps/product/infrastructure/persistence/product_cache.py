@@ -0,0 +1,67 @@
+from dataclasses import asdict
+from typing import (
+    Iterable,
+    Optional,
+)
+
+from django.conf import settings
+
+from apps.product.domain.value_objects import (
+    ProductFilter,
+    ProductSort,
+)
+from apps.utils.cache import (
+    ReadThroughCache,
+    TwoTierCache,
+)
+
+
+# 상품 변경 시 버전이 올라가는 cache_versions namespace (TwoTierCache는 prefix를 namespace로 사용)
+STAMP_NAMESPACE = "product"
+
+
+class ProductCache(TwoTierCache):
+    """
+    매핑된 Product 엔티티 캐시
+    - 상세: 상품 코드별 키 (전체 필드 엔티티를 저장하고 sparse 요청도 같은 키에서 응답)
+    - 목록: 조회 조건별 키, 어떤 상품이든 바뀌면 "list" 버전을 교체하여 한 번에 무효화
+    """
+
+    def __init__(self):
+        super().__init__(alias=settings.PRODUCT_CACHE_ALIAS, prefix=STAMP_NAMESPACE)
+
+    def detail_key(self, code: str) -> str:
+        return self.key("detail", code)
+
+    def list_key(
+        self,
+        code: Optional[str],
+        name: Optional[str],
+        fields: Optional[Iterable[str]],
+        product_filter: Optional[ProductFilter],
+        sort: Optional[ProductSort],
+        offset: int,
+        limit: Optional[int],
+    ) -> str:
+        conditions = {
+            "code": code,
+            "name": name,
+            "fields": sorted(fields) if fields is not None else None,
+            "filter": asdict(product_filter) if product_filter else None,
+            "sort": sort.value if sort else None,
+            "offset": offset,
+            "limit": limit,
+        }
+        return self.key("list", self.version("list"), self.digest(conditions))
+
+    def facet_key(self, index_sequence: int, product_filter: Optional[ProductFilter]) -> str:
+        # 목록과 같은 "list" 버전 + 패싯 색인에 반영된 변경 로그 순번
+        # (변경을 아직 반영하지 못한 워커의 건수가 새 버전 키에 남지 않도록 색인 순번도 키에 포함)
+        conditions = {"filter": asdict(product_filter) if product_filter else None}
+        return self.key("facets", self.version("list"), index_sequence, self.digest(conditions))
+
+    def invalidate(self, codes: Iterable[str]) -> None:
+        # 상세 키 삭제 + 목록 버전 교체는 L2에만 반영하고, 다른 워커의 L1 무효화 신호(cache_versions 버전 증가)는 한 번만
+        ReadThroughCache._delete_many(self, [self.detail_key(code) for code in codes])
+        ReadThroughCache.bump_version(self, "list")
+        self.invalidated()
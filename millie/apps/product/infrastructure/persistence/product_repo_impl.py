@@ -1,33 +1,108 @@
+from decimal import Decimal
 from typing import (
+    Dict,
+    Iterable,
     List,
     Optional,
+    Set,
+    Tuple,
 )
 
-from apps.product.domain.entity import Product as ProductEntity
+from django.db.models import (
+    Exists,
+    OuterRef,
+    QuerySet,
+)
+
+from apps.product.domain.entity import (
+    Product as ProductEntity,
+    Suggestion,
+)
 from apps.product.domain.repository import ProductRepository
-from apps.product.domain.value_objects import ProductStatus
+from apps.product.domain.value_objects import (
+    ProductAttributes,
+    ProductFilter,
+    ProductSort,
+    ProductStatus,
+)
+from apps.product.infrastructure.persistence.facet_index import book_facet_index
 from apps.product.infrastructure.persistence.mapper import ProductMapper
-from apps.product.infrastructure.persistence.models import Book as BookModel
+from apps.product.infrastructure.persistence.models import (
+    Book as BookModel,
+    BookFeature as BookFeatureModel,
+)
+from apps.product.infrastructure.persistence.prefix_index import book_prefix_index
+from apps.product.infrastructure.persistence.product_cache import ProductCache
+from apps.product.infrastructure.persistence.read_model import ProductReadModelStore
+from apps.product.infrastructure.persistence.search_index import BookSearchIndex
 
 from apps.utils.exceptions import NotFoundException
 
 
+# 응답 필드 → 함께 로딩해야 하는 연관 테이블
+RELATIONS_BY_FIELD = {
+    "author": "author",
+    "publisher": "publish_info",
+    "published_date": "publish_info",
+    "publish_info": "publish_info",
+    "detail": "detail",
+    "feature": "feature",
+}
+SELECT_RELATED = ("detail", "author", "publish_info")
+PREFETCH_RELATED = ("feature",)
+
+# 응답 필드와 무관하게 항상 읽는 컬럼 (상태 필터, 가격 계산, feature prefetch 조인 키)
+REQUIRED_COLUMNS = ("code", "status", "price")
+OPTIONAL_COLUMNS = ("name", "created_at", "updated_at")
+
+# 정렬 기준 → ORDER BY (같은 값이면 code 순으로 고정하여 페이지 간 중복/누락 방지)
+ORDERING_BY_SORT = {
+    ProductSort.PRICE_ASC: ("price", "code"),
+    ProductSort.PRICE_DESC: ("-price", "code"),
+    ProductSort.PUBLISHED_DATE_ASC: ("publish_info__published_date", "code"),
+    ProductSort.PUBLISHED_DATE_DESC: ("-publish_info__published_date", "code"),
+    ProductSort.CREATED_AT_ASC: ("created_at", "code"),
+    ProductSort.CREATED_AT_DESC: ("-created_at", "code"),
+}
+
+
 class ProductRepoImpl(ProductRepository):
 
     def __init__(self):
         self.mapper = ProductMapper()
+        self.cache = ProductCache()
+        self.read_models = ProductReadModelStore()
+        self.search_index = BookSearchIndex()
+        self.prefix_index = book_prefix_index
+        self.facet_index = book_facet_index
 
     def get_products(
         self,
         code: Optional[str] = None,
         name: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None,
+        product_filter: Optional[ProductFilter] = None,
+        sort: Optional[ProductSort] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
     ) -> List[ProductEntity]:
-        qs = (
-            BookModel.objects.select_related(
-                "detail", "author", "publish_info"
-            ).prefetch_related("feature")
-            .all()
+        key = self.cache.list_key(code, name, fields, product_filter, sort, offset, limit)
+        return self.cache.get_or_load(
+            key,
+            lambda: self._load_products(code, name, fields, product_filter, sort, offset, limit),
         )
+
+    def _load_products(
+        self,
+        code: Optional[str],
+        name: Optional[str],
+        fields: Optional[Iterable[str]],
+        product_filter: Optional[ProductFilter],
+        sort: Optional[ProductSort],
+        offset: int,
+        limit: Optional[int],
+    ) -> List[ProductEntity]:
+        qs, relations = self._build_queryset(fields)
         if code:
             qs = qs.filter(code=code)
 
@@ -35,13 +110,182 @@ class ProductRepoImpl(ProductRepository):
             qs = qs.filter(name=name)
 
         qs = qs.filter(status=ProductStatus.ACTIVE.value)
+        qs = self.apply_filter(qs, product_filter)
+
+        # 정렬 미지정 시에도 code 순으로 고정 (순서가 없으면 페이지마다 행이 겹치거나 빠지고, 그 결과가 키별로 캐시됨)
+        qs = qs.order_by(*ORDERING_BY_SORT[sort]) if sort else qs.order_by("code")
+
+        if limit is not None:
+            qs = qs[offset:offset + limit]
+
+        return [self.mapper.to_domain(book, relations) for book in qs]
+
+    def get_products_by_codes(
+        self,
+        codes: List[str],
+    ) -> List[ProductEntity]:
+        # 캐시에 있는 상품은 그대로 쓰고, 없는 코드만 일괄 조회
+        if not codes:
+            return []
+
+        keys = {code: self.cache.detail_key(code) for code in codes}
+        products = self.cache.get_many_or_load(keys, self._load_products_by_codes)
+        return [products[code] for code in codes if code in products]
+
+    def _load_products_by_codes(
+        self,
+        codes: List[str],
+    ) -> Dict[str, ProductEntity]:
+        # 조회 테이블에서 PK IN 1회로 읽고, 아직 조회 테이블에 없는 코드만 원본 조인 조회(books 1회 + features 1회)
+        read = self.read_models.get_many(codes)
+        products = {code: product for code, product in read.items() if product is not None}
 
-        return [self.mapper.to_domain(book) for book in qs]
+        missing = [code for code in codes if code not in read]
+        if missing:
+            qs, relations = self._build_queryset()
+            qs = qs.filter(code__in=missing, status=ProductStatus.ACTIVE.value)
+            products.update((book.code, self.mapper.to_domain(book, relations)) for book in qs)
+        return products
 
+    def get_product_by_code(
+        self,
+        code: str,
+        fields: Optional[Iterable[str]] = None,
+    ) -> ProductEntity:
+        # 캐시에는 전체 필드 엔티티를 저장하고 sparse 요청도 같은 키에서 응답 (응답 필드는 serializer에서 제외)
+        # 캐시가 비활성화된 경우에만 요청 필드 기준으로 조회
+        return self.cache.get_or_load(
+            self.cache.detail_key(code),
+            lambda: self._load_product(code, fields if self.cache.disabled else None),
+        )
+
+    def _load_product(
+        self,
+        code: str,
+        fields: Optional[Iterable[str]] = None,
+    ) -> ProductEntity:
+        # 조회 테이블 PK 조회 1회로 끝내고 (응답 필드는 serializer에서 제외), 없으면 원본 조인 조회
+        product = self.read_models.get(code)
+        if product is not None:
+            return product
 
-    def get_product_by_code(self, code: str) -> ProductEntity:
+        qs, relations = self._build_queryset(fields)
         try:
-            book = BookModel.objects.get(code=code, status=ProductStatus.ACTIVE.value)
+            book = qs.get(code=code, status=ProductStatus.ACTIVE.value)
         except BookModel.DoesNotExist:
             raise NotFoundException(f"해당 코드({code})의 상품이 없거나 판매 불가 상태입니다.")
-        return self.mapper.to_domain(book)
\ No newline at end of file
+        return self.mapper.to_domain(book, relations)
+
+    def search_products(
+        self,
+        query: str,
+        page: int,
+        size: int,
+    ) -> Tuple[List[ProductEntity], int]:
+        # 역색인에서 현재 페이지의 코드만 점수순으로 가져온 뒤, 상품은 일괄 조회하여 순서 복원
+        codes, total = self.search_index.search(query, offset=(page - 1) * size, limit=size)
+        products_by_code = {product.code: product for product in self.get_products_by_codes(codes)}
+        return [products_by_code[code] for code in codes if code in products_by_code], total
+
+    def suggest_products(
+        self,
+        prefix: str,
+        limit: int,
+    ) -> List[Suggestion]:
+        # DB 조회 없이 메모리 접두어 색인에서 바로 반환
+        return self.prefix_index.search(prefix, limit)
+
+    def count_facets(
+        self,
+        product_filter: Optional[ProductFilter] = None,
+    ) -> Tuple[Dict[str, Dict[str, int]], int]:
+        # books를 GROUP BY 하지 않고 메모리 패싯 색인의 집합 교집합으로 계산, 필터별 결과는 상품 캐시에 공유
+        key = self.cache.facet_key(self.facet_index.sync(), product_filter)
+        return self.cache.get_or_load(key, lambda: self.facet_index.count(product_filter))
+
+    def list_active_prices(self, codes: Optional[List[str]] = None) -> List[Tuple[str, Decimal]]:
+        # 카탈로그 전체 대상 계산(가격 시뮬레이션 등)용, 가격 계산에 필요한 두 컬럼만 코드 순으로 (codes 지정 시 해당 상품만)
+        qs = BookModel.objects.filter(status=ProductStatus.ACTIVE.value)
+        if codes is not None:
+            qs = qs.filter(code__in=codes)
+        return list(qs.order_by("code").values_list("code", "price"))
+
+    def list_active_attributes(self, codes: Optional[List[str]] = None) -> Dict[str, ProductAttributes]:
+        # 카탈로그 전체 대상 계산용 분류 속성 (books 1회 + features 1회)
+        # feature는 상품 엔티티와 같이 도서별 첫 번째 것만 (ProductMapper._first_feature)
+        qs = BookModel.objects.filter(status=ProductStatus.ACTIVE.value)
+        if codes is not None:
+            qs = qs.filter(code__in=codes)
+
+        features: Dict[str, str] = {}
+        feature_rows = BookFeatureModel.objects.filter(book_code__in=qs.values("code")).order_by("pk")
+        for book_code, feature in feature_rows.values_list("book_code_id", "feature"):
+            features.setdefault(book_code, feature)
+
+        return {
+            code: ProductAttributes(
+                category=category,
+                publisher=publisher,
+                features=(features[code],) if code in features else (),
+            )
+            for code, category, publisher in qs.values_list("code", "detail__category", "publish_info__publisher")
+        }
+
+    @staticmethod
+    def apply_filter(
+        qs: QuerySet,
+        product_filter: Optional[ProductFilter],
+    ) -> QuerySet:
+        """
+        books(status, price), book_details(category), product_features(feature, book_code) 인덱스를 타도록 조건 구성
+        feature는 1:N이므로 join 대신 EXISTS로 걸어 중복 행이 생기지 않게 함
+        """
+        if product_filter is None:
+            return qs
+
+        if product_filter.category:
+            qs = qs.filter(detail__category=product_filter.category.value)
+        if product_filter.feature:
+            qs = qs.filter(Exists(BookFeatureModel.objects.filter(
+                feature=product_filter.feature.value,
+                book_code=OuterRef("code"),
+            )))
+        if product_filter.publisher:
+            qs = qs.filter(publish_info__publisher=product_filter.publisher)
+        if product_filter.min_price is not None:
+            qs = qs.filter(price__gte=product_filter.min_price)
+        if product_filter.max_price is not None:
+            qs = qs.filter(price__lte=product_filter.max_price)
+        return qs
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # 요청 필드(sparse fieldset)에 맞춰 join / prefetch / 컬럼을 결정
+    # ──────────────────────────────────────────────────────────────────────────
+    @staticmethod
+    def _build_queryset(
+        fields: Optional[Iterable[str]] = None,
+    ) -> Tuple[QuerySet, Set[str]]:
+        if fields is None:
+            relations = set(SELECT_RELATED + PREFETCH_RELATED)
+        else:
+            fields = set(fields)
+            relations = {RELATIONS_BY_FIELD[field] for field in fields if field in RELATIONS_BY_FIELD}
+
+        select_related = [relation for relation in SELECT_RELATED if relation in relations]
+        prefetch_related = [relation for relation in PREFETCH_RELATED if relation in relations]
+
+        qs = BookModel.objects.all()
+        if select_related:
+            qs = qs.select_related(*select_related)
+        if prefetch_related:
+            qs = qs.prefetch_related(*prefetch_related)
+
+        if fields is not None:
+            columns = list(REQUIRED_COLUMNS) + [column for column in OPTIONAL_COLUMNS if column in fields]
+            # select_related 대상은 only()에서 빠지면 안되므로 연관 테이블 컬럼도 함께 지정
+            for relation in select_related:
+                related_model = BookModel._meta.get_field(relation).related_model
+                columns.extend(f"{relation}__{field.name}" for field in related_model._meta.concrete_fields)
+            qs = qs.only(*columns)
+
+        return qs, relations
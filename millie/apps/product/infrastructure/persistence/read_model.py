@@ -0,0 +1,83 @@
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Optional,
+)
+
+from django.db import transaction
+
+from apps.product.domain.entity import Product as ProductEntity
+from apps.product.domain.value_objects import ProductStatus
+from apps.product.infrastructure.persistence.mapper import ProductMapper
+from apps.product.infrastructure.persistence.models import (
+    Book as BookModel,
+    ProductReadModel,
+)
+
+
+class ProductReadModelStore:
+    """
+    product_read_models(비정규화 조회 테이블) 읽기/갱신
+    원본 5개 테이블을 조인해 만든 상세 payload를 도서별 1행으로 저장하고, 조회는 PK 조회 1회로 처리
+    """
+
+    def __init__(self, batch_size: int = 500):
+        self._batch_size = batch_size
+        self.mapper = ProductMapper()
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # 조회
+    # ──────────────────────────────────────────────────────────────────────────
+    def get(self, code: str) -> Optional[ProductEntity]:
+        """
+        판매중 상품이면 엔티티, 아직 조회 테이블에 없거나 판매 불가면 None (호출측에서 원본 조회로 대체)
+        """
+        row = ProductReadModel.objects.filter(pk=code).values_list("status", "payload").first()
+        if row is None or row[0] != ProductStatus.ACTIVE.value:
+            return None
+        return self.mapper.from_payload(row[1])
+
+    def get_many(self, codes: List[str]) -> Dict[str, Optional[ProductEntity]]:
+        """
+        조회 테이블에 있는 코드만 담아 반환 (판매 불가면 값이 None)
+        """
+        rows = ProductReadModel.objects.filter(pk__in=codes).values_list("book_code_id", "status", "payload")
+        return {
+            code: self.mapper.from_payload(payload) if status == ProductStatus.ACTIVE.value else None
+            for code, status, payload in rows
+        }
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # 갱신
+    # ──────────────────────────────────────────────────────────────────────────
+    def refresh(self, codes: Iterable[str]) -> None:
+        codes = list(codes)
+        with transaction.atomic():
+            ProductReadModel.objects.filter(pk__in=codes).delete()
+            self._insert(codes)
+
+    def rebuild(self) -> int:
+        """
+        전체 재생성 (초기 적재 및 복구용), 생성한 행 수 반환
+        """
+        with transaction.atomic():
+            ProductReadModel.objects.all().delete()
+            count = 0
+            codes = list(BookModel.objects.order_by("code").values_list("code", flat=True))
+            for start in range(0, len(codes), self._batch_size):
+                count += self._insert(codes[start:start + self._batch_size])
+        return count
+
+    def _insert(self, codes: List[str]) -> int:
+        books = (
+            BookModel.objects.filter(code__in=codes)
+            .select_related("detail", "author", "publish_info")
+            .prefetch_related("feature")
+        )
+        rows = [
+            ProductReadModel(book_code_id=book.code, status=book.status, payload=self.mapper.to_payload(book))
+            for book in books
+        ]
+        ProductReadModel.objects.bulk_create(rows, batch_size=self._batch_size)
+        return len(rows)
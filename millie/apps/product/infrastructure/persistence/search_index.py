@@ -0,0 +1,143 @@
+import math
+from collections import Counter
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Tuple,
+)
+
+from django.db import transaction
+from django.db.models import (
+    Case,
+    Count,
+    ExpressionWrapper,
+    F,
+    FloatField,
+    Sum,
+    Value,
+    When,
+)
+
+from apps.product.domain.value_objects import ProductStatus
+from apps.product.infrastructure.persistence.models import (
+    Book as BookModel,
+    BookSearchTerm as BookSearchTermModel,
+)
+from apps.utils.text import (
+    index_terms,
+    query_terms,
+)
+
+
+# 필드별 가중치 (도서명 일치가 설명 일치보다 우선)
+FIELD_WEIGHTS = (
+    ("name", 3),
+    ("author__author", 2),
+    ("publish_info__publisher", 2),
+    ("detail__description", 1),
+)
+
+
+class BookSearchIndex:
+    """
+    book_search_terms 테이블 기반 역색인
+    (SQLite/MySQL 모두 동일하게 동작하도록 DB 전용 전문검색 기능 대신 term 테이블 + 인덱스 조회 사용)
+    """
+
+    def __init__(self, batch_size: int = 500):
+        self._batch_size = batch_size
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # 색인
+    # ──────────────────────────────────────────────────────────────────────────
+    def reindex(self, codes: Iterable[str]) -> None:
+        codes = list(codes)
+        rows = self._load_rows(BookModel.objects.filter(code__in=codes))
+
+        with transaction.atomic():
+            BookSearchTermModel.objects.filter(book_code_id__in=codes).delete()
+            self._insert(rows)
+
+    def rebuild(self) -> int:
+        """
+        전체 재색인 (초기 적재 및 복구용), 색인한 도서 수 반환
+        """
+        with transaction.atomic():
+            BookSearchTermModel.objects.all().delete()
+            count = 0
+            codes = list(BookModel.objects.order_by("code").values_list("code", flat=True))
+            for start in range(0, len(codes), self._batch_size):
+                batch = codes[start:start + self._batch_size]
+                self._insert(self._load_rows(BookModel.objects.filter(code__in=batch)))
+                count += len(batch)
+        return count
+
+    def _load_rows(self, qs) -> List[dict]:
+        return list(qs.values("code", *(field for field, _ in FIELD_WEIGHTS)))
+
+    def _insert(self, rows: List[dict]) -> None:
+        terms = []
+        for row in rows:
+            for term, weight in self.build_terms(row).items():
+                terms.append(BookSearchTermModel(book_code_id=row["code"], term=term, weight=weight))
+        BookSearchTermModel.objects.bulk_create(terms, batch_size=self._batch_size)
+
+    @staticmethod
+    def build_terms(row: dict) -> Dict[str, int]:
+        weights = Counter()
+        for field, field_weight in FIELD_WEIGHTS:
+            for term in index_terms(row.get(field) or ""):
+                weights[term] += field_weight
+        return dict(weights)
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # 검색
+    # ──────────────────────────────────────────────────────────────────────────
+    def search(
+        self,
+        query: str,
+        offset: int,
+        limit: int,
+    ) -> Tuple[List[str], int]:
+        """
+        모든 term을 포함하는 판매중 도서 코드를 점수순으로 반환 (코드 목록, 전체 건수)
+        점수 = Σ(term 가중치 x idf), idf = log(1 + 전체 도서 수 / term 등장 도서 수)
+        """
+        terms = query_terms(query)
+        if not terms:
+            return [], 0
+
+        matched = BookSearchTermModel.objects.filter(
+            term__in=terms,
+            book_code__status=ProductStatus.ACTIVE.value,
+        )
+
+        document_frequency = dict(
+            matched.values("term").annotate(df=Count("book_code")).values_list("term", "df")
+        )
+        if len(document_frequency) < len(terms):     # 한 번도 등장하지 않은 term이 있으면 AND 조건 불만족
+            return [], 0
+
+        total_documents = BookModel.objects.filter(status=ProductStatus.ACTIVE.value).count()
+        idf = {term: math.log(1 + total_documents / df) for term, df in document_frequency.items()}
+
+        ranked = (
+            matched.values("book_code_id")
+            .annotate(
+                matched_terms=Count("term"),
+                score=Sum(Case(
+                    *[
+                        When(term=term, then=ExpressionWrapper(F("weight") * Value(weight), output_field=FloatField()))
+                        for term, weight in idf.items()
+                    ],
+                    output_field=FloatField(),
+                )),
+            )
+            .filter(matched_terms=len(terms))
+            .order_by("-score", "book_code_id")
+        )
+
+        total = ranked.count()
+        codes = [row["book_code_id"] for row in ranked[offset:offset + limit]]
+        return codes, total
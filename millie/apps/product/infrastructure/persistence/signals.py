@@ -0,0 +1,102 @@
+from django.db import transaction
+from django.db.models.signals import (
+    post_delete,
+    post_save,
+)
+from django.dispatch import receiver
+
+from apps.product.infrastructure.persistence.models import (
+    Author as AuthorModel,
+    Book as BookModel,
+    BookDetail as BookDetailModel,
+    BookFeature as BookFeatureModel,
+    PublishInfo as PublishInfoModel,
+)
+from apps.product.infrastructure.persistence.change_log import ProductChangeLog
+from apps.product.infrastructure.persistence.facet_index import book_facet_index
+from apps.product.infrastructure.persistence.prefix_index import book_prefix_index
+from apps.product.infrastructure.persistence.product_cache import ProductCache
+from apps.product.infrastructure.persistence.read_model import ProductReadModelStore
+from apps.product.infrastructure.persistence.search_index import BookSearchIndex
+
+
+def _book_code(instance) -> str:
+    # Book은 code, 나머지 연관 모델은 book_code FK(to_field="code")의 값
+    return instance.code if isinstance(instance, BookModel) else instance.book_code_id
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 검색 색인: 도서명/저자/출판사/설명이 바뀌면 해당 도서만 재색인
+# (삭제 cascade 도중에는 도서가 아직 남아있으므로 commit 이후에 반영)
+# ──────────────────────────────────────────────────────────────────────────────
+@receiver(post_save, sender=BookModel)
+@receiver(post_save, sender=BookDetailModel)
+@receiver(post_save, sender=AuthorModel)
+@receiver(post_save, sender=PublishInfoModel)
+@receiver(post_delete, sender=BookDetailModel)
+@receiver(post_delete, sender=AuthorModel)
+@receiver(post_delete, sender=PublishInfoModel)
+def reindex_search_terms(sender, instance, **kwargs):
+    code = _book_code(instance)
+    transaction.on_commit(lambda: BookSearchIndex().reindex([code]))
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 자동완성/패싯 색인: 변경 로그에 기록한 뒤 이 워커의 메모리 색인에서 해당 도서만 교체
+# (다른 워커는 변경 로그에서 바뀐 도서를 읽어 반영)
+# ──────────────────────────────────────────────────────────────────────────────
+@receiver(post_save, sender=BookModel)
+@receiver(post_save, sender=BookDetailModel)
+@receiver(post_save, sender=BookFeatureModel)
+@receiver(post_save, sender=PublishInfoModel)
+@receiver(post_save, sender=AuthorModel)
+@receiver(post_delete, sender=BookModel)
+@receiver(post_delete, sender=BookDetailModel)
+@receiver(post_delete, sender=BookFeatureModel)
+@receiver(post_delete, sender=PublishInfoModel)
+@receiver(post_delete, sender=AuthorModel)
+def refresh_memory_indexes(sender, instance, **kwargs):
+    code = _book_code(instance)
+    transaction.on_commit(lambda: _record_change(code))
+
+
+def _record_change(code: str) -> None:
+    sequence = ProductChangeLog().record([code])
+    book_prefix_index.refresh([code], sequence)
+    book_facet_index.refresh([code], sequence)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 조회 테이블: 도서를 구성하는 5개 테이블 중 하나라도 바뀌면 해당 도서 payload 재생성
+# ──────────────────────────────────────────────────────────────────────────────
+@receiver(post_save, sender=BookModel)
+@receiver(post_save, sender=BookDetailModel)
+@receiver(post_save, sender=BookFeatureModel)
+@receiver(post_save, sender=PublishInfoModel)
+@receiver(post_save, sender=AuthorModel)
+@receiver(post_delete, sender=BookDetailModel)
+@receiver(post_delete, sender=BookFeatureModel)
+@receiver(post_delete, sender=PublishInfoModel)
+@receiver(post_delete, sender=AuthorModel)
+def refresh_read_model(sender, instance, **kwargs):
+    code = _book_code(instance)
+    transaction.on_commit(lambda: ProductReadModelStore().refresh([code]))
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 상품 캐시: 해당 도서 상세 키 삭제 + 목록 버전 교체
+# (commit 전에 지우면 그 사이 다른 요청이 이전 값을 다시 캐시할 수 있으므로 commit 이후, 조회 테이블 갱신 뒤에 실행)
+# ──────────────────────────────────────────────────────────────────────────────
+@receiver(post_save, sender=BookModel)
+@receiver(post_save, sender=BookDetailModel)
+@receiver(post_save, sender=BookFeatureModel)
+@receiver(post_save, sender=PublishInfoModel)
+@receiver(post_save, sender=AuthorModel)
+@receiver(post_delete, sender=BookModel)
+@receiver(post_delete, sender=BookDetailModel)
+@receiver(post_delete, sender=BookFeatureModel)
+@receiver(post_delete, sender=PublishInfoModel)
+@receiver(post_delete, sender=AuthorModel)
+def invalidate_product_cache(sender, instance, **kwargs):
+    code = _book_code(instance)
+    transaction.on_commit(lambda: ProductCache().invalidate([code]))
@@ -0,0 +1,75 @@
+from decimal import (
+    Decimal,
+    InvalidOperation,
+)
+from typing import Optional
+
+from apps.product.domain.value_objects import (
+    Category,
+    Feature,
+    ProductFilter,
+    ProductSort,
+)
+from apps.utils import const
+
+
+PRODUCT_FILTER_PARAMS = (
+    const.CATEGORY,
+    const.FEATURE,
+    const.PUBLISHER,
+    const.MIN_PRICE,
+    const.MAX_PRICE,
+)
+
+
+def parse_product_filter(query_params) -> ProductFilter:
+    """
+    상품 목록/패싯 API 공용 필터 파라미터 변환, 허용되지 않는 값이면 ValueError(파라미터명)
+    """
+    def get(key: str) -> Optional[str]:
+        value = query_params.get(key, "").strip()
+        return value or None
+
+    def enum(key: str, enum_cls):
+        value = get(key)
+        try:
+            return enum_cls(value.upper()) if value else None
+        except ValueError:
+            raise ValueError(key)
+
+    def price(key: str) -> Optional[Decimal]:
+        value = get(key)
+        if value is None:
+            return None
+        try:
+            amount = Decimal(value)
+        except InvalidOperation:
+            raise ValueError(key)
+        if not amount.is_finite() or amount < 0:
+            raise ValueError(key)
+        return amount
+
+    product_filter = ProductFilter(
+        category=enum(const.CATEGORY, Category),
+        feature=enum(const.FEATURE, Feature),
+        publisher=get(const.PUBLISHER),
+        min_price=price(const.MIN_PRICE),
+        max_price=price(const.MAX_PRICE),
+    )
+    if (
+        product_filter.min_price is not None
+        and product_filter.max_price is not None
+        and product_filter.min_price > product_filter.max_price
+    ):
+        raise ValueError(f"{const.MIN_PRICE}, {const.MAX_PRICE}")
+    return product_filter
+
+
+def parse_product_sort(query_params) -> Optional[ProductSort]:
+    value = query_params.get(const.SORT, "").strip()
+    if not value:
+        return None
+    try:
+        return ProductSort(value)
+    except ValueError:
+        raise ValueError(const.SORT)
@@ -1,10 +1,33 @@
+from typing import (
+    Iterable,
+    Optional,
+)
+
 from rest_framework import serializers
 
 from apps.product.domain.entity import (
     Product,
+    Suggestion,
 )
 
 
+class SparseFieldsMixin:
+    """
+    fields 인자로 넘긴 필드만 직렬화 (?fields=code,name,price)
+    """
+
+    def __init__(self, *args, fields: Optional[Iterable[str]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is None:
+            return
+        for field_name in set(self.fields) - set(fields):
+            self.fields.pop(field_name)
+
+    @classmethod
+    def find_invalid_fields(cls, fields: Iterable[str]) -> list:
+        return sorted(set(fields) - set(cls().fields))
+
+
 class BookDetailSerializer(serializers.Serializer):
     category = serializers.CharField()
     description = serializers.CharField()
@@ -35,13 +58,14 @@ class AuthorSerializer(serializers.Serializer):
     updated_at = serializers.DateTimeField(required=False, allow_null=True)
 
 
-class ProductSerializer(serializers.Serializer):
+class ProductSerializer(SparseFieldsMixin, serializers.Serializer):
     code = serializers.CharField()
     name = serializers.CharField()
     author = serializers.SerializerMethodField()
     publisher = serializers.SerializerMethodField()
     published_date = serializers.SerializerMethodField()
     price = serializers.DecimalField(max_digits=10, decimal_places=2)
+    lowest_price = serializers.DecimalField(max_digits=10, decimal_places=2, allow_null=True)     # 최저 구매 가능가 (없으면 null)
     created_at = serializers.DateTimeField()
     updated_at = serializers.DateTimeField()
 
@@ -55,7 +79,7 @@ class ProductSerializer(serializers.Serializer):
         return obj.publish_info.published_date.isoformat() if obj.publish_info and obj.publish_info.published_date else None
 
 
-class ProductDetailSerializer(serializers.Serializer):
+class ProductDetailSerializer(SparseFieldsMixin, serializers.Serializer):
     code = serializers.CharField()
     name = serializers.CharField()
     author = serializers.SerializerMethodField()
@@ -78,3 +102,12 @@ class ProductDetailSerializer(serializers.Serializer):
 
     def get_published_date(self, obj: Product):
         return obj.publish_info.published_date.isoformat() if obj.publish_info and obj.publish_info.published_date else None
+
+
+class SuggestionSerializer(serializers.Serializer):
+    code = serializers.CharField()
+    text = serializers.CharField()
+    type = serializers.SerializerMethodField()
+
+    def get_type(self, obj: Suggestion):
+        return obj.type.value
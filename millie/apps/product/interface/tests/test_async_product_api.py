@@ -0,0 +1,74 @@
+from decimal import Decimal
+
+from asgiref.sync import sync_to_async
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.product.domain.value_objects import (
+    ProductStatus,
+    VisibilityStatus,
+)
+from apps.product.infrastructure.persistence.models import (
+    Author as AuthorModel,
+    Book as BookModel,
+    BookDetail as BookDetailModel,
+    BookFeature as BookFeatureModel,
+    PublishInfo as PublishInfoModel,
+)
+from apps.utils import (
+    const,
+    messages,
+)
+
+
+class AsyncProductAPITest(APITestCase):
+    """
+    비동기 상품 목록/상세 API는 동기 API와 같은 응답을 반환해야 한다.
+    """
+
+    def setUp(self):
+        now = timezone.now()
+        for code, price in (("BOOK001", "15000.00"), ("BOOK002", "20000.00")):
+            book = BookModel.objects.create(
+                code=code, name=f"{code} 도서", price=Decimal(price), status=ProductStatus.ACTIVE.value,
+            )
+            BookDetailModel.objects.create(
+                book_code=book, category="FICTION", description="설명", status=VisibilityStatus.VISIBLE.value,
+            )
+            BookFeatureModel.objects.create(
+                book_code=book, feature="BEST_SELLER", status=VisibilityStatus.VISIBLE.value,
+            )
+            PublishInfoModel.objects.create(
+                book_code=book, publisher="밀리출판", published_date=now.date(), status=VisibilityStatus.VISIBLE.value,
+            )
+            AuthorModel.objects.create(book_code=book, author="김작가", status=VisibilityStatus.VISIBLE.value)
+
+    async def test_list_matches_sync(self):
+        params = {const.SORT: "-price"}
+        response = await self.async_client.get(reverse("async-product-list"), params)
+        expected = await sync_to_async(self.client.get)(reverse("product-list"), params)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), expected.json())
+        self.assertEqual([item["code"] for item in response.json()["data"]], ["BOOK002", "BOOK001"])
+
+    async def test_list_invalid_fields_returns_400(self):
+        response = await self.async_client.get(reverse("async-product-list"), {const.FIELDS: "code,unknown"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn(messages.INVALID_FIELDS, response.json()["message"])
+
+    async def test_detail_matches_sync(self):
+        response = await self.async_client.get(reverse("async-product-detail", args=["BOOK001"]))
+        expected = await sync_to_async(self.client.get)(reverse("product-detail", args=["BOOK001"]))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), expected.json())
+
+    async def test_detail_not_found_returns_404(self):
+        response = await self.async_client.get(reverse("async-product-detail", args=["NOPE"]))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.json()["data"], {})
@@ -0,0 +1,124 @@
+from decimal import Decimal
+from unittest import mock
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.product.domain.value_objects import (
+    ProductStatus,
+    SuggestionType,
+    VisibilityStatus,
+)
+from apps.product.infrastructure.persistence.change_log import (
+    ChangeFeed,
+    ProductChangeLog,
+)
+from apps.product.infrastructure.persistence.models import (
+    Author as AuthorModel,
+    Book as BookModel,
+    ProductChange as ProductChangeModel,
+)
+from apps.product.infrastructure.persistence.prefix_index import (
+    BookPrefixIndex,
+    book_prefix_index,
+)
+from apps.product.infrastructure.persistence.product_cache import ProductCache
+from apps.utils import (
+    const,
+    messages,
+)
+
+
+class ProductAutocompleteAPITest(APITestCase):
+    def setUp(self):
+        # 색인은 프로세스 메모리에 남으므로 테스트마다 비우고 새 데이터로 적재되게 함
+        book_prefix_index.clear()
+        self.addCleanup(book_prefix_index.clear)
+
+        self._create_book("BOOK001", "파이썬 클린 아키텍처", "김작가")
+        self._create_book("BOOK002", "파이썬", "이작가")
+        self._create_book("BOOK003", "Django 실전", "Lee")
+        self._create_book("BOOK004", "파이썬 입문", "김작가", status=ProductStatus.SOLD_OUT)
+
+        self.url = reverse("product-autocomplete")
+
+    def _create_book(self, code, name, author, status=ProductStatus.ACTIVE):
+        book = BookModel.objects.create(code=code, name=name, price=Decimal("10000.00"), status=status.value)
+        AuthorModel.objects.create(book_code=book, author=author, status=VisibilityStatus.VISIBLE.value)
+        return book
+
+    def _suggest(self, prefix, **params):
+        response = self.client.get(self.url, {const.QUERY: prefix, **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [(item["code"], item["type"]) for item in response.data["data"]]
+
+    def test_prefix_match_with_partial_hangul(self):
+        """
+        입력 중인 글자(“파이ㅆ”)도 매칭되고, 짧은 도서명이 먼저, 판매 불가 도서는 제외되어야 한다.
+        """
+        response = self.client.get(self.url, {const.QUERY: "파이ㅆ"})
+
+        self.assertEqual(response.data["message"], messages.OK)
+        self.assertEqual(
+            [(item["code"], item["text"]) for item in response.data["data"]],
+            [("BOOK002", "파이썬"), ("BOOK001", "파이썬 클린 아키텍처")],
+        )
+
+    def test_author_latin_and_word_start_match(self):
+        name = SuggestionType.NAME.value
+        author = SuggestionType.AUTHOR.value
+
+        self.assertEqual(self._suggest("김작"), [("BOOK001", author)])
+        self.assertEqual(self._suggest("DJAN"), [("BOOK003", name)])
+        self.assertEqual(self._suggest("아키"), [("BOOK001", name)])
+        self.assertEqual(self._suggest("파이", **{const.LIMIT: 1}), [("BOOK002", name)])
+
+    def test_index_refreshed_on_commit(self):
+        self._suggest("파이")     # 최초 조회로 색인 적재
+
+        with self.captureOnCommitCallbacks(execute=True):
+            book = BookModel.objects.get(code="BOOK004")
+            book.status = ProductStatus.ACTIVE.value
+            book.save()
+            BookModel.objects.filter(code="BOOK002").delete()
+            self._create_book("BOOK005", "파스칼 입문", "박작가")
+
+        self.assertEqual(self._suggest("파이"), [("BOOK004", "NAME"), ("BOOK001", "NAME")])
+        self.assertEqual(self._suggest("파스"), [("BOOK005", "NAME")])
+        self.assertEqual(self._suggest("박"), [("BOOK005", "AUTHOR")])
+        # 이 워커에서 반영한 변경은 변경 로그 위치만 옮기고 다시 읽지 않음
+        self.assertEqual(book_prefix_index._feed.sequence, ProductChangeLog().latest())
+
+    def test_index_follows_change_log_of_other_workers(self):
+        index = BookPrefixIndex(feed=ChangeFeed(poll_interval=0))
+        self.assertEqual([s.code for s in index.search("파스", 5)], [])
+
+        # 다른 워커의 변경: 이 프로세스에서는 signal이 실행되지 않고 변경 로그와 상품 캐시 버전만 바뀜
+        BookModel.objects.filter(code="BOOK002").update(name="파스칼")
+        ProductChangeLog().record(["BOOK002"])
+        ProductCache().invalidate(["BOOK002"])
+
+        with mock.patch.object(index, "rebuild", wraps=index.rebuild) as rebuild:
+            self.assertEqual([s.code for s in index.search("파스", 5)], ["BOOK002"])
+            self.assertEqual([s.code for s in index.search("파이", 5)], ["BOOK001"])
+        rebuild.assert_not_called()
+
+    def test_index_rebuilt_when_change_log_cannot_catch_up(self):
+        index = BookPrefixIndex(feed=ChangeFeed(poll_interval=0))
+        index.search("파스", 5)
+
+        # 따라잡을 변경 일부가 정리된 경우: 바뀐 도서를 모두 알 수 없으므로 전체 재적재
+        BookModel.objects.filter(code="BOOK002").update(name="파스칼")
+        first = ProductChangeLog().record(["BOOK002"])
+        ProductChangeLog().record(["BOOK003"])
+        ProductChangeModel.objects.filter(id=first).delete()
+
+        with mock.patch.object(index, "rebuild", wraps=index.rebuild) as rebuild:
+            self.assertEqual([s.code for s in index.search("파스", 5)], ["BOOK002"])
+        rebuild.assert_called_once()
+
+    def test_bad_request(self):
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(self.url, {const.QUERY: "파", const.LIMIT: const.AUTOCOMPLETE_MAX_LIMIT + 1})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,184 @@
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import (
+    resolve,
+    reverse,
+)
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.pricing.domain.value_objects import (
+    CouponStatus,
+    DiscountType,
+    TargetType,
+)
+from apps.pricing.infrastructure.persistence.models import (
+    Coupon as CouponModel,
+    DiscountPolicy as DiscountPolicyModel,
+    DiscountTarget as DiscountTargetModel,
+)
+from apps.product.domain.value_objects import (
+    ProductStatus,
+    VisibilityStatus,
+)
+from apps.product.infrastructure.persistence.models import (
+    Author as AuthorModel,
+    Book as BookModel,
+    BookDetail as BookDetailModel,
+    BookFeature as BookFeatureModel,
+    PublishInfo as PublishInfoModel,
+)
+from apps.product.interface.views.product_bulk_detail_views import ProductBulkDetailView
+from apps.product.interface.views.product_detail_views import ProductDetailView
+from apps.utils import (
+    const,
+    messages,
+)
+
+
+class ProductBulkDetailAPITest(APITestCase):
+    def setUp(self):
+        # 조회 테이블(product_read_models)은 commit 이후 갱신되므로 on_commit 콜백을 실행시키며 생성
+        with self.captureOnCommitCallbacks(execute=True):
+            self._create_books()
+
+        # ── 쿠폰: 전체 대상(최소 25,000원) 1개, BOOK001 전용 1개 ─────────────────
+        self._create_coupon("ALL20", TargetType.ALL, minimum=Decimal("25000"))
+        self._create_coupon("B1FIX", TargetType.PRODUCT, target_book_code="BOOK001")
+
+    def _create_books(self):
+        now = timezone.now()
+
+        # ── ACTIVE 상태의 Book 6권 + 연관 정보 생성 ──────────────────────────────
+        for i in range(1, 7):
+            book = BookModel.objects.create(
+                code=f"BOOK00{i}",
+                name=f"Test Book {i}",
+                price=Decimal(f"{i}0000.00"),
+                status=ProductStatus.ACTIVE.value,
+            )
+            BookDetailModel.objects.create(
+                book_code=book,
+                category="FICTION",
+                description=f"테스트 도서 {i}의 설명입니다.",
+                status=VisibilityStatus.VISIBLE.value,
+            )
+            BookFeatureModel.objects.create(
+                book_code=book,
+                feature="BEST_SELLER",
+                status=VisibilityStatus.VISIBLE.value,
+            )
+            PublishInfoModel.objects.create(
+                book_code=book,
+                publisher=f"Pub{i}",
+                published_date=now.date(),
+                status=VisibilityStatus.VISIBLE.value,
+            )
+            AuthorModel.objects.create(
+                book_code=book,
+                author=f"Author{i}",
+                status=VisibilityStatus.VISIBLE.value,
+            )
+
+        # ── 품절 상품 (응답에서 제외되어야 함) ─────────────────────────────────
+        BookModel.objects.create(
+            code="BOOK009",
+            name="Sold Out Book",
+            price=Decimal("9000.00"),
+            status=ProductStatus.SOLD_OUT.value,
+        )
+
+    def _create_coupon(self, code, target_type, minimum=Decimal("0"), target_book_code=None):
+        now = timezone.now()
+        policy = DiscountPolicyModel.objects.create(
+            id=uuid.uuid4(),
+            discount_type=DiscountType.PERCENTAGE.value,
+            value=Decimal("0.10"),
+            target_type=target_type.value,
+            minimum_purchase_amount=minimum,
+            effective_start_at=now - timedelta(days=1),
+            effective_end_at=now + timedelta(days=30),
+        )
+        DiscountTargetModel.objects.create(
+            id=uuid.uuid4(),
+            discount_policy=policy,
+            target_product_code_id=target_book_code,
+            apply_priority=1,
+        )
+        CouponModel.objects.create(
+            id=uuid.uuid4(),
+            code=code,
+            name=f"{code} 쿠폰",
+            valid_until=now + timedelta(days=30),
+            status=CouponStatus.ACTIVE.value,
+            discount_policy=policy,
+        )
+
+    def _get(self, *codes):
+        url = reverse("product-bulk-detail")
+        return self.client.get(url, {const.CODES: ",".join(codes)})
+
+    def test_bulk_detail_returns_products_in_requested_order(self):
+        """
+        요청한 순서대로 product/available_discount가 반환되고, 판매 불가/없는 상품은 제외되어야 한다.
+        """
+        response = self._get("BOOK003", "BOOK001", "BOOK009", "NON_EXISTENT")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["message"], messages.OK)
+        data = response.data["data"]
+        self.assertEqual([item[const.PRODUCT]["code"] for item in data], ["BOOK003", "BOOK001"])
+
+        # BOOK003(30,000원): 전체 쿠폰만 / BOOK001(10,000원): 최소금액 미달로 전용 쿠폰만
+        self.assertEqual([c["code"] for c in data[0][const.AVAILABLE_DISCOUNT]], ["ALL20"])
+        self.assertEqual([c["code"] for c in data[1][const.AVAILABLE_DISCOUNT]], ["B1FIX"])
+
+        # nested 정보도 상세 조회와 동일하게 포함
+        self.assertEqual(data[1][const.PRODUCT]["author"]["author"], "Author1")
+        self.assertEqual(data[1][const.PRODUCT]["feature"]["feature"], "BEST_SELLER")
+
+    def test_query_count_is_constant_in_number_of_codes(self):
+        """
+        상품 수가 늘어나도 쿼리 수는 동일해야 한다. (N+1 방지)
+        """
+        with CaptureQueriesContext(connection) as two_codes:
+            self._get("BOOK001", "BOOK002")
+        with CaptureQueriesContext(connection) as six_codes:
+            self._get(*[f"BOOK00{i}" for i in range(1, 7)])
+
+        self.assertEqual(len(two_codes), len(six_codes))
+        self.assertLessEqual(len(six_codes), 4)
+
+    def test_bulk_path_not_captured_as_product_code(self):
+        self.assertIs(resolve("/api/v1/products/bulk").func.view_class, ProductBulkDetailView)
+        self.assertIs(resolve("/api/v1/products/BOOK001").func.view_class, ProductDetailView)
+
+    def test_bad_requests(self):
+        url = reverse("product-bulk-detail")
+
+        # codes 누락
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn(messages.MISSING_PARAMETER, response.data["message"])
+
+        # 최대 개수 초과
+        too_many = [f"CODE{i}" for i in range(const.BULK_DETAIL_MAX_CODES + 1)]
+        response = self._get(*too_many)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn(messages.TOO_MANY_CODES, response.data["message"])
+
+        # 허용되지 않은 파라미터
+        response = self.client.get(url, {const.CODES: "BOOK001", "foo": "bar"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_all_codes_not_found(self):
+        response = self._get("NON_EXISTENT", "BOOK009")
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertIn("없거나 판매 불가", response.data["message"])
+        self.assertEqual(response.data["data"], [])
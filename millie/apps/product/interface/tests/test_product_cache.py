@@ -0,0 +1,115 @@
+from decimal import Decimal
+
+from django.core.cache import caches
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.product.domain.value_objects import (
+    ProductStatus,
+    VisibilityStatus,
+)
+from apps.product.infrastructure.persistence.models import (
+    Author as AuthorModel,
+    Book as BookModel,
+    BookDetail as BookDetailModel,
+    BookFeature as BookFeatureModel,
+    PublishInfo as PublishInfoModel,
+)
+from apps.product.infrastructure.persistence.product_cache import STAMP_NAMESPACE
+from apps.utils import const
+from apps.utils.cache import clear_local_caches
+from apps.utils.models import CacheVersion
+
+
+@override_settings(CACHES={
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "product": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "product-cache-test"},
+    "pricing": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "pricing-cache-test"},
+})
+class ProductCacheTest(APITestCase):
+    def setUp(self):
+        caches["product"].clear()
+        caches["pricing"].clear()
+        clear_local_caches()
+        now = timezone.now()
+
+        for code, price in (("BOOK001", "15000.00"), ("BOOK002", "20000.00")):
+            book = BookModel.objects.create(
+                code=code, name=f"{code} 도서", price=Decimal(price), status=ProductStatus.ACTIVE.value,
+            )
+            BookDetailModel.objects.create(
+                book_code=book, category="FICTION", description="설명", status=VisibilityStatus.VISIBLE.value,
+            )
+            BookFeatureModel.objects.create(
+                book_code=book, feature="BEST_SELLER", status=VisibilityStatus.VISIBLE.value,
+            )
+            PublishInfoModel.objects.create(
+                book_code=book, publisher="밀리출판", published_date=now.date(), status=VisibilityStatus.VISIBLE.value,
+            )
+            AuthorModel.objects.create(book_code=book, author="김작가", status=VisibilityStatus.VISIBLE.value)
+
+    def _product_queries(self, queries) -> list:
+        return [q["sql"] for q in queries if "books" in q["sql"] or "product_read_models" in q["sql"]]
+
+    def test_detail_and_list_served_from_cache(self):
+        """
+        두 번째 조회부터는 상품 테이블을 조회하지 않고, sparse 요청도 캐시된 전체 엔티티로 응답해야 한다.
+        """
+        detail_url = reverse("product-detail", args=["BOOK001"])
+        first = self.client.get(detail_url).data["data"][const.PRODUCT]
+
+        with CaptureQueriesContext(connection) as queries:
+            second = self.client.get(detail_url).data["data"][const.PRODUCT]
+            sparse = self.client.get(detail_url, {const.FIELDS: "code,price"}).data["data"][const.PRODUCT]
+            self.client.get(reverse("product-bulk-detail"), {const.CODES: "BOOK001"})
+
+        self.assertEqual(first, second)
+        self.assertEqual(sparse, {"code": "BOOK001", "price": "15000.00"})
+        self.assertEqual(self._product_queries(queries), [])
+
+        list_url = reverse("product-list")
+        self.client.get(list_url, {const.SORT: "-price"})
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(list_url, {const.SORT: "-price"})
+        self.assertEqual([item["code"] for item in response.data["data"]], ["BOOK002", "BOOK001"])
+        self.assertEqual(self._product_queries(queries), [])
+
+    def test_invalidated_on_commit(self):
+        detail_url = reverse("product-detail", args=["BOOK001"])
+        list_url = reverse("product-list")
+        self.client.get(detail_url)
+        self.client.get(list_url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            book = BookModel.objects.get(code="BOOK001")
+            book.price = Decimal("9000.00")
+            book.save()
+
+        self.assertEqual(self.client.get(detail_url).data["data"][const.PRODUCT]["price"], "9000.00")
+        prices = {item["code"]: item["price"] for item in self.client.get(list_url).data["data"]}
+        self.assertEqual(prices["BOOK001"], "9000.00")
+
+        # 연관 테이블 변경도 해당 도서 캐시를 무효화
+        with self.captureOnCommitCallbacks(execute=True):
+            author = AuthorModel.objects.get(book_code="BOOK001")
+            author.author = "이작가"
+            author.save()
+        self.assertEqual(self.client.get(detail_url).data["data"][const.PRODUCT]["author"]["author"], "이작가")
+
+        # 저장 한 번에 다른 워커용 무효화 신호(cache_versions 버전)는 한 번만 증가
+        version = CacheVersion.objects.get(namespace=STAMP_NAMESPACE).version
+        with self.captureOnCommitCallbacks(execute=True):
+            book.price = Decimal("9500.00")
+            book.save(update_fields=["price"])
+        self.assertEqual(CacheVersion.objects.get(namespace=STAMP_NAMESPACE).version, version + 1)
+
+        # 판매 불가로 바뀌면 캐시에 남지 않고 404
+        with self.captureOnCommitCallbacks(execute=True):
+            book.status = ProductStatus.SOLD_OUT.value
+            book.save()
+        self.assertEqual(self.client.get(detail_url).status_code, status.HTTP_404_NOT_FOUND)
@@ -1,4 +1,9 @@
 from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from rest_framework.test import APITestCase
 from django.urls import reverse
@@ -193,3 +198,51 @@ class ProductDetailAPITest(APITestCase):
         self.assertIn("updated_at", product)
         self.assertTrue(isinstance(product["created_at"], str))
         self.assertTrue(isinstance(product["updated_at"], str))
+
+    def test_product_detail_sparse_fields(self):
+        """
+        ?fields=code,name,detail 요청 시, product에는 해당 필드만 포함되어야 한다.
+        """
+        url = reverse("product-detail", args=[self.book.code])
+        response = self.client.get(url, {const.FIELDS: "code,name,detail"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        product = response.data["data"]["product"]
+        self.assertEqual(set(product.keys()), {"code", "name", "detail"})
+        self.assertEqual(product["detail"]["category"], "FICTION")
+        self.assertIn(const.AVAILABLE_DISCOUNT, response.data["data"])
+
+        # 잘못된 필드 → 400
+        response = self.client.get(url, {const.FIELDS: "code,unknown"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_product_detail_from_read_model(self):
+        """
+        조회 테이블이 채워지면 상품 정보는 PK 조회 1회로 읽고, 응답은 원본 조인 조회와 동일해야 한다.
+        """
+        url = reverse("product-detail", args=[self.book.code])
+        joined = self.client.get(url).data["data"]["product"]
+
+        call_command("rebuild_product_read_models", stdout=StringIO())
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["data"]["product"], joined)
+
+        product_queries = [q["sql"] for q in queries if "product_read_models" in q["sql"] or "books" in q["sql"]]
+        self.assertEqual(len(product_queries), 1)
+        self.assertIn("product_read_models", product_queries[0])
+
+        # 원본이 바뀌면 commit 이후 조회 테이블도 갱신, 판매 불가가 되면 404
+        with self.captureOnCommitCallbacks(execute=True):
+            author = AuthorModel.objects.get(book_code=self.book)
+            author.author = "Author2"
+            author.save()
+        self.assertEqual(self.client.get(url).data["data"]["product"]["author"]["author"], "Author2")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.book.status = ProductStatus.SOLD_OUT.value
+            self.book.save()
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_404_NOT_FOUND)
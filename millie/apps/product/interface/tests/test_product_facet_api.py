@@ -0,0 +1,148 @@
+from decimal import Decimal
+from unittest import mock
+
+from django.core.cache import caches
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.product.domain.value_objects import (
+    ProductStatus,
+    VisibilityStatus,
+)
+from apps.product.infrastructure.persistence.change_log import (
+    ChangeFeed,
+    ProductChangeLog,
+)
+from apps.product.infrastructure.persistence.facet_index import (
+    BookFacetIndex,
+    book_facet_index,
+)
+from apps.product.infrastructure.persistence.models import (
+    Book as BookModel,
+    BookDetail as BookDetailModel,
+    BookFeature as BookFeatureModel,
+    PublishInfo as PublishInfoModel,
+)
+from apps.product.infrastructure.persistence.product_cache import ProductCache
+from apps.product.infrastructure.persistence.product_repo_impl import ProductRepoImpl
+from apps.utils import (
+    const,
+    messages,
+)
+from apps.utils.cache import clear_local_caches
+
+
+class ProductFacetAPITest(APITestCase):
+    def setUp(self):
+        # 색인은 프로세스 메모리에 남으므로 테스트마다 비우고 새 데이터로 적재되게 함
+        book_facet_index.clear()
+        self.addCleanup(book_facet_index.clear)
+
+        self._create_book("BOOK001", "15000.00", "FICTION", ["BEST_SELLER", "NEW_ARRIVAL"], "밀리출판")
+        self._create_book("BOOK002", "12000.00", "FICTION", ["NEW_ARRIVAL"], "다른출판")
+        self._create_book("BOOK003", "30000.00", "TECHNOLOGY", ["BEST_SELLER"], "밀리출판")
+        self._create_book("BOOK004", "9000.00", "FICTION", ["BEST_SELLER"], "밀리출판", status=ProductStatus.SOLD_OUT)
+
+        self.url = reverse("product-facets")
+
+    def _create_book(self, code, price, category, features, publisher, status=ProductStatus.ACTIVE):
+        book = BookModel.objects.create(code=code, name=code, price=Decimal(price), status=status.value)
+        BookDetailModel.objects.create(
+            book_code=book, category=category, description="", status=VisibilityStatus.VISIBLE.value,
+        )
+        for feature in features:
+            BookFeatureModel.objects.create(book_code=book, feature=feature, status=VisibilityStatus.VISIBLE.value)
+        PublishInfoModel.objects.create(
+            book_code=book, publisher=publisher, published_date=timezone.now().date(),
+            status=VisibilityStatus.VISIBLE.value,
+        )
+        return book
+
+    def _facets(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["message"], messages.OK)
+        return response.data["data"]
+
+    def test_facet_counts_for_current_filter(self):
+        """
+        판매중 상품만 세고, 각 패싯은 자기 자신을 제외한 나머지 필터 조건으로 세어야 한다.
+        """
+        data = self._facets()
+        self.assertEqual(data[const.TOTAL], 3)
+        self.assertEqual(data[const.CATEGORY]["FICTION"], 2)
+        self.assertEqual(data[const.CATEGORY]["TECHNOLOGY"], 1)
+        self.assertEqual(data[const.CATEGORY]["HISTORY"], 0)
+        self.assertEqual(data[const.FEATURE], {"BEST_SELLER": 2, "NEW_ARRIVAL": 2, "MONTHLY_RECOMMEND": 0})
+
+        data = self._facets(**{const.CATEGORY: "FICTION", const.PUBLISHER: "밀리출판"})
+        self.assertEqual(data[const.TOTAL], 1)
+        self.assertEqual(data[const.CATEGORY]["TECHNOLOGY"], 1)     # 분야 조건은 분야 패싯에 적용하지 않음
+        self.assertEqual(data[const.FEATURE]["BEST_SELLER"], 1)
+
+        data = self._facets(**{const.MIN_PRICE: "12000", const.MAX_PRICE: "15000"})
+        self.assertEqual(data[const.TOTAL], 2)
+        self.assertEqual(data[const.FEATURE]["NEW_ARRIVAL"], 2)
+
+    def test_facets_served_without_queries_and_refreshed_on_commit(self):
+        self._facets()      # 최초 조회로 색인 적재
+
+        with CaptureQueriesContext(connection) as queries:
+            self._facets(**{const.FEATURE: "BEST_SELLER"})
+        self.assertEqual(len(queries), 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            book = BookModel.objects.get(code="BOOK004")
+            book.status = ProductStatus.ACTIVE.value
+            book.save()
+
+            detail = BookDetailModel.objects.get(book_code="BOOK003")
+            detail.category = "HISTORY"
+            detail.save()
+
+            BookFeatureModel.objects.filter(book_code="BOOK002").delete()
+
+        data = self._facets()
+        self.assertEqual(data[const.TOTAL], 4)
+        self.assertEqual(data[const.CATEGORY]["FICTION"], 3)
+        self.assertEqual(data[const.CATEGORY]["HISTORY"], 1)
+        self.assertEqual(data[const.FEATURE]["NEW_ARRIVAL"], 1)
+        # 이 워커에서 반영한 변경은 변경 로그 위치만 옮기고 다시 읽지 않음
+        self.assertEqual(book_facet_index.sync(), ProductChangeLog().latest())
+
+    @override_settings(CACHES={
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        "product": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "facet-cache-test"},
+        "pricing": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
+    })
+    def test_counts_cached_per_index_version(self):
+        caches["product"].clear()
+        clear_local_caches()
+        repo = ProductRepoImpl()
+        repo.facet_index = BookFacetIndex(feed=ChangeFeed(poll_interval=0))
+        self.assertEqual(repo.count_facets()[1], 3)
+
+        # 같은 버전이면 캐시된 건수를 사용
+        with mock.patch.object(BookFacetIndex, "count") as count:
+            self.assertEqual(repo.count_facets()[1], 3)
+        count.assert_not_called()
+
+        # 다른 워커의 변경: 이 프로세스에서는 signal 없이 변경 로그와 상품 캐시 버전만 바뀜
+        # → 전체 재적재 없이 바뀐 도서만 갱신한 뒤 새 키로 계산
+        BookModel.objects.filter(code="BOOK004").update(status=ProductStatus.ACTIVE.value)
+        ProductChangeLog().record(["BOOK004"])
+        ProductCache().invalidate(["BOOK004"])
+        with mock.patch.object(repo.facet_index, "rebuild") as rebuild:
+            self.assertEqual(repo.count_facets()[1], 4)
+        rebuild.assert_not_called()
+
+    def test_bad_request(self):
+        self.assertEqual(self.client.get(self.url, {"foo": "bar"}).status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(self.url, {const.FEATURE: "UNKNOWN"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn(messages.INVALID_FILTER, response.data["message"])
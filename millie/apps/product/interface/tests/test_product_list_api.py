@@ -1,20 +1,33 @@
+from datetime import date
 from decimal import Decimal
+from unittest import skipUnless
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework.test import APITestCase
 from rest_framework import status
 
 from apps.product.domain.value_objects import (
+    Category,
+    Feature,
+    ProductFilter,
     ProductStatus,
     VisibilityStatus,
 )
 from apps.product.infrastructure.persistence.models import (
     Book as BookModel,
     Author as AuthorModel,
+    BookDetail as BookDetailModel,
+    BookFeature as BookFeatureModel,
     PublishInfo as PublishInfoModel,
 )
-from apps.utils import messages
+from apps.product.infrastructure.persistence.product_repo_impl import ProductRepoImpl
+from apps.utils import (
+    const,
+    messages,
+)
 
 
 class ProductListAPITest(APITestCase):
@@ -96,3 +109,132 @@ class ProductListAPITest(APITestCase):
         self.assertEqual(response.data["code"], status.HTTP_404_NOT_FOUND)
         self.assertEqual(response.data["message"], messages.NOT_FOUND)
         self.assertEqual(response.data["data"], [])
+
+    def test_sparse_fields_prune_joins_and_output(self):
+        """
+        ?fields=code,name,price 요청 시,
+        응답에는 해당 필드만 포함되고, authors/publishers 조인과 features prefetch 없이 books 1회 조회로 끝나야 한다.
+        """
+        url = reverse("product-list")
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {const.FIELDS: "code,name,price"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["data"], [{"code": "BOOK001", "name": "Test Book", "price": "10000.00"}])
+
+        self.assertEqual(len(queries), 1)
+        sql = queries[0]["sql"]
+        for table in ("authors", "publishers", "book_details", "product_features", "created_at"):
+            self.assertNotIn(table, sql)
+
+        # 연관 필드를 요청하면 필요한 테이블만 조인
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {const.FIELDS: "code,author"})
+
+        self.assertEqual(response.data["data"], [{"code": "BOOK001", "author": "Author1"}])
+        self.assertEqual(len(queries), 1)
+        self.assertIn("authors", queries[0]["sql"])
+        self.assertNotIn("publishers", queries[0]["sql"])
+
+    def test_sparse_fields_invalid_field(self):
+        """
+        존재하지 않는 필드를 요청하면 400을 반환해야 한다.
+        """
+        url = reverse("product-list")
+        response = self.client.get(url, {const.FIELDS: "code,unknown"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn(messages.INVALID_FIELDS, response.data["message"])
+        self.assertIn("unknown", response.data["message"])
+
+
+class ProductListFilterAPITest(APITestCase):
+    def setUp(self):
+        # (code, 가격, 분야, 타입, 출판사, 출간일)
+        books = [
+            ("BOOK001", "15000.00", "FICTION", "BEST_SELLER", "밀리출판", date(2023, 3, 1)),
+            ("BOOK002", "12000.00", "FICTION", "NEW_ARRIVAL", "다른출판", date(2024, 1, 1)),
+            ("BOOK003", "30000.00", "TECHNOLOGY", "BEST_SELLER", "밀리출판", date(2022, 5, 1)),
+            ("BOOK004", "9000.00", "FICTION", "BEST_SELLER", "밀리출판", date(2021, 7, 1)),
+        ]
+        for code, price, category, feature, publisher, published_date in books:
+            book = BookModel.objects.create(
+                code=code, name=code, price=Decimal(price), status=ProductStatus.ACTIVE.value,
+            )
+            BookDetailModel.objects.create(
+                book_code=book, category=category, description="", status=VisibilityStatus.VISIBLE.value,
+            )
+            BookFeatureModel.objects.create(book_code=book, feature=feature, status=VisibilityStatus.VISIBLE.value)
+            AuthorModel.objects.create(book_code=book, author="Author", status=VisibilityStatus.VISIBLE.value)
+            PublishInfoModel.objects.create(
+                book_code=book, publisher=publisher, published_date=published_date,
+                status=VisibilityStatus.VISIBLE.value,
+            )
+
+        self.url = reverse("product-list")
+
+    def _codes(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [item["code"] for item in response.data["data"]]
+
+    def test_filter_and_sort(self):
+        """
+        분야/타입/출판사/가격 범위 조건을 모두 만족하는 상품만 정렬 기준대로 반환되어야 한다.
+        """
+        self.assertEqual(
+            self._codes(**{const.CATEGORY: "fiction", const.FEATURE: "BEST_SELLER", const.SORT: "-price"}),
+            ["BOOK001", "BOOK004"],
+        )
+        self.assertEqual(
+            self._codes(**{
+                const.PUBLISHER: "밀리출판", const.MIN_PRICE: "10000", const.MAX_PRICE: "30000", const.SORT: "price",
+            }),
+            ["BOOK001", "BOOK003"],
+        )
+        self.assertEqual(
+            self._codes(**{const.SORT: "-published_date"}),
+            ["BOOK002", "BOOK001", "BOOK003", "BOOK004"],
+        )
+
+        # 페이지 지정 시 해당 구간만
+        self.assertEqual(self._codes(**{const.SORT: "price", const.PAGE: 2, const.SIZE: 2}), ["BOOK001", "BOOK003"])
+
+        # 정렬 미지정 페이지도 code 순으로 고정
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self._codes(**{const.PAGE: 2, const.SIZE: 2}), ["BOOK003", "BOOK004"])
+        self.assertTrue(any("ORDER BY" in q["sql"] and "LIMIT" in q["sql"] for q in queries.captured_queries))
+
+    def test_invalid_filter(self):
+        for params in (
+            {const.CATEGORY: "UNKNOWN"},
+            {const.MIN_PRICE: "abc"},
+            {const.MIN_PRICE: "20000", const.MAX_PRICE: "10000"},
+            {const.SORT: "name"},
+        ):
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn(messages.INVALID_FILTER, response.data["message"])
+
+    @skipUnless(connection.vendor == "sqlite", "EXPLAIN QUERY PLAN 형식은 SQLite 기준")
+    def test_filter_queries_use_indexes(self):
+        """
+        필터 조건이 추가한 인덱스를 타고, 어떤 테이블도 전체 스캔(SCAN)하지 않는지 실행 계획으로 확인
+        (조인 순서는 통계에 따라 옵티마이저가 고르므로 분야 조건은 인덱스 자체만 확인)
+        """
+        repo = ProductRepoImpl()
+        base = BookModel.objects.filter(status=ProductStatus.ACTIVE.value)
+
+        plans = {
+            None: repo.apply_filter(base, ProductFilter(category=Category.FICTION)).explain(),
+            "idx_product_features_feature": repo.apply_filter(
+                base, ProductFilter(feature=Feature.BEST_SELLER),
+            ).explain(),
+            "idx_books_status_price": repo.apply_filter(base, ProductFilter(min_price=Decimal("10000"))).explain(),
+            "idx_book_details_category": BookDetailModel.objects.filter(category=Category.FICTION.value).explain(),
+        }
+        for index_name, plan in plans.items():
+            self.assertNotIn("SCAN ", plan)
+            if index_name:
+                self.assertIn(index_name, plan)
@@ -0,0 +1,95 @@
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from apps.container import container
+from apps.pricing.application.use_case.refresh_lowest_prices_use_case import RefreshLowestPricesUseCase
+from apps.pricing.domain.value_objects import (
+    CouponStatus,
+    DiscountType,
+    TargetType,
+)
+from apps.pricing.infrastructure.persistence.models import (
+    Coupon as CouponModel,
+    DiscountPolicy as DiscountPolicyModel,
+    ProductLowestPrice as ProductLowestPriceModel,
+)
+from apps.product.domain.value_objects import (
+    ProductStatus,
+    VisibilityStatus,
+)
+from apps.product.infrastructure.persistence.models import (
+    Author as AuthorModel,
+    Book as BookModel,
+    BookDetail as BookDetailModel,
+    PublishInfo as PublishInfoModel,
+)
+from apps.utils import const
+
+
+class ProductLowestPriceAPITest(APITestCase):
+    """
+    목록/검색 응답의 lowest_price는 배치로 저장된 최저 구매 가능가를 페이지당 조회 1회로 붙여야 한다.
+    """
+
+    def setUp(self):
+        now = timezone.now()
+        for i in range(1, 6):
+            book = BookModel.objects.create(
+                code=f"BOOK00{i}", name=f"도서 {i}", price=Decimal(10000 * i), status=ProductStatus.ACTIVE.value,
+            )
+            BookDetailModel.objects.create(
+                book_code=book, category="FICTION", description="설명", status=VisibilityStatus.VISIBLE.value,
+            )
+            AuthorModel.objects.create(book_code=book, author="김작가", status=VisibilityStatus.VISIBLE.value)
+            PublishInfoModel.objects.create(
+                book_code=book, publisher="밀리출판", published_date=now.date(), status=VisibilityStatus.VISIBLE.value,
+            )
+        policy = DiscountPolicyModel.objects.create(
+            id=uuid.uuid4(), discount_type=DiscountType.FIXED.value, value=Decimal("3000.00"),
+            target_type=TargetType.ALL.value, effective_start_at=now - timedelta(days=1),
+            effective_end_at=now + timedelta(days=30),
+        )
+        CouponModel.objects.create(
+            id=uuid.uuid4(), code="MINUS3000", name="3,000원 할인", valid_until=now + timedelta(days=7),
+            status=CouponStatus.ACTIVE.value, discount_policy=policy,
+        )
+        container.resolve(RefreshLowestPricesUseCase).execute()
+
+    def _lowest_price_queries(self, queries) -> list:
+        return [q["sql"] for q in queries if "product_lowest_prices" in q["sql"]]
+
+    def test_list_includes_lowest_price_with_one_query(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("product-list"), {const.SORT: "price"})
+
+        self.assertEqual(
+            [(item["code"], item["lowest_price"]) for item in response.data["data"]],
+            [(f"BOOK00{i}", f"{10000 * i - 3000}.00") for i in range(1, 6)],
+        )
+        self.assertEqual(len(self._lowest_price_queries(queries)), 1)
+
+    def test_sparse_fields_skip_lookup(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("product-list"), {const.FIELDS: "code,price"})
+
+        self.assertEqual(set(response.data["data"][0]), {"code", "price"})
+        self.assertEqual(self._lowest_price_queries(queries), [])
+
+    def test_stale_or_missing_rows_are_null(self):
+        # 정가가 바뀐 뒤 아직 다시 계산되지 않은 행 / 계산된 적 없는 상품
+        ProductLowestPriceModel.objects.filter(pk="BOOK001").update(price=Decimal("9999.00"))
+        ProductLowestPriceModel.objects.filter(pk="BOOK002").delete()
+
+        response = self.client.get(reverse("product-list"), {const.SORT: "price", const.FIELDS: "code,lowest_price"})
+
+        lowest = {item["code"]: item["lowest_price"] for item in response.data["data"]}
+        self.assertIsNone(lowest["BOOK001"])
+        self.assertIsNone(lowest["BOOK002"])
+        self.assertEqual(lowest["BOOK003"], "27000.00")
@@ -0,0 +1,101 @@
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.product.domain.value_objects import (
+    ProductStatus,
+    VisibilityStatus,
+)
+from apps.product.infrastructure.persistence.models import (
+    Author as AuthorModel,
+    Book as BookModel,
+    BookDetail as BookDetailModel,
+    BookSearchTerm as BookSearchTermModel,
+    PublishInfo as PublishInfoModel,
+)
+from apps.utils import (
+    const,
+    messages,
+)
+
+
+class ProductSearchAPITest(APITestCase):
+    def setUp(self):
+        # 색인은 commit 이후 갱신되므로 on_commit 콜백을 실행시키며 데이터 생성
+        with self.captureOnCommitCallbacks(execute=True):
+            self._create_book("BOOK001", "파이썬 클린 아키텍처", "김작가", "밀리출판", "도메인 주도 설계 입문서")
+            self._create_book("BOOK002", "Django 실전", "Lee", "밀리출판", "파이썬 웹 프레임워크 아키텍처 소개")
+            self._create_book("BOOK003", "요리의 기술", "박셰프", "맛있는책", "집밥 레시피 모음")
+            self._create_book("BOOK004", "파이썬 입문", "김작가", "다른출판", "처음 배우는 프로그래밍", status=ProductStatus.SOLD_OUT)
+
+        self.url = reverse("product-search")
+
+    def _create_book(self, code, name, author, publisher, description, status=ProductStatus.ACTIVE):
+        book = BookModel.objects.create(code=code, name=name, price=Decimal("10000.00"), status=status.value)
+        BookDetailModel.objects.create(
+            book_code=book,
+            category="TECHNOLOGY",
+            description=description,
+            status=VisibilityStatus.VISIBLE.value,
+        )
+        AuthorModel.objects.create(book_code=book, author=author, status=VisibilityStatus.VISIBLE.value)
+        PublishInfoModel.objects.create(
+            book_code=book,
+            publisher=publisher,
+            published_date=timezone.now().date(),
+            status=VisibilityStatus.VISIBLE.value,
+        )
+        return book
+
+    def _codes(self, response):
+        return [item["code"] for item in response.data["data"][const.ITEMS]]
+
+    def test_search_ranks_name_match_over_description(self):
+        """
+        도서명 일치(가중치 3)가 설명 일치(가중치 1)보다 앞에 오고, 판매 불가 도서는 제외되어야 한다.
+        """
+        response = self.client.get(self.url, {const.QUERY: "파이썬 아키텍처"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["message"], messages.OK)
+        self.assertEqual(self._codes(response), ["BOOK001", "BOOK002"])
+        self.assertEqual(response.data["data"][const.TOTAL], 2)
+
+    def test_search_author_publisher_and_pagination(self):
+        self.assertEqual(self._codes(self.client.get(self.url, {const.QUERY: "김작가"})), ["BOOK001"])
+        self.assertEqual(self._codes(self.client.get(self.url, {const.QUERY: "django"})), ["BOOK002"])
+
+        response = self.client.get(self.url, {const.QUERY: "밀리출판", const.PAGE: 2, const.SIZE: 1})
+        self.assertEqual(len(self._codes(response)), 1)
+        self.assertEqual(response.data["data"][const.TOTAL], 2)
+        self.assertEqual(response.data["data"][const.PAGE], 2)
+
+        # 결과 없음은 빈 목록으로 정상 응답
+        response = self.client.get(self.url, {const.QUERY: "존재하지않는검색어"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self._codes(response), [])
+
+    def test_index_updated_incrementally_on_save(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            detail = BookDetailModel.objects.get(book_code="BOOK003")
+            detail.description = "캠핑 요리 가이드"
+            detail.save()
+
+        self.assertEqual(self._codes(self.client.get(self.url, {const.QUERY: "캠핑"})), ["BOOK003"])
+        self.assertEqual(self._codes(self.client.get(self.url, {const.QUERY: "레시피"})), [])
+
+    def test_rebuild_search_index_command(self):
+        BookSearchTermModel.objects.all().delete()
+        call_command("rebuild_search_index", stdout=StringIO())
+
+        self.assertEqual(self._codes(self.client.get(self.url, {const.QUERY: "요리"})), ["BOOK003"])
+
+    def test_bad_request(self):
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(self.url, {const.QUERY: "파이썬", const.SIZE: const.MAX_PAGE_SIZE + 1})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
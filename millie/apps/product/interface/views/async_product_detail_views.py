@@ -0,0 +1,78 @@
+from rest_framework import status
+
+from apps.product.application.async_get_product_detail_use_case import AsyncGetProductDetailUseCase
+from apps.product.interface.serializer import ProductDetailSerializer
+from apps.pricing.interface.serializer import CouponSummarySerializer
+
+from apps.container import container
+from apps.utils import (
+    const,
+    messages,
+)
+from apps.utils.async_views import AsyncAPIView
+from apps.utils.exceptions import NotFoundException
+from apps.utils.query_params import get_list_param
+from apps.utils.response import build_api_response
+
+
+class AsyncProductDetailView(AsyncAPIView):
+    """
+    ProductDetailView의 비동기(ASGI) 버전 (요청/응답 동일)
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._use_case = container.resolve(AsyncGetProductDetailUseCase)
+
+    async def get(self, request, code: str):
+        redundant_params = self._find_invalid_query_params(request)
+        if redundant_params:
+            return self._bad_request(f"{messages.BAD_REQUEST}: {', '.join(redundant_params)}")
+
+        fields = get_list_param(request.query_params, const.FIELDS) or None
+        invalid_fields = ProductDetailSerializer.find_invalid_fields(fields) if fields is not None else []
+        if invalid_fields:
+            return self._bad_request(f"{messages.INVALID_FIELDS}: {', '.join(invalid_fields)}")
+
+        user = request.user if getattr(request.user, "is_authenticated", False) else None
+
+        try:
+            product_entity, coupon_list = await self._use_case.execute(code=code, user=user, fields=fields)
+        except NotFoundException as e:
+            return build_api_response(
+                data={},
+                message=str(e),
+                code=status.HTTP_404_NOT_FOUND,
+                http_status=status.HTTP_404_NOT_FOUND,
+            )
+        except Exception as e:                  # NOTE! 실제 서비스에서는 이렇게 예외처리 하지 않고 더 세밀히 해야함
+            return build_api_response(
+                data={},
+                message=f"{messages.INTERNAL_SERVER_ERROR}: {str(e)}",
+                code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                http_status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        response_data = {
+            const.PRODUCT: ProductDetailSerializer(product_entity, fields=fields).data,
+            const.AVAILABLE_DISCOUNT: CouponSummarySerializer(coupon_list, many=True).data,
+        }
+        return build_api_response(
+            data=response_data,
+            message=messages.OK,
+            code=status.HTTP_200_OK,
+            http_status=status.HTTP_200_OK,
+        )
+
+    def _find_invalid_query_params(self, request) -> list:
+        allowed = {const.COUPON_CODE, const.FIELDS}
+        extras = set(request.query_params.keys()) - allowed
+        return list(extras)
+
+    def _bad_request(self, message: str):
+        return build_api_response(
+            data={},
+            message=message,
+            code=status.HTTP_400_BAD_REQUEST,
+            http_status=status.HTTP_400_BAD_REQUEST,
+        )
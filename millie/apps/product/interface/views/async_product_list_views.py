@@ -0,0 +1,94 @@
+from rest_framework import status
+
+from apps.product.application.async_get_product_list_use_case import AsyncGetProductListUseCase
+from apps.product.interface.filters import (
+    parse_product_filter,
+    parse_product_sort,
+)
+from apps.product.interface.serializer import ProductSerializer
+
+from apps.container import container
+from apps.utils import (
+    const,
+    messages,
+)
+from apps.utils.async_views import AsyncAPIView
+from apps.utils.exceptions import NotFoundException
+from apps.utils.query_params import (
+    get_int_param,
+    get_list_param,
+)
+from apps.utils.response import build_api_response
+
+
+class AsyncProductListView(AsyncAPIView):
+    """
+    ProductListView의 비동기(ASGI) 버전 (요청/응답 동일)
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.product_list_use_case = container.resolve(AsyncGetProductListUseCase)
+
+    # NOTE! 목록 API는 알 수 없는 파라미터를 무시 (기존 동작 유지)
+    async def get(self, request):
+        fields = get_list_param(request.query_params, const.FIELDS) or None
+        invalid_fields = ProductSerializer.find_invalid_fields(fields) if fields is not None else []
+        if invalid_fields:
+            return self._bad_request(f"{messages.INVALID_FIELDS}: {', '.join(invalid_fields)}")
+
+        try:
+            product_filter = parse_product_filter(request.query_params)
+            sort = parse_product_sort(request.query_params)
+        except ValueError as e:
+            return self._bad_request(f"{messages.INVALID_FILTER}: {str(e)}")
+
+        try:
+            page = get_int_param(request.query_params, const.PAGE, default=None, min_value=1)
+            size = get_int_param(
+                request.query_params, const.SIZE,
+                default=const.DEFAULT_PAGE_SIZE, min_value=1, max_value=const.MAX_PAGE_SIZE,
+            )
+        except ValueError:
+            return self._bad_request(f"{messages.BAD_REQUEST}: {const.PAGE}, {const.SIZE}")
+
+        try:
+            products = await self.product_list_use_case.execute(
+                fields=fields,
+                product_filter=product_filter,
+                sort=sort,
+                page=page,
+                size=size,
+            )
+        except NotFoundException:
+            products = []
+        except Exception as e:                # NOTE! 실제 서비스에서는 이렇게 예외처리 하지 않고 더 세밀히 해야함
+            return build_api_response(
+                data=[],
+                message=f"{messages.INTERNAL_SERVER_ERROR}: {str(e)}",
+                code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                http_status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        if not products:
+            return build_api_response(
+                data=[],
+                message=messages.NOT_FOUND,
+                code=status.HTTP_404_NOT_FOUND,
+                http_status=status.HTTP_404_NOT_FOUND,
+            )
+
+        return build_api_response(
+            data=ProductSerializer(products, many=True, fields=fields).data,
+            message=messages.OK,
+            code=status.HTTP_200_OK,
+            http_status=status.HTTP_200_OK,
+        )
+
+    def _bad_request(self, message: str):
+        return build_api_response(
+            data=[],
+            message=message,
+            code=status.HTTP_400_BAD_REQUEST,
+            http_status=status.HTTP_400_BAD_REQUEST,
+        )
@@ -0,0 +1,66 @@
+from rest_framework import status
+from rest_framework.views import APIView
+
+from apps.product.application.suggest_product_use_case import SuggestProductUseCase
+from apps.product.interface.serializer import SuggestionSerializer
+
+from apps.container import container
+from apps.utils import (
+    const,
+    messages,
+)
+from apps.utils.query_params import get_int_param
+from apps.utils.response import build_api_response
+
+
+class ProductAutocompleteView(APIView):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.suggest_use_case = container.resolve(SuggestProductUseCase)
+
+    def get(self, request):
+        redundant_params = self._find_invalid_query_params(request)
+        if redundant_params:
+            return self._bad_request(f"{messages.BAD_REQUEST}: {', '.join(redundant_params)}")
+
+        prefix = request.query_params.get(const.QUERY, "").strip()
+        if not prefix:
+            return self._bad_request(f"{messages.MISSING_PARAMETER}: {const.QUERY}")
+
+        try:
+            limit = get_int_param(
+                request.query_params, const.LIMIT,
+                default=const.AUTOCOMPLETE_DEFAULT_LIMIT, min_value=1, max_value=const.AUTOCOMPLETE_MAX_LIMIT,
+            )
+        except ValueError:
+            return self._bad_request(f"{messages.BAD_REQUEST}: {const.LIMIT}")
+
+        try:
+            suggestions = self.suggest_use_case.execute(prefix=prefix, limit=limit)
+        except Exception as e:                # NOTE! 실제 서비스에서는 이렇게 예외처리 하지 않고 더 세밀히 해야함
+            return build_api_response(
+                data=[],
+                message=f"{messages.INTERNAL_SERVER_ERROR}: {str(e)}",
+                code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                http_status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        return build_api_response(
+            data=SuggestionSerializer(suggestions, many=True).data,
+            message=messages.OK,
+            code=status.HTTP_200_OK,
+            http_status=status.HTTP_200_OK,
+        )
+
+    def _find_invalid_query_params(self, request) -> list:
+        allowed = {const.QUERY, const.LIMIT}
+        extras = set(request.query_params.keys()) - allowed
+        return list(extras)
+
+    def _bad_request(self, message: str):
+        return build_api_response(
+            data=[],
+            message=message,
+            code=status.HTTP_400_BAD_REQUEST,
+            http_status=status.HTTP_400_BAD_REQUEST,
+        )
@@ -2,19 +2,16 @@ from rest_framework.views import APIView
 from rest_framework import status
 
 from apps.product.application.get_product_detail_use_case import GetProductDetailUseCase
-from apps.product.infrastructure.persistence.product_repo_impl import ProductRepoImpl
 from apps.product.interface.serializer import ProductDetailSerializer
-from apps.pricing.application.services.coupon_service import CouponService
-from apps.pricing.application.services.promotion_service import PromotionService
-from apps.pricing.infrastructure.persistence.repository_impl.coupon_repo_impl import CouponRepoImpl
-from apps.pricing.infrastructure.persistence.repository_impl.promotion_repo_impl import PromotionRepoImpl
 from apps.pricing.interface.serializer import CouponSummarySerializer
 
+from apps.container import container
 from apps.utils import (
     const,
     messages,
 )
 from apps.utils.exceptions import NotFoundException
+from apps.utils.query_params import get_list_param
 from apps.utils.response import build_api_response
 
 
@@ -22,11 +19,7 @@ class ProductDetailView(APIView):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._use_case = GetProductDetailUseCase(
-            product_repo=ProductRepoImpl(),
-            promotion_service=PromotionService(PromotionRepoImpl()),
-            coupon_service=CouponService(CouponRepoImpl()),
-        )
+        self._use_case = container.resolve(GetProductDetailUseCase)
 
     def get(self, request, code: str):
         redundant_params = self._find_invalid_query_params(request)
@@ -38,6 +31,16 @@ class ProductDetailView(APIView):
                 http_status=status.HTTP_400_BAD_REQUEST,
             )
 
+        fields = get_list_param(request.query_params, const.FIELDS) or None
+        invalid_fields = ProductDetailSerializer.find_invalid_fields(fields) if fields is not None else []
+        if invalid_fields:
+            return build_api_response(
+                data={},
+                message=f"{messages.INVALID_FIELDS}: {', '.join(invalid_fields)}",
+                code=status.HTTP_400_BAD_REQUEST,
+                http_status=status.HTTP_400_BAD_REQUEST,
+            )
+
         coupon_code = request.query_params.getlist(const.COUPON_CODE, [])
         user = request.user if getattr(request.user, "is_authenticated", False) else None
 
@@ -46,6 +49,7 @@ class ProductDetailView(APIView):
                 code=code,
                 user=user,
                 coupon_code=coupon_code,
+                fields=fields,
             )
         except Exception as e:                  # NOTE! 실제 서비스에서는 이렇게 예외처리 하지 않고 더 세밀히 해야함
             if isinstance(e, NotFoundException):
@@ -62,7 +66,7 @@ class ProductDetailView(APIView):
                 http_status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
-        serialized_product = ProductDetailSerializer(product_entity).data
+        serialized_product = ProductDetailSerializer(product_entity, fields=fields).data
         serialized_coupons = CouponSummarySerializer(coupon_list, many=True).data
 
         response_data = {
@@ -78,6 +82,6 @@ class ProductDetailView(APIView):
         )
 
     def _find_invalid_query_params(self, request) -> list:
-        allowed = {const.COUPON_CODE}
+        allowed = {const.COUPON_CODE, const.FIELDS}
         extras = set(request.query_params.keys()) - allowed
         return list(extras)
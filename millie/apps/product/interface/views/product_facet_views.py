@@ -0,0 +1,65 @@
+from rest_framework import status
+from rest_framework.views import APIView
+
+from apps.product.application.get_product_facets_use_case import GetProductFacetsUseCase
+from apps.product.interface.filters import (
+    PRODUCT_FILTER_PARAMS,
+    parse_product_filter,
+)
+
+from apps.container import container
+from apps.utils import (
+    const,
+    messages,
+)
+from apps.utils.response import build_api_response
+
+
+class ProductFacetView(APIView):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.facets_use_case = container.resolve(GetProductFacetsUseCase)
+
+    def get(self, request):
+        redundant_params = self._find_invalid_query_params(request)
+        if redundant_params:
+            return self._bad_request(f"{messages.BAD_REQUEST}: {', '.join(redundant_params)}")
+
+        try:
+            product_filter = parse_product_filter(request.query_params)
+        except ValueError as e:
+            return self._bad_request(f"{messages.INVALID_FILTER}: {str(e)}")
+
+        try:
+            facets, total = self.facets_use_case.execute(product_filter=product_filter)
+        except Exception as e:                # NOTE! 실제 서비스에서는 이렇게 예외처리 하지 않고 더 세밀히 해야함
+            return build_api_response(
+                data={},
+                message=f"{messages.INTERNAL_SERVER_ERROR}: {str(e)}",
+                code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                http_status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        return build_api_response(
+            data={
+                const.CATEGORY: facets[const.CATEGORY],
+                const.FEATURE: facets[const.FEATURE],
+                const.TOTAL: total,
+            },
+            message=messages.OK,
+            code=status.HTTP_200_OK,
+            http_status=status.HTTP_200_OK,
+        )
+
+    def _find_invalid_query_params(self, request) -> list:
+        allowed = set(PRODUCT_FILTER_PARAMS)
+        extras = set(request.query_params.keys()) - allowed
+        return list(extras)
+
+    def _bad_request(self, message: str):
+        return build_api_response(
+            data={},
+            message=message,
+            code=status.HTTP_400_BAD_REQUEST,
+            http_status=status.HTTP_400_BAD_REQUEST,
+        )
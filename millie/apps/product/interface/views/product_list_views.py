@@ -2,23 +2,66 @@ from rest_framework import status
 from rest_framework.views import APIView
 
 from apps.product.application.get_product_list_use_case import GetProductListUseCase
-from apps.product.infrastructure.persistence.product_repo_impl import ProductRepoImpl
+from apps.product.interface.filters import (
+    parse_product_filter,
+    parse_product_sort,
+)
 from apps.product.interface.serializer import ProductSerializer
 
-from apps.utils import messages
+from apps.container import container
+from apps.utils import (
+    const,
+    messages,
+)
 from apps.utils.exceptions import NotFoundException
+from apps.utils.query_params import (
+    get_int_param,
+    get_list_param,
+)
 from apps.utils.response import build_api_response
 
 
 class ProductListView(APIView):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.product_list_use_case = GetProductListUseCase(ProductRepoImpl())
+        self.product_list_use_case = container.resolve(GetProductListUseCase)
 
-    # TODO! 페이징, 필터 등의 기능은 요구사항에 맞게 추후 구현 필요
+    # NOTE! 목록 API는 알 수 없는 파라미터를 무시 (기존 동작 유지)
     def get(self, request):
+        fields = get_list_param(request.query_params, const.FIELDS) or None
+        invalid_fields = ProductSerializer.find_invalid_fields(fields) if fields is not None else []
+        if invalid_fields:
+            return build_api_response(
+                data=[],
+                message=f"{messages.INVALID_FIELDS}: {', '.join(invalid_fields)}",
+                code=status.HTTP_400_BAD_REQUEST,
+                http_status=status.HTTP_400_BAD_REQUEST,
+            )
+
         try:
-            products = self.product_list_use_case.execute()
+            product_filter = parse_product_filter(request.query_params)
+            sort = parse_product_sort(request.query_params)
+        except ValueError as e:
+            return self._bad_request(f"{messages.INVALID_FILTER}: {str(e)}")
+
+        # page 미지정 시 전체 목록 (기존 동작 유지)
+        try:
+            page = get_int_param(request.query_params, const.PAGE, default=None, min_value=1)
+            size = get_int_param(
+                request.query_params, const.SIZE,
+                default=const.DEFAULT_PAGE_SIZE, min_value=1, max_value=const.MAX_PAGE_SIZE,
+            )
+        except ValueError:
+            return self._bad_request(f"{messages.BAD_REQUEST}: {const.PAGE}, {const.SIZE}")
+
+        try:
+            products = self.product_list_use_case.execute(
+                fields=fields,
+                product_filter=product_filter,
+                sort=sort,
+                page=page,
+                size=size,
+            )
         except NotFoundException as e:
             return build_api_response(
                 data=[],
@@ -42,10 +85,18 @@ class ProductListView(APIView):
                 http_status=status.HTTP_404_NOT_FOUND,
             )
 
-        serialized_data = ProductSerializer(products, many=True).data
+        serialized_data = ProductSerializer(products, many=True, fields=fields).data
         return build_api_response(
             data=serialized_data,
             message=messages.OK,
             code=status.HTTP_200_OK,
             http_status=status.HTTP_200_OK,
         )
+
+    def _bad_request(self, message: str):
+        return build_api_response(
+            data=[],
+            message=message,
+            code=status.HTTP_400_BAD_REQUEST,
+            http_status=status.HTTP_400_BAD_REQUEST,
+        )
@@ -0,0 +1,73 @@
+from rest_framework import status
+from rest_framework.views import APIView
+
+from apps.product.application.search_product_use_case import SearchProductUseCase
+from apps.product.interface.serializer import ProductSerializer
+
+from apps.container import container
+from apps.utils import (
+    const,
+    messages,
+)
+from apps.utils.query_params import get_int_param
+from apps.utils.response import build_api_response
+
+
+class ProductSearchView(APIView):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.search_use_case = container.resolve(SearchProductUseCase)
+
+    def get(self, request):
+        redundant_params = self._find_invalid_query_params(request)
+        if redundant_params:
+            return self._bad_request(f"{messages.BAD_REQUEST}: {', '.join(redundant_params)}")
+
+        query = request.query_params.get(const.QUERY, "").strip()
+        if not query:
+            return self._bad_request(f"{messages.MISSING_PARAMETER}: {const.QUERY}")
+
+        try:
+            page = get_int_param(request.query_params, const.PAGE, default=1, min_value=1)
+            size = get_int_param(
+                request.query_params, const.SIZE,
+                default=const.DEFAULT_PAGE_SIZE, min_value=1, max_value=const.MAX_PAGE_SIZE,
+            )
+        except ValueError:
+            return self._bad_request(f"{messages.BAD_REQUEST}: {const.PAGE}, {const.SIZE}")
+
+        try:
+            products, total = self.search_use_case.execute(query=query, page=page, size=size)
+        except Exception as e:                # NOTE! 실제 서비스에서는 이렇게 예외처리 하지 않고 더 세밀히 해야함
+            return build_api_response(
+                data={},
+                message=f"{messages.INTERNAL_SERVER_ERROR}: {str(e)}",
+                code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                http_status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        # 검색 결과가 없는 것은 정상 응답 (빈 items)
+        return build_api_response(
+            data={
+                const.ITEMS: ProductSerializer(products, many=True).data,
+                const.PAGE: page,
+                const.SIZE: size,
+                const.TOTAL: total,
+            },
+            message=messages.OK,
+            code=status.HTTP_200_OK,
+            http_status=status.HTTP_200_OK,
+        )
+
+    def _find_invalid_query_params(self, request) -> list:
+        allowed = {const.QUERY, const.PAGE, const.SIZE}
+        extras = set(request.query_params.keys()) - allowed
+        return list(extras)
+
+    def _bad_request(self, message: str):
+        return build_api_response(
+            data={},
+            message=message,
+            code=status.HTTP_400_BAD_REQUEST,
+            http_status=status.HTTP_400_BAD_REQUEST,
+        )
@@ -0,0 +1,18 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.product.infrastructure.persistence.read_model import ProductReadModelStore
+
+
+class Command(BaseCommand):
+    help = "상품 조회용 비정규화 테이블(product_read_models)을 전체 재생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        count = ProductReadModelStore(batch_size=options["batch_size"]).rebuild()
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f"{count}권 생성 완료 ({elapsed:.2f}s)"))
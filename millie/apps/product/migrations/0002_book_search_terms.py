@@ -0,0 +1,31 @@
+# Generated by Django 4.2.21 on 2026-10-19 18:44
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('product', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BookSearchTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(db_comment='검색 term', max_length=100)),
+                ('weight', models.PositiveIntegerField(db_comment='필드 가중치 x 등장 횟수', default=0)),
+                ('book_code', models.ForeignKey(db_comment='상품 코드', on_delete=django.db.models.deletion.CASCADE, related_name='search_terms', to='product.book', to_field='code')),
+            ],
+            options={
+                'db_table': 'book_search_terms',
+                'db_table_comment': '도서 검색 역색인 테이블',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='booksearchterm',
+            constraint=models.UniqueConstraint(fields=('term', 'book_code'), name='uniq_book_search_term'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.21 on 2026-10-19 18:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('product', '0002_book_search_terms'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='book',
+            index=models.Index(fields=['status', 'price'], name='idx_books_status_price'),
+        ),
+        migrations.AddIndex(
+            model_name='bookdetail',
+            index=models.Index(fields=['category'], name='idx_book_details_category'),
+        ),
+        migrations.AddIndex(
+            model_name='bookfeature',
+            index=models.Index(fields=['feature', 'book_code'], name='idx_product_features_feature'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 4.2.21 on 2026-10-19 18:51
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('product', '0003_product_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductReadModel',
+            fields=[
+                ('book_code', models.OneToOneField(db_comment='상품 코드', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='read_model', serialize=False, to='product.book', to_field='code')),
+                ('status', models.CharField(choices=[('ACTIVE', 'ACTIVE'), ('SOLD_OUT', 'SOLD_OUT'), ('DISCONTINUED', 'DISCONTINUED')], db_comment='판매 상태', max_length=255)),
+                ('payload', models.JSONField(db_comment='상세 응답용 상품 정보')),
+                ('updated_at', models.DateTimeField(auto_now=True, db_comment='수정 일자')),
+            ],
+            options={
+                'db_table': 'product_read_models',
+                'db_table_comment': '상품 조회용 비정규화 테이블',
+            },
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.21 on 2026-10-19 20:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('product', '0004_product_read_models'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductChange',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('book_code', models.CharField(db_comment='상품 코드', max_length=255)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_comment='등록 일자')),
+            ],
+            options={
+                'db_table': 'product_changes',
+                'db_table_comment': '상품 변경 로그 테이블',
+                'indexes': [models.Index(fields=['created_at'], name='idx_product_changes_created')],
+            },
+        ),
+    ]
@@ -0,0 +1,49 @@
+from asgiref.sync import (
+    iscoroutinefunction,
+    markcoroutinefunction,
+    sync_to_async,
+)
+from rest_framework.views import APIView
+
+
+class AsyncAPIView(APIView):
+    """
+    async def 핸들러를 쓰는 APIView (DRF 3.15는 async 핸들러를 지원하지 않으므로 dispatch만 async로 교체)
+    - 인증/권한 확인(initial)은 세션/사용자 조회가 DB를 사용하므로 sync_to_async로 실행
+    - 예외 처리/응답 렌더러 지정은 APIView와 동일
+    """
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+        # Django 4.2의 csrf_exempt는 coroutine 표시를 유지하지 않으므로 다시 표시
+        if cls.view_is_async:
+            markcoroutinefunction(view)
+        return view
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            # options/http_method_not_allowed 등 APIView 기본 핸들러는 sync
+            if iscoroutinefunction(handler):
+                response = await handler(request, *args, **kwargs)
+            else:
+                response = handler(request, *args, **kwargs)
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
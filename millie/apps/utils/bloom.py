@@ -0,0 +1,50 @@
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    문자열 집합의 근사 포함 여부 (bit 배열, 항목을 저장하지 않음)
+    - 없다고 판정하면 반드시 없음 / 있다고 판정하면 error_rate 확률로 실제로는 없음
+    - 항목당 약 -ln(error_rate) / ln(2)^2 bit (error_rate=0.001이면 약 1.8바이트)
+    - 해시는 blake2b 한 번으로 두 값을 만들어 k개 위치로 확장 (double hashing)
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        capacity = max(int(capacity), 1)
+        self._size = max(int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))), 8)
+        self._hash_count = max(int(round(self._size / capacity * math.log(2))), 1)
+        self._bits = bytearray((self._size + 7) // 8)
+
+    def _positions(self, item: str) -> range:
+        # first + i * second (i = 0..k-1) 를 bit 수로 나눈 나머지
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return range(first, first + self._hash_count * second, second)
+
+    def add(self, item: str) -> bool:
+        """
+        항목을 추가하고, 새로 추가된 것이면 True (이미 있었을 수 있으면 False)
+        """
+        bits, size = self._bits, self._size
+        added = False
+        for position in self._positions(item):
+            position %= size
+            index, mask = position >> 3, 1 << (position & 7)
+            if not bits[index] & mask:
+                bits[index] |= mask
+                added = True
+        return added
+
+    def __contains__(self, item: str) -> bool:
+        bits, size = self._bits, self._size
+        for position in self._positions(item):
+            position %= size
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    @property
+    def size_in_bytes(self) -> int:
+        return len(self._bits)
@@ -0,0 +1,317 @@
+import hashlib
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.db.models import F
+
+
+# 캐시에 None도 저장할 수 있도록 "없음"을 구분하는 표식
+MISSING = object()
+
+
+class ReadThroughCache:
+    """
+    Django cache alias 위의 read-through 캐시
+    - 백엔드는 settings.CACHES[alias]로 교체 (locmem/filebased/db 등)
+    - 목록처럼 한 번에 무효화해야 하는 키는 namespace 버전을 키에 넣고 버전만 교체
+    """
+
+    def __init__(self, alias: str, prefix: str):
+        self._alias = alias
+        self._prefix = prefix
+
+    @property
+    def backend(self):
+        # override_settings로 CACHES가 바뀌어도 따라가도록 매번 조회
+        return caches[self._alias]
+
+    @property
+    def disabled(self) -> bool:
+        return isinstance(self.backend, DummyCache)
+
+    def key(self, *parts: Any) -> str:
+        return ":".join([self._prefix, *map(str, parts)])
+
+    @staticmethod
+    def digest(value: Any) -> str:
+        # 조회 조건처럼 길이가 가변적인 값을 고정 길이 키로 변환
+        raw = json.dumps(value, sort_keys=True, default=str, ensure_ascii=False)
+        return hashlib.sha1(raw.encode()).hexdigest()
+
+    def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        is_fresh: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """
+        is_fresh: 저장된 값이 아직 유효한지 판단 (시간에 따라 결과가 바뀌는 조회용), False면 다시 로딩
+        """
+        value = self._get(key)
+        if value is MISSING or (is_fresh is not None and not is_fresh(value)):
+            value = loader()
+            self._set_many({key: value})
+        return value
+
+    def get_many_or_load(
+        self,
+        keys: Dict[Any, str],
+        loader: Callable[[List[Any]], Dict[Any, Any]],
+    ) -> Dict[Any, Any]:
+        """
+        keys: {식별자: 캐시 키}, loader: 캐시에 없는 식별자 목록 → {식별자: 값}
+        loader 결과에 없는 식별자는 저장하지 않음
+        """
+        cached = self._get_many(list(keys.values()))
+        result = {ident: cached[key] for ident, key in keys.items() if key in cached}
+
+        missing = [ident for ident in keys if ident not in result]
+        if missing:
+            loaded = loader(missing)
+            self._set_many({keys[ident]: value for ident, value in loaded.items()})
+            result.update(loaded)
+        return result
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        self._delete_many(list(keys))
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # namespace 버전
+    # ──────────────────────────────────────────────────────────────────────────
+    def version(self, namespace: str) -> str:
+        key = self.key("version", namespace)
+        version = self._get(key)
+        if version is MISSING:
+            version = uuid.uuid4().hex
+            if not self.backend.add(key, version, timeout=None):
+                version = self.backend.get(key, version)
+        return version
+
+    def bump_version(self, namespace: str) -> None:
+        # 기존 버전의 키는 참조되지 않고 TIMEOUT 후 만료
+        self.backend.set(self.key("version", namespace), uuid.uuid4().hex, timeout=None)
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # 저장소 접근 (TwoTierCache에서 로컬 캐시를 앞에 둠)
+    # ──────────────────────────────────────────────────────────────────────────
+    def _get(self, key: str) -> Any:
+        return self.backend.get(key, MISSING)
+
+    def _get_many(self, keys: List[str]) -> Dict[str, Any]:
+        return self.backend.get_many(keys)
+
+    def _set_many(self, values: Dict[str, Any]) -> None:
+        self.backend.set_many(values)
+
+    def _delete_many(self, keys: List[str]) -> None:
+        self.backend.delete_many(keys)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 2단계 캐시: 프로세스 로컬 LRU(L1) → 공유 캐시(L2)
+# ──────────────────────────────────────────────────────────────────────────────
+class LocalLRUCache:
+    """
+    프로세스 로컬 LRU 캐시 (스레드 안전)
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self._max_entries = max_entries or settings.LOCAL_CACHE_MAX_ENTRIES
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            if key not in self._entries:
+                return MISSING
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class VersionStamps:
+    """
+    cache_versions 테이블로 워커 간 로컬 캐시 무효화 신호를 주고받음
+    - 쓰기: namespace 버전을 1 올림
+    - 읽기: poll_interval마다 한 번만 버전을 조회하여, 마지막으로 본 버전과 다르면 변경된 것으로 판단
+    """
+
+    def __init__(self, poll_interval: Optional[float] = None):
+        self._poll_interval = settings.CACHE_VERSION_POLL_INTERVAL if poll_interval is None else poll_interval
+        self._seen: Dict[str, int] = {}
+        self._checked_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def changed(self, namespace: str) -> bool:
+        from apps.utils.models import CacheVersion
+
+        now = time.monotonic()
+        with self._lock:
+            if now - self._checked_at.get(namespace, float("-inf")) < self._poll_interval:
+                return False
+            self._checked_at[namespace] = now
+
+        version = CacheVersion.objects.filter(namespace=namespace).values_list("version", flat=True).first() or 0
+        with self._lock:
+            previous = self._seen.get(namespace)
+            self._seen[namespace] = version
+        return previous != version
+
+    def seen(self, namespace: str) -> Optional[int]:
+        # 마지막으로 확인한 버전 (아직 확인 전이면 None)
+        with self._lock:
+            return self._seen.get(namespace)
+
+    def bump(self, namespace: str) -> None:
+        from apps.utils.models import CacheVersion
+
+        _, created = CacheVersion.objects.get_or_create(namespace=namespace, defaults={"version": 1})
+        if not created:
+            CacheVersion.objects.filter(namespace=namespace).update(version=F("version") + 1)
+
+
+# 워커(프로세스) 단위로 공유하는 L1 / 버전 확인기
+_local_caches: Dict[str, LocalLRUCache] = {}
+_version_stamps: Optional[VersionStamps] = None
+_registry_lock = threading.Lock()
+
+
+def _process_local_cache(namespace: str) -> LocalLRUCache:
+    with _registry_lock:
+        if namespace not in _local_caches:
+            _local_caches[namespace] = LocalLRUCache()
+        return _local_caches[namespace]
+
+
+def _process_version_stamps() -> VersionStamps:
+    global _version_stamps
+    with _registry_lock:
+        if _version_stamps is None:
+            _version_stamps = VersionStamps()
+        return _version_stamps
+
+
+def seen_versions(namespaces: Iterable[str]) -> Tuple[Optional[int], ...]:
+    """
+    이 워커가 마지막으로 확인한 namespace별 cache_versions 버전 (DB 조회 없음, L1과 같은 주기로 갱신됨)
+    """
+    stamps = _process_version_stamps()
+    return tuple(stamps.seen(namespace) for namespace in namespaces)
+
+
+def clear_local_caches() -> None:
+    """
+    이 프로세스의 L1 전체 삭제 (테스트/운영 중 수동 초기화용)
+    """
+    with _registry_lock:
+        for local in _local_caches.values():
+            local.clear()
+
+
+class TwoTierCache(ReadThroughCache):
+    """
+    L1(프로세스 로컬 LRU) → L2(공유 캐시) 순으로 조회하는 read-through 캐시
+    - 쓰기/무효화는 L2에 반영하고 cache_versions의 namespace 버전을 올림
+    - 다른 워커는 다음 조회 때(최대 CACHE_VERSION_POLL_INTERVAL 이내) 버전 변경을 보고 자신의 L1을 비움
+    - L2가 비활성화(DummyCache)면 L1도 사용하지 않음
+    """
+
+    def __init__(
+        self,
+        alias: str,
+        prefix: str,
+        local: Optional[LocalLRUCache] = None,
+        stamps: Optional[VersionStamps] = None,
+    ):
+        super().__init__(alias=alias, prefix=prefix)
+        self._local = local if local is not None else _process_local_cache(prefix)
+        self._stamps = stamps if stamps is not None else _process_version_stamps()
+
+    def invalidated(self) -> None:
+        # 이 워커의 L1은 즉시 비우고 다른 워커에는 버전 변경으로 알림
+        self._local.clear()
+        self._stamps.bump(self._prefix)
+
+    def bump_version(self, namespace: str) -> None:
+        super().bump_version(namespace)
+        self.invalidated()
+
+    def _sync(self) -> None:
+        if self._stamps.changed(self._prefix):
+            self._local.clear()
+
+    def _get(self, key: str) -> Any:
+        if self.disabled:
+            return MISSING
+
+        self._sync()
+        value = self._local.get(key)
+        if value is MISSING:
+            value = super()._get(key)
+            if value is not MISSING:
+                self._local.set(key, value)
+        return value
+
+    def _get_many(self, keys: List[str]) -> Dict[str, Any]:
+        if self.disabled:
+            return {}
+
+        self._sync()
+        result = {}
+        for key in keys:
+            value = self._local.get(key)
+            if value is not MISSING:
+                result[key] = value
+
+        remaining = [key for key in keys if key not in result]
+        if remaining:
+            shared = super()._get_many(remaining)
+            for key, value in shared.items():
+                self._local.set(key, value)
+            result.update(shared)
+        return result
+
+    def _set_many(self, values: Dict[str, Any]) -> None:
+        if self.disabled:
+            return
+
+        super()._set_many(values)
+        for key, value in values.items():
+            self._local.set(key, value)
+
+    def _delete_many(self, keys: List[str]) -> None:
+        super()._delete_many(keys)
+        self.invalidated()
@@ -0,0 +1,122 @@
+import contextvars
+import functools
+import threading
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import ExitStack
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    List,
+    Optional,
+)
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connections
+
+
+def db_sync_to_async(func: Callable[..., Any]) -> Callable[..., Awaitable[Any]]:
+    """
+    ORM을 사용하는 sync 함수를 await 가능하게 감쌈 (Django async ORM과 같은 방식)
+    - ASYNC_DB_THREAD_SENSITIVE=True: 요청 스레드 하나에서 순서대로 실행 (트랜잭션 공유, 테스트 기본값)
+    - False: DB 조회용 스레드 풀(DB_THREAD_POOL_MAX_WORKERS)에서 실행되어 같은 요청 안의 여러 조회가 동시에 진행됨
+      이벤트 루프 기본 executor는 CPU 수에 맞춰 작게 잡히므로(min(32, CPU + 4)) 따로 둠
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        if settings.ASYNC_DB_THREAD_SENSITIVE:
+            return await sync_to_async(func, thread_sensitive=True)(*args, **kwargs)
+        return await sync_to_async(
+            _in_worker(func),
+            thread_sensitive=False,
+            executor=_db_executor(),
+        )(*args, **kwargs)
+
+    return wrapper
+
+
+def fan_out(*calls: Callable[[], Any]) -> List[Any]:
+    """
+    서로 결과가 필요 없는 조회들을 동시에 실행하고 결과를 순서대로 반환 (소요 시간 = 합이 아닌 최댓값)
+    - settings.USE_CASE_FAN_OUT=False면 순서대로 실행 (기본값)
+    - 마지막 호출은 현재 스레드에서, 나머지는 DB 조회용 스레드 풀에서 실행
+    - 다음 경우에는 순서대로 실행
+        - 트랜잭션(atomic) 안: 다른 스레드(연결)에서는 커밋 전 데이터가 보이지 않음
+        - 이미 스레드 풀 안: 풀 스레드가 서로를 기다리며 모두 막히지 않도록
+    - 예외는 모든 호출이 끝난 뒤 앞선 호출의 것부터 그대로 전달
+    """
+    if len(calls) < 2 or not _can_fan_out():
+        return [call() for call in calls]
+
+    executor = _db_executor()
+    # 요청 단위 ContextVar(컨테이너 scope, primary 고정 등)를 풀 스레드에도 전달
+    futures = [
+        executor.submit(contextvars.copy_context().run, _in_worker(call))
+        for call in calls[:-1]
+    ]
+    try:
+        last = calls[-1]()
+    except BaseException:
+        wait(futures)
+        raise
+    return [future.result() for future in futures] + [last]
+
+
+def _can_fan_out() -> bool:
+    if not settings.USE_CASE_FAN_OUT or getattr(_worker, "active", False):
+        return False
+    return not any(connection.in_atomic_block for connection in connections.all(initialized_only=True))
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# DB 조회용 스레드 풀
+# ──────────────────────────────────────────────────────────────────────────────
+# 프로세스 단위로 공유 (스레드마다 DB 연결을 하나씩 유지하므로 크기가 곧 추가 연결 수 상한)
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+_worker = threading.local()
+
+
+def _db_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.DB_THREAD_POOL_MAX_WORKERS,
+                thread_name_prefix="db-pool",
+            )
+        return _executor
+
+
+def _in_worker(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    풀 스레드에서 실행할 함수
+    스레드마다 자기 DB 연결을 쓰므로, 실행 후 수명(CONN_MAX_AGE)이 지났거나 끊긴 연결은 닫음 (요청 종료 시 정리와 동일)
+    - 이번 작업에서 쿼리를 실행한 연결만 확인 (close_old_connections는 이전 작업이 연 연결까지 DB에 접근해 확인함)
+    """
+
+    @functools.wraps(func)
+    def run(*args, **kwargs):
+        used = set()
+
+        def track(execute, sql, params, many, context):
+            used.add(context["connection"].alias)
+            return execute(sql, params, many, context)
+
+        _worker.active = True
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(track))
+                return func(*args, **kwargs)
+        finally:
+            _worker.active = False
+            for alias in used:
+                connections[alias].close_if_unusable_or_obsolete()
+
+    return run
@@ -7,5 +7,48 @@ DATA = "data"
 PRODUCT = "product"
 AVAILABLE_DISCOUNT = "available_discount"
 PRICE_CALCULATE_RESULT = "price_calculate_result"
+AVAILABLE_COUPONS = "available_coupons"
 
-COUPON_CODE = "coupon_code"
\ No newline at end of file
+COUPON_CODE = "coupon_code"
+CODES = "codes"
+FIELDS = "fields"
+INCLUDE = "include"
+BEST_PRICE = "best_price"
+LOWEST_PRICE = "lowest_price"
+QUERY = "q"
+PAGE = "page"
+SIZE = "size"
+LIMIT = "limit"
+SORT = "sort"
+
+# 상품 목록 필터
+CATEGORY = "category"
+FEATURE = "feature"
+PUBLISHER = "publisher"
+MIN_PRICE = "min_price"
+MAX_PRICE = "max_price"
+
+# 쿠폰 적용 API에서 include로 선택 가능한 부가 응답
+APPLY_COUPON_INCLUDE_OPTIONS = frozenset({AVAILABLE_COUPONS})
+
+# 일괄 조회 제한
+BULK_DETAIL_MAX_CODES = 50
+
+# 페이지네이션
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+# 페이지 응답 key
+ITEMS = "items"
+TOTAL = "total"
+
+# 자동완성 후보 수
+AUTOCOMPLETE_DEFAULT_LIMIT = 10
+AUTOCOMPLETE_MAX_LIMIT = 20
+
+# 할인 초안 시뮬레이션 응답의 상품별 변동 수
+SIMULATION_DEFAULT_LIMIT = 100
+SIMULATION_MAX_LIMIT = 1000
+
+# 장바구니 가격 계산 최대 상품(라인) 수
+CART_MAX_ITEMS = 100
@@ -0,0 +1,118 @@
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import Enum
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Optional,
+)
+
+
+class Lifetime(Enum):
+    SINGLETON = "SINGLETON"     # 프로세스당 1개 (최초 resolve 시 생성)
+    SCOPED = "SCOPED"           # 요청(scope)당 1개, scope 밖에서는 매번 생성
+    TRANSIENT = "TRANSIENT"     # resolve마다 생성
+
+
+@dataclass(frozen=True)
+class Registration:
+    factory: Callable[["Container"], Any]
+    lifetime: Lifetime
+
+
+class _Override:
+    """
+    container.override()의 반환값, mock.patch처럼 with 또는 start()/stop()으로 사용
+    """
+
+    def __init__(self, container: "Container", key: Any, instance: Any):
+        self._container = container
+        self._key = key
+        self._instance = instance
+
+    def start(self) -> Any:
+        self._container._overrides[self._key] = self._instance
+        return self._instance
+
+    def stop(self) -> None:
+        self._container._overrides.pop(self._key, None)
+
+    def __enter__(self) -> Any:
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+class Container:
+    """
+    repository/service/use case 객체 그래프를 한 곳에서 조립하는 DI 컨테이너
+    - register(key, factory, lifetime): factory는 컨테이너를 받아 의존성을 resolve하여 객체 생성
+    - key는 보통 추상 타입(ProductRepository 등) 또는 구현 클래스
+    - 테스트에서는 override(key, fake)로 교체
+    """
+
+    def __init__(self):
+        self._registrations: Dict[Any, Registration] = {}
+        self._singletons: Dict[Any, Any] = {}
+        self._overrides: Dict[Any, Any] = {}
+        self._scope: ContextVar[Optional[Dict[Any, Any]]] = ContextVar(f"container_scope_{id(self)}", default=None)
+        self._lock = threading.RLock()
+
+    def register(self, key: Any, factory: Callable[["Container"], Any], lifetime: Lifetime) -> None:
+        with self._lock:
+            self._registrations[key] = Registration(factory=factory, lifetime=lifetime)
+            self._singletons.pop(key, None)
+
+    def resolve(self, key: Any) -> Any:
+        if key in self._overrides:
+            return self._overrides[key]
+
+        registration = self._registrations.get(key)
+        if registration is None:
+            raise LookupError(f"등록되지 않은 의존성입니다: {key!r}")
+
+        if registration.lifetime is Lifetime.SINGLETON:
+            return self._resolve_singleton(key, registration)
+
+        if registration.lifetime is Lifetime.SCOPED:
+            scope = self._scope.get()
+            if scope is not None:
+                if key not in scope:
+                    scope[key] = registration.factory(self)
+                return scope[key]
+
+        return registration.factory(self)
+
+    def _resolve_singleton(self, key: Any, registration: Registration) -> Any:
+        if self._overrides:
+            # 교체된 의존성이 하위 객체까지 반영되도록 override 중에는 singleton을 새로 조립 (캐시하지 않음)
+            return registration.factory(self)
+        if key in self._singletons:
+            return self._singletons[key]
+        with self._lock:
+            if key not in self._singletons:
+                self._singletons[key] = registration.factory(self)
+            return self._singletons[key]
+
+    @contextmanager
+    def scope(self):
+        """
+        요청 단위 scope (RequestScopeMiddleware에서 요청마다 열고 닫음)
+        """
+        token = self._scope.set({})
+        try:
+            yield
+        finally:
+            self._scope.reset(token)
+
+    def override(self, key: Any, instance: Any) -> _Override:
+        return _Override(self, key, instance)
+
+    def reset(self) -> None:
+        # 생성된 singleton 폐기 (다음 resolve 때 다시 생성)
+        with self._lock:
+            self._singletons.clear()
@@ -0,0 +1,177 @@
+import itertools
+import threading
+import time
+from contextvars import ContextVar
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from django.conf import settings
+from django.db import (
+    DEFAULT_DB_ALIAS,
+    connections,
+)
+
+
+PRIMARY = DEFAULT_DB_ALIAS
+
+ROUND_ROBIN = "round_robin"
+LEAST_LAG = "least_lag"
+
+# 쓰기 직후 primary 고정 만료 시각(time.time()), 요청 중 쓰기 발생 여부
+_pinned_until: ContextVar[float] = ContextVar("primary_pinned_until", default=0.0)
+_wrote: ContextVar[bool] = ContextVar("primary_wrote", default=False)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 쓰기 후 primary 고정 (read-your-writes)
+# ──────────────────────────────────────────────────────────────────────────────
+def pin_primary(until: Optional[float] = None) -> None:
+    _pinned_until.set(until if until is not None else time.time() + settings.DATABASE_REPLICA_STICKY_SECONDS)
+
+
+def is_pinned() -> bool:
+    return _pinned_until.get() > time.time()
+
+
+def pinned_until() -> float:
+    return _pinned_until.get()
+
+
+def wrote() -> bool:
+    return _wrote.get()
+
+
+def reset_pin() -> None:
+    _pinned_until.set(0.0)
+    _wrote.set(False)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 복제 지연 확인
+# ──────────────────────────────────────────────────────────────────────────────
+class ReplicaLagMonitor:
+    """
+    replica별 복제 지연(초)을 DATABASE_REPLICA_LAG_CHECK_INTERVAL마다 한 번만 조회하여 보관
+    - MySQL: SHOW REPLICA STATUS(구버전은 SHOW SLAVE STATUS)의 Seconds_Behind_Source/Master
+    - 그 외(SQLite 등 로컬 대역): 0
+    - 조회 실패/복제 중단은 무한대로 취급하여 선택에서 제외
+    """
+
+    def __init__(self):
+        self._lags: Dict[str, Tuple[float, float]] = {}     # alias → (지연, 조회 시각)
+        self._lock = threading.Lock()
+
+    def lag(self, alias: str) -> float:
+        now = time.monotonic()
+        with self._lock:
+            cached = self._lags.get(alias)
+            if cached is not None and now - cached[1] < settings.DATABASE_REPLICA_LAG_CHECK_INTERVAL:
+                return cached[0]
+
+        lag = self._query_lag(alias)
+        with self._lock:
+            self._lags[alias] = (lag, now)
+        return lag
+
+    def clear(self) -> None:
+        with self._lock:
+            self._lags.clear()
+
+    @staticmethod
+    def _query_lag(alias: str) -> float:
+        connection = connections[alias]
+        if connection.vendor != "mysql":
+            return 0.0
+
+        for statement, column in (
+            ("SHOW REPLICA STATUS", "Seconds_Behind_Source"),
+            ("SHOW SLAVE STATUS", "Seconds_Behind_Master"),
+        ):
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute(statement)
+                    row = cursor.fetchone()
+                    columns = [description[0] for description in cursor.description or ()]
+            except Exception:
+                continue
+            if row is None or column not in columns:
+                return float("inf")
+            value = row[columns.index(column)]
+            return float("inf") if value is None else float(value)
+        return float("inf")
+
+
+# 프로세스 단위로 공유하는 지연 확인기
+replica_lag_monitor = ReplicaLagMonitor()
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Router
+# ──────────────────────────────────────────────────────────────────────────────
+class ReadReplicaRouter:
+    """
+    읽기는 replica(settings.DATABASE_REPLICAS), 쓰기는 primary(default)로 보내는 router
+    - 선택 방식(DATABASE_REPLICA_STRATEGY): round_robin / least_lag (지연이 가장 작은 replica)
+    - 지연이 DATABASE_REPLICA_MAX_LAG를 넘는 replica는 제외, 남은 replica가 없으면 primary
+    - primary에서 읽는 경우
+        - 쓰기 후 DATABASE_REPLICA_STICKY_SECONDS 동안 (같은 요청/스레드, 쿠키로 다음 요청까지 → PrimaryPinningMiddleware)
+        - primary 트랜잭션(atomic) 안
+        - DATABASE_PRIMARY_ONLY_MODELS (워커 간 무효화 신호처럼 지연되면 안 되는 테이블)
+    """
+
+    def __init__(self):
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def db_for_read(self, model, **hints):
+        replicas = self._replicas()
+        if not replicas:
+            return None
+
+        instance = hints.get("instance")
+        if instance is not None and instance._state.db:
+            # 이미 읽어온 객체의 연관 객체는 같은 DB에서 조회
+            return instance._state.db
+
+        if (
+            is_pinned()
+            or connections[PRIMARY].in_atomic_block
+            or model._meta.label in settings.DATABASE_PRIMARY_ONLY_MODELS
+        ):
+            return PRIMARY
+        return self._select(replicas)
+
+    def db_for_write(self, model, **hints):
+        _wrote.set(True)
+        pin_primary()
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {PRIMARY, *self._replicas()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # replica는 primary의 복제본이므로 스키마가 같음
+        return True
+
+    @staticmethod
+    def _replicas() -> List[str]:
+        return list(settings.DATABASE_REPLICAS)
+
+    def _select(self, replicas: List[str]) -> str:
+        lags = {alias: replica_lag_monitor.lag(alias) for alias in replicas}
+        healthy = [alias for alias in replicas if lags[alias] <= settings.DATABASE_REPLICA_MAX_LAG]
+        if not healthy:
+            return PRIMARY
+
+        if settings.DATABASE_REPLICA_STRATEGY == LEAST_LAG:
+            return min(healthy, key=lambda alias: (lags[alias], replicas.index(alias)))
+
+        with self._lock:
+            return healthy[next(self._counter) % len(healthy)]
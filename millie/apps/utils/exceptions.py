@@ -1,3 +1,7 @@
 
 class NotFoundException(Exception):
-    pass
\ No newline at end of file
+    pass
+
+
+class ConflictException(Exception):
+    pass
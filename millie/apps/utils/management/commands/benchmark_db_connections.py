@@ -0,0 +1,99 @@
+import logging
+import statistics
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import (
+    DEFAULT_DB_ALIAS,
+    close_old_connections,
+    connections,
+)
+from django.db.backends.signals import connection_created
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+
+
+class Command(BaseCommand):
+    help = "DB 연결 재사용(CONN_MAX_AGE/CONN_HEALTH_CHECKS) 설정별 요청당 지연시간을 비교합니다."
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument("--path", default=None, help="측정할 경로 (기본: 상품 목록)")
+        parser.add_argument("--requests", type=int, default=200)
+        parser.add_argument("--max-age", type=int, default=60, help="재사용 시 CONN_MAX_AGE(초)")
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+
+    def handle(self, *args, **options):
+        alias = options["database"]
+        connection = connections[alias]
+        if connection.vendor == "sqlite" and connection.is_in_memory_db():
+            self.stderr.write(self.style.WARNING("인메모리 SQLite는 연결을 닫지 않으므로 차이가 나타나지 않습니다. 파일 DB로 실행하세요."))
+
+        path = options["path"] or reverse("product-list")
+        modes = [
+            ("매 요청 새 연결", 0, False),
+            (f"재사용(max_age={options['max_age']})", options["max_age"], False),
+            (f"재사용(max_age={options['max_age']}) + health check", options["max_age"], True),
+        ]
+
+        original = {key: connection.settings_dict[key] for key in ("CONN_MAX_AGE", "CONN_HEALTH_CHECKS")}
+        # 캐시를 끄고 매 요청이 DB까지 가도록 측정
+        no_cache = {
+            alias_: {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}
+            for alias_ in (settings.PRODUCT_CACHE_ALIAS, settings.PRICING_CACHE_ALIAS)
+        }
+        # 데이터가 없어 404가 나도 측정에는 영향이 없으므로 요청 로그는 생략
+        request_logger = logging.getLogger("django.request")
+        log_level = request_logger.level
+        request_logger.setLevel(logging.ERROR)
+        try:
+            with override_settings(CACHES={**settings.CACHES, **no_cache}):
+                for label, max_age, health_checks in modes:
+                    connection.settings_dict["CONN_MAX_AGE"] = max_age
+                    connection.settings_dict["CONN_HEALTH_CHECKS"] = health_checks
+                    connection.close()
+                    self._report(label, *self._measure(alias, path, options["requests"]))
+        finally:
+            request_logger.setLevel(log_level)
+            connection.close()
+            connection.settings_dict.update(original)
+
+    def _measure(self, alias, path, count):
+        client = Client()
+        opened = []
+
+        def on_connect(sender, connection, **kwargs):
+            if connection.alias == alias:
+                opened.append(1)
+
+        connection_created.connect(on_connect)
+        try:
+            self._request(client, path)     # 워밍업
+            opened.clear()
+
+            elapsed = []
+            for _ in range(count):
+                started = time.perf_counter()
+                self._request(client, path)
+                elapsed.append((time.perf_counter() - started) * 1000)
+        finally:
+            connection_created.disconnect(on_connect)
+        return elapsed, len(opened)
+
+    @staticmethod
+    def _request(client, path):
+        # 테스트 Client는 요청 시작/종료 시 연결 정리를 생략하므로 WSGI 핸들러와 동일하게 직접 호출
+        close_old_connections()
+        response = client.get(path, HTTP_HOST="localhost")
+        close_old_connections()
+        return response
+
+    def _report(self, label, elapsed, opened):
+        elapsed.sort()
+        p95 = elapsed[min(len(elapsed) - 1, int(len(elapsed) * 0.95))]
+        self.stdout.write(
+            f"{label:<40} 평균 {statistics.mean(elapsed):7.2f}ms  p50 {statistics.median(elapsed):7.2f}ms  "
+            f"p95 {p95:7.2f}ms  새 연결 {opened}회 / {len(elapsed)}요청"
+        )
@@ -0,0 +1,186 @@
+import asyncio
+import json
+import logging
+import statistics
+import time
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.asgi import get_asgi_application
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+)
+from django.db import (
+    DEFAULT_DB_ALIAS,
+    connections,
+)
+from django.db.backends.signals import connection_created
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from apps.utils import const
+
+
+class Command(BaseCommand):
+    help = "ASGI 앱에 동시 요청을 보내 동기/비동기 상품 목록·상세·쿠폰 적용 API의 처리량과 지연시간을 비교합니다."
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument("--code", required=True, help="상세/쿠폰 적용에 사용할 상품 코드")
+        parser.add_argument("--coupon", action="append", default=[], help="쿠폰 적용 요청에 넣을 쿠폰 코드 (여러 번 지정 가능)")
+        parser.add_argument("--requests", type=int, default=200, help="엔드포인트별 요청 수")
+        parser.add_argument("--concurrency", type=int, default=20, help="동시에 진행하는 요청 수")
+        parser.add_argument("--db-latency-ms", type=float, default=0.0, help="쿼리마다 더할 지연(ms), 원격 DB 왕복시간 대역")
+        parser.add_argument(
+            "--thread-sensitive", action="store_true",
+            help="ASYNC_DB_THREAD_SENSITIVE=True로 측정 (조회가 한 스레드에서 순서대로 실행)",
+        )
+
+    def handle(self, *args, **options):
+        connection = connections[DEFAULT_DB_ALIAS]
+        if connection.vendor == "sqlite" and connection.is_in_memory_db():
+            raise CommandError("인메모리 SQLite는 스레드마다 별도 DB가 되므로 측정할 수 없습니다. 파일 DB로 실행하세요.")
+        if options["concurrency"] < 1 or options["requests"] < 1:
+            raise CommandError("--requests, --concurrency는 1 이상이어야 합니다.")
+
+        code = options["code"]
+        apply_body = json.dumps({const.COUPON_CODE: options["coupon"]}).encode()
+        targets = [
+            ("상품 목록", "GET", reverse("product-list"), reverse("async-product-list"), b""),
+            ("상품 상세", "GET", reverse("product-detail", args=[code]), reverse("async-product-detail", args=[code]), b""),
+            (
+                "쿠폰 적용", "POST",
+                reverse("apply-coupon", args=[code]), reverse("async-apply-coupon", args=[code]), apply_body,
+            ),
+        ]
+
+        # 캐시를 끄고 매 요청이 DB까지 가도록 측정
+        no_cache = {
+            alias: {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}
+            for alias in (settings.PRODUCT_CACHE_ALIAS, settings.PRICING_CACHE_ALIAS)
+        }
+        latency = _QueryLatency(options["db_latency_ms"] / 1000)
+        request_logger = logging.getLogger("django.request")
+        log_level = request_logger.level
+        request_logger.setLevel(logging.ERROR)
+        latency.install()
+        try:
+            with override_settings(
+                CACHES={**settings.CACHES, **no_cache},
+                ASYNC_DB_THREAD_SENSITIVE=options["thread_sensitive"],
+            ):
+                app = get_asgi_application()
+                for label, method, sync_path, async_path, body in targets:
+                    for kind, path in (("sync", sync_path), ("async", async_path)):
+                        result = asyncio.run(
+                            self._measure(app, method, path, body, options["requests"], options["concurrency"])
+                        )
+                        self._report(f"{label} ({kind})", *result)
+        finally:
+            latency.uninstall()
+            request_logger.setLevel(log_level)
+
+    async def _measure(self, app, method, path, body, count, concurrency) -> Tuple[List[float], float, Dict[int, int]]:
+        semaphore = asyncio.Semaphore(concurrency)
+        statuses: Dict[int, int] = {}
+
+        async def one() -> float:
+            async with semaphore:
+                started = time.perf_counter()
+                status_code = await _call(app, method, path, body)
+                statuses[status_code] = statuses.get(status_code, 0) + 1
+                return (time.perf_counter() - started) * 1000
+
+        await _call(app, method, path, body)    # 워밍업
+        started = time.perf_counter()
+        elapsed = await asyncio.gather(*(one() for _ in range(count)))
+        return list(elapsed), time.perf_counter() - started, statuses
+
+    def _report(self, label, elapsed, total_seconds, statuses):
+        elapsed.sort()
+        p95 = elapsed[min(len(elapsed) - 1, int(len(elapsed) * 0.95))]
+        status_summary = ", ".join(f"{code}×{n}" for code, n in sorted(statuses.items()))
+        self.stdout.write(
+            f"{label:<18} {len(elapsed) / total_seconds:8.1f} req/s  평균 {statistics.mean(elapsed):7.2f}ms  "
+            f"p50 {statistics.median(elapsed):7.2f}ms  p95 {p95:7.2f}ms  [{status_summary}]"
+        )
+
+
+async def _call(app, method: str, path: str, body: bytes) -> int:
+    """
+    ASGI 서버 없이 앱을 직접 호출 (서버 구현 차이를 빼고 앱의 동시 처리만 측정)
+    """
+    url = urlsplit(path)
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": url.path,
+        "raw_path": url.path.encode(),
+        "query_string": url.query.encode(),
+        "root_path": "",
+        "headers": [
+            (b"host", b"localhost"),
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+        "client": ("127.0.0.1", 0),
+        "server": ("localhost", 80),
+    }
+    received = False
+    response_status: Optional[int] = None
+
+    async def receive():
+        nonlocal received
+        if received:
+            # 응답이 끝날 때까지 연결 유지
+            await asyncio.Event().wait()
+        received = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        nonlocal response_status
+        if message["type"] == "http.response.start":
+            response_status = message["status"]
+
+    await app(scope, receive, send)
+    return response_status
+
+
+class _QueryLatency:
+    """
+    모든 DB 연결의 쿼리 실행 앞에 고정 지연을 더함 (원격 DB의 네트워크 왕복시간 대역)
+    """
+
+    def __init__(self, seconds: float):
+        self._seconds = seconds
+
+    def __call__(self, execute, sql, params, many, context):
+        time.sleep(self._seconds)
+        return execute(sql, params, many, context)
+
+    def install(self) -> None:
+        if self._seconds <= 0:
+            return
+        connection_created.connect(self._on_connect)
+        for connection in connections.all(initialized_only=True):
+            connection.execute_wrappers.append(self)
+
+    def uninstall(self) -> None:
+        connection_created.disconnect(self._on_connect)
+        for connection in connections.all(initialized_only=True):
+            if self in connection.execute_wrappers:
+                connection.execute_wrappers.remove(self)
+
+    def _on_connect(self, sender, connection, **kwargs):
+        if self not in connection.execute_wrappers:
+            connection.execute_wrappers.append(self)
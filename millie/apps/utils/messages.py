@@ -1,4 +1,11 @@
 NOT_FOUND = "Not found."
 OK = "OK."
 INTERNAL_SERVER_ERROR = "internal server errors."
-BAD_REQUEST = "Invalid query parameter(s):"
\ No newline at end of file
+BAD_REQUEST = "Invalid query parameter(s):"
+MISSING_PARAMETER = "Missing required query parameter(s):"
+TOO_MANY_CODES = "Too many codes requested. max:"
+INVALID_FIELDS = "Invalid field(s):"
+INVALID_INCLUDE = "Invalid include option(s):"
+INVALID_FILTER = "Invalid filter or sort value(s):"
+INVALID_BODY = "Invalid request body:"
+AUTHENTICATION_REQUIRED = "Authentication required."
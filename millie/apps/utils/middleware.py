@@ -0,0 +1,94 @@
+import time
+
+from asgiref.sync import (
+    iscoroutinefunction,
+    markcoroutinefunction,
+)
+from django.conf import settings
+
+from apps.container import container
+from apps.utils import db_router
+
+
+class RequestScopeMiddleware:
+    """
+    요청마다 DI 컨테이너의 scope를 열어 SCOPED 객체를 요청 단위로 공유하고, 응답 후 폐기
+    (ASGI에서도 동기 전환 없이 동작하도록 sync/async 모두 지원)
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with container.scope():
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        with container.scope():
+            return await self.get_response(request)
+
+
+class PrimaryPinningMiddleware:
+    """
+    쓰기가 있었던 요청의 응답에 쿠키를 남겨, 같은 클라이언트의 다음 요청도 DATABASE_REPLICA_STICKY_SECONDS 동안 primary에서 읽게 함
+    (replica 복제 지연 중에 방금 쓴 내용이 안 보이는 문제 방지)
+    - 쿠키는 서명하여 클라이언트가 만든 값은 무시하고, 값도 현재 시각 + DATABASE_REPLICA_STICKY_SECONDS까지만 인정
+    """
+
+    COOKIE_NAME = "primary_pinned_until"
+    COOKIE_SALT = "apps.utils.middleware.PrimaryPinningMiddleware"
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        self._before(request)
+        return self._after(self.get_response(request))
+
+    async def __acall__(self, request):
+        self._before(request)
+        return self._after(await self.get_response(request))
+
+    def _before(self, request) -> None:
+        # 같은 스레드의 이전 요청 상태가 남지 않도록 초기화 후 쿠키 기준으로 다시 고정
+        db_router.reset_pin()
+        now = time.time()
+        value = request.get_signed_cookie(
+            self.COOKIE_NAME, default=None, salt=self.COOKIE_SALT, max_age=settings.DATABASE_REPLICA_STICKY_SECONDS,
+        )
+        pinned_until = min(self._parse(value), now + settings.DATABASE_REPLICA_STICKY_SECONDS)
+        if pinned_until > now:
+            db_router.pin_primary(pinned_until)
+
+    def _after(self, response):
+        if db_router.wrote():
+            response.set_signed_cookie(
+                self.COOKIE_NAME,
+                f"{db_router.pinned_until():.3f}",
+                salt=self.COOKIE_SALT,
+                max_age=settings.DATABASE_REPLICA_STICKY_SECONDS,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+    @staticmethod
+    def _parse(value) -> float:
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return 0.0
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.21 on 2026-10-19 18:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CacheVersion',
+            fields=[
+                ('namespace', models.CharField(db_comment='캐시 namespace', max_length=100, primary_key=True, serialize=False)),
+                ('version', models.PositiveBigIntegerField(db_comment='버전', default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True, db_comment='수정 일자')),
+            ],
+            options={
+                'db_table': 'cache_versions',
+                'db_table_comment': '캐시 버전 테이블',
+            },
+        ),
+    ]
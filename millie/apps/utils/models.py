@@ -0,0 +1,15 @@
+from django.db import models
+
+
+class CacheVersion(models.Model):
+    """
+    캐시 namespace별 버전 (프로세스 로컬 캐시 무효화 신호)
+    어느 워커든 데이터를 바꾸면 버전을 올리고, 각 워커는 주기적으로 버전을 확인하여 바뀌었으면 로컬 캐시를 비움
+    """
+    namespace = models.CharField(max_length=100, primary_key=True, db_comment="캐시 namespace")
+    version = models.PositiveBigIntegerField(default=0, null=False, db_comment="버전")
+    updated_at = models.DateTimeField(auto_now=True, db_comment="수정 일자")
+
+    class Meta:
+        db_table = "cache_versions"
+        db_table_comment = "캐시 버전 테이블"
@@ -0,0 +1,38 @@
+from typing import (
+    List,
+    Optional,
+)
+
+
+def get_list_param(query_params, key: str) -> Optional[List[str]]:
+    """
+    ?key=A,B 와 ?key=A&key=B 를 모두 허용하여 리스트로 변환 (중복은 순서 유지하며 제거)
+    파라미터 자체가 없으면 None
+    """
+    if key not in query_params:
+        return None
+
+    values = []
+    for raw in query_params.getlist(key, []):
+        values.extend(value.strip() for value in raw.split(",") if value.strip())
+    return list(dict.fromkeys(values))
+
+
+def get_int_param(
+    query_params,
+    key: str,
+    default: Optional[int],
+    min_value: Optional[int] = None,
+    max_value: Optional[int] = None,
+) -> Optional[int]:
+    """
+    정수 파라미터 변환, 범위를 벗어나거나 정수가 아니면 ValueError
+    """
+    raw = query_params.get(key)
+    if raw in (None, ""):
+        return default
+
+    value = int(raw)
+    if (min_value is not None and value < min_value) or (max_value is not None and value > max_value):
+        raise ValueError(f"{key} must be between {min_value} and {max_value}")
+    return value
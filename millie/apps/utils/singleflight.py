@@ -0,0 +1,141 @@
+import threading
+import time
+import uuid
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Optional,
+)
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+
+from apps.utils.cache import (
+    MISSING,
+    ReadThroughCache,
+    seen_versions,
+)
+
+
+class _Call:
+    """
+    진행 중인 계산 하나 (먼저 들어온 호출이 실행하고 나머지는 완료를 기다림)
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    같은 키의 동시 호출을 한 번의 계산으로 합침 (cache stampede 방지)
+    - 프로세스 내: 먼저 들어온 스레드만 fn을 실행하고, 같은 키로 들어온 나머지는 그 결과(또는 예외)를 그대로 받음
+    - 프로세스 간(선택): settings.SINGLE_FLIGHT_CACHE_ALIAS가 있으면 공유 캐시의 add()로 락을 잡은 워커만 실행하고,
+      다른 워커는 결과 키가 채워질 때까지 기다림 (락이 풀렸는데 결과가 없거나 대기 시간을 넘기면 직접 실행)
+    - 결과를 저장하지는 않음, 계산이 끝나면 다음 호출은 다시 fn을 실행 (캐시는 repository 계층 담당)
+    """
+
+    def __init__(self, namespace: str, cache_alias: Any = MISSING, stamps: Iterable[str] = ()):
+        # cache_alias 미지정 시 settings.SINGLE_FLIGHT_CACHE_ALIAS, None이면 프로세스 내에서만 합침
+        # stamps: 결과가 의존하는 cache_versions namespace (키에 버전을 넣어 변경 전후의 계산이 합쳐지지 않도록)
+        self._namespace = namespace
+        self._cache_alias = cache_alias
+        self._stamps = tuple(stamps)
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+
+    def key(self, *parts: Any) -> str:
+        if self._stamps:
+            parts = (seen_versions(self._stamps), *parts)
+        return ":".join([self._namespace, ReadThroughCache.digest(parts)])
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            call.value = self._run_shared(key, fn)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.value
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+    def waiting(self, key: str) -> int:
+        # 해당 키의 진행 중 계산을 기다리는 호출 수
+        with self._lock:
+            call = self._calls.get(key)
+            return call.waiters if call is not None else 0
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # 프로세스 간 합치기 (공유 캐시 락)
+    # ──────────────────────────────────────────────────────────────────────────
+    @property
+    def _backend(self):
+        alias = settings.SINGLE_FLIGHT_CACHE_ALIAS if self._cache_alias is MISSING else self._cache_alias
+        if not alias:
+            return None
+        backend = caches[alias]
+        return None if isinstance(backend, DummyCache) else backend
+
+    def _run_shared(self, key: str, fn: Callable[[], Any]) -> Any:
+        backend = self._backend
+        if backend is None:
+            return fn()
+
+        lock_key = f"singleflight:lock:{key}"
+        result_key = f"singleflight:result:{key}"
+        token = uuid.uuid4().hex
+
+        if backend.add(lock_key, token, timeout=settings.SINGLE_FLIGHT_LOCK_TIMEOUT):
+            try:
+                value = fn()
+                # 기다리는 다른 워커가 가져갈 수 있도록 짧게 보관
+                backend.set(result_key, value, timeout=settings.SINGLE_FLIGHT_RESULT_TIMEOUT)
+                return value
+            finally:
+                # 락이 만료되어 다른 워커가 잡은 경우에는 지우지 않음
+                if backend.get(lock_key) == token:
+                    backend.delete(lock_key)
+
+        deadline = time.monotonic() + settings.SINGLE_FLIGHT_WAIT_TIMEOUT
+        while time.monotonic() < deadline:
+            time.sleep(settings.SINGLE_FLIGHT_POLL_INTERVAL)
+            value = backend.get(result_key, MISSING)
+            if value is not MISSING:
+                return value
+            if backend.get(lock_key) is None:
+                break
+        return fn()
+
+
+def user_key(user) -> Any:
+    # 사용자별로 결과가 달라지는 계산의 키 구성용: 로그인 사용자는 id(사용자 id 값이 직접 오면 그 값), 비로그인은 None
+    # (객체 id()는 요청마다 달라 같은 사용자끼리 합쳐지지 않고, 주소가 재사용되면 다른 사용자와 섞일 수 있음)
+    if user is None or not getattr(user, "is_authenticated", True):
+        return None
+    return getattr(user, "pk", None) or getattr(user, "id", user)
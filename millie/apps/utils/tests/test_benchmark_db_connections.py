@@ -0,0 +1,19 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+
+
+class BenchmarkDBConnectionsCommandTest(TestCase):
+    def test_reports_each_mode_and_restores_settings(self):
+        original = dict(connection.settings_dict)
+        stdout = StringIO()
+
+        call_command("benchmark_db_connections", requests=3, stdout=stdout, stderr=StringIO())
+
+        lines = stdout.getvalue().splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(all("p95" in line and "/ 3요청" in line for line in lines))
+        self.assertEqual(connection.settings_dict["CONN_MAX_AGE"], original["CONN_MAX_AGE"])
+        self.assertEqual(connection.settings_dict["CONN_HEALTH_CHECKS"], original["CONN_HEALTH_CHECKS"])
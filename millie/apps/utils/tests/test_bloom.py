@@ -0,0 +1,28 @@
+from django.test import SimpleTestCase
+
+from apps.utils.bloom import BloomFilter
+
+
+class BloomFilterTest(SimpleTestCase):
+    def test_added_items_are_always_found(self):
+        bloom = BloomFilter(1000)
+        items = [f"CODE{i:06d}" for i in range(1000)]
+
+        self.assertTrue(all(bloom.add(item) for item in items[:10]))
+        for item in items[10:]:
+            bloom.add(item)
+
+        self.assertTrue(all(item in bloom for item in items))
+        self.assertFalse(bloom.add(items[0]))
+
+    def test_false_positive_rate_within_bound(self):
+        bloom = BloomFilter(10000, error_rate=0.01)
+        for i in range(10000):
+            bloom.add(f"IN{i}")
+
+        false_positives = sum(f"OUT{i}" in bloom for i in range(10000))
+        self.assertLess(false_positives, 10000 * 0.02)
+
+    def test_size_per_item(self):
+        # error_rate=0.001이면 항목당 약 1.8바이트
+        self.assertLess(BloomFilter(1_000_000).size_in_bytes, 1_900_000)
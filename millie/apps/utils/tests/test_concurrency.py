@@ -0,0 +1,114 @@
+import threading
+from contextvars import ContextVar
+from unittest import mock
+
+from django.db import (
+    connection,
+    transaction,
+)
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.test import (
+    SimpleTestCase,
+    TestCase,
+    override_settings,
+)
+
+from apps.utils.concurrency import (
+    _in_worker,
+    fan_out,
+)
+
+
+_request_id: ContextVar[str] = ContextVar("test_request_id", default="")
+
+
+@override_settings(USE_CASE_FAN_OUT=True)
+class FanOutTest(SimpleTestCase):
+    def test_runs_calls_concurrently_in_order(self):
+        # 순서대로 실행되면 두 호출이 서로를 기다리다 BrokenBarrierError
+        barrier = threading.Barrier(2, timeout=5)
+
+        def load(value):
+            barrier.wait()
+            return value, threading.current_thread().name
+
+        (first, first_thread), (second, second_thread) = fan_out(lambda: load("a"), lambda: load("b"))
+
+        self.assertEqual((first, second), ("a", "b"))
+        self.assertTrue(first_thread.startswith("db-pool"))
+        self.assertEqual(second_thread, threading.current_thread().name)
+
+    def test_context_propagated_to_pool(self):
+        token = _request_id.set("req-1")
+        try:
+            self.assertEqual(fan_out(_request_id.get, _request_id.get), ["req-1", "req-1"])
+        finally:
+            _request_id.reset(token)
+
+    def test_error_raised_after_all_calls_finish(self):
+        started = threading.Event()
+        finished = threading.Event()
+
+        def slow():
+            started.set()
+            finished.wait(0.05)
+            finished.set()
+            return "coupon"
+
+        def fail():
+            started.wait(5)
+            raise ValueError("promotion")
+
+        # 풀에서 실행 중인 조회가 끝난 뒤에 예외 전달 (요청 종료 후 연결을 쓰는 스레드가 남지 않도록)
+        with self.assertRaisesMessage(ValueError, "promotion"):
+            fan_out(slow, fail)
+        self.assertTrue(finished.is_set())
+
+        def fail_in_pool():
+            raise ValueError("pool")
+
+        with self.assertRaisesMessage(ValueError, "pool"):
+            fan_out(fail_in_pool, lambda: None)
+
+    def test_nested_fan_out_runs_sequentially(self):
+        def outer():
+            return fan_out(lambda: threading.current_thread().name, lambda: threading.current_thread().name)
+
+        nested, _ = fan_out(outer, lambda: None)
+
+        # 풀 스레드 안에서는 새 작업을 제출하지 않고 같은 스레드에서 실행
+        self.assertEqual(len(set(nested)), 1)
+        self.assertTrue(nested[0].startswith("db-pool"))
+
+    def test_pool_task_without_queries_leaves_connections_alone(self):
+        # 이전 작업이 연 연결이 남아 있어도 쿼리하지 않은 작업은 연결을 확인하지 않음 (DB 접근 없음)
+        with mock.patch.object(BaseDatabaseWrapper, "close_if_unusable_or_obsolete") as close:
+            self.assertEqual(_in_worker(lambda: "done")(), "done")
+        close.assert_not_called()
+
+    @override_settings(USE_CASE_FAN_OUT=False)
+    def test_disabled_runs_in_caller_thread(self):
+        current = threading.current_thread().name
+        self.assertEqual(
+            fan_out(lambda: threading.current_thread().name, lambda: threading.current_thread().name),
+            [current, current],
+        )
+
+
+@override_settings(USE_CASE_FAN_OUT=True)
+class FanOutInTransactionTest(TestCase):
+    def test_sequential_inside_atomic(self):
+        # 다른 스레드의 연결에서는 커밋 전 데이터가 보이지 않으므로 현재 스레드에서 실행
+        current = threading.current_thread().name
+        with transaction.atomic():
+            names = fan_out(lambda: threading.current_thread().name, lambda: threading.current_thread().name)
+        self.assertEqual(names, [current, current])
+
+    def test_pool_task_checks_connections_it_queried(self):
+        def query():
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+
+        with mock.patch.object(BaseDatabaseWrapper, "close_if_unusable_or_obsolete", autospec=True) as close:
+            _in_worker(query)()
+        self.assertEqual([call.args[0].alias for call in close.call_args_list], ["default"])
@@ -0,0 +1,62 @@
+from django.test import SimpleTestCase
+
+from apps.utils.container import (
+    Container,
+    Lifetime,
+)
+
+
+class Repo:
+    pass
+
+
+class FakeRepo(Repo):
+    pass
+
+
+class Service:
+    def __init__(self, repo):
+        self.repo = repo
+
+
+class UseCase:
+    def __init__(self, service):
+        self.service = service
+
+
+class ContainerTest(SimpleTestCase):
+    def setUp(self):
+        self.container = Container()
+        self.container.register(Repo, lambda c: Repo(), Lifetime.SINGLETON)
+        self.container.register(Service, lambda c: Service(c.resolve(Repo)), Lifetime.SINGLETON)
+        self.container.register(UseCase, lambda c: UseCase(c.resolve(Service)), Lifetime.SCOPED)
+
+    def test_lifetimes(self):
+        service = self.container.resolve(Service)
+        self.assertIs(self.container.resolve(Service), service)
+        self.assertIs(service.repo, self.container.resolve(Repo))
+
+        # scope 밖의 SCOPED는 매번 생성
+        self.assertIsNot(self.container.resolve(UseCase), self.container.resolve(UseCase))
+
+        with self.container.scope():
+            first = self.container.resolve(UseCase)
+            self.assertIs(self.container.resolve(UseCase), first)
+            self.assertIs(first.service, service)
+        with self.container.scope():
+            self.assertIsNot(self.container.resolve(UseCase), first)
+
+    def test_override_reaches_dependents(self):
+        real_service = self.container.resolve(Service)
+        fake = FakeRepo()
+
+        with self.container.override(Repo, fake):
+            self.assertIs(self.container.resolve(UseCase).service.repo, fake)
+
+        # override 해제 후에는 기존 singleton 그대로
+        self.assertIs(self.container.resolve(Service), real_service)
+        self.assertIsNot(self.container.resolve(Repo), fake)
+
+    def test_unregistered(self):
+        with self.assertRaises(LookupError):
+            self.container.resolve(FakeRepo)
@@ -0,0 +1,157 @@
+import time
+from decimal import Decimal
+from unittest import mock
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.test import (
+    RequestFactory,
+    TransactionTestCase,
+    override_settings,
+)
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.product.domain.value_objects import (
+    ProductStatus,
+    VisibilityStatus,
+)
+from apps.product.infrastructure.persistence.models import (
+    Author as AuthorModel,
+    Book as BookModel,
+    BookDetail as BookDetailModel,
+    PublishInfo as PublishInfoModel,
+)
+from apps.utils import db_router
+from apps.utils.db_router import (
+    ReadReplicaRouter,
+    replica_lag_monitor,
+)
+from apps.utils.middleware import PrimaryPinningMiddleware
+from apps.utils.models import CacheVersion
+
+
+@override_settings(DATABASE_REPLICAS=["replica"])
+class ReadReplicaRouterTest(TransactionTestCase):
+    """
+    primary(default)와 replica를 서로 다른 SQLite DB로 두고, 한쪽에만 있는 데이터로 어느 DB에서 읽었는지 확인
+    (replica 데이터는 signal 없이 bulk_create로 직접 넣음)
+    """
+
+    databases = {"default", "replica"}
+
+    def setUp(self):
+        self._create_book("BOOK001", using="replica")
+        self._create_book("BOOK002", using="default")
+        db_router.reset_pin()
+        replica_lag_monitor.clear()
+        self.addCleanup(db_router.reset_pin)
+
+    def _create_book(self, code, using):
+        now = timezone.now()
+        book = BookModel(code=code, name=code, price=Decimal("10000.00"), status=ProductStatus.ACTIVE.value,
+                         created_at=now, updated_at=now)
+        BookModel.objects.using(using).bulk_create([book])
+        visible = {"book_code": book, "status": VisibilityStatus.VISIBLE.value, "created_at": now, "updated_at": now}
+        BookDetailModel.objects.using(using).bulk_create([
+            BookDetailModel(category="FICTION", description="", **visible),
+        ])
+        PublishInfoModel.objects.using(using).bulk_create([
+            PublishInfoModel(publisher="밀리출판", published_date=now.date(), **visible),
+        ])
+        AuthorModel.objects.using(using).bulk_create([AuthorModel(author="김작가", **visible)])
+
+    def _detail_status(self, client, code):
+        return client.get(reverse("product-detail", args=[code])).status_code
+
+    @staticmethod
+    def _signed_pin(until):
+        response = HttpResponse()
+        response.set_signed_cookie(
+            PrimaryPinningMiddleware.COOKIE_NAME, str(until), salt=PrimaryPinningMiddleware.COOKIE_SALT,
+        )
+        return response.cookies[PrimaryPinningMiddleware.COOKIE_NAME].value
+
+    def test_repository_reads_go_to_replica(self):
+        client = APIClient()
+        self.assertEqual(self._detail_status(client, "BOOK001"), status.HTTP_200_OK)
+        self.assertEqual(self._detail_status(client, "BOOK002"), status.HTTP_404_NOT_FOUND)
+
+    def test_pinned_to_primary_after_write(self):
+        BookModel.objects.filter(code="BOOK002").update(name="변경")
+        self.assertTrue(db_router.is_pinned())
+        self.assertTrue(BookModel.objects.filter(code="BOOK002").exists())
+
+        # 다음 요청은 쿠키로 고정 여부를 이어받음
+        client = APIClient()
+        self.assertEqual(self._detail_status(client, "BOOK002"), status.HTTP_404_NOT_FOUND)
+        client.cookies[PrimaryPinningMiddleware.COOKIE_NAME] = self._signed_pin(time.time() + 5)
+        self.assertEqual(self._detail_status(client, "BOOK002"), status.HTTP_200_OK)
+
+    def test_pin_cookie_cannot_extend_sticky_window(self):
+        pinned = []
+
+        def read_view(request):
+            pinned.append(db_router.pinned_until())
+            return HttpResponse()
+
+        def request_with(cookie):
+            request = RequestFactory().get("/")
+            request.COOKIES[PrimaryPinningMiddleware.COOKIE_NAME] = cookie
+            PrimaryPinningMiddleware(read_view)(request)
+
+        # 서명된 값이어도 현재 시각 + DATABASE_REPLICA_STICKY_SECONDS까지만 고정
+        request_with(self._signed_pin(time.time() + 3600))
+        self.assertLessEqual(pinned[-1], time.time() + settings.DATABASE_REPLICA_STICKY_SECONDS)
+
+        # 클라이언트가 만든(서명 없는) 값은 무시
+        request_with(str(time.time() + 3600))
+        self.assertEqual(pinned[-1], 0.0)
+
+    def test_middleware_sets_cookie_after_write(self):
+        def write_view(request):
+            CacheVersion.objects.create(namespace="router-test", version=1)
+            return HttpResponse()
+
+        response = PrimaryPinningMiddleware(write_view)(RequestFactory().post("/"))
+        self.assertIn(PrimaryPinningMiddleware.COOKIE_NAME, response.cookies)
+
+        response = PrimaryPinningMiddleware(lambda request: HttpResponse())(RequestFactory().get("/"))
+        self.assertNotIn(PrimaryPinningMiddleware.COOKIE_NAME, response.cookies)
+
+    def test_primary_only_models(self):
+        self.assertEqual(ReadReplicaRouter().db_for_read(CacheVersion), "default")
+        self.assertEqual(ReadReplicaRouter().db_for_read(BookModel), "replica")
+
+
+class ReplicaSelectionTest(TransactionTestCase):
+    databases = {"default", "replica"}
+
+    def setUp(self):
+        db_router.reset_pin()
+        self.router = ReadReplicaRouter()
+        self.lags = {"replica_a": 0.0, "replica_b": 0.0}
+        patcher = mock.patch.object(replica_lag_monitor, "lag", side_effect=lambda alias: self.lags[alias])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _reads(self, count=4):
+        return [self.router.db_for_read(BookModel) for _ in range(count)]
+
+    @override_settings(DATABASE_REPLICAS=["replica_a", "replica_b"], DATABASE_REPLICA_STRATEGY="round_robin")
+    def test_round_robin_skips_lagging_replica(self):
+        self.assertEqual(sorted(self._reads()), ["replica_a", "replica_a", "replica_b", "replica_b"])
+
+        self.lags["replica_b"] = 60
+        self.assertEqual(self._reads(), ["replica_a"] * 4)
+
+        # 모든 replica가 지연되면 primary
+        self.lags["replica_a"] = 60
+        self.assertEqual(self._reads(1), ["default"])
+
+    @override_settings(DATABASE_REPLICAS=["replica_a", "replica_b"], DATABASE_REPLICA_STRATEGY="least_lag")
+    def test_least_lag(self):
+        self.lags.update(replica_a=2.0, replica_b=0.5)
+        self.assertEqual(self._reads(), ["replica_b"] * 4)
@@ -0,0 +1,31 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import TestCase
+
+from apps.utils.management.commands.load_test_async import _QueryLatency
+
+
+class LoadTestAsyncCommandTest(TestCase):
+    def test_rejects_in_memory_database(self):
+        # 테스트 DB(인메모리 SQLite)는 스레드마다 다른 DB가 되므로 측정 거부
+        with self.assertRaises(CommandError):
+            call_command("load_test_async", code="BOOK001", stdout=StringIO())
+
+    def test_query_latency_wraps_and_restores_connections(self):
+        latency = _QueryLatency(0.001)
+        connection.ensure_connection()
+
+        latency.install()
+        try:
+            self.assertIn(latency, connection.execute_wrappers)
+            with mock.patch("apps.utils.management.commands.load_test_async.time.sleep") as sleep:
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+            sleep.assert_called_once_with(0.001)
+        finally:
+            latency.uninstall()
+        self.assertNotIn(latency, connection.execute_wrappers)
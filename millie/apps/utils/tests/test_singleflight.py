@@ -0,0 +1,195 @@
+import threading
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+from django.test import (
+    SimpleTestCase,
+    override_settings,
+)
+
+from apps.utils import singleflight
+from apps.utils.singleflight import (
+    SingleFlight,
+    user_key,
+)
+
+
+WAIT = 5
+
+
+class SingleFlightTest(SimpleTestCase):
+    def setUp(self):
+        self.results, self.errors = [], []
+
+    def _run_concurrently(self, flight, key, fn, count):
+        results, errors = self.results, self.errors
+
+        def call():
+            try:
+                results.append(flight.do(key, fn))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=call) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        return threads
+
+    def _wait_for_waiters(self, flight, key, count):
+        deadline = time.monotonic() + WAIT
+        while flight.waiting(key) < count and time.monotonic() < deadline:
+            time.sleep(0.001)
+        self.assertEqual(flight.waiting(key), count)
+
+    def test_concurrent_callers_share_one_computation(self):
+        flight = SingleFlight("test", cache_alias=None)
+        started, release = threading.Event(), threading.Event()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            started.set()
+            release.wait(WAIT)
+            return "value"
+
+        leader = self._run_concurrently(flight, "BOOK001", compute, 1)
+        self.assertTrue(started.wait(WAIT))
+        followers = self._run_concurrently(flight, "BOOK001", compute, 10)
+        self._wait_for_waiters(flight, "BOOK001", 10)
+        release.set()
+        for thread in leader + followers:
+            thread.join(WAIT)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(self.results, ["value"] * 11)
+        self.assertEqual(flight.in_flight(), 0)
+
+        # 완료 후 호출은 다시 계산
+        self.assertEqual(flight.do("BOOK001", lambda: "next"), "next")
+
+    def test_error_shared_and_not_cached(self):
+        flight = SingleFlight("test", cache_alias=None)
+        started, release = threading.Event(), threading.Event()
+
+        def fail():
+            started.set()
+            release.wait(WAIT)
+            raise ValueError("boom")
+
+        leader = self._run_concurrently(flight, "BOOK001", fail, 1)
+        self.assertTrue(started.wait(WAIT))
+        followers = self._run_concurrently(flight, "BOOK001", fail, 3)
+        self._wait_for_waiters(flight, "BOOK001", 3)
+        release.set()
+        for thread in leader + followers:
+            thread.join(WAIT)
+
+        self.assertEqual(len(self.errors), 4)
+        self.assertTrue(all(isinstance(e, ValueError) for e in self.errors))
+        self.assertEqual(flight.do("BOOK001", lambda: "ok"), "ok")
+
+    def test_different_keys_not_merged(self):
+        flight = SingleFlight("test", cache_alias=None)
+        self.assertNotEqual(flight.key("BOOK001", None), flight.key("BOOK002", None))
+        self.assertEqual(flight.do(flight.key("BOOK001"), lambda: 1), 1)
+        self.assertEqual(flight.do(flight.key("BOOK002"), lambda: 2), 2)
+
+
+@override_settings(
+    CACHES={
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        "shared": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "singleflight-test"},
+    },
+    SINGLE_FLIGHT_POLL_INTERVAL=0.005,
+)
+class SharedSingleFlightTest(SimpleTestCase):
+    """
+    워커 2개를 진행 중 계산 목록을 따로 가진 인스턴스로 흉내내고, 락/결과는 같은 캐시를 공유
+    """
+
+    def setUp(self):
+        # 다른 워커가 결과를 기다리기 시작한 시점을 알 수 있도록 대기(sleep)를 감쌈
+        self.polling = threading.Event()
+
+        def sleep(seconds):
+            self.polling.set()
+            time.sleep(seconds)
+
+        patcher = mock.patch.object(singleflight, "time", SimpleNamespace(monotonic=time.monotonic, sleep=sleep))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_key_by_user_id_and_seen_versions(self):
+        user = SimpleNamespace(pk="u1", id="u1", is_authenticated=True)
+        self.assertEqual(user_key(user), user_key(SimpleNamespace(pk="u1", id="u1", is_authenticated=True)))
+        self.assertEqual(user_key("u1"), "u1")
+        self.assertIsNone(user_key(None))
+        self.assertIsNone(user_key(SimpleNamespace(pk=None, id=None, is_authenticated=False)))
+
+        flight = SingleFlight("test", cache_alias=None, stamps=("product",))
+        with mock.patch.object(singleflight, "seen_versions", return_value=(1,)):
+            before = flight.key("BOOK001", user_key(user))
+        with mock.patch.object(singleflight, "seen_versions", return_value=(2,)):
+            after = flight.key("BOOK001", user_key(user))
+        self.assertNotEqual(before, after)
+
+    def test_other_worker_waits_for_lock_holder_result(self):
+        worker_a = SingleFlight("test", cache_alias="shared")
+        worker_b = SingleFlight("test", cache_alias="shared")
+        started, release = threading.Event(), threading.Event()
+        calls_b = []
+        results = {}
+
+        def compute_a():
+            started.set()
+            release.wait(WAIT)
+            return "from-a"
+
+        def compute_b():
+            calls_b.append(1)
+            return "from-b"
+
+        thread_a = threading.Thread(target=lambda: results.setdefault("a", worker_a.do("BOOK001", compute_a)))
+        thread_a.start()
+        self.assertTrue(started.wait(WAIT))
+
+        thread_b = threading.Thread(target=lambda: results.setdefault("b", worker_b.do("BOOK001", compute_b)))
+        thread_b.start()
+        self.assertTrue(self.polling.wait(WAIT))
+        release.set()
+        thread_a.join(WAIT)
+        thread_b.join(WAIT)
+
+        self.assertEqual(results, {"a": "from-a", "b": "from-a"})
+        self.assertEqual(calls_b, [])
+
+    def test_runs_itself_when_lock_holder_fails(self):
+        worker_a = SingleFlight("test", cache_alias="shared")
+        worker_b = SingleFlight("test", cache_alias="shared")
+        started, release = threading.Event(), threading.Event()
+        results = {}
+
+        def fail():
+            started.set()
+            release.wait(WAIT)
+            raise ValueError("boom")
+
+        def run_a():
+            try:
+                worker_a.do("BOOK002", fail)
+            except ValueError:
+                results["a"] = "error"
+
+        thread_a = threading.Thread(target=run_a)
+        thread_a.start()
+        self.assertTrue(started.wait(WAIT))
+
+        thread_b = threading.Thread(target=lambda: results.setdefault("b", worker_b.do("BOOK002", lambda: "from-b")))
+        thread_b.start()
+        self.assertTrue(self.polling.wait(WAIT))
+        release.set()
+        thread_a.join(WAIT)
+        thread_b.join(WAIT)
+
+        self.assertEqual(results, {"a": "error", "b": "from-b"})
@@ -0,0 +1,88 @@
+import shutil
+import tempfile
+
+from django.test import (
+    TestCase,
+    override_settings,
+)
+
+from apps.utils.cache import (
+    MISSING,
+    LocalLRUCache,
+    TwoTierCache,
+    VersionStamps,
+)
+from apps.utils.models import CacheVersion
+
+
+class TwoTierCacheTest(TestCase):
+    """
+    워커 2개를 L1/버전 확인기를 따로 가진 인스턴스로 흉내내고, L2는 같은 디렉토리의 파일 캐시를 공유
+    """
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+
+        settings_override = override_settings(CACHES={
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+            "shared": {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache", "LOCATION": directory},
+        })
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.worker_a = self._worker()
+        self.worker_b = self._worker()
+
+    def _worker(self, poll_interval=0):
+        return TwoTierCache(
+            alias="shared",
+            prefix="test",
+            local=LocalLRUCache(max_entries=2),
+            stamps=VersionStamps(poll_interval=poll_interval),
+        )
+
+    def test_read_through_l1_then_shared(self):
+        loads = []
+
+        def loader():
+            loads.append(1)
+            return {"price": 1000}
+
+        self.assertEqual(self.worker_a.get_or_load("test:BOOK001", loader), {"price": 1000})
+        self.assertEqual(self.worker_b.get_or_load("test:BOOK001", loader), {"price": 1000})    # L2 공유
+        self.assertEqual(len(loads), 1)
+
+        # L2에서 지워져도 B의 L1은 다른 워커가 버전을 올리기 전까지 유지
+        self.worker_a.backend.delete("test:BOOK001")
+        self.assertEqual(self.worker_b.get_or_load("test:BOOK001", loader), {"price": 1000})
+        self.assertEqual(len(loads), 1)
+
+    def test_write_in_one_worker_drops_l1_of_others(self):
+        self.worker_a.get_or_load("test:BOOK001", lambda: "old")
+        self.worker_b.get_or_load("test:BOOK001", lambda: "old")
+
+        self.worker_a.delete_many(["test:BOOK001"])
+        self.assertEqual(CacheVersion.objects.get(namespace="test").version, 1)
+
+        self.assertEqual(self.worker_b.get_or_load("test:BOOK001", lambda: "new"), "new")
+        self.assertEqual(self.worker_a.get_or_load("test:BOOK001", lambda: "newer"), "new")
+
+    def test_poll_interval_bounds_version_checks(self):
+        worker = self._worker(poll_interval=60)
+        worker.get_or_load("test:BOOK001", lambda: "old")
+
+        with self.assertNumQueries(0):      # 주기 안에서는 버전 테이블을 다시 조회하지 않음
+            self.assertEqual(worker.get_or_load("test:BOOK001", lambda: "new"), "old")
+
+    def test_lru_eviction(self):
+        local = LocalLRUCache(max_entries=2)
+        local.set("a", 1)
+        local.set("b", 2)
+        local.get("a")
+        local.set("c", 3)
+
+        self.assertEqual(len(local), 2)
+        self.assertEqual(local.get("a"), 1)
+        self.assertEqual(local.get("c"), 3)
+        self.assertIs(local.get("b"), MISSING)      # 가장 오래 안 쓴 항목부터 제거
@@ -0,0 +1,93 @@
+import re
+import unicodedata
+from typing import List
+
+
+WORD_RE = re.compile(r"[^\W_]+")
+HANGUL_RE = re.compile(r"[가-힣]")
+
+# 색인 term 최대 길이 (DB 컬럼 길이와 동일)
+MAX_TERM_LENGTH = 100
+
+
+def normalize(text: str) -> str:
+    """
+    전각/반각, 호환 문자 등을 통일하고 소문자로 변환 (NFKC)
+    """
+    return unicodedata.normalize("NFKC", text or "").lower()
+
+
+def tokenize(text: str) -> List[str]:
+    return WORD_RE.findall(normalize(text))
+
+
+def bigrams(word: str) -> List[str]:
+    if len(word) < 2:
+        return [word]
+    return [word[i:i + 2] for i in range(len(word) - 1)]
+
+
+def index_terms(text: str) -> List[str]:
+    """
+    색인용 term 목록 (중복 포함 → 빈도로 사용)
+    - 한글이 포함된 단어: 띄어쓰기/조사와 무관하게 부분 일치하도록 bigram으로 분해
+    - 그 외 단어: 단어 그대로
+    """
+    terms = []
+    for word in tokenize(text):
+        if HANGUL_RE.search(word):
+            terms.extend(bigrams(word))
+        else:
+            terms.append(word[:MAX_TERM_LENGTH])
+    return terms
+
+
+def query_terms(text: str) -> List[str]:
+    """
+    검색어 → term 목록 (색인과 같은 규칙, 중복 제거)
+    """
+    return list(dict.fromkeys(index_terms(text)))
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 자동완성용 정규화: 입력 중인 한글(“파ㅇ”, “파이ㅆ”)도 접두어로 매칭되도록 자모 단위로 분해
+# ──────────────────────────────────────────────────────────────────────────────
+HANGUL_BASE, HANGUL_LAST = 0xAC00, 0xD7A3
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = " ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"
+
+# 겹받침/이중모음은 입력 순서대로 분해 (“닭”은 “달” 다음에 입력됨)
+COMPOUND_JAMO = {
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ",
+    "ㄽ": "ㄹㅅ", "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+}
+
+
+# NFKC는 호환 자모(ㅆ)를 조합용 자모(U+110A)로 바꾸므로 분해 결과와 맞추기 위해 되돌림
+CONJOINING_TO_COMPAT = {
+    unicodedata.normalize("NFKC", chr(code)): chr(code)
+    for code in range(0x3131, 0x3164)
+}
+
+
+def to_jamo(text: str) -> str:
+    result = []
+    for char in text:
+        code = ord(char)
+        char = CONJOINING_TO_COMPAT.get(char, char)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            offset = code - HANGUL_BASE
+            jamo = CHOSEONG[offset // 588] + JUNGSEONG[(offset % 588) // 28] + JONGSEONG[offset % 28].strip()
+        else:
+            jamo = char
+        result.append("".join(COMPOUND_JAMO.get(j, j) for j in jamo))
+    return "".join(result)
+
+
+def prefix_key(text: str) -> str:
+    """
+    자동완성 키: NFKC + 소문자 + 공백 정리 + 한글 자모 분해
+    """
+    return to_jamo(" ".join(normalize(text).split()))
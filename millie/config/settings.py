@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 
@@ -40,6 +41,7 @@ INSTALLED_APPS = [
     'django.contrib.staticfiles',
     'rest_framework',
     'pymysql',
+    'apps.utils',
     'apps.product',
     'apps.pricing',
 ]
@@ -52,6 +54,8 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'apps.utils.middleware.RequestScopeMiddleware',
+    'apps.utils.middleware.PrimaryPinningMiddleware',
 ]
 
 ROOT_URLCONF = 'config.urls'
@@ -78,17 +82,63 @@ WSGI_APPLICATION = 'config.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
 
+# 요청마다 연결을 새로 맺지 않도록 스레드(워커)별 연결을 재사용
+#   DB_CONN_MAX_AGE: 연결 최대 수명(초), 지나면 요청 종료 시 닫고 다음 요청에서 새로 연결 (0: 매 요청 새 연결, None: 무제한)
+#                    DB 서버의 wait_timeout보다 짧게 설정
+#   DB_CONN_HEALTH_CHECKS: 재사용 전 연결 상태를 확인하여 끊긴 연결이면 새로 연결
+DB_CONN_MAX_AGE = os.environ.get('DB_CONN_MAX_AGE', '60')
+DB_CONN_HEALTH_CHECKS = os.environ.get('DB_CONN_HEALTH_CHECKS', 'true').lower() in ('1', 'true', 'yes')
+
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.mysql',
-        'NAME': 'millie',
-        'USER': 'millie_user',
-        'PASSWORD': 'millie_pw',
-        'HOST': '127.0.0.1',
-        'PORT': '3307',   # 로컬에 이미 3306 포트 점유중이라 3307로 세팅
+        'ENGINE': os.environ.get('DB_ENGINE', 'django.db.backends.mysql'),
+        'NAME': os.environ.get('DB_NAME', 'millie'),
+        'USER': os.environ.get('DB_USER', 'millie_user'),
+        'PASSWORD': os.environ.get('DB_PASSWORD', 'millie_pw'),
+        'HOST': os.environ.get('DB_HOST', '127.0.0.1'),
+        'PORT': os.environ.get('DB_PORT', '3307'),   # 로컬에 이미 3306 포트 점유중이라 3307로 세팅
+        'CONN_MAX_AGE': None if DB_CONN_MAX_AGE.lower() == 'none' else int(DB_CONN_MAX_AGE),
+        'CONN_HEALTH_CHECKS': DB_CONN_HEALTH_CHECKS,
     }
 }
 
+# 읽기 전용 replica (ReadReplicaRouter)
+#   DB_REPLICAS: 콤마로 구분, MySQL은 HOST[:PORT], SQLite는 DB 파일 경로 → replica1, replica2, ... alias로 등록
+#   e.g. DB_REPLICAS=10.0.0.11:3306,10.0.0.12:3306
+#        DB_ENGINE=django.db.backends.sqlite3 DB_NAME=/tmp/primary.sqlite3 DB_REPLICAS=/tmp/replica.sqlite3
+DATABASE_REPLICAS = []
+for index, replica in enumerate(filter(None, os.environ.get('DB_REPLICAS', '').split(',')), start=1):
+    replica_settings = dict(DATABASES['default'])
+    if replica_settings['ENGINE'].endswith('sqlite3'):
+        replica_settings['NAME'] = replica.strip()
+    else:
+        host, _, port = replica.strip().partition(':')
+        replica_settings.update(HOST=host, PORT=port or replica_settings['PORT'])
+    DATABASES[f'replica{index}'] = replica_settings
+    DATABASE_REPLICAS.append(f'replica{index}')
+
+DATABASE_ROUTERS = ['apps.utils.db_router.ReadReplicaRouter']
+DATABASE_REPLICA_STRATEGY = os.environ.get('DB_REPLICA_STRATEGY', 'round_robin')              # round_robin / least_lag
+DATABASE_REPLICA_MAX_LAG = float(os.environ.get('DB_REPLICA_MAX_LAG', 5))                      # 이보다 지연된 replica는 제외(초)
+DATABASE_REPLICA_LAG_CHECK_INTERVAL = float(os.environ.get('DB_REPLICA_LAG_CHECK_INTERVAL', 1))
+DATABASE_REPLICA_STICKY_SECONDS = int(os.environ.get('DB_REPLICA_STICKY_SECONDS', 5))         # 쓰기 후 primary에서 읽는 시간(초)
+# 지연되면 안 되는 테이블은 항상 primary에서 읽음 (워커 간 캐시 무효화 버전)
+DATABASE_PRIMARY_ONLY_MODELS = {'utils.CacheVersion'}
+
+# 비동기 뷰의 repository 조회 실행 방식 (apps/utils/concurrency.py)
+#   False: 스레드 풀에서 실행하여 한 요청 안의 상품/프로모션/쿠폰 조회가 동시에 진행 (스레드별 DB 연결)
+#   True: 요청마다 하나의 스레드에서 순서대로 실행 (Django async ORM 기본 방식)
+ASYNC_DB_THREAD_SENSITIVE = os.environ.get('ASYNC_DB_THREAD_SENSITIVE', 'false').lower() in ('1', 'true', 'yes')
+# use case 안의 서로 독립적인 조회(상품/프로모션/쿠폰)를 스레드 풀에서 동시에 실행 (apps/utils/concurrency.py fan_out)
+USE_CASE_FAN_OUT = os.environ.get('USE_CASE_FAN_OUT', 'false').lower() in ('1', 'true', 'yes')
+# 위 두 방식이 함께 쓰는 DB 조회용 스레드 수 (스레드마다 DB 연결을 하나씩 유지하므로 DB 최대 연결 수 안에서 설정)
+DB_THREAD_POOL_MAX_WORKERS = int(os.environ.get('DB_THREAD_POOL_MAX_WORKERS', '32'))
+# 전체 대상 규칙이 바뀌었을 때 최저 구매 가능가 전체 재계산을 요청 스레드 대신 백그라운드 스레드에서 실행
+# (apps/pricing/infrastructure/lowest_price_refresh.py)
+LOWEST_PRICE_REFRESH_IN_BACKGROUND = (
+    os.environ.get('LOWEST_PRICE_REFRESH_IN_BACKGROUND', 'true').lower() in ('1', 'true', 'yes')
+)
+
 import sys
 
 if 'test' in sys.argv or 'pytest' in sys.argv:
@@ -96,6 +146,64 @@ if 'test' in sys.argv or 'pytest' in sys.argv:
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': ':memory:',  # 인메모리 DB. 혹은 'db.sqlite3'로 변경 가능
     }
+    # router 테스트용 별도 DB (기본은 replica로 쓰지 않고, 테스트에서 DATABASE_REPLICAS로 지정)
+    DATABASES['replica'] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+    DATABASE_REPLICAS = []
+    # 테스트는 트랜잭션 안에서 실행되므로 다른 스레드(연결)에서는 데이터가 보이지 않음
+    ASYNC_DB_THREAD_SENSITIVE = True
+    LOWEST_PRICE_REFRESH_IN_BACKGROUND = False
+
+
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# 상품/가격 조회 캐시는 2단계: 프로세스 로컬 LRU(L1) → 공유 캐시 백엔드(L2)
+# L2 백엔드는 환경변수로 교체 (단일 프로세스: locmem, 여러 프로세스 공유: filebased/db/redis 등)
+#   e.g. CACHE_BACKEND=django.core.cache.backends.filebased.FileBasedCache CACHE_LOCATION=/tmp/millie_cache
+#        (DatabaseCache는 `python manage.py createcachetable` 필요)
+
+PRODUCT_CACHE_ALIAS = 'product'
+PRICING_CACHE_ALIAS = 'pricing'
+
+SHARED_CACHE = {
+    'BACKEND': os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+    'LOCATION': os.environ.get('CACHE_LOCATION', 'millie'),
+    'TIMEOUT': int(os.environ.get('CACHE_TIMEOUT', 60 * 10)),
+}
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    PRODUCT_CACHE_ALIAS: SHARED_CACHE,
+    PRICING_CACHE_ALIAS: SHARED_CACHE,
+}
+
+# L1 최대 항목 수, 다른 워커의 변경(cache_versions)을 확인하는 주기(초, 0이면 조회마다 확인)
+LOCAL_CACHE_MAX_ENTRIES = int(os.environ.get('LOCAL_CACHE_MAX_ENTRIES', 1024))
+CACHE_VERSION_POLL_INTERVAL = float(os.environ.get('CACHE_VERSION_POLL_INTERVAL', 1.0))
+
+# 상품 변경 로그(product_changes) 보관 시간(초), 이보다 오래 뒤처진 워커의 메모리 색인은 전체 재적재
+PRODUCT_CHANGE_LOG_RETENTION = int(os.environ.get('PRODUCT_CHANGE_LOG_RETENTION', 60 * 60 * 24))
+
+# 사용자 세그먼트 회원 목록을 프로세스마다 보관하는 최대 세그먼트 수 (회원 100만 명 = 약 16MB)
+SEGMENT_CACHE_MAX_ENTRIES = int(os.environ.get('SEGMENT_CACHE_MAX_ENTRIES', 16))
+
+# 동시 요청 합치기(single-flight)를 워커 간에도 적용할 공유 캐시 alias (미지정 시 프로세스 내에서만)
+#   e.g. SINGLE_FLIGHT_CACHE_ALIAS=product
+SINGLE_FLIGHT_CACHE_ALIAS = os.environ.get('SINGLE_FLIGHT_CACHE_ALIAS') or None
+SINGLE_FLIGHT_LOCK_TIMEOUT = int(os.environ.get('SINGLE_FLIGHT_LOCK_TIMEOUT', 10))        # 락을 잡은 워커가 죽어도 풀리는 시간(초)
+SINGLE_FLIGHT_WAIT_TIMEOUT = float(os.environ.get('SINGLE_FLIGHT_WAIT_TIMEOUT', 3.0))     # 다른 워커 결과를 기다리는 최대 시간(초)
+SINGLE_FLIGHT_RESULT_TIMEOUT = int(os.environ.get('SINGLE_FLIGHT_RESULT_TIMEOUT', 2))     # 기다리는 워커에 넘겨줄 결과 보관 시간(초)
+SINGLE_FLIGHT_POLL_INTERVAL = float(os.environ.get('SINGLE_FLIGHT_POLL_INTERVAL', 0.02))
+
+if 'test' in sys.argv or 'pytest' in sys.argv:
+    # 테스트 간 캐시가 남지 않도록 기본은 비활성화 (캐시 동작 테스트는 override_settings로 지정)
+    CACHES[PRODUCT_CACHE_ALIAS] = CACHES[PRICING_CACHE_ALIAS] = {
+        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+    }
 
 
 # Password validation
@@ -1,10 +1,33 @@
 from django.urls import path
 from apps.product.interface.views.product_list_views import ProductListView
 from apps.product.interface.views.product_detail_views import ProductDetailView
+from apps.product.interface.views.product_bulk_detail_views import ProductBulkDetailView
+from apps.product.interface.views.product_search_views import ProductSearchView
+from apps.product.interface.views.product_autocomplete_views import ProductAutocompleteView
+from apps.product.interface.views.product_facet_views import ProductFacetView
+from apps.product.interface.views.async_product_list_views import AsyncProductListView
+from apps.product.interface.views.async_product_detail_views import AsyncProductDetailView
 from apps.pricing.interface.views.coupon_apply_views import CouponApplyView
+from apps.pricing.interface.views.async_coupon_apply_views import AsyncCouponApplyView
+from apps.pricing.interface.views.pricing_simulation_views import PricingSimulationView
+from apps.pricing.interface.views.cart_price_views import CartPriceView
+from apps.pricing.interface.views.coupon_wallet_views import CouponWalletView
 
 urlpatterns = [
     path("api/v1/products", ProductListView.as_view(), name="product-list"),
+    # 고정 경로는 상품 코드(<str:code>)보다 먼저 등록 (뒤에 두면 "bulk" 등이 상품 코드로 매칭됨)
+    path("api/v1/products/bulk", ProductBulkDetailView.as_view(), name="product-bulk-detail"),
+    path("api/v1/products/search", ProductSearchView.as_view(), name="product-search"),
+    path("api/v1/products/autocomplete", ProductAutocompleteView.as_view(), name="product-autocomplete"),
+    path("api/v1/products/facets", ProductFacetView.as_view(), name="product-facets"),
     path("api/v1/products/<str:code>", ProductDetailView.as_view(), name="product-detail"),
     path("api/v1/pricing/apply-coupon/<str:code>", CouponApplyView.as_view(), name="apply-coupon"),
-]
\ No newline at end of file
+    path("api/v1/pricing/simulations", PricingSimulationView.as_view(), name="pricing-simulation"),
+    path("api/v1/pricing/cart", CartPriceView.as_view(), name="cart-price"),
+    path("api/v1/pricing/users/me/coupons", CouponWalletView.as_view(), name="coupon-wallet"),
+
+    # 비동기(ASGI) 버전, 요청/응답은 위와 동일
+    path("api/v1/async/products", AsyncProductListView.as_view(), name="async-product-list"),
+    path("api/v1/async/products/<str:code>", AsyncProductDetailView.as_view(), name="async-product-detail"),
+    path("api/v1/async/pricing/apply-coupon/<str:code>", AsyncCouponApplyView.as_view(), name="async-apply-coupon"),
+]